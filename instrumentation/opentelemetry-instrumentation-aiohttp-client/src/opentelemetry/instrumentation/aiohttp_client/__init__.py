@@ -264,6 +264,7 @@ from opentelemetry.util.http import (
     redact_url,
     sanitize_method,
 )
+from opentelemetry.util.http.span_budget import get_outbound_span_budget
 
 if TYPE_CHECKING:
     from typing_extensions import Unpack
@@ -425,6 +426,7 @@ def create_trace_config(
         )
 
     excluded_urls = get_excluded_urls("AIOHTTP_CLIENT")
+    span_budget = get_outbound_span_budget()
 
     def _end_trace(trace_config_ctx: types.SimpleNamespace):
         elapsed_time = max(default_timer() - trace_config_ctx.start_time, 0)
@@ -432,6 +434,8 @@ def create_trace_config(
             context_api.detach(trace_config_ctx.token)
         if trace_config_ctx.span:
             trace_config_ctx.span.end()
+        if trace_config_ctx.suppressed_call is not None:
+            trace_config_ctx.suppressed_call.record(elapsed_time)
 
         if trace_config_ctx.duration_histogram_old is not None:
             duration_attrs_old = cast(
@@ -500,8 +504,10 @@ def create_trace_config(
         )
         _set_http_url(span_attributes, request_url, sem_conv_opt_in_mode)
 
+        host = None
         try:
             parsed_url = urlparse(request_url)
+            host = parsed_url.hostname
             if parsed_url.hostname:
                 _set_http_host_client(
                     trace_config_ctx.metric_attributes,
@@ -544,9 +550,18 @@ def create_trace_config(
             )
         )
 
-        trace_config_ctx.span = trace_config_ctx.tracer.start_span(
-            request_span_name, kind=SpanKind.CLIENT, attributes=span_attributes
-        )
+        if span_budget is not None:
+            trace_config_ctx.suppressed_call = span_budget.acquire(
+                host, method
+            )
+        if trace_config_ctx.suppressed_call is not None:
+            trace_config_ctx.span = trace_config_ctx.suppressed_call.span
+        else:
+            trace_config_ctx.span = trace_config_ctx.tracer.start_span(
+                request_span_name,
+                kind=SpanKind.CLIENT,
+                attributes=span_attributes,
+            )
 
         if callable(request_hook):
             request_hook(trace_config_ctx.span, params)
@@ -617,6 +632,7 @@ def create_trace_config(
         return types.SimpleNamespace(
             tracer=tracer,
             span=None,
+            suppressed_call=None,
             token=None,
             duration_histogram_old=duration_histogram_old,
             duration_histogram_new=duration_histogram_new,
@@ -68,6 +68,9 @@ from opentelemetry.semconv.attributes.url_attributes import URL_FULL
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import Span, StatusCode
 from opentelemetry.util._importlib_metadata import entry_points
+from opentelemetry.util.http.span_budget import (
+    OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET,
+)
 
 
 def run_with_test_server(
@@ -1628,6 +1631,29 @@ class TestAioHttpClientInstrumentor(TestBase):
         self._assert_spans(0)
         self._assert_metrics(0)
 
+    @mock.patch.dict(
+        os.environ, {OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET: "2"}
+    )
+    def test_outbound_span_budget(self):
+        tracer = self.tracer_provider.get_tracer(__name__)
+
+        async def make_requests(server: aiohttp.test_utils.TestServer):
+            async with aiohttp.test_utils.TestClient(server) as session:
+                with tracer.start_as_current_span("parent"):
+                    for _ in range(5):
+                        await session.get(self.URL)
+
+        run_with_test_server(make_requests, self.URL, self.default_handler)
+        spans = self._assert_spans(3)
+        parent = spans[-1]
+        self.assertEqual(parent.name, "parent")
+        self.assertEqual(
+            parent.attributes["http.client.suppressed.count"], (3,)
+        )
+        # durations are still recorded for every request
+        metrics = self._assert_metrics(1)
+        self.assertEqual(metrics[0].data.data_points[0].count, 5)
+
 
 class TestLoadingAioHttpInstrumentor(unittest.TestCase):
     def test_loading_instrumentor(self):
@@ -209,6 +209,7 @@ from opentelemetry.util.http import (
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE,
     SanitizeValue,
     _parse_url_query,
+    create_metric_attribute_limiter,
     get_custom_headers,
     get_excluded_urls,
     normalise_request_header_name,
@@ -223,6 +224,8 @@ meter_old = None
 meter_new = None
 duration_histogram_old = None
 duration_histogram_new = None
+duration_attrs_limiter_old = None
+duration_attrs_limiter_new = None
 active_requests_counter = None
 _excluded_urls = None
 _sem_conv_opt_in_mode = _StabilityMode.DEFAULT
@@ -517,6 +520,10 @@ def create_aiohttp_middleware(
                     duration_attrs_old = _parse_duration_attrs(
                         request_attrs, _StabilityMode.DEFAULT
                     )
+                    if duration_attrs_limiter_old:
+                        duration_attrs_limiter_old.limit_attributes(
+                            duration_attrs_old
+                        )
                     duration_histogram_old.record(
                         max(round(duration_s * 1000), 0), duration_attrs_old
                     )
@@ -524,6 +531,10 @@ def create_aiohttp_middleware(
                     duration_attrs_new = _parse_duration_attrs(
                         request_attrs, _StabilityMode.HTTP
                     )
+                    if duration_attrs_limiter_new:
+                        duration_attrs_limiter_new.limit_attributes(
+                            duration_attrs_new
+                        )
                     duration_histogram_new.record(
                         max(duration_s, 0), duration_attrs_new
                     )
@@ -585,6 +596,8 @@ class AioHttpServerInstrumentor(BaseInstrumentor):
         global meter_new  # pylint: disable=global-statement
         global duration_histogram_old  # pylint: disable=global-statement
         global duration_histogram_new  # pylint: disable=global-statement
+        global duration_attrs_limiter_old  # pylint: disable=global-statement
+        global duration_attrs_limiter_new  # pylint: disable=global-statement
         global active_requests_counter  # pylint: disable=global-statement
 
         if _report_old(sem_conv_opt_in_mode):
@@ -598,6 +611,9 @@ class AioHttpServerInstrumentor(BaseInstrumentor):
                 unit="ms",
                 description="Measures the duration of inbound HTTP requests.",
             )
+            duration_attrs_limiter_old = create_metric_attribute_limiter(
+                meter_old, MetricInstruments.HTTP_SERVER_DURATION
+            )
 
         if _report_new(sem_conv_opt_in_mode):
             meter_new = metrics.get_meter(
@@ -611,6 +627,9 @@ class AioHttpServerInstrumentor(BaseInstrumentor):
                 description="Duration of HTTP server requests.",
                 explicit_bucket_boundaries_advisory=HTTP_DURATION_HISTOGRAM_BUCKETS_NEW,
             )
+            duration_attrs_limiter_new = create_metric_attribute_limiter(
+                meter_new, HTTP_SERVER_REQUEST_DURATION
+            )
 
         meter_for_counter = meter_new or meter_old
         active_requests_counter = meter_for_counter.create_up_down_counter(
@@ -102,6 +102,10 @@ class AiopgInstrumentor(BaseInstrumentor):
         """
 
         tracer_provider = kwargs.get("tracer_provider")
+        meter_provider = kwargs.get("meter_provider")
+        enable_metrics = kwargs.get("enable_metrics", False)
+        metrics_fingerprint_limit = kwargs.get("metrics_fingerprint_limit", 0)
+        repeated_query_threshold = kwargs.get("repeated_query_threshold", 0)
 
         wrappers.wrap_connect(
             __name__,
@@ -109,6 +113,10 @@ class AiopgInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
         )
 
         wrappers.wrap_create_pool(
@@ -117,6 +125,10 @@ class AiopgInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
         )
 
     # pylint:disable=no-self-use
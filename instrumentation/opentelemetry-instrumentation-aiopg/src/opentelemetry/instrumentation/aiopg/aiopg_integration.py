@@ -104,6 +104,7 @@ class AsyncCursorTracer(CursorTracer):
         *args: typing.Tuple[typing.Any, typing.Any],
         **kwargs: typing.Dict[typing.Any, typing.Any],
     ):
+        operation_timer = self._time_operation(cursor, args)
         name = ""
         if args:
             name = self.get_operation_name(cursor, args)
@@ -119,7 +120,10 @@ class AsyncCursorTracer(CursorTracer):
             name, kind=SpanKind.CLIENT
         ) as span:
             self._populate_span(span, cursor, *args)
-            return await query_method(*args, **kwargs)
+            if span.is_recording():
+                self._set_batch_size(span, query_method, args)
+            with operation_timer:
+                return await query_method(*args, **kwargs)
 
 
 def get_traced_cursor_proxy(cursor, db_api_integration, *args, **kwargs):
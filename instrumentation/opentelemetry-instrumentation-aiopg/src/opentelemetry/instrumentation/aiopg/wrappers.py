@@ -45,6 +45,7 @@ from opentelemetry.instrumentation.aiopg.aiopg_integration import (
 )
 from opentelemetry.instrumentation.aiopg.version import __version__
 from opentelemetry.instrumentation.utils import unwrap
+from opentelemetry.metrics import MeterProvider
 from opentelemetry.trace import TracerProvider
 
 logger = logging.getLogger(__name__)
@@ -82,6 +83,10 @@ def wrap_connect(
     connection_attributes: typing.Dict = None,
     version: str = "",
     tracer_provider: typing.Optional[TracerProvider] = None,
+    meter_provider: typing.Optional[MeterProvider] = None,
+    enable_metrics: bool = False,
+    metrics_fingerprint_limit: int = 0,
+    repeated_query_threshold: int = 0,
 ):
     """Integrate with aiopg library.
     https://github.com/aio-libs/aiopg
@@ -95,6 +100,14 @@ def wrap_connect(
         version: Version of opentelemetry extension for aiopg.
         tracer_provider: The :class:`opentelemetry.trace.TracerProvider` to
             use. If omitted the current configured one is used.
+        meter_provider: The :class:`opentelemetry.metrics.MeterProvider` to
+            use. If omitted the current configured one is used.
+        enable_metrics: Flag to enable/disable the db.client.operation.duration metric.
+        metrics_fingerprint_limit: Number of distinct statement fingerprints
+            that get their own db.query.fingerprint_id metric attribute.
+        repeated_query_threshold: Number of consecutive executions of a
+            statement under the same parent span traced as usual before
+            further ones are folded in an aggregate span, 0 to disable.
     """
 
     # pylint: disable=unused-argument
@@ -110,6 +123,10 @@ def wrap_connect(
             connection_attributes=connection_attributes,
             version=version,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
         )
         return _ContextManager(  # pylint: disable=no-value-for-parameter
             db_integration.wrapped_connection(wrapped, args, kwargs)
@@ -190,6 +207,10 @@ def wrap_create_pool(
     connection_attributes: typing.Dict = None,
     version: str = "",
     tracer_provider: typing.Optional[TracerProvider] = None,
+    meter_provider: typing.Optional[MeterProvider] = None,
+    enable_metrics: bool = False,
+    metrics_fingerprint_limit: int = 0,
+    repeated_query_threshold: int = 0,
 ):
     # pylint: disable=unused-argument
     def wrap_create_pool_(
@@ -204,6 +225,10 @@ def wrap_create_pool(
             connection_attributes=connection_attributes,
             version=version,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
         )
         return _PoolContextManager(
             db_integration.wrapped_pool(wrapped, args, kwargs)
@@ -282,11 +282,11 @@ from opentelemetry.util.http import (
     ExcludeList,
     SanitizeValue,
     _parse_url_query,
-    detect_synthetic_user_agent,
+    classify_user_agent,
+    create_metric_attribute_limiter,
     get_custom_headers,
     normalise_request_header_name,
     normalise_response_header_name,
-    normalize_user_agent,
     parse_excluded_urls,
     redact_url,
     sanitize_method,
@@ -403,15 +403,15 @@ def collect_request_attributes(
             result[HTTP_SERVER_NAME] = ",".join(http_host_value_list)
     http_user_agent = asgi_getter.get(scope, "user-agent")
     if http_user_agent:
-        user_agent_raw = http_user_agent[0]
-        user_agent_value = normalize_user_agent(user_agent_raw)
+        user_agent_value, synthetic_type = classify_user_agent(
+            http_user_agent[0]
+        )
         if user_agent_value:
             _set_http_user_agent(
                 result, user_agent_value, sem_conv_opt_in_mode
             )
 
         # Check for synthetic user agent type
-        synthetic_type = detect_synthetic_user_agent(user_agent_value)
         if synthetic_type:
             result[USER_AGENT_SYNTHETIC_TYPE] = synthetic_type
 
@@ -642,6 +642,12 @@ class OpenTelemetryMiddleware:
                 unit="s",
                 explicit_bucket_boundaries_advisory=HTTP_DURATION_HISTOGRAM_BUCKETS_NEW,
             )
+        self._duration_attrs_limiter_old = create_metric_attribute_limiter(
+            self.meter, MetricInstruments.HTTP_SERVER_DURATION
+        )
+        self._duration_attrs_limiter_new = create_metric_attribute_limiter(
+            self.meter, HTTP_SERVER_REQUEST_DURATION
+        )
         self.server_response_size_histogram = None
         if _report_old(sem_conv_opt_in_mode):
             self.server_response_size_histogram = self.meter.create_histogram(
@@ -827,9 +833,15 @@ class OpenTelemetryMiddleware:
                 )
                 if target:
                     duration_attrs_old[HTTP_TARGET] = target
+                self._duration_attrs_limiter_old.limit_attributes(
+                    duration_attrs_old
+                )
                 duration_attrs_new = _parse_duration_attrs(
                     attributes, _StabilityMode.HTTP
                 )
+                self._duration_attrs_limiter_new.limit_attributes(
+                    duration_attrs_new
+                )
                 span_ctx = set_span_in_context(span)
                 if self.duration_histogram_old:
                     self.duration_histogram_old.record(
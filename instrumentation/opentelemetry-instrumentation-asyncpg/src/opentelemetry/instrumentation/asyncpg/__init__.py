@@ -45,11 +45,27 @@ Run instrumented code:
 
     asyncio.run(main())
 
+Connection pool metrics
+-----------------------
+
+The connection pools created by ``asyncpg.create_pool`` report the
+``db.client.connection.count``, ``db.client.connection.max``,
+``db.client.connection.wait_time``, ``db.client.connection.timeouts`` and
+``db.client.connection.create_time`` metrics through the ``MeterProvider``
+passed to ``instrument()``, or the global one. Pools are named after the
+address and database of their connections, ``localhost:5432/database`` for
+instance. The connection counts are reported for the asyncpg versions whose
+pools provide ``get_size()``, ``get_idle_size()``, ``get_max_size()`` and
+``is_closing()``.
+
 API
 ---
 """
 
-import re
+from __future__ import annotations
+
+import asyncio
+from timeit import default_timer
 from typing import Collection
 
 import asyncpg
@@ -58,8 +74,19 @@ import wrapt
 from opentelemetry import trace
 from opentelemetry.instrumentation.asyncpg.package import _instruments
 from opentelemetry.instrumentation.asyncpg.version import __version__
+from opentelemetry.instrumentation.connection_pool_metrics import (
+    _ConnectionPoolMetrics,
+    _PoolUsage,
+)
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _get_sql_operation_name,
+)
+from opentelemetry.instrumentation.sql_parameters import (
+    _render_sql_parameters,
+)
 from opentelemetry.instrumentation.utils import unwrap
+from opentelemetry.metrics import get_meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_NAME,
     DB_STATEMENT,
@@ -107,14 +134,45 @@ def _hydrate_span_from_args(connection, query, parameters) -> dict:
         span_attributes[DB_STATEMENT] = query
 
     if parameters is not None and len(parameters) > 0:
-        span_attributes["db.statement.parameters"] = str(parameters)
+        span_attributes["db.statement.parameters"] = _render_sql_parameters(
+            parameters
+        )
 
     return span_attributes
 
 
+def _get_pool_name(connection) -> str:
+    """Names a pool after the address and database of its connections."""
+    addr = getattr(connection, "_addr", None)
+    if isinstance(addr, tuple):
+        name = f"{addr[0]}:{addr[1]}"
+    else:
+        name = str(addr or "")
+    dbname = getattr(getattr(connection, "_params", None), "database", None)
+    if dbname:
+        name = f"{name}/{dbname}"
+    return name
+
+
+# The methods reading the usage of the pools of recent asyncpg versions
+_POOL_USAGE_METHODS = (
+    "get_size",
+    "get_idle_size",
+    "get_max_size",
+    "is_closing",
+)
+
+
+def _get_pool_usage(pool) -> _PoolUsage | None:
+    if pool.is_closing():
+        return None
+    idle = pool.get_idle_size()
+    return _PoolUsage(idle, pool.get_size() - idle, pool.get_max_size())
+
+
 class AsyncPGInstrumentor(BaseInstrumentor):
-    _leading_comment_remover = re.compile(r"^/\*.*?\*/")
     _tracer = None
+    _pool_metrics = None
 
     def __init__(self, capture_parameters=False):
         super().__init__()
@@ -131,6 +189,21 @@ class AsyncPGInstrumentor(BaseInstrumentor):
             tracer_provider,
             schema_url="https://opentelemetry.io/schemas/1.11.0",
         )
+        meter = get_meter(
+            __name__,
+            __version__,
+            kwargs.get("meter_provider"),
+            schema_url="https://opentelemetry.io/schemas/1.11.0",
+        )
+        self._pool_metrics = _ConnectionPoolMetrics(
+            meter,
+            _get_pool_usage
+            if all(
+                hasattr(asyncpg.pool.Pool, method)
+                for method in _POOL_USAGE_METHODS
+            )
+            else None,
+        )
 
         for method in [
             "Connection.execute",
@@ -153,6 +226,19 @@ class AsyncPGInstrumentor(BaseInstrumentor):
                 "asyncpg.cursor", method, self._do_cursor_execute
             )
 
+        wrapt.wrap_function_wrapper(
+            "asyncpg.pool", "Pool._acquire", self._do_pool_acquire
+        )
+        wrapt.wrap_function_wrapper(
+            "asyncpg.pool", "Pool._get_new_connection", self._do_pool_connect
+        )
+        wrapt.wrap_function_wrapper(
+            "asyncpg.pool", "Pool.close", self._do_pool_close
+        )
+        wrapt.wrap_function_wrapper(
+            "asyncpg.pool", "Pool.terminate", self._do_pool_terminate
+        )
+
     def _uninstrument(self, **__):
         for cls, methods in [
             (
@@ -161,10 +247,47 @@ class AsyncPGInstrumentor(BaseInstrumentor):
             ),
             (asyncpg.cursor.Cursor, ("forward", "fetch", "fetchrow")),
             (asyncpg.cursor.CursorIterator, ("__anext__",)),
+            (
+                asyncpg.pool.Pool,
+                ("_acquire", "_get_new_connection", "close", "terminate"),
+            ),
         ]:
             for method_name in methods:
                 unwrap(cls, method_name)
 
+    async def _do_pool_acquire(self, func, instance, args, kwargs):
+        """Records the time spent waiting for a connection of the pool."""
+        start = default_timer()
+        try:
+            connection = await func(*args, **kwargs)
+        except asyncio.TimeoutError:
+            self._pool_metrics.record_timeout(instance)
+            raise
+        self._pool_metrics.record_wait_time(
+            instance, max(default_timer() - start, 0)
+        )
+        return connection
+
+    async def _do_pool_connect(self, func, instance, args, kwargs):
+        """Records the time spent creating a connection of the pool."""
+        start = default_timer()
+        connection = await func(*args, **kwargs)
+        self._pool_metrics.register(instance, _get_pool_name(connection))
+        self._pool_metrics.record_create_time(
+            instance, max(default_timer() - start, 0)
+        )
+        return connection
+
+    async def _do_pool_close(self, func, instance, args, kwargs):
+        # asyncpg pools cannot be weakly referenced, they are unregistered
+        # when closed
+        self._pool_metrics.unregister(instance)
+        return await func(*args, **kwargs)
+
+    def _do_pool_terminate(self, func, instance, args, kwargs):
+        self._pool_metrics.unregister(instance)
+        return func(*args, **kwargs)
+
     async def _do_execute(self, func, instance, args, kwargs):
         exception = None
         params = getattr(instance, "_params", None)
@@ -172,11 +295,7 @@ class AsyncPGInstrumentor(BaseInstrumentor):
             args[0] if args[0] else getattr(params, "database", "postgresql")
         )
 
-        try:
-            # Strip leading comments so we get the operation name.
-            name = self._leading_comment_remover.sub("", name).split()[0]
-        except IndexError:
-            name = ""
+        name = _get_sql_operation_name(name)
 
         # Hydrate attributes before span creation to enable filtering
         span_attributes = _hydrate_span_from_args(
@@ -209,11 +328,7 @@ class AsyncPGInstrumentor(BaseInstrumentor):
             else getattr(params, "database", "postgresql")
         )
 
-        try:
-            # Strip leading comments so we get the operation name.
-            name = self._leading_comment_remover.sub("", name).split()[0]
-        except IndexError:
-            name = ""
+        name = _get_sql_operation_name(name)
 
         # Hydrate attributes before span creation to enable filtering
         span_attributes = _hydrate_span_from_args(
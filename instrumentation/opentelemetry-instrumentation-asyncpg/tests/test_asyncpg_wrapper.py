@@ -2,7 +2,7 @@ import asyncio
 from unittest import mock
 
 import pytest
-from asyncpg import Connection, Record, cursor
+from asyncpg import Connection, Record, create_pool, cursor
 from wrapt import ObjectProxy
 
 from opentelemetry import trace as trace_api
@@ -10,6 +10,38 @@ from opentelemetry.instrumentation.asyncpg import AsyncPGInstrumentor
 from opentelemetry.test.test_base import TestBase
 
 
+class _PoolConnection(Connection):
+    """A connection of a pool that never reaches a server."""
+
+    def __del__(self):
+        pass
+
+    def is_closed(self):
+        return False
+
+    def terminate(self):
+        pass
+
+    def _on_release(self, stacklevel=1):
+        pass
+
+    def _set_proxy(self, proxy):
+        pass
+
+    async def reset(self, *, timeout=None):
+        pass
+
+
+async def _pool_connect(*args, **kwargs):
+    conn = Connection.__new__(_PoolConnection)
+    conn._addr = ("localhost", 5432)
+    conn._params = mock.Mock(database="database")
+    conn._protocol = mock.Mock(
+        queries_count=0, **{"_is_cancelling.return_value": False}
+    )
+    return conn
+
+
 class TestAsyncPGInstrumentation(TestBase):
     def test_duplicated_instrumentation_can_be_uninstrumented(self):
         AsyncPGInstrumentor().instrument()
@@ -139,3 +171,78 @@ class TestAsyncPGInstrumentation(TestBase):
 
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
+
+    def test_pool_metrics(self):
+        AsyncPGInstrumentor().uninstrument()
+        AsyncPGInstrumentor().instrument(meter_provider=self.meter_provider)
+        pool_name = {
+            "db.client.connection.pool.name": "localhost:5432/database"
+        }
+
+        async def use_pool():
+            pool = await create_pool(
+                connect=_pool_connect,
+                connection_class=_PoolConnection,
+                min_size=1,
+                max_size=1,
+            )
+            async with pool.acquire():
+                with pytest.raises(asyncio.TimeoutError):
+                    await pool.acquire(timeout=0.01)
+                metrics = {
+                    metric.name: metric.data.data_points
+                    for metric in self.get_sorted_metrics()
+                }
+            pool.terminate()
+            return metrics
+
+        metrics = asyncio.run(use_pool())
+        AsyncPGInstrumentor().uninstrument()
+
+        self.assertEqual(
+            {
+                point.attributes["db.client.connection.state"]: point.value
+                for point in metrics["db.client.connection.count"]
+            },
+            {"idle": 0, "used": 1},
+        )
+        (max_point,) = metrics["db.client.connection.max"]
+        self.assertEqual(max_point.attributes, pool_name)
+        self.assertEqual(max_point.value, 1)
+        (timeouts_point,) = metrics["db.client.connection.timeouts"]
+        self.assertEqual(timeouts_point.attributes, pool_name)
+        self.assertEqual(timeouts_point.value, 1)
+        for name in (
+            "db.client.connection.wait_time",
+            "db.client.connection.create_time",
+        ):
+            (point,) = metrics[name]
+            self.assertEqual(point.attributes, pool_name)
+            self.assertEqual(point.count, 1)
+
+        # closed pools are no longer reported
+        self.assertNotIn(
+            "db.client.connection.count",
+            [metric.name for metric in self.get_sorted_metrics()],
+        )
+
+    def test_closed_pools_are_released(self):
+        AsyncPGInstrumentor().uninstrument()
+        AsyncPGInstrumentor().instrument(meter_provider=self.meter_provider)
+        # pylint: disable=protected-access
+        pools = AsyncPGInstrumentor()._pool_metrics._unreferenceable_pools
+
+        async def use_pool():
+            pool = await create_pool(
+                connect=_pool_connect,
+                connection_class=_PoolConnection,
+                min_size=1,
+                max_size=1,
+            )
+            self.assertIn(pool, pools)
+            pool.terminate()
+
+        asyncio.run(use_pool())
+        AsyncPGInstrumentor().uninstrument()
+
+        self.assertEqual(pools, {})
@@ -33,11 +33,29 @@ Usage
     session = cluster.connect()
     rows = session.execute("SELECT * FROM test")
 
+Metrics
+-------
+
+The callbacks of the ``ResponseFuture`` returned by ``Session.execute_async``
+record the following metrics for each page requested, with the address of the
+coordinator of the request as ``server.address``:
+
+- ``db.client.operation.duration``: the duration of the request of a page.
+- ``db.cassandra.retries``: the number of requests retried by the retry policy.
+- ``db.cassandra.speculative_executions``: the number of requests started by
+  the speculative execution plan.
+- ``db.cassandra.pages``: the number of pages of rows fetched.
+- ``db.cassandra.page.rows``: the number of rows of the pages fetched.
+
+At most 128 coordinators are reported separately, the other ones are reported
+as ``_OTHER``. A custom meter provider can be passed as ``meter_provider``.
+
 API
 ---
 """
 
 from importlib.metadata import PackageNotFoundError, distribution
+from timeit import default_timer
 from typing import Collection
 
 import cassandra.cluster
@@ -49,9 +67,13 @@ from opentelemetry.instrumentation.cassandra.package import (
     _instruments_cassandra_driver,
     _instruments_scylla_driver,
 )
+from opentelemetry.instrumentation.cassandra.request_metrics import (
+    _RequestMetrics,
+)
 from opentelemetry.instrumentation.cassandra.version import __version__
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.utils import unwrap
+from opentelemetry.metrics import get_meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_NAME,
     DB_STATEMENT,
@@ -62,10 +84,13 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
 )
 
 
-def _instrument(tracer_provider, include_db_statement=False):
+def _instrument(
+    tracer_provider, include_db_statement=False, meter_provider=None
+):
     """Instruments the cassandra-driver/scylla-driver module
 
-    Wraps cassandra.cluster.Session.execute_async().
+    Wraps cassandra.cluster.Session.execute_async() and
+    cassandra.cluster.ResponseFuture.start_fetching_next_page().
     """
     tracer = trace.get_tracer(
         __name__,
@@ -73,6 +98,13 @@ def _instrument(tracer_provider, include_db_statement=False):
         tracer_provider,
         schema_url="https://opentelemetry.io/schemas/1.11.0",
     )
+    meter = get_meter(
+        __name__,
+        __version__,
+        meter_provider,
+        schema_url="https://opentelemetry.io/schemas/1.11.0",
+    )
+    metrics = _RequestMetrics(meter)
     name = "Cassandra"
 
     def _traced_execute_async(func, instance, args, kwargs):
@@ -91,12 +123,20 @@ def _instrument(tracer_provider, include_db_statement=False):
                     query = args[0]
                     span.set_attribute(DB_STATEMENT, str(query))
 
+            start = default_timer()
             response = func(*args, **kwargs)
+            if isinstance(response, cassandra.cluster.ResponseFuture):
+                metrics.track(response, instance.keyspace, start)
             return response
 
     wrap_function_wrapper(
         "cassandra.cluster", "Session.execute_async", _traced_execute_async
     )
+    wrap_function_wrapper(
+        "cassandra.cluster",
+        "ResponseFuture.start_fetching_next_page",
+        _RequestMetrics.traced_start_fetching_next_page,
+    )
 
 
 class CassandraInstrumentor(BaseInstrumentor):
@@ -122,7 +162,9 @@ class CassandraInstrumentor(BaseInstrumentor):
         _instrument(
             tracer_provider=kwargs.get("tracer_provider"),
             include_db_statement=kwargs.get("include_db_statement"),
+            meter_provider=kwargs.get("meter_provider"),
         )
 
     def _uninstrument(self, **kwargs):
         unwrap(cassandra.cluster.Session, "execute_async")
+        unwrap(cassandra.cluster.ResponseFuture, "start_fetching_next_page")
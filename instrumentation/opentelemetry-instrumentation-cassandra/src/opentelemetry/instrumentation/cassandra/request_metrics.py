@@ -0,0 +1,205 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Metrics of the requests sent by the cassandra driver, recorded from the
+callbacks of the ``ResponseFuture`` returned by ``Session.execute_async``.
+"""
+
+from __future__ import annotations
+
+from timeit import default_timer
+from typing import Any
+
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
+from opentelemetry.metrics import Meter
+from opentelemetry.semconv._incubating.attributes.db_attributes import (
+    DbSystemNameValues,
+)
+from opentelemetry.semconv._incubating.metrics.db_metrics import (
+    DB_CLIENT_OPERATION_DURATION,
+)
+from opentelemetry.semconv.attributes.db_attributes import (
+    DB_NAMESPACE,
+    DB_SYSTEM_NAME,
+)
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+from opentelemetry.semconv.attributes.server_attributes import (
+    SERVER_ADDRESS,
+    SERVER_PORT,
+)
+
+DB_CASSANDRA_RETRIES = "db.cassandra.retries"
+DB_CASSANDRA_SPECULATIVE_EXECUTIONS = "db.cassandra.speculative_executions"
+DB_CASSANDRA_PAGES = "db.cassandra.pages"
+DB_CASSANDRA_PAGE_ROWS = "db.cassandra.page.rows"
+
+_PAGE_ROWS_BUCKETS = (0, 1, 10, 100, 500, 1000, 5000, 10000, 50000)
+
+# Bound of the coordinators reported separately, the others are reported
+# as _OTHER
+_MAX_HOSTS = 128
+_OTHER_HOST = "_OTHER"
+
+# Attribute of the ResponseFuture holding its _RequestTracker
+_TRACKER_ATTR = "_otel_request_tracker"
+
+
+class _RequestTracker:
+    """Tracks the attempts of the request of a page of a ``ResponseFuture``.
+
+    The callbacks of a ``ResponseFuture`` are called for each page, the
+    attempts of a page are the hosts appended to ``attempted_hosts`` and the
+    retries counted by ``_query_retries`` since the request of the page.
+    """
+
+    __slots__ = ("_metrics", "_keyspace", "_start", "_hosts", "_retries")
+
+    def __init__(
+        self, metrics: _RequestMetrics, keyspace: str | None, start: float
+    ):
+        self._metrics = metrics
+        self._keyspace = keyspace
+        self._start = start
+        self._hosts = 0
+        self._retries = 0
+
+    def start_page(self, future: Any) -> None:
+        self._start = default_timer()
+        self._hosts = len(future.attempted_hosts)
+        self._retries = future._query_retries
+
+    def on_result(self, result: Any, future: Any) -> None:
+        self._record(future, result, None)
+
+    def on_error(self, exc: BaseException, future: Any) -> None:
+        self._record(future, None, type(exc).__qualname__)
+
+    def _record(
+        self, future: Any, result: Any, error_type: str | None
+    ) -> None:
+        duration_s = default_timer() - self._start
+        attempts = len(future.attempted_hosts) - self._hosts
+        retries = future._query_retries - self._retries
+        host = future.coordinator_host or future._current_host
+        self._metrics.record(
+            self._keyspace,
+            host,
+            duration_s,
+            error_type,
+            retries=retries,
+            # every attempt which is neither the first one nor a retry was
+            # started by the speculative execution plan
+            speculative_executions=max(attempts - 1 - retries, 0),
+            rows=result,
+        )
+
+
+class _RequestMetrics:
+    """Records the metrics of the requests sent to the coordinators."""
+
+    def __init__(self, meter: Meter):
+        self._host_attributes: dict[Any, dict[str, Any]] = {}
+        self._duration = meter.create_histogram(
+            name=DB_CLIENT_OPERATION_DURATION,
+            unit="s",
+            description="Duration of database client operations.",
+            explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+        )
+        self._retries = meter.create_counter(
+            name=DB_CASSANDRA_RETRIES,
+            unit="{retry}",
+            description="The number of requests retried by the retry policy.",
+        )
+        self._speculative_executions = meter.create_counter(
+            name=DB_CASSANDRA_SPECULATIVE_EXECUTIONS,
+            unit="{execution}",
+            description="The number of requests started by the speculative execution plan.",
+        )
+        self._pages = meter.create_counter(
+            name=DB_CASSANDRA_PAGES,
+            unit="{page}",
+            description="The number of pages of rows fetched.",
+        )
+        self._page_rows = meter.create_histogram(
+            name=DB_CASSANDRA_PAGE_ROWS,
+            unit="{row}",
+            description="The number of rows of the pages fetched.",
+            explicit_bucket_boundaries_advisory=_PAGE_ROWS_BUCKETS,
+        )
+
+    def _get_host_attributes(
+        self, keyspace: str | None, host: Any
+    ) -> dict[str, Any]:
+        key = (keyspace, getattr(host, "endpoint", None))
+        attributes = self._host_attributes.get(key)
+        if attributes is None:
+            attributes = {DB_SYSTEM_NAME: DbSystemNameValues.CASSANDRA.value}
+            if keyspace:
+                attributes[DB_NAMESPACE] = keyspace
+            if host is None:
+                return attributes
+            if len(self._host_attributes) >= _MAX_HOSTS:
+                attributes[SERVER_ADDRESS] = _OTHER_HOST
+                return attributes
+            endpoint = host.endpoint
+            attributes[SERVER_ADDRESS] = endpoint.address
+            attributes[SERVER_PORT] = endpoint.port
+            self._host_attributes[key] = attributes
+        return attributes
+
+    def track(self, future: Any, keyspace: str | None, start: float) -> None:
+        """Attaches a ``_RequestTracker`` to the callbacks of ``future``."""
+        tracker = _RequestTracker(self, keyspace, start)
+        setattr(future, _TRACKER_ATTR, tracker)
+        future.add_callbacks(
+            tracker.on_result,
+            tracker.on_error,
+            callback_args=(future,),
+            errback_args=(future,),
+        )
+
+    def record(
+        self,
+        keyspace: str | None,
+        host: Any,
+        duration_s: float,
+        error_type: str | None,
+        retries: int = 0,
+        speculative_executions: int = 0,
+        rows: Any = None,
+    ) -> None:
+        attributes = self._get_host_attributes(keyspace, host)
+        if retries:
+            self._retries.add(retries, attributes)
+        if speculative_executions:
+            self._speculative_executions.add(
+                speculative_executions, attributes
+            )
+        # the results of the queries which do not return rows are not lists
+        if isinstance(rows, list):
+            self._pages.add(1, attributes)
+            self._page_rows.record(len(rows), attributes)
+        if error_type is not None:
+            attributes = {**attributes, ERROR_TYPE: error_type}
+        self._duration.record(duration_s, attributes)
+
+    @staticmethod
+    def traced_start_fetching_next_page(func, instance, args, kwargs):
+        """Wraps ``ResponseFuture.start_fetching_next_page``."""
+        tracker = getattr(instance, _TRACKER_ATTR, None)
+        if tracker is not None:
+            tracker.start_page(instance)
+        return func(*args, **kwargs)
@@ -17,6 +17,9 @@ from unittest import TestCase, mock
 from unittest.mock import call, patch
 
 import cassandra.cluster
+from cassandra.connection import DefaultEndPoint
+from cassandra.policies import SimpleConvictionPolicy
+from cassandra.pool import Host
 from wrapt import BoundFunctionWrapper
 
 import opentelemetry.instrumentation.cassandra
@@ -26,6 +29,9 @@ from opentelemetry.instrumentation.cassandra.package import (
     _instruments_cassandra_driver,
     _instruments_scylla_driver,
 )
+from opentelemetry.instrumentation.cassandra.request_metrics import (
+    _MAX_HOSTS,
+)
 from opentelemetry.sdk import resources
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import SpanKind
@@ -145,6 +151,162 @@ class TestCassandraIntegration(TestBase):
         self.assertEqual(len(spans_list), 0)
 
 
+def _host(address):
+    return Host(DefaultEndPoint(address, 9042), SimpleConvictionPolicy)
+
+
+@mock.patch("cassandra.cluster.ResponseFuture.send_request")
+class TestCassandraRequestMetrics(TestBase):
+    def setUp(self):
+        super().setUp()
+        CassandraInstrumentor().instrument()
+        with mock.patch("cassandra.cluster.Session.__init__") as init:
+            init.return_value = None
+            self.session = cassandra.cluster.Session(
+                cluster=mock.Mock(), hosts=[]
+            )
+        self.session.cluster = mock.Mock(contact_points=["127.0.0.1"])
+        self.session.keyspace = "test"
+        self.session._request_init_callbacks = []
+
+    def tearDown(self):
+        super().tearDown()
+        with self.disable_logging():
+            CassandraInstrumentor().uninstrument()
+
+    def execute_async(self):
+        load_balancer = mock.Mock()
+        load_balancer.make_query_plan.return_value = []
+        future = cassandra.cluster.ResponseFuture(
+            self.session,
+            mock.Mock(),
+            "SELECT * FROM test",
+            None,
+            load_balancer=load_balancer,
+        )
+        with mock.patch.object(
+            self.session, "_create_response_future", return_value=future
+        ):
+            return self.session.execute_async("SELECT * FROM test")
+
+    @staticmethod
+    def attempt(future, host):
+        # what ResponseFuture._query does for each host the request is sent to
+        future._current_host = host
+        future.attempted_hosts.append(host)
+
+    @staticmethod
+    def complete(future, host, rows):
+        future.coordinator_host = host
+        future._set_final_result(rows)
+
+    def get_data_points(self, name):
+        for metric in self.get_sorted_metrics():
+            if metric.name == name:
+                return metric.data.data_points
+        return []
+
+    def test_duration_by_coordinator(self, _send_request):
+        host_1, host_2 = _host("10.0.0.1"), _host("10.0.0.2")
+        for host in (host_1, host_2, host_2):
+            future = self.execute_async()
+            self.attempt(future, host)
+            self.complete(future, host, [])
+
+        data_points = self.get_data_points("db.client.operation.duration")
+        counts = {
+            point.attributes["server.address"]: point.count
+            for point in data_points
+        }
+        self.assertEqual(counts, {"10.0.0.1": 1, "10.0.0.2": 2})
+        self.assertEqual(
+            dict(data_points[0].attributes),
+            {
+                "db.system.name": "cassandra",
+                "db.namespace": "test",
+                "server.address": data_points[0].attributes["server.address"],
+                "server.port": 9042,
+            },
+        )
+
+    def test_error(self, _send_request):
+        host = _host("10.0.0.1")
+        future = self.execute_async()
+        self.attempt(future, host)
+        future._set_final_exception(
+            cassandra.OperationTimedOut("timed out", host)
+        )
+
+        (data_point,) = self.get_data_points("db.client.operation.duration")
+        self.assertEqual(
+            data_point.attributes["error.type"], "OperationTimedOut"
+        )
+        self.assertEqual(data_point.attributes["server.address"], "10.0.0.1")
+
+    def test_retries_and_speculative_executions(self, _send_request):
+        host_1, host_2, host_3 = (
+            _host("10.0.0.1"),
+            _host("10.0.0.2"),
+            _host("10.0.0.3"),
+        )
+        future = self.execute_async()
+        self.attempt(future, host_1)
+        # retry on the next host
+        future._query_retries += 1
+        self.attempt(future, host_2)
+        # speculative execution
+        self.attempt(future, host_3)
+        self.complete(future, host_3, [])
+
+        (retries,) = self.get_data_points("db.cassandra.retries")
+        self.assertEqual(retries.value, 1)
+        self.assertEqual(retries.attributes["server.address"], "10.0.0.3")
+        (speculative,) = self.get_data_points(
+            "db.cassandra.speculative_executions"
+        )
+        self.assertEqual(speculative.value, 1)
+
+    def test_paging(self, _send_request):
+        host = _host("10.0.0.1")
+        future = self.execute_async()
+        self.attempt(future, host)
+        future._paging_state = b"page-2"
+        self.complete(future, host, [1] * 100)
+
+        future.start_fetching_next_page()
+        self.attempt(future, host)
+        future._paging_state = None
+        self.complete(future, host, [1] * 20)
+
+        (pages,) = self.get_data_points("db.cassandra.pages")
+        self.assertEqual(pages.value, 2)
+        (rows,) = self.get_data_points("db.cassandra.page.rows")
+        self.assertEqual(rows.count, 2)
+        self.assertEqual(rows.sum, 120)
+        (duration,) = self.get_data_points("db.client.operation.duration")
+        self.assertEqual(duration.count, 2)
+        # the next page was attempted on a single host, without retries
+        self.assertEqual(
+            self.get_data_points("db.cassandra.speculative_executions"), []
+        )
+
+    def test_coordinators_bounded(self, _send_request):
+        for index in range(_MAX_HOSTS + 2):
+            host = _host(f"10.0.{index // 256}.{index % 256}")
+            future = self.execute_async()
+            self.attempt(future, host)
+            self.complete(future, host, [])
+
+        data_points = self.get_data_points("db.client.operation.duration")
+        self.assertEqual(len(data_points), _MAX_HOSTS + 1)
+        (other,) = [
+            point
+            for point in data_points
+            if point.attributes["server.address"] == "_OTHER"
+        ]
+        self.assertEqual(other.count, 2)
+
+
 class TestCassandraInstrumentationDependencies(TestCase):
     """Tests to verify that the correct package is returned by
     instrumentation_dependencies() depending on which driver is installed.
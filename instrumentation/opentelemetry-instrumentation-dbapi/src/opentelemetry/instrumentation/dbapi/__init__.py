@@ -136,6 +136,87 @@ The following sqlcomment key-values can be opted out of through ``commenter_opti
 | ``opentelemetry_values``  | OpenTelemetry context as traceparent at time of query.    | ``traceparent='00-03afa25236b8cd948fa853d67038ac79-405ff022e8247c46-01'`` |
 +---------------------------+-----------------------------------------------------------+---------------------------------------------------------------------------+
 
+Prepared statement friendly sqlcommenter
+****************************************
+By default the ``traceparent`` makes the text of every commented statement
+unique, which defeats driver side prepared statement caches, such as psycopg
+``prepare_threshold`` or the statement cache of mysql-connector prepared
+cursors, and server side statement statistics. With the
+``prepared_statement_friendly`` commenter option, only tags that do not change
+between executions are added to statements, and the commented statement is
+cached. The ``traceparent`` is only added to statements executed in sampled
+spans, unless ``opentelemetry_values`` is disabled.
+
+.. code:: python
+
+    import psycopg
+
+    from opentelemetry.instrumentation.dbapi import wrap_connect
+
+
+    wrap_connect(
+        __name__,
+        psycopg,
+        "connect",
+        "postgresql",
+        enable_commenter=True,
+        commenter_options={"prepared_statement_friendly": True},
+    )
+
+Operation duration metric
+*************************
+With ``enable_metrics``, the duration of every ``execute``, ``executemany``
+and ``callproc`` call is recorded in the ``db.client.operation.duration``
+histogram, whether the span of the call is sampled or not. The histogram
+attributes are ``db.system.name``, ``db.namespace``, ``db.operation.name`` and
+``error.type``. With ``metrics_fingerprint_limit``, the first
+``metrics_fingerprint_limit`` distinct statement fingerprints (statements
+without their literals and bind parameters) of each instrumented connection
+also get a ``db.query.fingerprint_id`` attribute, later ones all share the
+``other`` id.
+Statements longer than 16 KiB are not fingerprinted and get the ``other`` id.
+
+.. code:: python
+
+    import psycopg
+
+    from opentelemetry.instrumentation.dbapi import wrap_connect
+
+
+    wrap_connect(
+        __name__,
+        psycopg,
+        "connect",
+        "postgresql",
+        enable_metrics=True,
+        metrics_fingerprint_limit=100,
+    )
+
+The spans of ``executemany`` calls get the number of parameter sets of the
+batch in the ``db.operation.batch.size`` attribute.
+
+Repeated queries
+****************
+Statements executed over and over under the same parent span, such as the
+N+1 queries of ORMs loading related objects one by one, can be folded in a
+single span. With ``repeated_query_threshold`` set to ``N``, the first ``N``
+consecutive executions of a statement, with literals and bind parameters
+left out, get their own span. Further executions are folded in one
+aggregate span with their count, error count and total and max duration in
+the ``db.client.repeated.*`` attributes and ``db.client.n_plus_one`` set.
+The aggregate span ends when another statement is executed under the parent
+span, or right before the parent span ends. The runs are tracked per
+instrumented connection, and only under parent spans whose end can be
+observed, such as the SDK spans. Each occurrence is also counted
+in the ``db.client.n_plus_one`` metric, with ``db.system.name`` and the
+``http.route`` of the parent span if it has one.
+
+.. code:: python
+
+    from opentelemetry.instrumentation.psycopg2 import Psycopg2Instrumentor
+
+    Psycopg2Instrumentor().instrument(repeated_query_threshold=5)
+
 SQLComment in span attribute
 ****************************
 If sqlcommenter is enabled, you can opt into the inclusion of sqlcomment in
@@ -168,24 +249,47 @@ API
 
 from __future__ import annotations
 
+import contextlib
 import functools
 import logging
-import re
+from timeit import default_timer
 from typing import Any, Awaitable, Callable, Generic, TypeVar
 
 import wrapt
 from wrapt import wrap_function_wrapper
 
 from opentelemetry import trace as trace_api
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
+from opentelemetry.instrumentation.dbapi.repeated_queries import (
+    FoldedExecution,
+    RepeatedQueries,
+)
 from opentelemetry.instrumentation.dbapi.version import __version__
-from opentelemetry.instrumentation.sqlcommenter_utils import _add_sql_comment
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _OTHER_FINGERPRINT_ID,
+    _fingerprint_sql,
+    _get_sql_operation_name,
+    _SqlFingerprintIds,
+)
+from opentelemetry.instrumentation.sql_parameters import (
+    _render_sql_parameters,
+)
+from opentelemetry.instrumentation.sqlcommenter_utils import (
+    _add_sql_comment_with_static,
+    _add_static_sql_comment,
+    _StaticSqlComment,
+)
 from opentelemetry.instrumentation.utils import (
     _get_opentelemetry_values,
     is_instrumentation_enabled,
     unwrap,
 )
+from opentelemetry.metrics import Counter, Histogram, MeterProvider, get_meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_NAME,
+    DB_OPERATION_BATCH_SIZE,
     DB_STATEMENT,
     DB_SYSTEM,
     DB_USER,
@@ -194,6 +298,16 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_PEER_NAME,
     NET_PEER_PORT,
 )
+from opentelemetry.semconv._incubating.metrics.db_metrics import (
+    DB_CLIENT_OPERATION_DURATION,
+)
+from opentelemetry.semconv.attributes.db_attributes import (
+    DB_NAMESPACE,
+    DB_OPERATION_NAME,
+    DB_SYSTEM_NAME,
+)
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+from opentelemetry.semconv.attributes.http_attributes import HTTP_ROUTE
 from opentelemetry.trace import SpanKind, TracerProvider, get_tracer
 from opentelemetry.util._importlib_metadata import version as util_version
 
@@ -201,6 +315,9 @@ _DB_DRIVER_ALIASES = {
     "MySQLdb": "mysqlclient",
 }
 
+_DB_QUERY_FINGERPRINT_ID = "db.query.fingerprint_id"
+_DB_CLIENT_N_PLUS_ONE = "db.client.n_plus_one"
+
 _logger = logging.getLogger(__name__)
 
 ConnectionT = TypeVar("ConnectionT")
@@ -218,6 +335,10 @@ def trace_integration(
     db_api_integration_factory: type[DatabaseApiIntegration] | None = None,
     enable_attribute_commenter: bool = False,
     commenter_options: dict[str, Any] | None = None,
+    meter_provider: MeterProvider | None = None,
+    enable_metrics: bool = False,
+    metrics_fingerprint_limit: int = 0,
+    repeated_query_threshold: int = 0,
 ):
     """Integrate with DB API library.
     https://www.python.org/dev/peps/pep-0249/
@@ -237,6 +358,15 @@ def trace_integration(
             default one is used.
         enable_attribute_commenter: Flag to enable/disable sqlcomment inclusion in `db.statement` span attribute. Only available if enable_commenter=True.
         commenter_options: Configurations for tags to be appended at the sql query.
+        meter_provider: The :class:`opentelemetry.metrics.MeterProvider` to
+            use. If omitted the current configured one is used.
+        enable_metrics: Flag to enable/disable the db.client.operation.duration metric.
+        metrics_fingerprint_limit: Number of distinct statement fingerprints
+            that get their own db.query.fingerprint_id metric attribute, 0 to
+            disable the attribute.
+        repeated_query_threshold: Number of consecutive executions of a
+            statement under the same parent span traced as usual before
+            further ones are folded in an aggregate span, 0 to disable.
     """
     wrap_connect(
         __name__,
@@ -251,6 +381,10 @@ def trace_integration(
         db_api_integration_factory=db_api_integration_factory,
         enable_attribute_commenter=enable_attribute_commenter,
         commenter_options=commenter_options,
+        meter_provider=meter_provider,
+        enable_metrics=enable_metrics,
+        metrics_fingerprint_limit=metrics_fingerprint_limit,
+        repeated_query_threshold=repeated_query_threshold,
     )
 
 
@@ -267,6 +401,10 @@ def wrap_connect(
     db_api_integration_factory: type[DatabaseApiIntegration] | None = None,
     commenter_options: dict[str, Any] | None = None,
     enable_attribute_commenter: bool = False,
+    meter_provider: MeterProvider | None = None,
+    enable_metrics: bool = False,
+    metrics_fingerprint_limit: int = 0,
+    repeated_query_threshold: int = 0,
 ):
     """Integrate with DB API library.
     https://www.python.org/dev/peps/pep-0249/
@@ -286,6 +424,15 @@ def wrap_connect(
             default one is used.
         commenter_options: Configurations for tags to be appended at the sql query.
         enable_attribute_commenter: Flag to enable/disable sqlcomment inclusion in `db.statement` span attribute. Only available if enable_commenter=True.
+        meter_provider: The :class:`opentelemetry.metrics.MeterProvider` to
+            use. If omitted the current configured one is used.
+        enable_metrics: Flag to enable/disable the db.client.operation.duration metric.
+        metrics_fingerprint_limit: Number of distinct statement fingerprints
+            that get their own db.query.fingerprint_id metric attribute, 0 to
+            disable the attribute.
+        repeated_query_threshold: Number of consecutive executions of a
+            statement under the same parent span traced as usual before
+            further ones are folded in an aggregate span, 0 to disable.
 
     """
     db_api_integration_factory = (
@@ -310,6 +457,10 @@ def wrap_connect(
             commenter_options=commenter_options,
             connect_module=connect_module,
             enable_attribute_commenter=enable_attribute_commenter,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
         )
         return db_integration.wrapped_connection(wrapped, args, kwargs)
 
@@ -347,6 +498,10 @@ def instrument_connection(
     connect_module: Callable[..., Any] | None = None,
     enable_attribute_commenter: bool = False,
     db_api_integration_factory: type[DatabaseApiIntegration] | None = None,
+    meter_provider: MeterProvider | None = None,
+    enable_metrics: bool = False,
+    metrics_fingerprint_limit: int = 0,
+    repeated_query_threshold: int = 0,
 ) -> TracedConnectionProxy[ConnectionT]:
     """Enable instrumentation in a database connection.
 
@@ -368,6 +523,15 @@ def instrument_connection(
             replacement for :class:`DatabaseApiIntegration`. Can be used to
             obtain connection attributes from the connect method instead of
             from the connection itself (as done by the pymssql intrumentor).
+        meter_provider: The :class:`opentelemetry.metrics.MeterProvider` to
+            use. If omitted the current configured one is used.
+        enable_metrics: Flag to enable/disable the db.client.operation.duration metric.
+        metrics_fingerprint_limit: Number of distinct statement fingerprints
+            that get their own db.query.fingerprint_id metric attribute, 0 to
+            disable the attribute.
+        repeated_query_threshold: Number of consecutive executions of a
+            statement under the same parent span traced as usual before
+            further ones are folded in an aggregate span, 0 to disable.
 
     Returns:
         An instrumented connection.
@@ -391,6 +555,10 @@ def instrument_connection(
         commenter_options=commenter_options,
         connect_module=connect_module,
         enable_attribute_commenter=enable_attribute_commenter,
+        meter_provider=meter_provider,
+        enable_metrics=enable_metrics,
+        metrics_fingerprint_limit=metrics_fingerprint_limit,
+        repeated_query_threshold=repeated_query_threshold,
     )
     db_integration.get_connection_attributes(connection)
     return get_traced_connection_proxy(connection, db_integration)
@@ -427,6 +595,10 @@ class DatabaseApiIntegration:
         commenter_options: dict[str, Any] | None = None,
         connect_module: Callable[..., Any] | None = None,
         enable_attribute_commenter: bool = False,
+        meter_provider: MeterProvider | None = None,
+        enable_metrics: bool = False,
+        metrics_fingerprint_limit: int = 0,
+        repeated_query_threshold: int = 0,
     ):
         if connection_attributes is None:
             self.connection_attributes = {
@@ -445,6 +617,40 @@ class DatabaseApiIntegration:
             tracer_provider=tracer_provider,
             schema_url="https://opentelemetry.io/schemas/1.11.0",
         )
+        self.repeated_query_threshold = repeated_query_threshold
+        meter = None
+        if enable_metrics or self.repeated_query_threshold:
+            meter = get_meter(
+                self._name,
+                self._version,
+                meter_provider,
+                schema_url="https://opentelemetry.io/schemas/1.11.0",
+            )
+        self._operation_duration: Histogram | None = None
+        if enable_metrics:
+            self._operation_duration = meter.create_histogram(
+                name=DB_CLIENT_OPERATION_DURATION,
+                unit="s",
+                description="Duration of database client operations.",
+                explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+            )
+        self.metrics_fingerprint_limit = metrics_fingerprint_limit
+        self._fingerprint_ids: _SqlFingerprintIds | None = None
+        if metrics_fingerprint_limit > 0:
+            self._fingerprint_ids = _SqlFingerprintIds(
+                metrics_fingerprint_limit
+            )
+        self._n_plus_one: Counter | None = None
+        self._repeated_queries: RepeatedQueries | None = None
+        if self.repeated_query_threshold:
+            self._repeated_queries = RepeatedQueries(
+                self.repeated_query_threshold
+            )
+            self._n_plus_one = meter.create_counter(
+                name=_DB_CLIENT_N_PLUS_ONE,
+                unit="{occurrence}",
+                description="Number of statements executed more than the repeated query threshold in a row under the same parent span.",
+            )
         self.capture_parameters = capture_parameters
         self.enable_commenter = enable_commenter
         self.commenter_options = commenter_options
@@ -456,6 +662,22 @@ class DatabaseApiIntegration:
         self.database = ""
         self.connect_module = connect_module
         self.commenter_data = self.calculate_commenter_data()
+        self._static_sql_comment: _StaticSqlComment | None = None
+
+    def _get_static_sql_comment(self) -> _StaticSqlComment:
+        """Returns the sqlcomment tags of ``commenter_data`` allowed by
+        ``commenter_options``, computed once until ``commenter_data`` changes.
+        """
+        if self._static_sql_comment is None:
+            commenter_options = self.commenter_options or {}
+            self._static_sql_comment = _StaticSqlComment(
+                **{
+                    key: value
+                    for key, value in self.commenter_data.items()
+                    if commenter_options.get(key, True)
+                }
+            )
+        return self._static_sql_comment
 
     def _get_db_version(self, db_driver: str) -> str:
         if db_driver in _DB_DRIVER_ALIASES:
@@ -607,6 +829,30 @@ def get_traced_connection_proxy(
     return TracedConnectionProxy(connection, db_api_integration)
 
 
+class _OperationTimer:
+    """Records the duration of a database operation in a histogram"""
+
+    __slots__ = ("_histogram", "_attributes", "_start")
+
+    def __init__(self, histogram: Histogram, attributes: dict[str, Any]):
+        self._histogram = histogram
+        self._attributes = attributes
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = max(default_timer() - self._start, 0)
+        if exc_type is not None:
+            self._attributes[ERROR_TYPE] = exc_type.__qualname__
+        self._histogram.record(duration, self._attributes)
+
+
+_NO_OPERATION_TIMER = contextlib.nullcontext()
+
+
 class CursorTracer(Generic[CursorT]):
     def __init__(self, db_api_integration: DatabaseApiIntegration) -> None:
         self._db_api_integration = db_api_integration
@@ -619,8 +865,10 @@ class CursorTracer(Generic[CursorT]):
         self._enable_attribute_commenter = (
             self._db_api_integration.enable_attribute_commenter
         )
+        self._prepared_statement_friendly = self._commenter_options.get(
+            "prepared_statement_friendly", False
+        )
         self._connect_module = self._db_api_integration.connect_module
-        self._leading_comment_remover = re.compile(r"^/\*.*?\*/")
 
     def _capture_mysql_version(self, cursor) -> None:
         """Lazy capture of mysql-connector client version using cursor, if applicable"""
@@ -649,30 +897,45 @@ class CursorTracer(Generic[CursorT]):
             self._db_api_integration.commenter_data["mysql_client_version"] = (
                 client_version
             )
+            self._db_api_integration._static_sql_comment = None
 
-    def _get_commenter_data(self) -> dict:
-        """Uses DB-API integration to return commenter data for sqlcomment"""
-        commenter_data = dict(self._db_api_integration.commenter_data)
-        if self._commenter_options.get("opentelemetry_values", True):
-            commenter_data.update(**_get_opentelemetry_values())
+    def _get_opentelemetry_commenter_data(self) -> dict:
+        """Returns the sqlcomment tags of the current OpenTelemetry context"""
+        if not self._commenter_options.get("opentelemetry_values", True):
+            return {}
         return {
             k: v
-            for k, v in commenter_data.items()
+            for k, v in _get_opentelemetry_values().items()
             if self._commenter_options.get(k, True)
         }
 
-    def _update_args_with_added_sql_comment(self, args, cursor) -> tuple:
+    def _update_args_with_added_sql_comment(
+        self, args, cursor, span: trace_api.Span | None = None
+    ) -> tuple:
         """Updates args with cursor info and adds sqlcomment to query statement"""
         try:
             args_list = list(args)
             self._capture_mysql_version(cursor)
-            commenter_data = self._get_commenter_data()
             # Convert sql statement to string, handling  psycopg2.sql.Composable object
             if hasattr(args_list[0], "as_string"):
                 args_list[0] = args_list[0].as_string(cursor.connection)
 
             args_list[0] = str(args_list[0])
-            statement = _add_sql_comment(args_list[0], **commenter_data)
+            static_comment = self._db_api_integration._get_static_sql_comment()
+            if self._prepared_statement_friendly and not (
+                span is not None
+                and span.get_span_context().trace_flags.sampled
+            ):
+                # only static tags, for the statement text to stay the same
+                statement = _add_static_sql_comment(
+                    args_list[0], static_comment
+                )
+            else:
+                statement = _add_sql_comment_with_static(
+                    args_list[0],
+                    static_comment,
+                    **self._get_opentelemetry_commenter_data(),
+                )
             args_list[0] = statement
             args = tuple(args_list)
         except Exception as exc:  # pylint: disable=broad-except
@@ -701,14 +964,110 @@ class CursorTracer(Generic[CursorT]):
             span.set_attribute(attribute_key, attribute_value)
 
         if self._db_api_integration.capture_parameters and len(args) > 1:
-            span.set_attribute("db.statement.parameters", str(args[1]))
+            span.set_attribute(
+                "db.statement.parameters", _render_sql_parameters(args[1])
+            )
+
+    @staticmethod
+    def _set_batch_size(
+        span: trace_api.Span,
+        query_method: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        if getattr(query_method, "__name__", None) != "executemany":
+            return
+        try:
+            batch_size = len(args[1])
+        except (IndexError, TypeError):
+            # parameters given as an iterator or as a keyword argument
+            return
+        span.set_attribute(DB_OPERATION_BATCH_SIZE, batch_size)
+
+    def _time_operation(
+        self, cursor: CursorT, args: tuple[Any, ...]
+    ) -> contextlib.AbstractContextManager:
+        """Returns a context manager recording the duration of the operation
+        executing ``args``, if the operation duration metric is enabled.
+        """
+        histogram = self._db_api_integration._operation_duration
+        if histogram is None:
+            return _NO_OPERATION_TIMER
+        attributes = {DB_SYSTEM_NAME: self._db_api_integration.database_system}
+        if self._db_api_integration.database:
+            attributes[DB_NAMESPACE] = self._db_api_integration.database
+        statement = self.get_statement(cursor, args)
+        if statement and isinstance(statement, str):
+            operation = _get_sql_operation_name(statement)
+            if operation:
+                attributes[DB_OPERATION_NAME] = operation.upper()
+            fingerprint_ids = self._db_api_integration._fingerprint_ids
+            if fingerprint_ids is not None:
+                fingerprint = _fingerprint_sql(statement)
+                attributes[_DB_QUERY_FINGERPRINT_ID] = (
+                    fingerprint_ids.get(fingerprint.fingerprint)
+                    if fingerprint is not None
+                    else _OTHER_FINGERPRINT_ID
+                )
+        return _OperationTimer(histogram, attributes)
+
+    def _get_span_name(self, cursor: CursorT, args: tuple[Any, ...]) -> str:
+        name = self.get_operation_name(cursor, args)
+        if not name:
+            name = (
+                self._db_api_integration.database
+                if self._db_api_integration.database
+                else self._db_api_integration.name
+            )
+        return name
+
+    def _fold_repeated_query(
+        self, cursor: CursorT, args: tuple[Any, ...]
+    ) -> FoldedExecution | None:
+        """Returns the ``FoldedExecution`` to run the execution of ``args``
+        in, if the statement was repeated over the threshold under the
+        current span.
+        """
+        repeated_queries = self._db_api_integration._repeated_queries
+        if repeated_queries is None:
+            return None
+        statement = self.get_statement(cursor, args)
+        if not statement or not isinstance(statement, str):
+            return None
+        fingerprint = _fingerprint_sql(statement)
+        if fingerprint is None:
+            return None
+        fingerprint = fingerprint.fingerprint
+
+        def describe():
+            attributes = {
+                DB_SYSTEM: self._db_api_integration.database_system,
+                DB_SYSTEM_NAME: self._db_api_integration.database_system,
+                DB_NAME: self._db_api_integration.database,
+                DB_STATEMENT: fingerprint,
+                **self._db_api_integration.span_attributes,
+            }
+            return (
+                self._db_api_integration._tracer,
+                self._get_span_name(cursor, args),
+                attributes,
+            )
+
+        folded = repeated_queries.acquire(fingerprint, describe)
+        if folded is not None and folded.n_plus_one:
+            attributes = {
+                DB_SYSTEM_NAME: self._db_api_integration.database_system
+            }
+            route = getattr(folded.parent, "attributes", {}).get(HTTP_ROUTE)
+            if route:
+                attributes[HTTP_ROUTE] = route
+            self._db_api_integration._n_plus_one.add(1, attributes)
+        return folded
 
     def get_operation_name(
         self, cursor: CursorT, args: tuple[Any, ...]
     ) -> str:  # pylint: disable=no-self-use
         if args and isinstance(args[0], str):
-            # Strip leading comments so we get the operation name.
-            return self._leading_comment_remover.sub("", args[0]).split()[0]
+            return _get_sql_operation_name(args[0])
         return ""
 
     def get_statement(self, cursor: CursorT, args: tuple[Any, ...]):  # pylint: disable=no-self-use
@@ -729,14 +1088,16 @@ class CursorTracer(Generic[CursorT]):
         if not is_instrumentation_enabled():
             return query_method(*args, **kwargs)
 
-        name = self.get_operation_name(cursor, args)
-        if not name:
-            name = (
-                self._db_api_integration.database
-                if self._db_api_integration.database
-                else self._db_api_integration.name
-            )
+        # before the sqlcomment, which is unique to each execution, is added
+        operation_timer = self._time_operation(cursor, args)
+        folded = self._fold_repeated_query(cursor, args)
+        if folded is not None:
+            if args and self._commenter_enabled:
+                args = self._update_args_with_added_sql_comment(args, cursor)
+            with folded, operation_timer:
+                return query_method(*args, **kwargs)
 
+        name = self._get_span_name(cursor, args)
         with self._db_api_integration._tracer.start_as_current_span(
             name, kind=SpanKind.CLIENT
         ) as span:
@@ -745,7 +1106,7 @@ class CursorTracer(Generic[CursorT]):
                     if self._enable_attribute_commenter:
                         # sqlcomment is added to executed query and db.statement span attribute
                         args = self._update_args_with_added_sql_comment(
-                            args, cursor
+                            args, cursor, span
                         )
                         self._populate_span(span, cursor, *args)
                     else:
@@ -753,12 +1114,21 @@ class CursorTracer(Generic[CursorT]):
                         # so db.statement is set before add_sql_comment
                         self._populate_span(span, cursor, *args)
                         args = self._update_args_with_added_sql_comment(
-                            args, cursor
+                            args, cursor, span
                         )
                 else:
                     # no sqlcomment anywhere
                     self._populate_span(span, cursor, *args)
-            return query_method(*args, **kwargs)
+                self._set_batch_size(span, query_method, args)
+            elif (
+                args
+                and self._commenter_enabled
+                and self._prepared_statement_friendly
+            ):
+                # keep the same statement text as for recorded executions
+                args = self._update_args_with_added_sql_comment(args, cursor)
+            with operation_timer:
+                return query_method(*args, **kwargs)
 
     async def traced_execution_async(
         self,
@@ -767,14 +1137,16 @@ class CursorTracer(Generic[CursorT]):
         *args: tuple[Any, ...],
         **kwargs: dict[Any, Any],
     ):
-        name = self.get_operation_name(cursor, args)
-        if not name:
-            name = (
-                self._db_api_integration.database
-                if self._db_api_integration.database
-                else self._db_api_integration.name
-            )
-
+        # before the sqlcomment, which is unique to each execution, is added
+        operation_timer = self._time_operation(cursor, args)
+        folded = self._fold_repeated_query(cursor, args)
+        if folded is not None:
+            if args and self._commenter_enabled:
+                args = self._update_args_with_added_sql_comment(args, cursor)
+            with folded, operation_timer:
+                return await query_method(*args, **kwargs)
+
+        name = self._get_span_name(cursor, args)
         with self._db_api_integration._tracer.start_as_current_span(
             name, kind=SpanKind.CLIENT
         ) as span:
@@ -783,7 +1155,7 @@ class CursorTracer(Generic[CursorT]):
                     if self._enable_attribute_commenter:
                         # sqlcomment is added to executed query and db.statement span attribute
                         args = self._update_args_with_added_sql_comment(
-                            args, cursor
+                            args, cursor, span
                         )
                         self._populate_span(span, cursor, *args)
                     else:
@@ -791,12 +1163,21 @@ class CursorTracer(Generic[CursorT]):
                         # so db.statement is set before add_sql_comment
                         self._populate_span(span, cursor, *args)
                         args = self._update_args_with_added_sql_comment(
-                            args, cursor
+                            args, cursor, span
                         )
                 else:
                     # no sqlcomment anywhere
                     self._populate_span(span, cursor, *args)
-            return await query_method(*args, **kwargs)
+                self._set_batch_size(span, query_method, args)
+            elif (
+                args
+                and self._commenter_enabled
+                and self._prepared_statement_friendly
+            ):
+                # keep the same statement text as for recorded executions
+                args = self._update_args_with_added_sql_comment(args, cursor)
+            with operation_timer:
+                return await query_method(*args, **kwargs)
 
 
 # pylint: disable=abstract-method
@@ -0,0 +1,223 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Folding of statements repeated under the same parent span.
+
+ORM code loading related objects one by one (the N+1 queries problem)
+executes the same statement, with different parameters, hundreds of times
+while handling a single request. With a ``repeated_query_threshold`` of
+``N``, the first ``N`` consecutive executions of a statement fingerprint
+under the same parent span are traced as usual. Further executions get no
+span of their own, they are folded in a single aggregate span with the
+``db.client.repeated.*`` attributes and the ``db.client.n_plus_one`` flag.
+
+The aggregate span is ended when another statement is executed under the
+parent span, or right before the parent span ends. The end of the parent
+span is observed with ``opentelemetry.instrumentation.utils.call_before_span_end``,
+statements executed under parent spans whose end cannot be observed that
+way are never folded.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from time import time_ns
+from timeit import default_timer
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from opentelemetry.instrumentation.utils import call_before_span_end
+from opentelemetry.trace import (
+    Span,
+    SpanKind,
+    Tracer,
+    get_current_span,
+    set_span_in_context,
+)
+
+_REPEATED_COUNT = "db.client.repeated.count"
+_REPEATED_ERROR_COUNT = "db.client.repeated.error_count"
+_REPEATED_DURATION_SUM = "db.client.repeated.duration_sum"
+_REPEATED_DURATION_MAX = "db.client.repeated.duration_max"
+_N_PLUS_ONE = "db.client.n_plus_one"
+
+# Describes the aggregate span of a run: tracer, span name and attributes
+SpanDescription = tuple[Tracer, str, dict[str, Any]]
+
+
+class _Run:
+    """Consecutive executions of a statement fingerprint under a parent."""
+
+    __slots__ = (
+        "fingerprint",
+        "hooked",
+        "count",
+        "description",
+        "folded",
+        "errors",
+        "start_time",
+        "end_time",
+        "duration_sum",
+        "duration_max",
+    )
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        # whether the end of the parent span is hooked to emit its last run
+        self.hooked = False
+        self.count = 1
+        self.description: SpanDescription | None = None
+        self.folded = 0
+        self.errors = 0
+        self.start_time = 0
+        self.end_time = 0
+        self.duration_sum = 0.0
+        self.duration_max = 0.0
+
+    def emit(self, parent: Span) -> None:
+        tracer, name, attributes = self.description
+        span = tracer.start_span(
+            name,
+            context=set_span_in_context(parent),
+            kind=SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=self.start_time,
+        )
+        span.set_attributes(
+            {
+                _REPEATED_COUNT: self.folded,
+                _REPEATED_ERROR_COUNT: self.errors,
+                _REPEATED_DURATION_SUM: self.duration_sum,
+                _REPEATED_DURATION_MAX: self.duration_max,
+                _N_PLUS_ONE: True,
+            }
+        )
+        span.end(end_time=self.end_time)
+
+
+class FoldedExecution:
+    """An execution folded in the aggregate span of its run.
+
+    Used as a context manager around the execution to record its duration.
+    ``n_plus_one`` is true for the first folded execution of a run.
+    """
+
+    __slots__ = ("_queries", "_run", "parent", "n_plus_one", "_start")
+
+    def __init__(
+        self,
+        queries: RepeatedQueries,
+        run: _Run,
+        parent: Span,
+        n_plus_one: bool,
+    ):
+        self._queries = queries
+        self._run = run
+        self.parent = parent
+        self.n_plus_one = n_plus_one
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration_s = max(default_timer() - self._start, 0)
+        # pylint: disable=protected-access
+        self._queries._record(self._run, duration_s, exc_type is not None)
+
+
+class RepeatedQueries:
+    """Tracks the runs of repeated statements under each parent span.
+
+    Args:
+        threshold: Number of consecutive executions of a statement traced as
+            usual under the same parent span before further ones are folded.
+    """
+
+    def __init__(self, threshold: int):
+        self._threshold = threshold
+        # Keyed by parent span so the bookkeeping goes away with it.
+        self._runs: WeakKeyDictionary[Span, _Run] = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def acquire(
+        self,
+        fingerprint: str,
+        describe: Callable[[], SpanDescription],
+    ) -> FoldedExecution | None:
+        """Accounts for an execution of ``fingerprint`` under the current span.
+
+        Args:
+            fingerprint: Fingerprint of the executed statement.
+            describe: Returns the tracer, name and attributes of the
+                aggregate span, called once per run over the threshold.
+
+        Returns:
+            ``None`` if the execution should be traced as usual, otherwise
+            the ``FoldedExecution`` to run the execution in.
+        """
+        parent = get_current_span()
+        if not parent.is_recording():
+            return None
+        over = None
+        with self._lock:
+            try:
+                run = self._runs.get(parent)
+            except TypeError:  # span types that cannot be weakly referenced
+                return None
+            if run is None or run.fingerprint != fingerprint:
+                # the run of the previous statement, if any, is over
+                self._runs[parent] = new_run = _Run(fingerprint)
+                if run is not None:
+                    new_run.hooked = run.hooked
+                    if run.folded:
+                        over = run
+                folded = None
+            else:
+                run.count += 1
+                folded = run if run.count > self._threshold else None
+            if folded is not None and not folded.hooked:
+                folded.hooked = call_before_span_end(
+                    parent, lambda: self._end_parent(parent)
+                )
+                if not folded.hooked:
+                    folded = None
+            n_plus_one = folded is not None and folded.description is None
+            if n_plus_one:
+                folded.description = describe()
+        if over is not None:
+            over.emit(parent)
+        if folded is None:
+            return None
+        return FoldedExecution(self, folded, parent, n_plus_one)
+
+    def _end_parent(self, parent: Span) -> None:
+        """Emits the last run of ``parent`` before it ends."""
+        with self._lock:
+            run = self._runs.pop(parent, None)
+        if run is not None and run.folded:
+            run.emit(parent)
+
+    def _record(self, run: _Run, duration_s: float, failed: bool) -> None:
+        end_time = time_ns()
+        with self._lock:
+            if run.folded == 0:
+                run.start_time = end_time - int(duration_s * 1e9)
+            run.folded += 1
+            run.errors += failed
+            run.end_time = end_time
+            run.duration_sum += duration_s
+            run.duration_max = max(run.duration_max, duration_s)
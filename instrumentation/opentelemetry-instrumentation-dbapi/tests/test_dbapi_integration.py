@@ -20,12 +20,17 @@ from unittest import mock
 
 from opentelemetry import context
 from opentelemetry import trace as trace_api
-from opentelemetry.instrumentation import dbapi
+from opentelemetry.instrumentation import dbapi, sql_fingerprint
 from opentelemetry.instrumentation.utils import suppress_instrumentation
 from opentelemetry.sdk import resources
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ParentBased
 from opentelemetry.semconv._incubating.attributes import net_attributes
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_NAME,
+    DB_NAMESPACE,
+    DB_OPERATION_BATCH_SIZE,
+    DB_OPERATION_NAME,
     DB_STATEMENT,
     DB_SYSTEM,
     DB_USER,
@@ -34,6 +39,8 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_PEER_NAME,
     NET_PEER_PORT,
 )
+from opentelemetry.semconv.attributes.db_attributes import DB_SYSTEM_NAME
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
 from opentelemetry.test.test_base import TestBase
 
 
@@ -306,6 +313,235 @@ class TestDBApiIntegration(TestBase):
         span = spans_list[0]
         self.assertEqual(span.attributes[DB_STATEMENT], "Test query")
 
+    def test_executemany_capture_of_large_batch_parameters(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name",
+            "testcomponent",
+            capture_parameters=True,
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        cursor.executemany(
+            "Test query", [(index, "x" * 100) for index in range(10000)]
+        )
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 1)
+        parameters = spans_list[0].attributes["db.statement.parameters"]
+        self.assertTrue(parameters.startswith("[(0, 'xxx"))
+        self.assertTrue(parameters.endswith("..."))
+        self.assertLess(len(parameters), 10000)
+
+    def test_executemany_batch_size(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name", "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        cursor.executemany("Test query", [(1,), (2,), (3,)])
+        cursor.executemany("Test query", iter([(1,), (2,)]))
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 2)
+        self.assertEqual(spans_list[0].attributes[DB_OPERATION_BATCH_SIZE], 3)
+        self.assertNotIn(DB_OPERATION_BATCH_SIZE, spans_list[1].attributes)
+
+    def test_operation_duration_metric(self):
+        # durations are recorded for executions that are not sampled too
+        tracer_provider = TracerProvider(sampler=ALWAYS_OFF)
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name",
+            "testcomponent",
+            tracer_provider=tracer_provider,
+            meter_provider=self.meter_provider,
+            enable_metrics=True,
+            metrics_fingerprint_limit=1,
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {"database": "testdatabase"}
+        )
+        cursor = mock_connection.cursor()
+        cursor.execute("SELECT * FROM users WHERE id = 1")
+        cursor.execute("SELECT * FROM users WHERE id = 2")
+        cursor.executemany("INSERT INTO users VALUES (%s)", [(1,), (2,)])
+        with self.assertRaises(Exception):
+            cursor.execute("SELECT 1", throw_exception=True)
+
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 0)
+        metrics = self.get_sorted_metrics()
+        self.assertEqual(len(metrics), 1)
+        self.assertEqual(metrics[0].name, "db.client.operation.duration")
+        self.assertEqual(metrics[0].unit, "s")
+        data_points = {
+            (
+                point.attributes[DB_OPERATION_NAME],
+                point.attributes["db.query.fingerprint_id"],
+                point.attributes.get(ERROR_TYPE),
+            ): point
+            for point in metrics[0].data.data_points
+        }
+        select_id = sql_fingerprint._get_sql_fingerprint_id(
+            "SELECT * FROM users WHERE id = ?"
+        )
+        self.assertEqual(
+            set(data_points),
+            {
+                ("SELECT", select_id, None),
+                ("INSERT", "other", None),
+                ("SELECT", "other", "Exception"),
+            },
+        )
+        self.assertEqual(data_points["SELECT", select_id, None].count, 2)
+        for point in data_points.values():
+            self.assertEqual(point.attributes[DB_SYSTEM_NAME], "testcomponent")
+            self.assertEqual(point.attributes[DB_NAMESPACE], "testdatabase")
+
+    def test_operation_duration_metric_disabled(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name",
+            "testcomponent",
+            meter_provider=self.meter_provider,
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        cursor.execute("Test query")
+        self.assertEqual(self.get_sorted_metrics(), [])
+
+    def test_repeated_queries_folded(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name",
+            "testcomponent",
+            meter_provider=self.meter_provider,
+            repeated_query_threshold=2,
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {"database": "testdatabase"}
+        )
+        cursor = mock_connection.cursor()
+        with self.tracer.start_as_current_span(
+            "GET /users", attributes={"http.route": "/users"}
+        ):
+            for user_id in range(5):
+                cursor.execute(
+                    f"SELECT * FROM orders WHERE user_id = {user_id}"
+                )
+            cursor.execute("SELECT * FROM users")
+
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            [span.name for span in spans],
+            ["SELECT", "SELECT", "SELECT", "SELECT", "GET /users"],
+        )
+        parent = spans[-1]
+        aggregate = spans[2]
+        self.assertEqual(aggregate.parent, parent.context)
+        self.assertEqual(
+            aggregate.attributes[DB_STATEMENT],
+            "SELECT * FROM orders WHERE user_id = ?",
+        )
+        self.assertEqual(aggregate.attributes[DB_NAME], "testdatabase")
+        self.assertEqual(aggregate.attributes[DB_SYSTEM_NAME], "testcomponent")
+        self.assertEqual(aggregate.attributes["db.client.repeated.count"], 3)
+        self.assertEqual(
+            aggregate.attributes["db.client.repeated.error_count"], 0
+        )
+        self.assertGreaterEqual(
+            aggregate.attributes["db.client.repeated.duration_sum"],
+            aggregate.attributes["db.client.repeated.duration_max"],
+        )
+        self.assertTrue(aggregate.attributes["db.client.n_plus_one"])
+        self.assertLessEqual(spans[1].end_time, aggregate.start_time)
+        self.assertLessEqual(aggregate.end_time, spans[3].start_time)
+        for span in (spans[0], spans[1], spans[3]):
+            self.assertNotIn("db.client.n_plus_one", span.attributes)
+
+        metrics = self.get_sorted_metrics()
+        self.assertEqual(len(metrics), 1)
+        self.assertEqual(metrics[0].name, "db.client.n_plus_one")
+        (point,) = metrics[0].data.data_points
+        self.assertEqual(point.value, 1)
+        self.assertEqual(
+            dict(point.attributes),
+            {DB_SYSTEM_NAME: "testcomponent", "http.route": "/users"},
+        )
+
+    def test_repeated_queries_folded_until_parent_ends(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name",
+            "testcomponent",
+            repeated_query_threshold=1,
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        with self.tracer.start_as_current_span("parent") as parent:
+            for _ in range(3):
+                cursor.execute("SELECT 1")
+            self.assertEqual(len(self.memory_exporter.get_finished_spans()), 1)
+
+        # the aggregate span is emitted right before its parent ends
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            [span.name for span in spans], ["SELECT", "SELECT", "parent"]
+        )
+        self.assertEqual(spans[1].parent, spans[2].context)
+        self.assertEqual(spans[1].attributes["db.client.repeated.count"], 2)
+        self.assertLessEqual(spans[1].end_time, spans[2].end_time)
+        self.assertNotIn("end", vars(parent))
+
+        # nothing is kept for the ended parent
+        cursor.execute("SELECT 1")
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 4)
+        # pylint: disable=protected-access
+        self.assertEqual(len(db_integration._repeated_queries._runs), 0)
+
+    def test_repeated_queries_per_integration(self):
+        cursors = []
+        for threshold in (1, 3):
+            db_integration = dbapi.DatabaseApiIntegration(
+                "instrumenting_module_test_name",
+                "testcomponent",
+                repeated_query_threshold=threshold,
+            )
+            cursors.append(
+                db_integration.wrapped_connection(
+                    mock_connect, {}, {}
+                ).cursor()
+            )
+        with self.tracer.start_as_current_span("parent"):
+            for _ in range(3):
+                for cursor in cursors:
+                    cursor.execute("SELECT 1")
+
+        # each integration folds its own run past its own threshold
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 6)
+        (aggregate,) = [
+            span
+            for span in spans
+            if "db.client.repeated.count" in span.attributes
+        ]
+        self.assertEqual(aggregate.attributes["db.client.repeated.count"], 2)
+
+    def test_repeated_queries_disabled_by_default(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name", "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        with self.tracer.start_as_current_span("parent"):
+            for _ in range(5):
+                cursor.execute("SELECT 1")
+
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 6)
+
     def test_executemany_comment(self):
         connect_module = mock.MagicMock()
         connect_module.__name__ = "test"
@@ -339,6 +575,55 @@ class TestDBApiIntegration(TestBase):
             "Select 1;",
         )
 
+    def test_executemany_comment_prepared_statement_friendly(self):
+        connect_module = mock.MagicMock()
+        connect_module.__name__ = "test"
+        connect_module.__version__ = mock.MagicMock()
+        connect_module.pq.version.return_value = 123
+        connect_module.apilevel = 123
+        connect_module.threadsafety = 123
+        connect_module.paramstyle = "test"
+
+        db_integration = dbapi.DatabaseApiIntegration(
+            "instrumenting_module_test_name",
+            "postgresql",
+            tracer_provider=TracerProvider(sampler=ParentBased(ALWAYS_OFF)),
+            enable_commenter=True,
+            commenter_options={
+                "db_driver": False,
+                "dbapi_level": False,
+                "prepared_statement_friendly": True,
+            },
+            connect_module=connect_module,
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        cursor.executemany("Select 1;")
+        static_query = cursor.query
+        self.assertEqual(
+            static_query,
+            "Select 1 /*dbapi_threadsafety=123,driver_paramstyle='test',libpq_version=123*/;",
+        )
+        cursor.executemany("Select 1;")
+        self.assertIs(cursor.query, static_query)
+
+        sampled_parent = trace_api.NonRecordingSpan(
+            trace_api.SpanContext(
+                trace_id=1,
+                span_id=2,
+                is_remote=True,
+                trace_flags=trace_api.TraceFlags(trace_api.TraceFlags.SAMPLED),
+            )
+        )
+        with trace_api.use_span(sampled_parent):
+            cursor.executemany("Select 1;")
+        self.assertRegex(
+            cursor.query,
+            r"Select 1 /\*dbapi_threadsafety=123,driver_paramstyle='test',libpq_version=123,traceparent='\d{1,2}-[a-zA-Z0-9_]{32}-[a-zA-Z0-9_]{16}-\d{1,2}'\*/;",
+        )
+
     def test_executemany_comment_stmt_enabled(self):
         connect_module = mock.MagicMock()
         connect_module.__name__ = "test"
@@ -1088,6 +1373,10 @@ class TestDBApiIntegration(TestBase):
         self.assertEqual(kwargs["commenter_options"], None)
         self.assertEqual(kwargs["connect_module"], None)
         self.assertEqual(kwargs["enable_attribute_commenter"], False)
+        self.assertEqual(kwargs["meter_provider"], None)
+        self.assertEqual(kwargs["enable_metrics"], False)
+        self.assertEqual(kwargs["metrics_fingerprint_limit"], 0)
+        self.assertEqual(kwargs["repeated_query_threshold"], 0)
 
     @mock.patch("opentelemetry.instrumentation.dbapi.DatabaseApiIntegration")
     def test_instrument_connection_kwargs_provided(self, mock_dbapiint):
@@ -332,7 +332,11 @@ from opentelemetry.semconv.metrics.http_metrics import (
     HTTP_SERVER_REQUEST_DURATION,
 )
 from opentelemetry.trace import get_tracer
-from opentelemetry.util.http import get_excluded_urls, parse_excluded_urls
+from opentelemetry.util.http import (
+    create_metric_attribute_limiter,
+    get_excluded_urls,
+    parse_excluded_urls,
+)
 
 _excluded_urls_from_env = get_excluded_urls("DJANGO")
 _django_middleware_setting = "MIDDLEWARE"
@@ -432,6 +436,16 @@ class DjangoInstrumentor(BaseInstrumentor):
                 unit="s",
                 explicit_bucket_boundaries_advisory=HTTP_DURATION_HISTOGRAM_BUCKETS_NEW,
             )
+        _DjangoMiddleware._duration_attrs_limiter_old = (
+            create_metric_attribute_limiter(
+                meter, MetricInstruments.HTTP_SERVER_DURATION
+            )
+        )
+        _DjangoMiddleware._duration_attrs_limiter_new = (
+            create_metric_attribute_limiter(
+                meter, HTTP_SERVER_REQUEST_DURATION
+            )
+        )
         _DjangoMiddleware._active_request_counter = (
             create_http_server_active_requests(meter)
         )
@@ -137,6 +137,8 @@ class _DjangoMiddleware:
     _meter = None
     _duration_histogram_old = None
     _duration_histogram_new = None
+    _duration_attrs_limiter_old = None
+    _duration_attrs_limiter_new = None
     _active_request_counter = None
     _sem_conv_opt_in_mode = _StabilityMode.DEFAULT
 
@@ -415,6 +417,10 @@ class _DjangoMiddleware:
                 target = duration_attrs.get(HTTP_TARGET)
                 if target:
                     duration_attrs_old[HTTP_TARGET] = target
+                if self._duration_attrs_limiter_old:
+                    self._duration_attrs_limiter_old.limit_attributes(
+                        duration_attrs_old
+                    )
                 self._duration_histogram_old.record(
                     max(round(duration_s * 1000), 0),
                     duration_attrs_old,
@@ -423,6 +429,10 @@ class _DjangoMiddleware:
                 duration_attrs_new = _parse_duration_attrs(
                     duration_attrs, _StabilityMode.HTTP
                 )
+                if self._duration_attrs_limiter_new:
+                    self._duration_attrs_limiter_new.limit_attributes(
+                        duration_attrs_new
+                    )
                 self._duration_histogram_new.record(
                     max(duration_s, 0),
                     duration_attrs_new,
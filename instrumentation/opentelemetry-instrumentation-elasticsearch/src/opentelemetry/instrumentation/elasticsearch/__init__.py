@@ -88,6 +88,28 @@ for example:
     es.index(index='my-index', doc_type='_doc', id=1, body={'my': 'data', 'timestamp': datetime.now()})
     es.get(index='my-index', doc_type='_doc', id=1)
 
+Bulk requests
+-------------
+
+The bodies of the ``_bulk`` and ``_msearch`` requests, which can carry a large
+number of operations, are never captured as ``db.statement``. Their spans have
+the following attributes instead:
+
+- ``db.operation.batch.size``: the number of items of the response.
+- ``elasticsearch.batch.errors``: the number of items of the response which failed.
+- ``elasticsearch.request.body.size``: the size in bytes of the request body, if it
+  was serialized before reaching the transport.
+
+The ``db.statement`` of the other requests is truncated to 4096 characters.
+
+Metrics
+-------
+
+The duration of the requests is recorded in the ``db.client.operation.duration``
+histogram, by ``url.template``, the path of the request with the index names and
+the document identifiers replaced by placeholders, e.g. ``/{index}/_doc/{id}``.
+A custom meter provider can be passed as ``meter_provider``.
+
 API
 ---
 """
@@ -96,23 +118,48 @@ import re
 import warnings
 from logging import getLogger
 from os import environ
+from timeit import default_timer
 from typing import Collection
 
 import elasticsearch
 import elasticsearch.exceptions
 from wrapt import wrap_function_wrapper as _wrap
 
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
 from opentelemetry.instrumentation.elasticsearch.package import _instruments
 from opentelemetry.instrumentation.elasticsearch.version import __version__
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.utils import unwrap
+from opentelemetry.metrics import get_meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
+    DB_OPERATION_BATCH_SIZE,
     DB_STATEMENT,
     DB_SYSTEM,
+    DbSystemNameValues,
+)
+from opentelemetry.semconv._incubating.attributes.url_attributes import (
+    URL_TEMPLATE,
+)
+from opentelemetry.semconv._incubating.metrics.db_metrics import (
+    DB_CLIENT_OPERATION_DURATION,
+)
+from opentelemetry.semconv.attributes.db_attributes import DB_SYSTEM_NAME
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+from opentelemetry.semconv.attributes.http_attributes import (
+    HTTP_REQUEST_METHOD,
+    HTTP_RESPONSE_STATUS_CODE,
 )
 from opentelemetry.trace import SpanKind, Status, StatusCode, get_tracer
 
-from .utils import sanitize_body
+from .utils import (
+    _count_batch_items,
+    _get_body_size,
+    _get_url_template,
+    _is_batch_endpoint,
+    sanitize_body,
+)
 
 # Split of elasticsearch and elastic_transport in 8.0.0+
 # https://www.elastic.co/guide/en/elasticsearch/client/python-api/master/release-notes.html#rn-8-0-0
@@ -134,6 +181,17 @@ _ATTRIBUTES_FROM_RESULT = [
 
 _DEFAULT_OP_NAME = "request"
 
+_ELASTICSEARCH_BATCH_ERRORS = "elasticsearch.batch.errors"
+_ELASTICSEARCH_REQUEST_BODY_SIZE = "elasticsearch.request.body.size"
+
+# Length budget of db.statement
+_STATEMENT_MAX_LENGTH = 4096
+
+# Bound of the url templates reported separately, the others are reported
+# as _OTHER
+_MAX_URL_TEMPLATES = 256
+_OTHER_URL_TEMPLATE = "_OTHER"
+
 
 class ElasticsearchInstrumentor(BaseInstrumentor):
     """An instrumentor for elasticsearch
@@ -163,6 +221,18 @@ class ElasticsearchInstrumentor(BaseInstrumentor):
             tracer_provider,
             schema_url="https://opentelemetry.io/schemas/1.11.0",
         )
+        meter = get_meter(
+            __name__,
+            __version__,
+            kwargs.get("meter_provider"),
+            schema_url="https://opentelemetry.io/schemas/1.11.0",
+        )
+        duration_histogram = meter.create_histogram(
+            name=DB_CLIENT_OPERATION_DURATION,
+            unit="s",
+            description="Duration of database client operations.",
+            explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+        )
         request_hook = kwargs.get("request_hook")
         response_hook = kwargs.get("response_hook")
         if es_transport_split:
@@ -174,6 +244,7 @@ class ElasticsearchInstrumentor(BaseInstrumentor):
                     self._span_name_prefix,
                     request_hook,
                     response_hook,
+                    duration_histogram,
                 ),
             )
         else:
@@ -185,6 +256,7 @@ class ElasticsearchInstrumentor(BaseInstrumentor):
                     self._span_name_prefix,
                     request_hook,
                     response_hook,
+                    duration_histogram,
                 ),
             )
 
@@ -210,8 +282,33 @@ def _wrap_perform_request(
     span_name_prefix,
     request_hook=None,
     response_hook=None,
+    duration_histogram=None,
 ):
-    # pylint: disable=R0912,R0914
+    url_templates = set()
+
+    def _get_metric_attributes(method, path):
+        template = _get_url_template(path)
+        if template not in url_templates:
+            if len(url_templates) >= _MAX_URL_TEMPLATES:
+                template = _OTHER_URL_TEMPLATE
+            else:
+                url_templates.add(template)
+        attributes = {
+            DB_SYSTEM_NAME: DbSystemNameValues.ELASTICSEARCH.value,
+            URL_TEMPLATE: template,
+        }
+        if method:
+            attributes[HTTP_REQUEST_METHOD] = method
+        return attributes
+
+    def _get_status_error(method, status):
+        if (method == "HEAD" and status == 404) or 200 <= status < 299:
+            return None
+        return elasticsearch.exceptions.HTTP_EXCEPTIONS.get(
+            status, elasticsearch.exceptions.ApiError
+        )
+
+    # pylint: disable=R0912,R0914,R0915
     def wrapper(wrapped, _, args, kwargs):
         # if wrapped elasticsearch has native OTel instrumentation just call the wrapped function
         otel_span = kwargs.get("otel_span")
@@ -237,6 +334,8 @@ def _wrap_perform_request(
 
         doc_id = None
         search_target = None
+        path = url.split("?", 1)[0] if url else ""
+        is_batch = _is_batch_endpoint(path)
 
         if url:
             # TODO: This regex-based solution avoids creating an unbounded number of span names, but should be replaced by instrumenting individual Elasticsearch methods instead of Transport.perform_request()
@@ -299,8 +398,16 @@ def _wrap_perform_request(
                     attributes["elasticsearch.method"] = method
                 if body:
                     # Don't set db.statement for bulk requests, as it can be very large
-                    if isinstance(body, dict):
-                        attributes[DB_STATEMENT] = sanitize_body(body)
+                    if is_batch:
+                        body_size = _get_body_size(body)
+                        if body_size is not None:
+                            attributes[_ELASTICSEARCH_REQUEST_BODY_SIZE] = (
+                                body_size
+                            )
+                    elif isinstance(body, dict):
+                        attributes[DB_STATEMENT] = sanitize_body(
+                            body, _STATEMENT_MAX_LENGTH
+                        )
                 if params:
                     attributes["elasticsearch.params"] = str(params)
                 if doc_id:
@@ -310,7 +417,26 @@ def _wrap_perform_request(
                 for key, value in attributes.items():
                     span.set_attribute(key, value)
 
-            rv = wrapped(*args, **kwargs)
+            metric_attributes = _get_metric_attributes(method, path)
+            start = default_timer()
+            try:
+                rv = wrapped(*args, **kwargs)
+            except Exception as exc:
+                if duration_histogram is not None:
+                    metric_attributes[ERROR_TYPE] = type(exc).__qualname__
+                    duration_histogram.record(
+                        default_timer() - start, metric_attributes
+                    )
+                raise
+            if duration_histogram is not None:
+                duration = default_timer() - start
+                if es_transport_split:
+                    status = rv.meta.status
+                    metric_attributes[HTTP_RESPONSE_STATUS_CODE] = status
+                    exception = _get_status_error(method, status)
+                    if exception is not None:
+                        metric_attributes[ERROR_TYPE] = exception.__name__
+                duration_histogram.record(duration, metric_attributes)
 
             body = rv.body if es_transport_split else rv
             if isinstance(body, dict) and span.is_recording():
@@ -320,16 +446,17 @@ def _wrap_perform_request(
                             f"elasticsearch.{member}",
                             str(body[member]),
                         )
+                if is_batch:
+                    items, errors = _count_batch_items(body)
+                    if items is not None:
+                        span.set_attribute(DB_OPERATION_BATCH_SIZE, items)
+                        span.set_attribute(_ELASTICSEARCH_BATCH_ERRORS, errors)
 
             # since the transport split the raising of exceptions that set the error status
             # are called after this code so need to set error status manually
             if es_transport_split and span.is_recording():
-                if not (method == "HEAD" and rv.meta.status == 404) and (
-                    not 200 <= rv.meta.status < 299
-                ):
-                    exception = elasticsearch.exceptions.HTTP_EXCEPTIONS.get(
-                        rv.meta.status, elasticsearch.exceptions.ApiError
-                    )
+                exception = _get_status_error(method, rv.meta.status)
+                if exception is not None:
                     message = str(body)
                     if isinstance(body, dict):
                         error = body.get("error", message)
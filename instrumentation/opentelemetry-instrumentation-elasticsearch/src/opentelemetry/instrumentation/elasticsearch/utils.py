@@ -15,6 +15,15 @@ import json
 
 sanitized_value = "?"
 
+# Appended to the statements truncated to the length budget
+_TRUNCATED_MARK = "..."
+
+# Endpoints sending several operations in a single NDJSON request
+_BATCH_ENDPOINTS = frozenset(("_bulk", "_msearch"))
+
+# Path segments followed by a document identifier
+_DOCUMENT_ENDPOINTS = frozenset(("_doc", "_create", "_update", "_source"))
+
 
 def _mask_leaf_nodes(obj):
     """
@@ -29,9 +38,131 @@ def _mask_leaf_nodes(obj):
     return sanitized_value
 
 
-def sanitize_body(body) -> str:
+def _iter_masked(obj):
+    """
+    Yields the parts of the string representation of the JSON structure
+    returned by _mask_leaf_nodes, without building the masked copy.
+    """
+    if isinstance(obj, dict):
+        yield "{"
+        for index, (key, value) in enumerate(obj.items()):
+            if index:
+                yield ", "
+            yield repr(key)
+            yield ": "
+            yield from _iter_masked(value)
+        yield "}"
+    elif isinstance(obj, list):
+        yield "["
+        for index, item in enumerate(obj):
+            if index:
+                yield ", "
+            yield from _iter_masked(item)
+        yield "]"
+    else:
+        yield repr(sanitized_value)
+
+
+def sanitize_body(body, max_length=None) -> str:
+    """
+    Returns the string representation of body with its leaf values masked.
+
+    The traversal of body stops once the representation is longer than
+    max_length, if given, and the representation is truncated.
+    """
     if isinstance(body, str):
         body = json.loads(body)
 
-    masked_body = _mask_leaf_nodes(body)
-    return str(masked_body)
+    if max_length is None:
+        return "".join(_iter_masked(body))
+
+    parts = []
+    remaining = max_length
+    for part in _iter_masked(body):
+        if len(part) > remaining:
+            parts.append(part[:remaining])
+            parts.append(_TRUNCATED_MARK)
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return "".join(parts)
+
+
+def _get_endpoint(path):
+    """
+    Returns the name of the API of path, its first segment starting with
+    an underscore, e.g. ``_bulk`` for ``/my-index/_bulk``.
+    """
+    for segment in path.split("/"):
+        if segment.startswith("_"):
+            return segment
+    return None
+
+
+def _is_batch_endpoint(path):
+    return _get_endpoint(path) in _BATCH_ENDPOINTS
+
+
+def _get_url_template(path):
+    """
+    Returns the template of path, with the index names and the document
+    identifiers replaced by placeholders, e.g. ``/{index}/_doc/{id}`` for
+    ``/my-index/_doc/1``.
+    """
+    segments = path.split("/")
+    template = []
+    api = None
+    for segment in segments:
+        if not segment:
+            template.append(segment)
+        elif api is None:
+            if segment.startswith("_"):
+                api = segment
+                template.append(segment)
+            else:
+                template.append("{index}")
+        elif api in _DOCUMENT_ENDPOINTS:
+            template.append("{id}")
+        else:
+            template.append(segment)
+    return "/".join(template)
+
+
+def _get_body_size(body):
+    """
+    Returns the size in bytes of a serialized request body, or None for
+    the bodies serialized by the transport.
+    """
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        # the length of a str is only its size in bytes for ASCII strings,
+        # which is checked in constant time
+        return len(body) if body.isascii() else len(body.encode("utf-8"))
+    return None
+
+
+def _count_batch_items(body):
+    """
+    Returns the number of items of the response of a _bulk or _msearch
+    request and the number of those which failed.
+    """
+    items = body.get("items")
+    if items is not None:
+        # each item of a _bulk response maps its action to its result
+        errors = 0
+        if body.get("errors"):
+            for item in items:
+                for result in item.values():
+                    if isinstance(result, dict) and "error" in result:
+                        errors += 1
+        return len(items), errors
+    responses = body.get("responses")
+    if responses is not None:
+        errors = sum(
+            1
+            for response in responses
+            if isinstance(response, dict) and "error" in response
+        )
+        return len(responses), errors
+    return None, None
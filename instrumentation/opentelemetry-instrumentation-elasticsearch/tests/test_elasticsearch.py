@@ -30,8 +30,12 @@ from opentelemetry import trace
 from opentelemetry.instrumentation.elasticsearch import (
     ElasticsearchInstrumentor,
 )
-from opentelemetry.instrumentation.elasticsearch.utils import sanitize_body
+from opentelemetry.instrumentation.elasticsearch.utils import (
+    _get_url_template,
+    sanitize_body,
+)
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
+    DB_OPERATION_BATCH_SIZE,
     DB_STATEMENT,
     DB_SYSTEM,
 )
@@ -629,6 +633,137 @@ class TestElasticsearchIntegration(TestBase):
             span, opentelemetry.instrumentation.elasticsearch
         )
 
+    def test_body_sanitization_max_length(self, _):
+        sanitized = str(sanitization_queries.interval_query_sanitized)
+        self.assertEqual(
+            sanitize_body(sanitization_queries.interval_query, 50),
+            sanitized[:50] + "...",
+        )
+        self.assertEqual(
+            sanitize_body(sanitization_queries.interval_query, len(sanitized)),
+            sanitized,
+        )
+
+    def test_bulk_items(self, request_mock):
+        request_mock.return_value = helpers.mock_response(
+            json.dumps(
+                {
+                    "took": 3,
+                    "errors": True,
+                    "items": [
+                        {"index": {"_id": "1", "status": 201}},
+                        {
+                            "index": {
+                                "_id": "2",
+                                "status": 400,
+                                "error": {"type": "mapper_parsing_exception"},
+                            }
+                        },
+                        {"delete": {"_id": "3", "status": 200}},
+                    ],
+                }
+            )
+        )
+
+        es = get_elasticsearch_client(hosts=["http://localhost:9200"])
+        es.bulk(
+            body=[
+                {"index": {"_index": "sw", "_id": "1"}},
+                {"name": "adam"},
+                {"index": {"_index": "sw", "_id": "2"}},
+                {"name": {"first": "eve"}},
+                {"delete": {"_index": "sw", "_id": "3"}},
+            ]
+        )
+
+        (span,) = self.get_finished_spans()
+        self.assertNotIn(DB_STATEMENT, span.attributes)
+        self.assertEqual(span.attributes[DB_OPERATION_BATCH_SIZE], 3)
+        self.assertEqual(span.attributes["elasticsearch.batch.errors"], 1)
+        if major_version < 8:
+            # the bodies are serialized by the client before elasticsearch 8
+            self.assertGreater(
+                span.attributes["elasticsearch.request.body.size"], 0
+            )
+
+    def test_msearch_items(self, request_mock):
+        request_mock.return_value = helpers.mock_response(
+            json.dumps(
+                {
+                    "took": 3,
+                    "responses": [
+                        {"hits": {"hits": []}, "status": 200},
+                        {"error": {"type": "index_not_found"}, "status": 404},
+                    ],
+                }
+            )
+        )
+
+        es = get_elasticsearch_client(hosts=["http://localhost:9200"])
+        es.msearch(
+            body=[
+                {"index": "sw"},
+                {"query": {"match_all": {}}},
+                {"index": "missing"},
+                {"query": {"match_all": {}}},
+            ]
+        )
+
+        (span,) = self.get_finished_spans()
+        self.assertNotIn(DB_STATEMENT, span.attributes)
+        self.assertEqual(span.attributes[DB_OPERATION_BATCH_SIZE], 2)
+        self.assertEqual(span.attributes["elasticsearch.batch.errors"], 1)
+
+    def test_duration_metric(self, request_mock):
+        request_mock.return_value = helpers.mock_response("{}")
+
+        es = get_elasticsearch_client(hosts=["http://localhost:9200"])
+        for doc_id in (1, 2):
+            es.get(
+                index="test-index",
+                **normalize_arguments(doc_type="_doc"),
+                id=doc_id,
+            )
+
+        (metric,) = self.get_sorted_metrics()
+        self.assertEqual(metric.name, "db.client.operation.duration")
+        (data_point,) = metric.data.data_points
+        self.assertEqual(data_point.count, 2)
+        self.assertEqual(
+            data_point.attributes["db.system.name"], "elasticsearch"
+        )
+        self.assertEqual(
+            data_point.attributes["url.template"], "/{index}/_doc/{id}"
+        )
+        self.assertEqual(data_point.attributes["http.request.method"], "GET")
+
+    def test_duration_metric_error(self, request_mock):
+        request_mock.side_effect = RuntimeError("custom error")
+
+        es = get_elasticsearch_client(hosts=["http://localhost:9200"])
+        with self.assertRaises(RuntimeError):
+            es.get(
+                index="test-index",
+                **normalize_arguments(doc_type="_doc"),
+                id=1,
+            )
+
+        (metric,) = self.get_sorted_metrics()
+        (data_point,) = metric.data.data_points
+        self.assertEqual(data_point.attributes["error.type"], "RuntimeError")
+
+    def test_url_template(self, _):
+        self.assertEqual(_get_url_template("/"), "/")
+        self.assertEqual(_get_url_template("/test-index"), "/{index}")
+        self.assertEqual(
+            _get_url_template("/test-index/_doc/1"), "/{index}/_doc/{id}"
+        )
+        self.assertEqual(_get_url_template("/a,b/_search"), "/{index}/_search")
+        self.assertEqual(_get_url_template("/_bulk"), "/_bulk")
+        self.assertEqual(
+            _get_url_template("/_cluster/health"), "/_cluster/health"
+        )
+
     @mark.skipif(
         (major_version, minor_version) < (8, 13),
         reason="Native OTel since elasticsearch 8.13",
@@ -223,7 +223,11 @@ from opentelemetry.semconv.metrics import MetricInstruments
 from opentelemetry.semconv.metrics.http_metrics import (
     HTTP_SERVER_REQUEST_DURATION,
 )
-from opentelemetry.util.http import get_excluded_urls, get_traced_request_attrs
+from opentelemetry.util.http import (
+    create_metric_attribute_limiter,
+    get_excluded_urls,
+    get_traced_request_attrs,
+)
 
 _logger = getLogger(__name__)
 
@@ -300,6 +304,12 @@ class _InstrumentedFalconAPI(getattr(falcon, _instrument_app)):
                 unit="s",
                 explicit_bucket_boundaries_advisory=HTTP_DURATION_HISTOGRAM_BUCKETS_NEW,
             )
+        self._duration_attrs_limiter_old = create_metric_attribute_limiter(
+            self._otel_meter, MetricInstruments.HTTP_SERVER_DURATION
+        )
+        self._duration_attrs_limiter_new = create_metric_attribute_limiter(
+            self._otel_meter, HTTP_SERVER_REQUEST_DURATION
+        )
 
         self.active_requests_counter = self._otel_meter.create_up_down_counter(
             name=MetricInstruments.HTTP_SERVER_ACTIVE_REQUESTS,
@@ -419,6 +429,9 @@ class _InstrumentedFalconAPI(getattr(falcon, _instrument_app)):
                 duration_attrs = otel_wsgi._parse_duration_attrs(
                     attributes, _StabilityMode.DEFAULT
                 )
+                self._duration_attrs_limiter_old.limit_attributes(
+                    duration_attrs
+                )
                 self.duration_histogram_old.record(
                     max(round(duration_s * 1000), 0), duration_attrs
                 )
@@ -426,6 +439,9 @@ class _InstrumentedFalconAPI(getattr(falcon, _instrument_app)):
                 duration_attrs = otel_wsgi._parse_duration_attrs(
                     attributes, _StabilityMode.HTTP
                 )
+                self._duration_attrs_limiter_new.limit_attributes(
+                    duration_attrs
+                )
                 self.duration_histogram_new.record(
                     max(duration_s, 0), duration_attrs
                 )
@@ -293,6 +293,7 @@ from opentelemetry.semconv.metrics.http_metrics import (
 )
 from opentelemetry.util._importlib_metadata import version
 from opentelemetry.util.http import (
+    create_metric_attribute_limiter,
     get_excluded_urls,
     parse_excluded_urls,
     sanitize_method,
@@ -347,6 +348,8 @@ def _rewrapped_app(
     excluded_urls=None,
     sem_conv_opt_in_mode=_StabilityMode.DEFAULT,
     duration_histogram_new=None,
+    duration_attrs_limiter_old=None,
+    duration_attrs_limiter_new=None,
 ):
     # pylint: disable=too-many-statements
     def _wrapped_app(wrapped_app_environ, start_response):
@@ -435,6 +438,10 @@ def _rewrapped_app(
                 if request_route:
                     # http.target to be included in old semantic conventions
                     duration_attrs_old[HTTP_TARGET] = str(request_route)
+                if duration_attrs_limiter_old:
+                    duration_attrs_limiter_old.limit_attributes(
+                        duration_attrs_old
+                    )
                 duration_histogram_old.record(
                     max(round(duration_s * 1000), 0),
                     duration_attrs_old,
@@ -447,6 +454,10 @@ def _rewrapped_app(
 
                 if request_route:
                     duration_attrs_new[HTTP_ROUTE] = str(request_route)
+                if duration_attrs_limiter_new:
+                    duration_attrs_limiter_new.limit_attributes(
+                        duration_attrs_new
+                    )
 
                 duration_histogram_new.record(
                     max(duration_s, 0),
@@ -706,6 +717,12 @@ class _InstrumentedFlask(flask.Flask):
             excluded_urls=_InstrumentedFlask._excluded_urls,
             sem_conv_opt_in_mode=_InstrumentedFlask._sem_conv_opt_in_mode,
             duration_histogram_new=duration_histogram_new,
+            duration_attrs_limiter_old=create_metric_attribute_limiter(
+                meter, MetricInstruments.HTTP_SERVER_DURATION
+            ),
+            duration_attrs_limiter_new=create_metric_attribute_limiter(
+                meter, HTTP_SERVER_REQUEST_DURATION
+            ),
         )
 
         tracer = trace.get_tracer(
@@ -841,6 +858,12 @@ class FlaskInstrumentor(BaseInstrumentor):
                 excluded_urls=excluded_urls,
                 sem_conv_opt_in_mode=sem_conv_opt_in_mode,
                 duration_histogram_new=duration_histogram_new,
+                duration_attrs_limiter_old=create_metric_attribute_limiter(
+                    meter, MetricInstruments.HTTP_SERVER_DURATION
+                ),
+                duration_attrs_limiter_new=create_metric_attribute_limiter(
+                    meter, HTTP_SERVER_REQUEST_DURATION
+                ),
             )
 
             tracer = trace.get_tracer(
@@ -229,6 +229,61 @@ You can also add the interceptor manually, rather than using
 
     server = grpc.aio.server(interceptors = [aio_server_interceptor()])
 
+Metrics
+-------
+
+The server and client interceptors record the following histograms for every
+RPC they trace, whether or not its span is sampled:
+
+* ``rpc.server.duration`` and ``rpc.client.duration``, in milliseconds
+* ``rpc.server.request.size``, ``rpc.server.response.size``,
+  ``rpc.client.request.size`` and ``rpc.client.response.size``, the
+  serialized size of each message, in bytes
+* ``rpc.server.requests_per_rpc``, ``rpc.server.responses_per_rpc``,
+  ``rpc.client.requests_per_rpc`` and ``rpc.client.responses_per_rpc``
+
+The messages of streaming RPCs are tallied as they are sent and received, the
+duration and the message counts are recorded when the stream ends. The sizes
+are only recorded for protobuf and raw bytes messages.
+
+The meter provider can be passed to the instrumentors as ``meter_provider``,
+as well as to the interceptor factories:
+
+.. code-block:: python
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(),
+        interceptors = [server_interceptor(meter_provider=meter_provider)],
+    )
+
+Streaming RPCs
+--------------
+
+By default, the size of every message of a streaming RPC is recorded in the
+message size histograms, as the semantic conventions define them per message.
+Each message then costs a histogram measurement on both sides, which more than
+doubles the overhead of the instrumentation for streams of many small
+messages. For long-lived streams carrying many messages, pass
+``summarize_streams=True`` to the instrumentors or the interceptor factories:
+the messages of the streams are then only counted, and the counters are set
+on the span of the stream when it ends:
+
+* ``rpc.grpc.stream.requests`` and ``rpc.grpc.stream.responses``
+* ``rpc.grpc.stream.request_bytes`` and ``rpc.grpc.stream.response_bytes``
+
+The duration and messages per RPC histograms are still recorded, the message
+size histograms are not recorded for the summarized streams.
+
+With ``message_event_interval`` set to ``N``, an ``rpc.message`` event is also
+added to the span of a summarized stream every ``N`` requests and every ``N``
+responses:
+
+.. code-block:: python
+
+    GrpcInstrumentorServer().instrument(
+        summarize_streams=True, message_event_interval=1000
+    )
+
 Filters
 -------
 
@@ -296,6 +351,7 @@ from opentelemetry.instrumentation.grpc.package import _instruments
 from opentelemetry.instrumentation.grpc.version import __version__
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.utils import unwrap
+from opentelemetry.metrics import get_meter
 
 # pylint:disable=import-outside-toplevel
 # pylint:disable=import-self
@@ -337,6 +393,9 @@ class GrpcInstrumentorServer(BaseInstrumentor):
     def _instrument(self, **kwargs):
         self._original_func = grpc.server
         tracer_provider = kwargs.get("tracer_provider")
+        meter_provider = kwargs.get("meter_provider")
+        summarize_streams = kwargs.get("summarize_streams", False)
+        message_event_interval = kwargs.get("message_event_interval", 0)
 
         def server(*args, **kwargs):
             if "interceptors" in kwargs and kwargs["interceptors"]:
@@ -345,13 +404,21 @@ class GrpcInstrumentorServer(BaseInstrumentor):
                 kwargs["interceptors"].insert(
                     0,
                     server_interceptor(
-                        tracer_provider=tracer_provider, filter_=self._filter
+                        tracer_provider=tracer_provider,
+                        filter_=self._filter,
+                        meter_provider=meter_provider,
+                        summarize_streams=summarize_streams,
+                        message_event_interval=message_event_interval,
                     ),
                 )
             else:
                 kwargs["interceptors"] = [
                     server_interceptor(
-                        tracer_provider=tracer_provider, filter_=self._filter
+                        tracer_provider=tracer_provider,
+                        filter_=self._filter,
+                        meter_provider=meter_provider,
+                        summarize_streams=summarize_streams,
+                        message_event_interval=message_event_interval,
                     )
                 ]
 
@@ -391,6 +458,9 @@ class GrpcAioInstrumentorServer(BaseInstrumentor):
     def _instrument(self, **kwargs):
         self._original_func = grpc.aio.server
         tracer_provider = kwargs.get("tracer_provider")
+        meter_provider = kwargs.get("meter_provider")
+        summarize_streams = kwargs.get("summarize_streams", False)
+        message_event_interval = kwargs.get("message_event_interval", 0)
 
         def server(*args, **kwargs):
             if "interceptors" in kwargs and kwargs["interceptors"]:
@@ -399,13 +469,21 @@ class GrpcAioInstrumentorServer(BaseInstrumentor):
                 kwargs["interceptors"].insert(
                     0,
                     aio_server_interceptor(
-                        tracer_provider=tracer_provider, filter_=self._filter
+                        tracer_provider=tracer_provider,
+                        filter_=self._filter,
+                        meter_provider=meter_provider,
+                        summarize_streams=summarize_streams,
+                        message_event_interval=message_event_interval,
                     ),
                 )
             else:
                 kwargs["interceptors"] = [
                     aio_server_interceptor(
-                        tracer_provider=tracer_provider, filter_=self._filter
+                        tracer_provider=tracer_provider,
+                        filter_=self._filter,
+                        meter_provider=meter_provider,
+                        summarize_streams=summarize_streams,
+                        message_event_interval=message_event_interval,
                     )
                 ]
             return self._original_func(*args, **kwargs)
@@ -445,6 +523,9 @@ class GrpcInstrumentorClient(BaseInstrumentor):
         self._filter = filter_
         self._request_hook = None
         self._response_hook = None
+        self._meter_provider = None
+        self._summarize_streams = False
+        self._message_event_interval = 0
 
     # Figures out which channel type we need to wrap
     def _which_channel(self, kwargs):
@@ -468,6 +549,9 @@ class GrpcInstrumentorClient(BaseInstrumentor):
     def _instrument(self, **kwargs):
         self._request_hook = kwargs.get("request_hook")
         self._response_hook = kwargs.get("response_hook")
+        self._meter_provider = kwargs.get("meter_provider")
+        self._summarize_streams = kwargs.get("summarize_streams", False)
+        self._message_event_interval = kwargs.get("message_event_interval", 0)
         for ctype in self._which_channel(kwargs):
             _wrap(
                 "grpc",
@@ -491,6 +575,9 @@ class GrpcInstrumentorClient(BaseInstrumentor):
                 filter_=self._filter,
                 request_hook=request_hook,
                 response_hook=response_hook,
+                meter_provider=self._meter_provider,
+                summarize_streams=self._summarize_streams,
+                message_event_interval=self._message_event_interval,
             ),
         )
 
@@ -518,6 +605,9 @@ class GrpcAioInstrumentorClient(BaseInstrumentor):
         self._filter = filter_
         self._request_hook = None
         self._response_hook = None
+        self._meter_provider = None
+        self._summarize_streams = False
+        self._message_event_interval = 0
 
     def instrumentation_dependencies(self) -> Collection[str]:
         return _instruments
@@ -531,6 +621,9 @@ class GrpcAioInstrumentorClient(BaseInstrumentor):
                     filter_=self._filter,
                     request_hook=self._request_hook,
                     response_hook=self._response_hook,
+                    meter_provider=self._meter_provider,
+                    summarize_streams=self._summarize_streams,
+                    message_event_interval=self._message_event_interval,
                 )
                 + kwargs["interceptors"]
             )
@@ -540,6 +633,9 @@ class GrpcAioInstrumentorClient(BaseInstrumentor):
                 filter_=self._filter,
                 request_hook=self._request_hook,
                 response_hook=self._response_hook,
+                meter_provider=self._meter_provider,
+                summarize_streams=self._summarize_streams,
+                message_event_interval=self._message_event_interval,
             )
 
         return kwargs
@@ -549,6 +645,9 @@ class GrpcAioInstrumentorClient(BaseInstrumentor):
         self._original_secure = grpc.aio.secure_channel
         self._request_hook = kwargs.get("request_hook")
         self._response_hook = kwargs.get("response_hook")
+        self._meter_provider = kwargs.get("meter_provider")
+        self._summarize_streams = kwargs.get("summarize_streams", False)
+        self._message_event_interval = kwargs.get("message_event_interval", 0)
         tracer_provider = kwargs.get("tracer_provider")
 
         def insecure(*args, **kwargs):
@@ -570,7 +669,13 @@ class GrpcAioInstrumentorClient(BaseInstrumentor):
 
 
 def client_interceptor(
-    tracer_provider=None, filter_=None, request_hook=None, response_hook=None
+    tracer_provider=None,
+    filter_=None,
+    request_hook=None,
+    response_hook=None,
+    meter_provider=None,
+    summarize_streams=False,
+    message_event_interval=0,
 ):
     """Create a gRPC client channel interceptor.
 
@@ -581,6 +686,14 @@ def client_interceptor(
                  matches the condition. Default is None and intercept
                  all requests.
 
+        meter_provider: The meter provider of the RPC metrics.
+
+        summarize_streams: whether the messages of the streaming RPCs are
+                 only counted, see "Streaming RPCs".
+
+        message_event_interval: the number of messages of a summarized
+                 stream per message event added to its span.
+
     Returns:
         An invocation-side interceptor object.
     """
@@ -593,15 +706,31 @@ def client_interceptor(
         schema_url="https://opentelemetry.io/schemas/1.11.0",
     )
 
+    meter = get_meter(
+        __name__,
+        __version__,
+        meter_provider,
+        schema_url="https://opentelemetry.io/schemas/1.11.0",
+    )
+
     return _client.OpenTelemetryClientInterceptor(
         tracer,
         filter_=filter_,
         request_hook=request_hook,
         response_hook=response_hook,
+        meter=meter,
+        summarize_streams=summarize_streams,
+        message_event_interval=message_event_interval,
     )
 
 
-def server_interceptor(tracer_provider=None, filter_=None):
+def server_interceptor(
+    tracer_provider=None,
+    filter_=None,
+    meter_provider=None,
+    summarize_streams=False,
+    message_event_interval=0,
+):
     """Create a gRPC server interceptor.
 
     Args:
@@ -611,6 +740,14 @@ def server_interceptor(tracer_provider=None, filter_=None):
                  matches the condition. Default is None and intercept
                  all requests.
 
+        meter_provider: The meter provider of the RPC metrics.
+
+        summarize_streams: whether the messages of the streaming RPCs are
+                 only counted, see "Streaming RPCs".
+
+        message_event_interval: the number of messages of a summarized
+                 stream per message event added to its span.
+
     Returns:
         A service-side interceptor object.
     """
@@ -623,17 +760,44 @@ def server_interceptor(tracer_provider=None, filter_=None):
         schema_url="https://opentelemetry.io/schemas/1.11.0",
     )
 
-    return _server.OpenTelemetryServerInterceptor(tracer, filter_=filter_)
+    meter = get_meter(
+        __name__,
+        __version__,
+        meter_provider,
+        schema_url="https://opentelemetry.io/schemas/1.11.0",
+    )
+
+    return _server.OpenTelemetryServerInterceptor(
+        tracer,
+        filter_=filter_,
+        meter=meter,
+        summarize_streams=summarize_streams,
+        message_event_interval=message_event_interval,
+    )
 
 
 def aio_client_interceptors(
-    tracer_provider=None, filter_=None, request_hook=None, response_hook=None
+    tracer_provider=None,
+    filter_=None,
+    request_hook=None,
+    response_hook=None,
+    meter_provider=None,
+    summarize_streams=False,
+    message_event_interval=0,
 ):
     """Create a gRPC client channel interceptor.
 
     Args:
         tracer: The tracer to use to create client-side spans.
 
+        meter_provider: The meter provider of the RPC metrics.
+
+        summarize_streams: whether the messages of the streaming RPCs are
+                 only counted, see "Streaming RPCs".
+
+        message_event_interval: the number of messages of a summarized
+                 stream per message event added to its span.
+
     Returns:
         An invocation-side interceptor object.
     """
@@ -646,40 +810,73 @@ def aio_client_interceptors(
         schema_url="https://opentelemetry.io/schemas/1.11.0",
     )
 
+    meter = get_meter(
+        __name__,
+        __version__,
+        meter_provider,
+        schema_url="https://opentelemetry.io/schemas/1.11.0",
+    )
+
     return [
         _aio_client.UnaryUnaryAioClientInterceptor(
             tracer,
             filter_=filter_,
             request_hook=request_hook,
             response_hook=response_hook,
+            meter=meter,
+            summarize_streams=summarize_streams,
+            message_event_interval=message_event_interval,
         ),
         _aio_client.UnaryStreamAioClientInterceptor(
             tracer,
             filter_=filter_,
             request_hook=request_hook,
             response_hook=response_hook,
+            meter=meter,
+            summarize_streams=summarize_streams,
+            message_event_interval=message_event_interval,
         ),
         _aio_client.StreamUnaryAioClientInterceptor(
             tracer,
             filter_=filter_,
             request_hook=request_hook,
             response_hook=response_hook,
+            meter=meter,
+            summarize_streams=summarize_streams,
+            message_event_interval=message_event_interval,
         ),
         _aio_client.StreamStreamAioClientInterceptor(
             tracer,
             filter_=filter_,
             request_hook=request_hook,
             response_hook=response_hook,
+            meter=meter,
+            summarize_streams=summarize_streams,
+            message_event_interval=message_event_interval,
         ),
     ]
 
 
-def aio_server_interceptor(tracer_provider=None, filter_=None):
+def aio_server_interceptor(
+    tracer_provider=None,
+    filter_=None,
+    meter_provider=None,
+    summarize_streams=False,
+    message_event_interval=0,
+):
     """Create a gRPC aio server interceptor.
 
     Args:
         tracer: The tracer to use to create server-side spans.
 
+        meter_provider: The meter provider of the RPC metrics.
+
+        summarize_streams: whether the messages of the streaming RPCs are
+                 only counted, see "Streaming RPCs".
+
+        message_event_interval: the number of messages of a summarized
+                 stream per message event added to its span.
+
     Returns:
         A service-side interceptor object.
     """
@@ -692,8 +889,19 @@ def aio_server_interceptor(tracer_provider=None, filter_=None):
         schema_url="https://opentelemetry.io/schemas/1.11.0",
     )
 
+    meter = get_meter(
+        __name__,
+        __version__,
+        meter_provider,
+        schema_url="https://opentelemetry.io/schemas/1.11.0",
+    )
+
     return _aio_server.OpenTelemetryAioServerInterceptor(
-        tracer, filter_=filter_
+        tracer,
+        filter_=filter_,
+        meter=meter,
+        summarize_streams=summarize_streams,
+        message_event_interval=message_event_interval,
     )
 
 
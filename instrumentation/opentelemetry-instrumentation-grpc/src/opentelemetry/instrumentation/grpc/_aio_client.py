@@ -88,22 +88,31 @@ class _BaseAioClientInterceptor(OpenTelemetryClientInterceptor):
         )
         span.record_exception(exc)
 
-    def _start_interceptor_span(self, method):
+    @staticmethod
+    def _method_name(method):
         # method _should_ be a string here but due to a bug in grpc, it is
         # populated with a bytes object. Handle both cases such that we
         # are forward-compatible with a fixed version of grpc
         # More info: https://github.com/grpc/grpc/issues/31092
         if isinstance(method, bytes):
-            method = method.decode()
+            return method.decode()
+        return method
 
+    def _start_interceptor_span(self, method):
         return self._start_span(
-            method,
+            self._method_name(method),
             end_on_exit=False,
             record_exception=False,
             set_status_on_exception=False,
         )
 
-    async def _wrap_unary_response(self, continuation, span):
+    def _start_tally(self, client_call_details, streaming):
+        return self._metrics.start(
+            self._method_name(client_call_details.method),
+            streaming=streaming,
+        )
+
+    async def _wrap_unary_response(self, continuation, span, tally):
         try:
             call = await continuation()
 
@@ -114,6 +123,10 @@ class _BaseAioClientInterceptor(OpenTelemetryClientInterceptor):
             code = await call.code()
             details = await call.details()
 
+            if code == grpc.StatusCode.OK:
+                tally.on_response(await call)
+            tally.end(code)
+
             call.add_done_callback(
                 _unary_done_callback(
                     span, code, details, self._call_response_hook
@@ -122,19 +135,24 @@ class _BaseAioClientInterceptor(OpenTelemetryClientInterceptor):
 
             return call
         except grpc.aio.AioRpcError as exc:
+            tally.fail(exc)
+            tally.end()
             self.add_error_details_to_span(span, exc)
             raise exc
 
-    async def _wrap_stream_response(self, span, call):
+    async def _wrap_stream_response(self, span, call, tally):
         try:
             async for response in call:
+                tally.on_response(response)
                 if self._response_hook:
                     self._call_response_hook(span, response)
                 yield response
         except Exception as exc:
+            tally.fail(exc)
             self.add_error_details_to_span(span, exc)
             raise exc
         finally:
+            tally.end()
             span.end()
 
     def tracing_skipped(self, client_call_details):
@@ -157,9 +175,12 @@ class UnaryUnaryAioClientInterceptor(
         if self.tracing_skipped(client_call_details):
             return await continuation(client_call_details, request)
 
+        tally = self._start_tally(client_call_details, False)
+        tally.on_request(request)
         with self._start_interceptor_span(
             client_call_details.method,
         ) as span:
+            tally.set_span(span)
             new_details = self.propagate_trace_in_details(client_call_details)
 
             if self._request_hook:
@@ -169,7 +190,7 @@ class UnaryUnaryAioClientInterceptor(
                 continuation, new_details, request
             )
             return await self._wrap_unary_response(
-                continuation_with_args, span
+                continuation_with_args, span, tally
             )
 
 
@@ -183,15 +204,18 @@ class UnaryStreamAioClientInterceptor(
         if self.tracing_skipped(client_call_details):
             return await continuation(client_call_details, request)
 
+        tally = self._start_tally(client_call_details, True)
+        tally.on_request(request)
         with self._start_interceptor_span(
             client_call_details.method,
         ) as span:
+            tally.set_span(span)
             new_details = self.propagate_trace_in_details(client_call_details)
 
             resp = await continuation(new_details, request)
             if self._request_hook:
                 self._call_request_hook(span, request)
-            return self._wrap_stream_response(span, resp)
+            return self._wrap_stream_response(span, resp, tally)
 
 
 class StreamUnaryAioClientInterceptor(
@@ -204,16 +228,19 @@ class StreamUnaryAioClientInterceptor(
         if self.tracing_skipped(client_call_details):
             return await continuation(client_call_details, request_iterator)
 
+        tally = self._start_tally(client_call_details, True)
+        request_iterator = tally.count_aio_requests(request_iterator)
         with self._start_interceptor_span(
             client_call_details.method,
         ) as span:
+            tally.set_span(span)
             new_details = self.propagate_trace_in_details(client_call_details)
 
             continuation_with_args = functools.partial(
                 continuation, new_details, request_iterator
             )
             return await self._wrap_unary_response(
-                continuation_with_args, span
+                continuation_with_args, span, tally
             )
 
 
@@ -227,11 +254,14 @@ class StreamStreamAioClientInterceptor(
         if self.tracing_skipped(client_call_details):
             return await continuation(client_call_details, request_iterator)
 
+        tally = self._start_tally(client_call_details, True)
+        request_iterator = tally.count_aio_requests(request_iterator)
         with self._start_interceptor_span(
             client_call_details.method,
         ) as span:
+            tally.set_span(span)
             new_details = self.propagate_trace_in_details(client_call_details)
 
             resp = await continuation(new_details, request_iterator)
 
-            return self._wrap_stream_response(span, resp)
+            return self._wrap_stream_response(span, resp, tally)
@@ -86,19 +86,46 @@ class OpenTelemetryAioServerInterceptor(
                 return self._intercept_aio_server_stream(
                     behavior,
                     handler_call_details,
+                    request_streaming,
                 )
 
             return self._intercept_aio_server_unary(
                 behavior,
                 handler_call_details,
+                request_streaming,
             )
 
         next_handler = await continuation(handler_call_details)
 
         return _wrap_rpc_behavior(next_handler, telemetry_wrapper)
 
-    def _intercept_aio_server_unary(self, behavior, handler_call_details):
+    def _start_tally(
+        self,
+        handler_call_details,
+        request_or_iterator,
+        request_streaming,
+        response_streaming,
+    ):
+        tally = self._metrics.start(
+            handler_call_details.method,
+            streaming=request_streaming or response_streaming,
+        )
+        if request_streaming:
+            request_or_iterator = tally.count_aio_requests(request_or_iterator)
+        else:
+            tally.on_request(request_or_iterator)
+        return tally, request_or_iterator
+
+    def _intercept_aio_server_unary(
+        self, behavior, handler_call_details, request_streaming
+    ):
         async def _unary_interceptor(request_or_iterator, context):
+            tally, request_or_iterator = self._start_tally(
+                handler_call_details,
+                request_or_iterator,
+                request_streaming,
+                False,
+            )
             with self._set_remote_context(context):
                 with self._start_span(
                     handler_call_details,
@@ -107,12 +134,16 @@ class OpenTelemetryAioServerInterceptor(
                 ) as span:
                     # wrap the context
                     context = _OpenTelemetryAioServicerContext(context, span)
+                    tally.set_span(span)
 
                     # And now we run the actual RPC.
                     try:
-                        return await behavior(request_or_iterator, context)
+                        response = await behavior(request_or_iterator, context)
+                        tally.on_response(response)
+                        return response
 
                     except Exception as error:
+                        tally.fail(error)
                         # Bare exceptions are likely to be gRPC aborts, which
                         # we handle in our context wrapper.
                         # Here, we're interested in uncaught exceptions.
@@ -120,11 +151,21 @@ class OpenTelemetryAioServerInterceptor(
                         if type(error) != Exception:  # noqa: E721
                             span.record_exception(error)
                         raise error
+                    finally:
+                        tally.end(context._self_code)
 
         return _unary_interceptor
 
-    def _intercept_aio_server_stream(self, behavior, handler_call_details):
+    def _intercept_aio_server_stream(
+        self, behavior, handler_call_details, request_streaming
+    ):
         async def _stream_interceptor(request_or_iterator, context):
+            tally, request_or_iterator = self._start_tally(
+                handler_call_details,
+                request_or_iterator,
+                request_streaming,
+                True,
+            )
             with self._set_remote_context(context):
                 with self._start_span(
                     handler_call_details,
@@ -132,17 +173,22 @@ class OpenTelemetryAioServerInterceptor(
                     set_status_on_exception=False,
                 ) as span:
                     context = _OpenTelemetryAioServicerContext(context, span)
+                    tally.set_span(span)
 
                     try:
                         async for response in behavior(
                             request_or_iterator, context
                         ):
+                            tally.on_response(response)
                             yield response
 
                     except Exception as error:
+                        tally.fail(error)
                         # pylint:disable=unidiomatic-typecheck
                         if type(error) != Exception:  # noqa: E721
                             span.record_exception(error)
                         raise error
+                    finally:
+                        tally.end(context._self_code)
 
         return _stream_interceptor
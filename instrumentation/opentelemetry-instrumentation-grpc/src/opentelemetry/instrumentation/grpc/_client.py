@@ -27,15 +27,17 @@ import grpc
 
 from opentelemetry import trace
 from opentelemetry.instrumentation.grpc import grpcext
-from opentelemetry.instrumentation.grpc._utilities import RpcInfo
+from opentelemetry.instrumentation.grpc._metrics import _RpcMetrics
+from opentelemetry.instrumentation.grpc._utilities import (
+    RpcInfo,
+    _rpc_attributes,
+)
+from opentelemetry.instrumentation.grpc.filters import _compile
 from opentelemetry.instrumentation.utils import is_instrumentation_enabled
 from opentelemetry.propagate import inject
 from opentelemetry.propagators.textmap import Setter
 from opentelemetry.semconv._incubating.attributes.rpc_attributes import (
     RPC_GRPC_STATUS_CODE,
-    RPC_METHOD,
-    RPC_SERVICE,
-    RPC_SYSTEM,
 )
 from opentelemetry.trace.status import Status, StatusCode
 
@@ -54,15 +56,18 @@ class _CarrierSetter(Setter):
 _carrier_setter = _CarrierSetter()
 
 
-def _make_future_done_callback(span, rpc_info):
+def _make_future_done_callback(span, rpc_info, tally):
     def callback(response_future):
         with trace.use_span(span, end_on_exit=True):
             code = response_future.code()
             if code != grpc.StatusCode.OK:
                 rpc_info.error = code
+                tally.end(code)
                 return
             response = response_future.result()
             rpc_info.response = response
+            tally.on_response(response)
+            tally.end()
 
     return callback
 
@@ -82,36 +87,38 @@ class OpenTelemetryClientInterceptor(
     grpcext.UnaryClientInterceptor, grpcext.StreamClientInterceptor
 ):
     def __init__(
-        self, tracer, filter_=None, request_hook=None, response_hook=None
+        self,
+        tracer,
+        filter_=None,
+        request_hook=None,
+        response_hook=None,
+        meter=None,
+        summarize_streams=False,
+        message_event_interval=0,
     ):
         self._tracer = tracer
-        self._filter = filter_
+        self._filter = _compile(filter_)
         self._request_hook = request_hook
         self._response_hook = response_hook
+        self._metrics = _RpcMetrics(
+            meter, "client", summarize_streams, message_event_interval
+        )
 
     def _start_span(self, method, **kwargs):
-        service, meth = method.lstrip("/").split("/", 1)
-        attributes = {
-            RPC_SYSTEM: "grpc",
-            RPC_GRPC_STATUS_CODE: grpc.StatusCode.OK.value[0],
-            RPC_METHOD: meth,
-            RPC_SERVICE: service,
-        }
-
         return self._tracer.start_as_current_span(
             name=method,
             kind=trace.SpanKind.CLIENT,
-            attributes=attributes,
+            attributes=_rpc_attributes(method),
             **kwargs,
         )
 
     # pylint:disable=no-self-use
-    def _trace_result(self, span, rpc_info, result):
+    def _trace_result(self, span, rpc_info, result, tally):
         # If the RPC is called asynchronously, add a callback to end the span
         # when the future is done, else end the span immediately
         if isinstance(result, grpc.Future):
             result.add_done_callback(
-                _make_future_done_callback(span, rpc_info)
+                _make_future_done_callback(span, rpc_info, tally)
             )
             return result
         response = result
@@ -124,6 +131,9 @@ class OpenTelemetryClientInterceptor(
         rpc_info.response = response
         if self._response_hook:
             self._call_response_hook(span, response)
+        if response is not None:
+            tally.on_response(response)
+        tally.end()
         span.end()
         return result
 
@@ -131,6 +141,15 @@ class OpenTelemetryClientInterceptor(
         if not is_instrumentation_enabled():
             return invoker(request, metadata)
 
+        is_client_stream = getattr(client_info, "is_client_stream", False)
+        tally = self._metrics.start(
+            client_info.full_method, streaming=is_client_stream
+        )
+        if is_client_stream:
+            request = tally.count_requests(request)
+        else:
+            tally.on_request(request)
+
         if not metadata:
             mutable_metadata = OrderedDict()
         else:
@@ -142,6 +161,7 @@ class OpenTelemetryClientInterceptor(
             set_status_on_exception=False,
         ) as span:
             result = None
+            tally.set_span(span)
             try:
                 inject(mutable_metadata, setter=_carrier_setter)
                 metadata = tuple(mutable_metadata.items())
@@ -156,6 +176,8 @@ class OpenTelemetryClientInterceptor(
                     self._call_request_hook(span, request)
                 result = invoker(request, metadata)
             except Exception as exc:
+                tally.fail(exc)
+                tally.end()
                 if isinstance(exc, grpc.RpcError):
                     span.set_attribute(
                         RPC_GRPC_STATUS_CODE,
@@ -172,7 +194,7 @@ class OpenTelemetryClientInterceptor(
             finally:
                 if result is None:
                     span.end()
-        return self._trace_result(span, rpc_info, result)
+        return self._trace_result(span, rpc_info, result, tally)
 
     def _call_request_hook(self, span, request):
         if not callable(self._request_hook):
@@ -195,12 +217,19 @@ class OpenTelemetryClientInterceptor(
     def _intercept_server_stream(
         self, request_or_iterator, metadata, client_info, invoker
     ):
+        tally = self._metrics.start(client_info.full_method, streaming=True)
+        if client_info.is_client_stream:
+            request_or_iterator = tally.count_requests(request_or_iterator)
+        else:
+            tally.on_request(request_or_iterator)
+
         if not metadata:
             mutable_metadata = OrderedDict()
         else:
             mutable_metadata = OrderedDict(metadata)
 
         with self._start_span(client_info.full_method) as span:
+            tally.set_span(span)
             inject(mutable_metadata, setter=_carrier_setter)
             metadata = tuple(mutable_metadata.items())
             rpc_info = RpcInfo(
@@ -213,11 +242,16 @@ class OpenTelemetryClientInterceptor(
                 rpc_info.request = request_or_iterator
 
             try:
-                yield from invoker(request_or_iterator, metadata)
+                for response in invoker(request_or_iterator, metadata):
+                    tally.on_response(response)
+                    yield response
             except grpc.RpcError as err:
+                tally.fail(err)
                 span.set_status(Status(StatusCode.ERROR))
                 span.set_attribute(RPC_GRPC_STATUS_CODE, err.code().value[0])
                 raise err
+            finally:
+                tally.end()
 
     def intercept_stream(
         self, request_or_iterator, metadata, client_info, invoker
@@ -0,0 +1,312 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Metrics of the RPCs sent and received by the gRPC interceptors, recorded
+whether or not the spans of the RPCs are sampled.
+"""
+
+from timeit import default_timer
+
+import grpc
+
+from opentelemetry.metrics import NoOpMeter
+from opentelemetry.semconv._incubating.attributes.rpc_attributes import (
+    RPC_GRPC_STATUS_CODE,
+    RPC_MESSAGE_ID,
+    RPC_MESSAGE_TYPE,
+    RPC_MESSAGE_UNCOMPRESSED_SIZE,
+)
+from opentelemetry.semconv._incubating.metrics.rpc_metrics import (
+    RPC_CLIENT_DURATION,
+    RPC_CLIENT_REQUEST_SIZE,
+    RPC_CLIENT_REQUESTS_PER_RPC,
+    RPC_CLIENT_RESPONSE_SIZE,
+    RPC_CLIENT_RESPONSES_PER_RPC,
+    RPC_SERVER_DURATION,
+    RPC_SERVER_REQUEST_SIZE,
+    RPC_SERVER_REQUESTS_PER_RPC,
+    RPC_SERVER_RESPONSE_SIZE,
+    RPC_SERVER_RESPONSES_PER_RPC,
+)
+
+from ._utilities import _method_attributes
+
+# Span attributes of the message counters of the summarized streams
+RPC_GRPC_STREAM_REQUESTS = "rpc.grpc.stream.requests"
+RPC_GRPC_STREAM_RESPONSES = "rpc.grpc.stream.responses"
+RPC_GRPC_STREAM_REQUEST_BYTES = "rpc.grpc.stream.request_bytes"
+RPC_GRPC_STREAM_RESPONSE_BYTES = "rpc.grpc.stream.response_bytes"
+
+# Types of the requests and responses in the message events of each side
+_MESSAGE_TYPES = {
+    "server": ("RECEIVED", "SENT"),
+    "client": ("SENT", "RECEIVED"),
+}
+
+# Names of the duration, request size, response size, requests per RPC and
+# responses per RPC histograms of each side of the RPCs
+_INSTRUMENT_NAMES = {
+    "server": (
+        RPC_SERVER_DURATION,
+        RPC_SERVER_REQUEST_SIZE,
+        RPC_SERVER_RESPONSE_SIZE,
+        RPC_SERVER_REQUESTS_PER_RPC,
+        RPC_SERVER_RESPONSES_PER_RPC,
+    ),
+    "client": (
+        RPC_CLIENT_DURATION,
+        RPC_CLIENT_REQUEST_SIZE,
+        RPC_CLIENT_RESPONSE_SIZE,
+        RPC_CLIENT_REQUESTS_PER_RPC,
+        RPC_CLIENT_RESPONSES_PER_RPC,
+    ),
+}
+
+
+def _message_size(message):
+    """Returns the serialized size of a protobuf or raw bytes message."""
+    if isinstance(message, (bytes, bytearray)):
+        return len(message)
+    byte_size = getattr(message, "ByteSize", None)
+    if byte_size is None:
+        return None
+    return byte_size()
+
+
+class _RpcTally:
+    """Tallies the messages of an RPC as they are sent or received, the
+    sizes of the messages are recorded as they go and the duration and
+    message counts when the RPC ends."""
+
+    __slots__ = (
+        "_metrics",
+        "_attributes",
+        "_start",
+        "code",
+        "requests",
+        "responses",
+    )
+
+    def __init__(self, metrics, full_method):
+        self._metrics = metrics
+        self._attributes = _method_attributes(full_method)
+        self._start = default_timer()
+        self.code = grpc.StatusCode.OK
+        self.requests = 0
+        self.responses = 0
+
+    def set_span(self, span):
+        pass
+
+    def on_request(self, message):
+        self.requests += 1
+        size = _message_size(message)
+        if size is not None:
+            self._metrics.request_size.record(size, self._attributes)
+
+    def on_response(self, message):
+        self.responses += 1
+        size = _message_size(message)
+        if size is not None:
+            self._metrics.response_size.record(size, self._attributes)
+
+    def count_requests(self, request_iterator):
+        for request in request_iterator:
+            self.on_request(request)
+            yield request
+
+    async def _count_requests_async(self, request_iterator):
+        async for request in request_iterator:
+            self.on_request(request)
+            yield request
+
+    def count_aio_requests(self, request_iterator):
+        """Counts the requests of an iterator passed to a ``grpc.aio`` stream,
+        which may be synchronous or asynchronous, or ``None`` when the
+        requests are written to the call."""
+        if request_iterator is None:
+            return None
+        if hasattr(request_iterator, "__aiter__"):
+            return self._count_requests_async(request_iterator)
+        return self.count_requests(request_iterator)
+
+    def fail(self, error):
+        """Sets the status code of the RPC which raised ``error``."""
+        if isinstance(error, grpc.RpcError) and callable(
+            getattr(error, "code", None)
+        ):
+            self.code = error.code()
+        elif self.code == grpc.StatusCode.OK:
+            self.code = grpc.StatusCode.UNKNOWN
+
+    def end(self, code=None):
+        """Records the duration and message counts of the RPC.
+
+        Args:
+            code: the status code set on the RPC, such as the one set by the
+                servicer, which takes precedence over the status code of the
+                error the RPC failed with unless it is ``OK``.
+        """
+        # an RPC is only recorded once, even if its end is observed twice
+        if self._start is None:
+            return
+        duration_ms = (default_timer() - self._start) * 1000
+        if code is not None and code != grpc.StatusCode.OK:
+            self.code = code
+        attributes = {
+            **self._attributes,
+            RPC_GRPC_STATUS_CODE: self.code.value[0],
+        }
+        metrics = self._metrics
+        metrics.duration.record(duration_ms, attributes)
+        metrics.requests_per_rpc.record(self.requests, attributes)
+        metrics.responses_per_rpc.record(self.responses, attributes)
+        self._start = None
+
+
+class _StreamTally(_RpcTally):
+    """Tallies the messages of a streaming RPC in plain counters.
+
+    Nothing is recorded per message, the counters are set on the span and
+    the duration and message counts are recorded when the stream ends. The
+    sizes of the messages are only summed up, they are not recorded in the
+    message size histograms. When ``event_interval`` is set, one message
+    event out of ``event_interval`` is added to the span.
+    """
+
+    __slots__ = (
+        "_span",
+        "_event_interval",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self, metrics, full_method, event_interval):
+        super().__init__(metrics, full_method)
+        self._span = None
+        self._event_interval = event_interval
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def set_span(self, span):
+        if span.is_recording():
+            self._span = span
+
+    def on_request(self, message):
+        self.requests += 1
+        size = _message_size(message)
+        if size is not None:
+            self.request_bytes += size
+        if (
+            self._event_interval
+            and self._span is not None
+            and self.requests % self._event_interval == 0
+        ):
+            self._add_message_event(0, self.requests, size)
+
+    def on_response(self, message):
+        self.responses += 1
+        size = _message_size(message)
+        if size is not None:
+            self.response_bytes += size
+        if (
+            self._event_interval
+            and self._span is not None
+            and self.responses % self._event_interval == 0
+        ):
+            self._add_message_event(1, self.responses, size)
+
+    def _add_message_event(self, direction, message_id, size):
+        attributes = {
+            RPC_MESSAGE_TYPE: _MESSAGE_TYPES[self._metrics.side][direction],
+            RPC_MESSAGE_ID: message_id,
+        }
+        if size is not None:
+            attributes[RPC_MESSAGE_UNCOMPRESSED_SIZE] = size
+        self._span.add_event("rpc.message", attributes)
+
+    def end(self, code=None):
+        if self._span is not None and self._start is not None:
+            self._span.set_attributes(
+                {
+                    RPC_GRPC_STREAM_REQUESTS: self.requests,
+                    RPC_GRPC_STREAM_RESPONSES: self.responses,
+                    RPC_GRPC_STREAM_REQUEST_BYTES: self.request_bytes,
+                    RPC_GRPC_STREAM_RESPONSE_BYTES: self.response_bytes,
+                }
+            )
+        super().end(code)
+
+
+class _RpcMetrics:
+    """Creates the RPC histograms of the server or the client side.
+
+    Args:
+        summarize_streams: whether the messages of the streaming RPCs are
+            tallied by a ``_StreamTally``.
+        message_event_interval: the number of messages of a summarized
+            stream per message event added to its span, ``0`` for none.
+    """
+
+    def __init__(
+        self, meter, side, summarize_streams=False, message_event_interval=0
+    ):
+        self.side = side
+        self._summarize_streams = summarize_streams
+        self._message_event_interval = message_event_interval
+        if meter is None:
+            meter = NoOpMeter("opentelemetry.instrumentation.grpc")
+        (
+            duration,
+            request_size,
+            response_size,
+            requests_per_rpc,
+            responses_per_rpc,
+        ) = _INSTRUMENT_NAMES[side]
+        self.duration = meter.create_histogram(
+            name=duration,
+            unit="ms",
+            description="Measures the duration of inbound RPC."
+            if side == "server"
+            else "Measures the duration of outbound RPC.",
+        )
+        self.request_size = meter.create_histogram(
+            name=request_size,
+            unit="By",
+            description="Measures the size of RPC request messages (uncompressed).",
+        )
+        self.response_size = meter.create_histogram(
+            name=response_size,
+            unit="By",
+            description="Measures the size of RPC response messages (uncompressed).",
+        )
+        self.requests_per_rpc = meter.create_histogram(
+            name=requests_per_rpc,
+            unit="{count}",
+            description="Measures the number of messages received per RPC.",
+        )
+        self.responses_per_rpc = meter.create_histogram(
+            name=responses_per_rpc,
+            unit="{count}",
+            description="Measures the number of messages sent per RPC.",
+        )
+
+    def start(self, full_method, streaming=False):
+        """Returns the tally of a new RPC of ``full_method``."""
+        if streaming and self._summarize_streams:
+            return _StreamTally(
+                self, full_method, self._message_event_interval
+            )
+        return _RpcTally(self, full_method)
@@ -29,6 +29,7 @@ import grpc
 
 from opentelemetry import trace
 from opentelemetry.context import attach, detach
+from opentelemetry.instrumentation.grpc.filters import _compile
 from opentelemetry.propagate import extract
 from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_PEER_IP,
@@ -37,12 +38,10 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
 )
 from opentelemetry.semconv._incubating.attributes.rpc_attributes import (
     RPC_GRPC_STATUS_CODE,
-    RPC_METHOD,
-    RPC_SERVICE,
-    RPC_SYSTEM,
 )
 
-from ._utilities import _server_status
+from ._metrics import _RpcMetrics
+from ._utilities import _rpc_attributes, _server_status
 
 logger = logging.getLogger(__name__)
 
@@ -195,9 +194,19 @@ class OpenTelemetryServerInterceptor(grpc.ServerInterceptor):
 
     """
 
-    def __init__(self, tracer, filter_=None):
+    def __init__(
+        self,
+        tracer,
+        filter_=None,
+        meter=None,
+        summarize_streams=False,
+        message_event_interval=0,
+    ):
         self._tracer = tracer
-        self._filter = filter_
+        self._filter = _compile(filter_)
+        self._metrics = _RpcMetrics(
+            meter, "server", summarize_streams, message_event_interval
+        )
 
     @contextmanager
     def _set_remote_context(self, servicer_context):
@@ -217,23 +226,8 @@ class OpenTelemetryServerInterceptor(grpc.ServerInterceptor):
     def _start_span(
         self, handler_call_details, context, set_status_on_exception=False
     ):
-        # standard attributes
-        attributes = {
-            RPC_SYSTEM: "grpc",
-            RPC_GRPC_STATUS_CODE: grpc.StatusCode.OK.value[0],
-        }
-
-        # if we have details about the call, split into service and method
-        if handler_call_details.method:
-            service, method = handler_call_details.method.lstrip("/").split(
-                "/", 1
-            )
-            attributes.update(
-                {
-                    RPC_METHOD: method,
-                    RPC_SERVICE: service,
-                }
-            )
+        # standard attributes, with the service and method of the call
+        attributes = dict(_rpc_attributes(handler_call_details.method))
 
         # add some attributes from the metadata
         metadata = dict(context.invocation_metadata())
@@ -284,6 +278,17 @@ class OpenTelemetryServerInterceptor(grpc.ServerInterceptor):
 
         def telemetry_wrapper(behavior, request_streaming, response_streaming):
             def telemetry_interceptor(request_or_iterator, context):
+                tally = self._metrics.start(
+                    handler_call_details.method,
+                    streaming=request_streaming or response_streaming,
+                )
+                if request_streaming:
+                    request_or_iterator = tally.count_requests(
+                        request_or_iterator
+                    )
+                else:
+                    tally.on_request(request_or_iterator)
+
                 # handle streaming responses specially
                 if response_streaming:
                     return self._intercept_server_stream(
@@ -291,6 +296,7 @@ class OpenTelemetryServerInterceptor(grpc.ServerInterceptor):
                         handler_call_details,
                         request_or_iterator,
                         context,
+                        tally,
                     )
 
                 with self._set_remote_context(context):
@@ -301,12 +307,16 @@ class OpenTelemetryServerInterceptor(grpc.ServerInterceptor):
                     ) as span:
                         # wrap the context
                         context = _OpenTelemetryServicerContext(context, span)
+                        tally.set_span(span)
 
                         # And now we run the actual RPC.
                         try:
-                            return behavior(request_or_iterator, context)
+                            response = behavior(request_or_iterator, context)
+                            tally.on_response(response)
+                            return response
 
                         except Exception as error:
+                            tally.fail(error)
                             # Bare exceptions are likely to be gRPC aborts, which
                             # we handle in our context wrapper.
                             # Here, we're interested in uncaught exceptions.
@@ -314,6 +324,8 @@ class OpenTelemetryServerInterceptor(grpc.ServerInterceptor):
                             if type(error) != Exception:  # noqa: E721
                                 span.record_exception(error)
                             raise error
+                        finally:
+                            tally.end(context._code)
 
             return telemetry_interceptor
 
@@ -325,19 +337,30 @@ class OpenTelemetryServerInterceptor(grpc.ServerInterceptor):
     # to return a *new* generator or various upstream things
     # get confused, or we'll lose the consistent trace
     def _intercept_server_stream(
-        self, behavior, handler_call_details, request_or_iterator, context
+        self,
+        behavior,
+        handler_call_details,
+        request_or_iterator,
+        context,
+        tally,
     ):
         with self._set_remote_context(context):
             with self._start_span(
                 handler_call_details, context, set_status_on_exception=False
             ) as span:
                 context = _OpenTelemetryServicerContext(context, span)
+                tally.set_span(span)
 
                 try:
-                    yield from behavior(request_or_iterator, context)
+                    for response in behavior(request_or_iterator, context):
+                        tally.on_response(response)
+                        yield response
 
                 except Exception as error:
+                    tally.fail(error)
                     # pylint:disable=unidiomatic-typecheck
                     if type(error) != Exception:  # noqa: E721
                         span.record_exception(error)
                     raise error
+                finally:
+                    tally.end(context._code)
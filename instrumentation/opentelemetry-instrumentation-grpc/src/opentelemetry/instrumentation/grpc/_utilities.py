@@ -14,8 +14,18 @@
 
 """Internal utilities."""
 
+import functools
+from types import MappingProxyType
+
 import grpc
 
+from opentelemetry.instrumentation.grpc.filters import _MAX_CACHED_METHODS
+from opentelemetry.semconv._incubating.attributes.rpc_attributes import (
+    RPC_GRPC_STATUS_CODE,
+    RPC_METHOD,
+    RPC_SERVICE,
+    RPC_SYSTEM,
+)
 from opentelemetry.trace.status import Status, StatusCode
 
 
@@ -37,6 +47,30 @@ class RpcInfo:
         self.error = error
 
 
+@functools.lru_cache(maxsize=_MAX_CACHED_METHODS)
+def _method_attributes(full_method):
+    """Returns the read-only system, service and method attributes of the
+    RPCs of ``full_method``, such as ``/package.Service/Method``."""
+    attributes = {RPC_SYSTEM: "grpc"}
+    if full_method:
+        service, method = full_method.lstrip("/").split("/", 1)
+        attributes[RPC_METHOD] = method
+        attributes[RPC_SERVICE] = service
+    return MappingProxyType(attributes)
+
+
+@functools.lru_cache(maxsize=_MAX_CACHED_METHODS)
+def _rpc_attributes(full_method):
+    """Returns the read-only attributes of the spans of the RPCs of
+    ``full_method``."""
+    return MappingProxyType(
+        {
+            **_method_attributes(full_method),
+            RPC_GRPC_STATUS_CODE: grpc.StatusCode.OK.value[0],
+        }
+    )
+
+
 def _server_status(code, details):
     error_status = Status(
         status_code=StatusCode.ERROR, description=f"{code}:{details}"
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
-from typing import Callable, TypeVar
+from typing import Callable, NamedTuple, TypeVar
 
 import grpc
 
@@ -26,6 +27,49 @@ CallDetailsT = TypeVar(
 # pylint: disable=invalid-name
 Condition = Callable[[CallDetailsT], bool]
 
+# Bound of the method names the parsed names and the filter decisions are
+# memoized for, servers receive the method names chosen by the clients
+_MAX_CACHED_METHODS = 1024
+
+# Set on the filter functions which only depend on the full method name
+_METHOD_FILTER_ATTR = "_otel_method_filter"
+
+
+class _MethodCallDetails(NamedTuple):
+    """The call details a method filter is evaluated on when compiled."""
+
+    method: str
+
+
+def _method_filter(filter_fn):
+    """Marks ``filter_fn`` as only depending on the full method name of the
+    RPC, so that its decisions can be memoized by ``_compile``."""
+    setattr(filter_fn, _METHOD_FILTER_ATTR, True)
+    return filter_fn
+
+
+def _is_method_filter(func) -> bool:
+    return getattr(func, _METHOD_FILTER_ATTR, False)
+
+
+def _compile(func):
+    """Returns ``func`` with its decisions memoized per full method name.
+
+    Filters which may depend on other call details than the method name,
+    such as user-defined filters, are returned unchanged.
+    """
+    if func is None or not _is_method_filter(func):
+        return func
+
+    @functools.lru_cache(maxsize=_MAX_CACHED_METHODS)
+    def decide(name):
+        return func(_MethodCallDetails(name))
+
+    def filter_fn(metadata):
+        return decide(_full_method(metadata))
+
+    return _method_filter(filter_fn)
+
 
 def _full_method(metadata):
     name = ""
@@ -53,8 +97,8 @@ def _full_method(metadata):
     return name
 
 
-def _split_full_method(metadata):
-    name = _full_method(metadata)
+@functools.lru_cache(maxsize=_MAX_CACHED_METHODS)
+def _split_method(name):
     service, method = os.path.split(name)
     if service != "":
         service = os.path.normpath(service)
@@ -62,6 +106,10 @@ def _split_full_method(metadata):
     return (service, method)
 
 
+def _split_full_method(metadata):
+    return _split_method(_full_method(metadata))
+
+
 def all_of(*args: Condition[CallDetailsT]) -> Condition[CallDetailsT]:
     """Returns a filter function that returns True if all filter functions
     assigned matches conditions.
@@ -77,6 +125,8 @@ def all_of(*args: Condition[CallDetailsT]) -> Condition[CallDetailsT]:
     def filter_fn(metadata):
         return all(func(metadata) for func in args)
 
+    if all(_is_method_filter(func) for func in args):
+        return _method_filter(filter_fn)
     return filter_fn
 
 
@@ -95,6 +145,8 @@ def any_of(*args: Condition[CallDetailsT]) -> Condition[CallDetailsT]:
     def filter_fn(metadata):
         return any(func(metadata) for func in args)
 
+    if all(_is_method_filter(func) for func in args):
+        return _method_filter(filter_fn)
     return filter_fn
 
 
@@ -111,6 +163,8 @@ def negate(func: Condition[CallDetailsT]) -> Condition[CallDetailsT]:
     def filter_fn(metadata):
         return not func(metadata)
 
+    if _is_method_filter(func):
+        return _method_filter(filter_fn)
     return filter_fn
 
 
@@ -130,7 +184,7 @@ def method_name(name: str) -> Condition[CallDetailsT]:
         _, method = _split_full_method(metadata)
         return method == name
 
-    return filter_fn
+    return _method_filter(filter_fn)
 
 
 def method_prefix(prefix: str) -> Condition[CallDetailsT]:
@@ -149,7 +203,7 @@ def method_prefix(prefix: str) -> Condition[CallDetailsT]:
         _, method = _split_full_method(metadata)
         return method.startswith(prefix)
 
-    return filter_fn
+    return _method_filter(filter_fn)
 
 
 def full_method_name(name: str) -> Condition[CallDetailsT]:
@@ -168,7 +222,7 @@ def full_method_name(name: str) -> Condition[CallDetailsT]:
         fm = _full_method(metadata)
         return fm == name
 
-    return filter_fn
+    return _method_filter(filter_fn)
 
 
 def service_name(name: str) -> Condition[CallDetailsT]:
@@ -187,7 +241,7 @@ def service_name(name: str) -> Condition[CallDetailsT]:
         service, _ = _split_full_method(metadata)
         return service == name
 
-    return filter_fn
+    return _method_filter(filter_fn)
 
 
 def service_prefix(prefix: str) -> Condition[CallDetailsT]:
@@ -206,7 +260,7 @@ def service_prefix(prefix: str) -> Condition[CallDetailsT]:
         service, _ = _split_full_method(metadata)
         return service.startswith(prefix)
 
-    return filter_fn
+    return _method_filter(filter_fn)
 
 
 def health_check() -> Condition[CallDetailsT]:
@@ -388,3 +388,73 @@ def test_health_check(test_case):
 def test_all_any_negate(test_case):
     fn = test_case[1]
     assert test_case[0] == fn(test_case[2])
+
+
+def test_compile_memoizes_decisions():
+    calls = []
+    fn = filters.method_name("SimpleMethod")
+
+    def counting_fn(metadata):
+        calls.append(metadata)
+        return fn(metadata)
+
+    compiled = filters._compile(filters._method_filter(counting_fn))
+    details = _UnaryClientInfo(
+        full_method="/GRPCTestServer/SimpleMethod", timeout=3000
+    )
+    assert compiled(details)
+    assert compiled(details)
+    assert compiled(
+        _HandlerCallDetails(
+            method="/GRPCTestServer/SimpleMethod", invocation_metadata=[]
+        )
+    )
+    assert not compiled(
+        _UnaryClientInfo(full_method="/GRPCTestServer/OtherMethod", timeout=0)
+    )
+    assert len(calls) == 2
+
+
+def test_compile_keeps_user_filters():
+    def user_fn(metadata):
+        return metadata.timeout > 1000
+
+    assert filters._compile(user_fn) is user_fn
+    assert filters._compile(None) is None
+
+    combined = filters.all_of(filters.method_name("SimpleMethod"), user_fn)
+    assert filters._compile(combined) is combined
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        filters.method_name("SimpleMethod"),
+        filters.full_method_name("/GRPCTestServer/SimpleMethod"),
+        filters.negate(filters.service_prefix("GRPCMock")),
+        filters.all_of(
+            filters.service_name("GRPCTestServer"),
+            filters.method_prefix("Simple"),
+        ),
+        filters.any_of(
+            filters.method_name("NotSimpleMethod"),
+            filters.health_check(),
+            filters.service_name("GRPCTestServer"),
+        ),
+    ],
+)
+def test_compiled_method_filters(fn):
+    compiled = filters._compile(fn)
+    assert compiled is not fn
+    for details in (
+        _UnaryClientInfo(
+            full_method="/GRPCTestServer/SimpleMethod", timeout=3000
+        ),
+        _StreamClientInfo(
+            full_method="/GRPCMockServer/OtherMethod",
+            is_client_stream=True,
+            is_server_stream=False,
+            timeout=3000,
+        ),
+    ):
+        assert compiled(details) == fn(details)
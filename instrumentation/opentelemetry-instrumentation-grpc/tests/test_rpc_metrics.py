@@ -0,0 +1,376 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent import futures
+from unittest import IsolatedAsyncioTestCase
+
+import grpc
+import grpc.aio
+
+from opentelemetry import trace
+from opentelemetry.instrumentation.grpc import (
+    aio_client_interceptors,
+    aio_server_interceptor,
+    client_interceptor,
+    server_interceptor,
+)
+from opentelemetry.instrumentation.grpc._metrics import (
+    RPC_GRPC_STREAM_REQUEST_BYTES,
+    RPC_GRPC_STREAM_REQUESTS,
+    RPC_GRPC_STREAM_RESPONSE_BYTES,
+    RPC_GRPC_STREAM_RESPONSES,
+    _RpcMetrics,
+)
+from opentelemetry.instrumentation.grpc.grpcext import intercept_channel
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+from opentelemetry.semconv._incubating.attributes.rpc_attributes import (
+    RPC_GRPC_STATUS_CODE,
+    RPC_MESSAGE_ID,
+    RPC_MESSAGE_TYPE,
+    RPC_METHOD,
+    RPC_SERVICE,
+    RPC_SYSTEM,
+)
+from opentelemetry.test.test_base import TestBase
+
+from ._client import (
+    bidirectional_streaming_method,
+    client_streaming_method,
+    server_streaming_method,
+    simple_method,
+    simple_method_future,
+)
+from ._server import TestServer
+from .protobuf.test_server_pb2 import Request, Response
+from .protobuf.test_server_pb2_grpc import (
+    GRPCTestServerServicer,
+    GRPCTestServerStub,
+    add_GRPCTestServerServicer_to_server,
+)
+
+
+class _RpcMetricsAssertions:
+    def get_histogram_points(self, name):
+        for metric in self.get_sorted_metrics():
+            if metric.name == name:
+                return list(metric.data.data_points)
+        return []
+
+    def assert_rpc_recorded(
+        self, side, method, code=grpc.StatusCode.OK, requests=1, responses=1
+    ):
+        attributes = {
+            RPC_SYSTEM: "grpc",
+            RPC_SERVICE: "GRPCTestServer",
+            RPC_METHOD: method,
+            RPC_GRPC_STATUS_CODE: code.value[0],
+        }
+        (duration,) = self.get_histogram_points(f"rpc.{side}.duration")
+        self.assertEqual(dict(duration.attributes), attributes)
+        self.assertEqual(duration.count, 1)
+        self.assertGreaterEqual(duration.sum, 0)
+
+        for name, count in (
+            ("requests_per_rpc", requests),
+            ("responses_per_rpc", responses),
+        ):
+            (point,) = self.get_histogram_points(f"rpc.{side}.{name}")
+            self.assertEqual(dict(point.attributes), attributes)
+            self.assertEqual(point.sum, count)
+
+        for name, count in (
+            ("request.size", requests),
+            ("response.size", responses),
+        ):
+            points = self.get_histogram_points(f"rpc.{side}.{name}")
+            self.assertEqual(sum(point.count for point in points), count)
+            for point in points:
+                self.assertNotIn(RPC_GRPC_STATUS_CODE, point.attributes)
+                # the responses of the failed RPCs of the tests are empty
+                if code == grpc.StatusCode.OK:
+                    self.assertGreater(point.sum, 0)
+
+
+class TestRpcMetrics(_RpcMetricsAssertions, TestBase):
+    def setUp(self):
+        super().setUp()
+        # the metrics are recorded even if the spans are not sampled
+        tracer_provider, _ = self.create_tracer_provider(sampler=ALWAYS_OFF)
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=1),
+            interceptors=[
+                server_interceptor(
+                    tracer_provider=tracer_provider,
+                    meter_provider=self.meter_provider,
+                )
+            ],
+        )
+        add_GRPCTestServerServicer_to_server(TestServer(), self.server)
+        port = self.server.add_insecure_port("localhost:0")
+        self.server.start()
+        self.channel = intercept_channel(
+            grpc.insecure_channel(f"localhost:{port}"),
+            client_interceptor(
+                tracer_provider=tracer_provider,
+                meter_provider=self.meter_provider,
+            ),
+        )
+        self._stub = GRPCTestServerStub(self.channel)
+
+    def tearDown(self):
+        super().tearDown()
+        self.server.stop(None)
+        self.channel.close()
+
+    def test_unary_unary(self):
+        simple_method(self._stub)
+
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 0)
+        self.assert_rpc_recorded("server", "SimpleMethod")
+        self.assert_rpc_recorded("client", "SimpleMethod")
+
+    def test_unary_unary_future(self):
+        simple_method_future(self._stub).result()
+
+        self.assert_rpc_recorded("client", "SimpleMethod")
+
+    def test_unary_unary_error(self):
+        with self.assertRaises(grpc.RpcError):
+            simple_method(self._stub, error=True)
+
+        self.assert_rpc_recorded(
+            "server", "SimpleMethod", code=grpc.StatusCode.INVALID_ARGUMENT
+        )
+        (duration,) = self.get_histogram_points("rpc.client.duration")
+        self.assertEqual(
+            duration.attributes[RPC_GRPC_STATUS_CODE],
+            grpc.StatusCode.INVALID_ARGUMENT.value[0],
+        )
+
+    def test_client_streaming(self):
+        client_streaming_method(self._stub)
+
+        self.assert_rpc_recorded("server", "ClientStreamingMethod", requests=5)
+        self.assert_rpc_recorded("client", "ClientStreamingMethod", requests=5)
+
+    def test_server_streaming(self):
+        server_streaming_method(self._stub)
+
+        self.assert_rpc_recorded(
+            "server", "ServerStreamingMethod", responses=5
+        )
+        self.assert_rpc_recorded(
+            "client", "ServerStreamingMethod", responses=5
+        )
+
+    def test_bidirectional_streaming(self):
+        bidirectional_streaming_method(self._stub)
+
+        self.assert_rpc_recorded(
+            "server", "BidirectionalStreamingMethod", requests=5, responses=5
+        )
+        self.assert_rpc_recorded(
+            "client", "BidirectionalStreamingMethod", requests=5, responses=5
+        )
+
+    def test_stream_sizes_recorded_per_message(self):
+        metrics = _RpcMetrics(
+            self.meter_provider.get_meter(__name__), "server"
+        )
+        tally = metrics.start("/GRPCTestServer/Method", streaming=True)
+        for message in (b"one", b"three"):
+            tally.on_response(message)
+        tally.end()
+
+        (point,) = self.get_histogram_points("rpc.server.response.size")
+        self.assertEqual(point.count, 2)
+        self.assertEqual(point.sum, 8)
+        self.assertEqual(point.min, 3)
+        self.assertEqual(point.max, 5)
+
+    def test_server_streaming_abort(self):
+        with self.assertRaises(grpc.RpcError):
+            server_streaming_method(self._stub, error=True)
+
+        (duration,) = self.get_histogram_points("rpc.server.duration")
+        self.assertEqual(
+            duration.attributes[RPC_GRPC_STATUS_CODE],
+            grpc.StatusCode.INVALID_ARGUMENT.value[0],
+        )
+        (duration,) = self.get_histogram_points("rpc.client.duration")
+        self.assertEqual(
+            duration.attributes[RPC_GRPC_STATUS_CODE],
+            grpc.StatusCode.INVALID_ARGUMENT.value[0],
+        )
+
+
+class TestSummarizedStreams(_RpcMetricsAssertions, TestBase):
+    def setUp(self):
+        super().setUp()
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=1),
+            interceptors=[
+                server_interceptor(
+                    meter_provider=self.meter_provider,
+                    summarize_streams=True,
+                    message_event_interval=2,
+                )
+            ],
+        )
+        add_GRPCTestServerServicer_to_server(TestServer(), self.server)
+        port = self.server.add_insecure_port("localhost:0")
+        self.server.start()
+        self.channel = intercept_channel(
+            grpc.insecure_channel(f"localhost:{port}"),
+            client_interceptor(
+                meter_provider=self.meter_provider,
+                summarize_streams=True,
+                message_event_interval=2,
+            ),
+        )
+        self._stub = GRPCTestServerStub(self.channel)
+
+    def tearDown(self):
+        super().tearDown()
+        self.server.stop(None)
+        self.channel.close()
+
+    def test_bidirectional_streaming(self):
+        bidirectional_streaming_method(self._stub)
+
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 2)
+        for span in spans:
+            self.assertEqual(span.attributes[RPC_GRPC_STREAM_REQUESTS], 5)
+            self.assertEqual(span.attributes[RPC_GRPC_STREAM_RESPONSES], 5)
+            self.assertGreater(
+                span.attributes[RPC_GRPC_STREAM_REQUEST_BYTES], 0
+            )
+            self.assertGreater(
+                span.attributes[RPC_GRPC_STREAM_RESPONSE_BYTES], 0
+            )
+
+        server_span = next(
+            span for span in spans if span.kind == trace.SpanKind.SERVER
+        )
+        self.assertEqual(
+            [
+                (
+                    event.name,
+                    event.attributes[RPC_MESSAGE_TYPE],
+                    event.attributes[RPC_MESSAGE_ID],
+                )
+                for event in server_span.events
+            ],
+            [
+                ("rpc.message", "RECEIVED", 2),
+                ("rpc.message", "RECEIVED", 4),
+                ("rpc.message", "SENT", 2),
+                ("rpc.message", "SENT", 4),
+            ],
+        )
+
+        (point,) = self.get_histogram_points("rpc.server.requests_per_rpc")
+        self.assertEqual(point.sum, 5)
+        (point,) = self.get_histogram_points("rpc.client.responses_per_rpc")
+        self.assertEqual(point.sum, 5)
+        self.assertEqual(
+            self.get_histogram_points("rpc.server.request.size"), []
+        )
+        self.assertEqual(
+            self.get_histogram_points("rpc.client.response.size"), []
+        )
+
+    def test_unary_unary_not_summarized(self):
+        simple_method(self._stub)
+
+        for span in self.memory_exporter.get_finished_spans():
+            self.assertNotIn(RPC_GRPC_STREAM_REQUESTS, span.attributes)
+            self.assertEqual(len(span.events), 0)
+        self.assert_rpc_recorded("server", "SimpleMethod")
+        self.assert_rpc_recorded("client", "SimpleMethod")
+
+    def test_unsampled_stream(self):
+        metrics = _RpcMetrics(None, "server", True, 1)
+        tally = metrics.start("/GRPCTestServer/Method", streaming=True)
+        span = trace.NonRecordingSpan(trace.INVALID_SPAN_CONTEXT)
+        tally.set_span(span)
+        for message in (b"one", b"three"):
+            tally.on_request(message)
+        tally.end()
+
+        self.assertEqual(tally.requests, 2)
+        self.assertEqual(tally.request_bytes, 8)
+
+
+class _AioServicer(GRPCTestServerServicer):
+    # pylint:disable=C0103
+    async def SimpleMethod(self, request, context):
+        return Response(server_id=1, response_data=request.request_data)
+
+    # pylint:disable=C0103
+    async def BidirectionalStreamingMethod(self, request_iterator, context):
+        async for request in request_iterator:
+            yield Response(server_id=1, response_data=request.request_data)
+
+
+class TestAioRpcMetrics(
+    _RpcMetricsAssertions, TestBase, IsolatedAsyncioTestCase
+):
+    async def asyncSetUp(self):
+        self.server = grpc.aio.server(
+            interceptors=[
+                aio_server_interceptor(meter_provider=self.meter_provider)
+            ]
+        )
+        add_GRPCTestServerServicer_to_server(_AioServicer(), self.server)
+        port = self.server.add_insecure_port("localhost:0")
+        await self.server.start()
+        self.channel = grpc.aio.insecure_channel(
+            f"localhost:{port}",
+            interceptors=aio_client_interceptors(
+                meter_provider=self.meter_provider
+            ),
+        )
+        self._stub = GRPCTestServerStub(self.channel)
+
+    async def asyncTearDown(self):
+        await self.channel.close()
+        await self.server.stop(None)
+
+    async def test_unary_unary(self):
+        await self._stub.SimpleMethod(Request(client_id=1, request_data="a"))
+
+        self.assert_rpc_recorded("server", "SimpleMethod")
+        self.assert_rpc_recorded("client", "SimpleMethod")
+
+    async def test_bidirectional_streaming(self):
+        async def request_messages():
+            for data in ("one", "two", "three"):
+                yield Request(client_id=1, request_data=data)
+
+        responses = [
+            response
+            async for response in self._stub.BidirectionalStreamingMethod(
+                request_messages()
+            )
+        ]
+
+        self.assertEqual(len(responses), 3)
+        self.assert_rpc_recorded(
+            "server", "BidirectionalStreamingMethod", requests=3, responses=3
+        )
+        self.assert_rpc_recorded(
+            "client", "BidirectionalStreamingMethod", requests=3, responses=3
+        )
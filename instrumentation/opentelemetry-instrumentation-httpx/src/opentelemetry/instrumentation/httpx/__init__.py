@@ -382,6 +382,11 @@ from opentelemetry.util.http import (
     redact_url,
     sanitize_method,
 )
+from opentelemetry.util.http.span_budget import (
+    OutboundSpanBudget,
+    get_outbound_span_budget,
+    start_client_span,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -452,6 +457,15 @@ def _extract_parameters(
     return method, url, headers, stream, extensions
 
 
+def _get_url_host(
+    url: httpx.URL | tuple[bytes, bytes, int | None, bytes],
+) -> str:
+    if isinstance(url, tuple):
+        host = url[1]
+        return host.decode() if isinstance(host, bytes) else host
+    return url.host
+
+
 def _normalize_url(
     url: httpx.URL | tuple[bytes, bytes, int | None, bytes],
 ) -> str:
@@ -731,6 +745,7 @@ class SyncOpenTelemetryTransport(httpx.BaseTransport):
         self._sensitive_headers = get_custom_headers(
             OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
         )
+        self._span_budget = get_outbound_span_budget()
 
     def __enter__(self) -> SyncOpenTelemetryTransport:
         self._transport.__enter__()
@@ -784,8 +799,14 @@ class SyncOpenTelemetryTransport(httpx.BaseTransport):
 
         request_info = RequestInfo(method, url, headers, stream, extensions)
 
-        with self._tracer.start_as_current_span(
-            span_name, kind=SpanKind.CLIENT, attributes=span_attributes
+        with start_client_span(
+            self._tracer,
+            self._span_budget,
+            span_name,
+            _get_url_host(url),
+            method_original,
+            kind=SpanKind.CLIENT,
+            attributes=span_attributes,
         ) as span:
             exception = None
             if callable(self._request_hook):
@@ -946,6 +967,7 @@ class AsyncOpenTelemetryTransport(httpx.AsyncBaseTransport):
         self._sensitive_headers = get_custom_headers(
             OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
         )
+        self._span_budget = get_outbound_span_budget()
 
     async def __aenter__(self) -> "AsyncOpenTelemetryTransport":
         await self._transport.__aenter__()
@@ -997,8 +1019,14 @@ class AsyncOpenTelemetryTransport(httpx.AsyncBaseTransport):
 
         request_info = RequestInfo(method, url, headers, stream, extensions)
 
-        with self._tracer.start_as_current_span(
-            span_name, kind=SpanKind.CLIENT, attributes=span_attributes
+        with start_client_span(
+            self._tracer,
+            self._span_budget,
+            span_name,
+            _get_url_host(url),
+            method_original,
+            kind=SpanKind.CLIENT,
+            attributes=span_attributes,
         ) as span:
             exception = None
             if callable(self._request_hook):
@@ -1143,6 +1171,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
         sensitive_headers: list[str] = get_custom_headers(
             OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
         )
+        span_budget = get_outbound_span_budget()
 
         _OpenTelemetrySemanticConventionStability._initialize()
         sem_conv_opt_in_mode = _OpenTelemetrySemanticConventionStability._get_opentelemetry_stability_opt_in_mode(
@@ -1195,6 +1224,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
                 captured_request_headers=captured_request_headers,
                 captured_response_headers=captured_response_headers,
                 sensitive_headers=sensitive_headers,
+                span_budget=span_budget,
             ),
         )
         wrap_function_wrapper(
@@ -1212,6 +1242,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
                 captured_request_headers=captured_request_headers,
                 captured_response_headers=captured_response_headers,
                 sensitive_headers=sensitive_headers,
+                span_budget=span_budget,
             ),
         )
 
@@ -1235,6 +1266,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
         captured_request_headers: list[str] | None = None,
         captured_response_headers: list[str] | None = None,
         sensitive_headers: list[str] | None = None,
+        span_budget: OutboundSpanBudget | None = None,
     ):
         if not is_http_instrumentation_enabled():
             return wrapped(*args, **kwargs)
@@ -1264,8 +1296,14 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
 
         request_info = RequestInfo(method, url, headers, stream, extensions)
 
-        with tracer.start_as_current_span(
-            span_name, kind=SpanKind.CLIENT, attributes=span_attributes
+        with start_client_span(
+            tracer,
+            span_budget,
+            span_name,
+            _get_url_host(url),
+            method_original,
+            kind=SpanKind.CLIENT,
+            attributes=span_attributes,
         ) as span:
             exception = None
             if callable(request_hook):
@@ -1366,6 +1404,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
         captured_request_headers: typing.Optional[list[str]] = None,
         captured_response_headers: typing.Optional[list[str]] = None,
         sensitive_headers: typing.Optional[list[str]] = None,
+        span_budget: typing.Optional[OutboundSpanBudget] = None,
     ):
         if not is_http_instrumentation_enabled():
             return await wrapped(*args, **kwargs)
@@ -1395,8 +1434,14 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
 
         request_info = RequestInfo(method, url, headers, stream, extensions)
 
-        with tracer.start_as_current_span(
-            span_name, kind=SpanKind.CLIENT, attributes=span_attributes
+        with start_client_span(
+            tracer,
+            span_budget,
+            span_name,
+            _get_url_host(url),
+            method_original,
+            kind=SpanKind.CLIENT,
+            attributes=span_attributes,
         ) as span:
             exception = None
             if callable(async_request_hook):
@@ -1564,6 +1609,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
         sensitive_headers: list[str] = get_custom_headers(
             OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
         )
+        span_budget = get_outbound_span_budget()
 
         if hasattr(client._transport, "handle_request"):
             wrap_function_wrapper(
@@ -1581,6 +1627,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
                     captured_request_headers=captured_request_headers,
                     captured_response_headers=captured_response_headers,
                     sensitive_headers=sensitive_headers,
+                    span_budget=span_budget,
                 ),
             )
             for transport in client._mounts.values():
@@ -1600,6 +1647,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
                             captured_request_headers=captured_request_headers,
                             captured_response_headers=captured_response_headers,
                             sensitive_headers=sensitive_headers,
+                            span_budget=span_budget,
                         ),
                     )
             client._is_instrumented_by_opentelemetry = True
@@ -1619,6 +1667,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
                     captured_request_headers=captured_request_headers,
                     captured_response_headers=captured_response_headers,
                     sensitive_headers=sensitive_headers,
+                    span_budget=span_budget,
                 ),
             )
             for transport in client._mounts.values():
@@ -1638,6 +1687,7 @@ class HTTPXClientInstrumentor(BaseInstrumentor):
                             captured_request_headers=captured_request_headers,
                             captured_response_headers=captured_response_headers,
                             sensitive_headers=sensitive_headers,
+                            span_budget=span_budget,
                         ),
                     )
             client._is_instrumented_by_opentelemetry = True
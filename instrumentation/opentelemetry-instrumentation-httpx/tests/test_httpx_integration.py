@@ -72,6 +72,9 @@ from opentelemetry.semconv.schemas import Schemas
 from opentelemetry.test.mock_textmap import MockTextMapPropagator
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import StatusCode
+from opentelemetry.util.http.span_budget import (
+    OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET,
+)
 
 if typing.TYPE_CHECKING:
     from opentelemetry.instrumentation.httpx import (
@@ -1486,6 +1489,38 @@ class BaseTestCases:
                             and getattr(handler, "__wrapped__")
                         )
 
+        def test_outbound_span_budget(self):
+            HTTPXClientInstrumentor().uninstrument()
+            with mock.patch.dict(
+                "os.environ",
+                {OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET: "2"},
+            ):
+                HTTPXClientInstrumentor().instrument()
+
+            tracer = trace.get_tracer(__name__)
+            with tracer.start_as_current_span("parent"):
+                for _ in range(5):
+                    result = self.perform_request(
+                        self.URL, client=self.create_client()
+                    )
+                    self.assertEqual(result.text, "Hello!")
+
+            spans = self.assert_span(num_spans=3)
+            parent = spans[-1]
+            self.assertEqual(parent.name, "parent")
+            for span in spans[:-1]:
+                self.assertEqual(span.parent.span_id, parent.context.span_id)
+            self.assertEqual(
+                parent.attributes["http.client.suppressed.targets"],
+                ("GET mock",),
+            )
+            self.assertEqual(
+                parent.attributes["http.client.suppressed.count"], (3,)
+            )
+            # durations are still recorded for every request
+            (metric,) = self.assert_metrics()
+            self.assertEqual(metric.data.data_points[0].count, 5)
+
         def test_custom_tracer_provider(self):
             resource = resources.Resource.create({})
             result = self.create_tracer_provider(resource=resource)
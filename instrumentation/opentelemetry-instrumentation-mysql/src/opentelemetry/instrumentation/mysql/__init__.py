@@ -177,6 +177,10 @@ class MySQLInstrumentor(BaseInstrumentor):
         https://dev.mysql.com/doc/connector-python/en/
         """
         tracer_provider = kwargs.get("tracer_provider")
+        meter_provider = kwargs.get("meter_provider")
+        enable_metrics = kwargs.get("enable_metrics", False)
+        metrics_fingerprint_limit = kwargs.get("metrics_fingerprint_limit", 0)
+        repeated_query_threshold = kwargs.get("repeated_query_threshold", 0)
         enable_sqlcommenter = kwargs.get("enable_commenter", False)
         commenter_options = kwargs.get("commenter_options", {})
         enable_attribute_commenter = kwargs.get(
@@ -191,6 +195,10 @@ class MySQLInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
             enable_commenter=enable_sqlcommenter,
             commenter_options=commenter_options,
             enable_attribute_commenter=enable_attribute_commenter,
@@ -137,26 +137,91 @@ setting.
 Warning:
     Capture of sqlcomment in ``db.statement`` may have high cardinality without platform normalization. See `Semantic Conventions for database spans <https://opentelemetry.io/docs/specs/semconv/database/database-spans/#generating-a-summary-of-the-query-text>`_ for more information.
 
+Connection pool metrics
+***********************
+When `psycopg_pool`_ is installed, its ``ConnectionPool`` and
+``AsyncConnectionPool`` report the ``db.client.connection.count``,
+``db.client.connection.max``, ``db.client.connection.wait_time``,
+``db.client.connection.timeouts`` and ``db.client.connection.create_time``
+metrics, through the ``meter_provider`` passed to ``instrument()`` or the
+global one. Pools are identified by their ``name``.
+
+.. _psycopg_pool: https://www.psycopg.org/psycopg3/docs/advanced/pool.html
+
+COPY, stream() and server-side cursors
+**************************************
+Besides ``execute``, ``executemany`` and ``callproc``, the following operations of
+sync and async cursors are traced:
+
+- ``cursor.copy()``: a span covers the ``with`` block of the :sql:`COPY` operation,
+  with the number of rows copied in ``db.postgresql.copy.rows`` and, for
+  :sql:`COPY FROM`, the number of bytes sent in ``db.postgresql.copy.bytes``.
+- ``cursor.stream()``: a span covers the iteration on the results, with the number
+  of rows in ``db.response.returned_rows``. Breaking out of the iteration cancels
+  the query, the span then ends with the rows returned so far and no error.
+- server-side cursors, created by ``connection.cursor(name=...)``: their ``execute``
+  calls are traced as for the other cursors, and each :sql:`FETCH` round trip gets
+  a span with the number of rows in ``db.response.returned_rows``.
+
+The bytes of a COPY are counted per buffer, the rows of a stream as they are
+yielded, without any call per row. With ``enable_metrics``, the duration of these
+operations is also recorded in the ``db.client.operation.duration`` histogram.
+
 API
 ---
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
+from timeit import default_timer
 from typing import Any, Callable, Collection, TypeVar
 
 import psycopg  # pylint: disable=import-self
+import psycopg.copy  # pylint: disable=import-self
 from psycopg.sql import Composable  # pylint: disable=no-name-in-module
+from wrapt import wrap_function_wrapper
+
+try:
+    import psycopg_pool
+except ImportError:
+    psycopg_pool = None
 
 from opentelemetry.instrumentation import dbapi
+from opentelemetry.instrumentation.connection_pool_metrics import (
+    _ConnectionPoolMetrics,
+    _PoolUsage,
+)
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.psycopg.package import _instruments
 from opentelemetry.instrumentation.psycopg.version import __version__
-from opentelemetry.trace import TracerProvider
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _get_sql_operation_name,
+)
+from opentelemetry.instrumentation.utils import (
+    is_instrumentation_enabled,
+    unwrap,
+)
+from opentelemetry.metrics import get_meter
+from opentelemetry.semconv._incubating.attributes.db_attributes import (
+    DB_RESPONSE_RETURNED_ROWS,
+)
+from opentelemetry.trace import (
+    Span,
+    SpanKind,
+    Status,
+    StatusCode,
+    TracerProvider,
+    use_span,
+)
 
 _logger = logging.getLogger(__name__)
 _OTEL_CURSOR_FACTORY_KEY = "_otel_orig_cursor_factory"
+_OTEL_SERVER_CURSOR_FACTORY_KEY = "_otel_orig_server_cursor_factory"
+
+_DB_POSTGRESQL_COPY_ROWS = "db.postgresql.copy.rows"
+_DB_POSTGRESQL_COPY_BYTES = "db.postgresql.copy.bytes"
 
 ConnectionT = TypeVar(
     "ConnectionT", psycopg.Connection, psycopg.AsyncConnection
@@ -182,6 +247,10 @@ class PsycopgInstrumentor(BaseInstrumentor):
         Psycopg: http://initd.org/psycopg/
         """
         tracer_provider = kwargs.get("tracer_provider")
+        meter_provider = kwargs.get("meter_provider")
+        enable_metrics = kwargs.get("enable_metrics", False)
+        metrics_fingerprint_limit = kwargs.get("metrics_fingerprint_limit", 0)
+        repeated_query_threshold = kwargs.get("repeated_query_threshold", 0)
         enable_sqlcommenter = kwargs.get("enable_commenter", False)
         commenter_options = kwargs.get("commenter_options", {})
         enable_attribute_commenter = kwargs.get(
@@ -196,6 +265,10 @@ class PsycopgInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
             db_api_integration_factory=DatabaseApiIntegration,
             enable_commenter=enable_sqlcommenter,
             commenter_options=commenter_options,
@@ -211,6 +284,10 @@ class PsycopgInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
             db_api_integration_factory=DatabaseApiIntegration,
             enable_commenter=enable_sqlcommenter,
             commenter_options=commenter_options,
@@ -225,12 +302,18 @@ class PsycopgInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
             db_api_integration_factory=DatabaseApiAsyncIntegration,
             enable_commenter=enable_sqlcommenter,
             commenter_options=commenter_options,
             enable_attribute_commenter=enable_attribute_commenter,
             capture_parameters=capture_parameters,
         )
+        if psycopg_pool is not None:
+            _instrument_pools(meter_provider)
 
     def _uninstrument(self, **kwargs: Any):
         """ "Disable Psycopg instrumentation"""
@@ -243,6 +326,13 @@ class PsycopgInstrumentor(BaseInstrumentor):
             psycopg.AsyncConnection,
             "connect",  # pylint: disable=no-member
         )
+        if psycopg_pool is not None:
+            for pool_class in (
+                psycopg_pool.ConnectionPool,
+                psycopg_pool.AsyncConnectionPool,
+            ):
+                unwrap(pool_class, "getconn")
+                unwrap(pool_class, "_connect")
 
     # TODO(owais): check if core dbapi can do this for all dbapi implementations e.g, pymysql and mysql
     @staticmethod
@@ -268,14 +358,27 @@ class PsycopgInstrumentor(BaseInstrumentor):
             setattr(
                 connection, _OTEL_CURSOR_FACTORY_KEY, connection.cursor_factory
             )
+            setattr(
+                connection,
+                _OTEL_SERVER_CURSOR_FACTORY_KEY,
+                getattr(connection, "server_cursor_factory", None),
+            )
             if isinstance(connection, psycopg.AsyncConnection):
                 connection.cursor_factory = _new_cursor_async_factory(
                     tracer_provider=tracer_provider
                 )
+                connection.server_cursor_factory = (
+                    _new_server_cursor_async_factory(
+                        tracer_provider=tracer_provider
+                    )
+                )
             else:
                 connection.cursor_factory = _new_cursor_factory(
                     tracer_provider=tracer_provider
                 )
+                connection.server_cursor_factory = _new_server_cursor_factory(
+                    tracer_provider=tracer_provider
+                )
             connection._is_instrumented_by_opentelemetry = True
         else:
             _logger.warning(
@@ -289,6 +392,11 @@ class PsycopgInstrumentor(BaseInstrumentor):
         connection.cursor_factory = getattr(
             connection, _OTEL_CURSOR_FACTORY_KEY, None
         )
+        server_cursor_factory = getattr(
+            connection, _OTEL_SERVER_CURSOR_FACTORY_KEY, None
+        )
+        if server_cursor_factory is not None:
+            connection.server_cursor_factory = server_cursor_factory
 
         return connection
 
@@ -308,6 +416,10 @@ class DatabaseApiIntegration(dbapi.DatabaseApiIntegration):
             new_factory_kwargs["base_factory"] = base_cursor_factory
         kwargs["cursor_factory"] = _new_cursor_factory(**new_factory_kwargs)
         connection = connect_method(*args, **kwargs)
+        connection.server_cursor_factory = _new_server_cursor_factory(
+            db_api=self,
+            base_factory=getattr(connection, "server_cursor_factory", None),
+        )
         self.get_connection_attributes(connection)
         return connection
 
@@ -328,10 +440,49 @@ class DatabaseApiAsyncIntegration(dbapi.DatabaseApiIntegration):
             **new_factory_kwargs
         )
         connection = await connect_method(*args, **kwargs)
+        connection.server_cursor_factory = _new_server_cursor_async_factory(
+            db_api=self,
+            base_factory=getattr(connection, "server_cursor_factory", None),
+        )
         self.get_connection_attributes(connection)
         return connection
 
 
+class _CountingWriter(psycopg.copy.Writer):
+    """Counts the bytes of the buffers written by a COPY FROM operation."""
+
+    def __init__(self, writer: psycopg.copy.Writer):
+        self.writer = writer
+        self.size = 0
+        self.finished = False
+
+    def write(self, data) -> None:
+        self.size += len(data)
+        self.writer.write(data)
+
+    def finish(self, exc: BaseException | None = None) -> None:
+        # only called for COPY FROM operations
+        self.finished = True
+        self.writer.finish(exc)
+
+
+class _AsyncCountingWriter(psycopg.copy.AsyncWriter):
+    """Counts the bytes of the buffers written by a COPY FROM operation."""
+
+    def __init__(self, writer: psycopg.copy.AsyncWriter):
+        self.writer = writer
+        self.size = 0
+        self.finished = False
+
+    async def write(self, data) -> None:
+        self.size += len(data)
+        await self.writer.write(data)
+
+    async def finish(self, exc: BaseException | None = None) -> None:
+        self.finished = True
+        await self.writer.finish(exc)
+
+
 class CursorTracer(dbapi.CursorTracer):
     def get_operation_name(self, cursor: CursorT, args: list[Any]) -> str:
         if not args:
@@ -343,8 +494,7 @@ class CursorTracer(dbapi.CursorTracer):
 
         # `statement` can be empty string. See #2643
         if statement and isinstance(statement, str):
-            # Strip leading comments so we get the operation name.
-            return self._leading_comment_remover.sub("", statement).split()[0]
+            return _get_sql_operation_name(statement)
 
         return ""
 
@@ -357,6 +507,208 @@ class CursorTracer(dbapi.CursorTracer):
             statement = statement.as_string(cursor)
         return statement
 
+    def _start_operation(self, cursor: CursorT, args: tuple[Any, ...]):
+        """Starts the span and the operation timer of an operation which is
+        not a single call, such as the ``with`` block of a COPY."""
+        operation_timer = self._time_operation(cursor, args)
+        span = self._db_api_integration._tracer.start_span(
+            self._get_span_name(cursor, args), kind=SpanKind.CLIENT
+        )
+        self._populate_span(span, cursor, *args)
+        operation_timer.__enter__()
+        return span, operation_timer
+
+    @staticmethod
+    def _end_operation(
+        span: Span, operation_timer, exc: BaseException | None = None
+    ) -> None:
+        if exc is None:
+            operation_timer.__exit__(None, None, None)
+        else:
+            operation_timer.__exit__(type(exc), exc, exc.__traceback__)
+            if span.is_recording():
+                span.record_exception(exc)
+                span.set_status(
+                    Status(StatusCode.ERROR, f"{type(exc).__name__}: {exc}")
+                )
+        span.end()
+
+    @staticmethod
+    def _set_copy_attributes(
+        span: Span, cursor: CursorT, writer: _CountingWriter
+    ) -> None:
+        if not span.is_recording():
+            return
+        if cursor.rowcount >= 0:
+            span.set_attribute(_DB_POSTGRESQL_COPY_ROWS, cursor.rowcount)
+        if writer.finished:
+            span.set_attribute(_DB_POSTGRESQL_COPY_BYTES, writer.size)
+
+    @contextlib.contextmanager
+    def traced_copy(
+        self,
+        cursor: psycopg.Cursor,
+        copy_method: Callable[..., Any],
+        statement: Any,
+        params: Any,
+        writer: psycopg.copy.Writer | None,
+    ):
+        if not is_instrumentation_enabled():
+            with copy_method(statement, params, writer=writer) as copy:
+                yield copy
+            return
+
+        args = (statement,) if params is None else (statement, params)
+        writer = _CountingWriter(writer or psycopg.copy.LibpqWriter(cursor))
+        span, operation_timer = self._start_operation(cursor, args)
+        exception = None
+        try:
+            with use_span(
+                span, record_exception=False, set_status_on_exception=False
+            ):
+                with copy_method(statement, params, writer=writer) as copy:
+                    yield copy
+        except BaseException as exc:
+            exception = exc
+            raise
+        finally:
+            if exception is None:
+                self._set_copy_attributes(span, cursor, writer)
+            self._end_operation(span, operation_timer, exception)
+
+    @contextlib.asynccontextmanager
+    async def traced_copy_async(
+        self,
+        cursor: psycopg.AsyncCursor,
+        copy_method: Callable[..., Any],
+        statement: Any,
+        params: Any,
+        writer: psycopg.copy.AsyncWriter | None,
+    ):
+        if not is_instrumentation_enabled():
+            async with copy_method(statement, params, writer=writer) as copy:
+                yield copy
+            return
+
+        args = (statement,) if params is None else (statement, params)
+        writer = _AsyncCountingWriter(
+            writer or psycopg.copy.AsyncLibpqWriter(cursor)
+        )
+        span, operation_timer = self._start_operation(cursor, args)
+        exception = None
+        try:
+            with use_span(
+                span, record_exception=False, set_status_on_exception=False
+            ):
+                async with copy_method(
+                    statement, params, writer=writer
+                ) as copy:
+                    yield copy
+        except BaseException as exc:
+            exception = exc
+            raise
+        finally:
+            if exception is None:
+                self._set_copy_attributes(span, cursor, writer)
+            self._end_operation(span, operation_timer, exception)
+
+    def traced_stream(
+        self,
+        cursor: psycopg.Cursor,
+        stream_method: Callable[..., Any],
+        query: Any,
+        params: Any,
+        kwargs: dict[str, Any],
+    ):
+        """Traces the iteration on the rows of a ``stream()``."""
+        if not is_instrumentation_enabled():
+            return (yield from stream_method(query, params, **kwargs))
+
+        args = (query,) if params is None else (query, params)
+        span, operation_timer = self._start_operation(cursor, args)
+        rows = stream_method(query, params, **kwargs)
+        returned_rows = 0
+        exception = None
+        try:
+            for returned_rows, row in enumerate(rows, 1):
+                yield row
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            exception = exc
+            raise
+        finally:
+            # On an early exit, psycopg cancels the query and discards the
+            # results left, the cancellation is not an error of the stream.
+            rows.close()
+            self._end_stream(span, operation_timer, returned_rows, exception)
+
+    async def traced_stream_async(
+        self,
+        cursor: psycopg.AsyncCursor,
+        stream_method: Callable[..., Any],
+        query: Any,
+        params: Any,
+        kwargs: dict[str, Any],
+    ):
+        """Traces the iteration on the rows of an async ``stream()``."""
+        rows = stream_method(query, params, **kwargs)
+        if not is_instrumentation_enabled():
+            try:
+                async for row in rows:
+                    yield row
+            finally:
+                await rows.aclose()
+            return
+
+        args = (query,) if params is None else (query, params)
+        span, operation_timer = self._start_operation(cursor, args)
+        returned_rows = 0
+        exception = None
+        try:
+            async for row in rows:
+                returned_rows += 1
+                yield row
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            exception = exc
+            raise
+        finally:
+            await rows.aclose()
+            self._end_stream(span, operation_timer, returned_rows, exception)
+
+    def _end_stream(
+        self,
+        span: Span,
+        operation_timer,
+        returned_rows: int,
+        exc: BaseException | None = None,
+    ) -> None:
+        if span.is_recording():
+            span.set_attribute(DB_RESPONSE_RETURNED_ROWS, returned_rows)
+        self._end_operation(span, operation_timer, exc)
+
+    def traced_fetch_gen(
+        self, cursor: CursorT, fetch_gen: Callable[..., Any], num: int | None
+    ):
+        """Traces a FETCH round trip of a server-side cursor."""
+        if not is_instrumentation_enabled():
+            return (yield from fetch_gen(num))
+        statement = (
+            f"FETCH FORWARD {'ALL' if num is None else num} FROM {cursor.name}"
+        )
+        span, operation_timer = self._start_operation(cursor, (statement,))
+        try:
+            rows = yield from fetch_gen(num)
+        except BaseException as exc:
+            self._end_operation(span, operation_timer, exc)
+            raise
+        if span.is_recording():
+            span.set_attribute(DB_RESPONSE_RETURNED_ROWS, len(rows))
+        self._end_operation(span, operation_timer)
+        return rows
+
 
 def _new_cursor_factory(
     db_api: DatabaseApiIntegration | None = None,
@@ -391,6 +743,16 @@ def _new_cursor_factory(
                 self, super().callproc, *args, **kwargs
             )
 
+        def copy(self, statement: Any, params: Any = None, *, writer=None):
+            return _cursor_tracer.traced_copy(
+                self, super().copy, statement, params, writer
+            )
+
+        def stream(self, query: Any, params: Any = None, **kwargs: Any):
+            return _cursor_tracer.traced_stream(
+                self, super().stream, query, params, kwargs
+            )
+
     return TracedCursorFactory
 
 
@@ -426,4 +788,147 @@ def _new_cursor_async_factory(
                 self, super().callproc, *args, **kwargs
             )
 
+        def copy(self, statement: Any, params: Any = None, *, writer=None):
+            return _cursor_tracer.traced_copy_async(
+                self, super().copy, statement, params, writer
+            )
+
+        def stream(self, query: Any, params: Any = None, **kwargs: Any):
+            return _cursor_tracer.traced_stream_async(
+                self, super().stream, query, params, kwargs
+            )
+
     return TracedCursorAsyncFactory
+
+
+def _new_server_cursor_factory(
+    db_api: DatabaseApiIntegration | None = None,
+    base_factory: type[psycopg.ServerCursor] | None = None,
+    tracer_provider: TracerProvider | None = None,
+):
+    if not db_api:
+        db_api = DatabaseApiIntegration(
+            __name__,
+            PsycopgInstrumentor._DATABASE_SYSTEM,
+            connection_attributes=PsycopgInstrumentor._CONNECTION_ATTRIBUTES,
+            version=__version__,
+            tracer_provider=tracer_provider,
+        )
+
+    base_factory = base_factory or psycopg.ServerCursor
+    _cursor_tracer = CursorTracer(db_api)
+
+    class TracedServerCursorFactory(base_factory):
+        def execute(self, *args: Any, **kwargs: Any):
+            return _cursor_tracer.traced_execution(
+                self, super().execute, *args, **kwargs
+            )
+
+        def _fetch_gen(self, num: int | None):
+            return _cursor_tracer.traced_fetch_gen(
+                self, super()._fetch_gen, num
+            )
+
+    return TracedServerCursorFactory
+
+
+def _new_server_cursor_async_factory(
+    db_api: DatabaseApiAsyncIntegration | None = None,
+    base_factory: type[psycopg.AsyncServerCursor] | None = None,
+    tracer_provider: TracerProvider | None = None,
+):
+    if not db_api:
+        db_api = DatabaseApiAsyncIntegration(
+            __name__,
+            PsycopgInstrumentor._DATABASE_SYSTEM,
+            connection_attributes=PsycopgInstrumentor._CONNECTION_ATTRIBUTES,
+            version=__version__,
+            tracer_provider=tracer_provider,
+        )
+    base_factory = base_factory or psycopg.AsyncServerCursor
+    _cursor_tracer = CursorTracer(db_api)
+
+    class TracedServerCursorAsyncFactory(base_factory):
+        async def execute(self, *args: Any, **kwargs: Any):
+            return await _cursor_tracer.traced_execution_async(
+                self, super().execute, *args, **kwargs
+            )
+
+        def _fetch_gen(self, num: int | None):
+            return _cursor_tracer.traced_fetch_gen(
+                self, super()._fetch_gen, num
+            )
+
+    return TracedServerCursorAsyncFactory
+
+
+def _get_pool_usage(pool) -> _PoolUsage | None:
+    if pool.closed:
+        return None
+    stats = pool.get_stats()
+    idle = stats["pool_available"]
+    return _PoolUsage(idle, stats["pool_size"] - idle, stats["pool_max"])
+
+
+def _instrument_pools(meter_provider):
+    """Reports the connection pool metrics of the ``psycopg_pool`` pools."""
+    meter = get_meter(
+        __name__,
+        __version__,
+        meter_provider,
+        schema_url="https://opentelemetry.io/schemas/1.11.0",
+    )
+    pool_metrics = _ConnectionPoolMetrics(meter, _get_pool_usage)
+
+    def getconn(wrapped, instance, args, kwargs):
+        pool_metrics.register(instance, instance.name)
+        start = default_timer()
+        try:
+            connection = wrapped(*args, **kwargs)
+        except psycopg_pool.PoolTimeout:
+            pool_metrics.record_timeout(instance)
+            raise
+        pool_metrics.record_wait_time(
+            instance, max(default_timer() - start, 0)
+        )
+        return connection
+
+    async def getconn_async(wrapped, instance, args, kwargs):
+        pool_metrics.register(instance, instance.name)
+        start = default_timer()
+        try:
+            connection = await wrapped(*args, **kwargs)
+        except psycopg_pool.PoolTimeout:
+            pool_metrics.record_timeout(instance)
+            raise
+        pool_metrics.record_wait_time(
+            instance, max(default_timer() - start, 0)
+        )
+        return connection
+
+    def connect(wrapped, instance, args, kwargs):
+        pool_metrics.register(instance, instance.name)
+        start = default_timer()
+        connection = wrapped(*args, **kwargs)
+        pool_metrics.record_create_time(
+            instance, max(default_timer() - start, 0)
+        )
+        return connection
+
+    async def connect_async(wrapped, instance, args, kwargs):
+        pool_metrics.register(instance, instance.name)
+        start = default_timer()
+        connection = await wrapped(*args, **kwargs)
+        pool_metrics.record_create_time(
+            instance, max(default_timer() - start, 0)
+        )
+        return connection
+
+    wrap_function_wrapper(psycopg_pool.ConnectionPool, "getconn", getconn)
+    wrap_function_wrapper(psycopg_pool.ConnectionPool, "_connect", connect)
+    wrap_function_wrapper(
+        psycopg_pool.AsyncConnectionPool, "getconn", getconn_async
+    )
+    wrap_function_wrapper(
+        psycopg_pool.AsyncConnectionPool, "_connect", connect_async
+    )
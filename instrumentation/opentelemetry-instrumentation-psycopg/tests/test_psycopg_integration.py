@@ -13,16 +13,28 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
+import gc
 import types
+import weakref
 from unittest import IsolatedAsyncioTestCase, mock
 
 import psycopg
+import psycopg.copy
+import psycopg_pool
+from psycopg.pq import TransactionStatus
 from psycopg.sql import SQL, Composed
 
 import opentelemetry.instrumentation.psycopg
-from opentelemetry.instrumentation.psycopg import PsycopgInstrumentor
+from opentelemetry.instrumentation.psycopg import (
+    PsycopgInstrumentor,
+    _new_cursor_async_factory,
+    _new_cursor_factory,
+    _new_server_cursor_factory,
+)
 from opentelemetry.sdk import resources
 from opentelemetry.test.test_base import TestBase
+from opentelemetry.trace import StatusCode
 
 
 class MockCursor:
@@ -645,3 +657,302 @@ class TestPostgresqlIntegrationAsync(
         self.assertEqualSpanInstrumentationScope(
             span, opentelemetry.instrumentation.psycopg
         )
+
+
+class MockPoolConnection:
+    @classmethod
+    def connect(cls, *args, **kwargs):
+        conn = mock.MagicMock(closed=False, broken=False)
+        conn.pgconn.transaction_status = TransactionStatus.IDLE
+        return conn
+
+
+class TestPsycopgPoolMetrics(TestBase):
+    def tearDown(self):
+        super().tearDown()
+        with self.disable_logging():
+            PsycopgInstrumentor().uninstrument()
+
+    def test_pool_metrics(self):
+        PsycopgInstrumentor().instrument(meter_provider=self.meter_provider)
+        pool_name = {"db.client.connection.pool.name": "test"}
+
+        with psycopg_pool.ConnectionPool(
+            "", connection_class=MockPoolConnection, min_size=1, name="test"
+        ) as pool:
+            pool.wait()
+            with pool.connection():
+                with self.assertRaises(psycopg_pool.PoolTimeout):
+                    pool.getconn(timeout=0.01)
+                metrics = {
+                    metric.name: metric.data.data_points
+                    for metric in self.get_sorted_metrics()
+                }
+
+        self.assertEqual(
+            {
+                point.attributes["db.client.connection.state"]: point.value
+                for point in metrics["db.client.connection.count"]
+            },
+            {"idle": 0, "used": 1},
+        )
+        (max_point,) = metrics["db.client.connection.max"]
+        self.assertEqual(max_point.attributes, pool_name)
+        self.assertEqual(max_point.value, 1)
+        (timeouts_point,) = metrics["db.client.connection.timeouts"]
+        self.assertEqual(timeouts_point.attributes, pool_name)
+        self.assertEqual(timeouts_point.value, 1)
+        for name in (
+            "db.client.connection.wait_time",
+            "db.client.connection.create_time",
+        ):
+            (point,) = metrics[name]
+            self.assertEqual(point.attributes, pool_name)
+            self.assertEqual(point.count, 1)
+
+        # closed pools are no longer reported
+        self.assertNotIn(
+            "db.client.connection.count",
+            [metric.name for metric in self.get_sorted_metrics()],
+        )
+
+    def test_pools_are_weakly_referenced(self):
+        PsycopgInstrumentor().instrument(meter_provider=self.meter_provider)
+
+        with psycopg_pool.ConnectionPool(
+            "", connection_class=MockPoolConnection, min_size=1, name="test"
+        ) as pool:
+            pool.wait()
+            with pool.connection():
+                pass
+        pool_ref = weakref.ref(pool)
+        del pool
+        gc.collect()
+
+        self.assertIsNone(pool_ref())
+
+
+def _wait(gen):
+    """Runs a psycopg generator, which does not do any I/O here."""
+    try:
+        while True:
+            next(gen)
+    except StopIteration as ex:
+        return ex.value
+
+
+class MockResult:
+    def __init__(self, ntuples):
+        self.ntuples = ntuples
+
+
+class MockCopy:
+    def __init__(self, writer):
+        self.writer = writer
+
+    def write_row(self, row):
+        self.writer.write(("\t".join(row) + "\n").encode())
+
+
+class MockStreamingCursor:
+    """Implements the COPY and stream() internals of psycopg cursors."""
+
+    rowcount = -1
+
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.closed_streams = 0
+
+    @contextlib.contextmanager
+    def copy(self, statement, params=None, *, writer=None):
+        yield MockCopy(writer)
+        if " FROM " in statement:
+            writer.finish(None)
+        self.rowcount = 2
+
+    def stream(self, query, params=None, *, size=1):
+        try:
+            while self.results:
+                yield from range(self.results.pop(0).ntuples)
+        finally:
+            self.closed_streams += 1
+
+
+class MockAsyncCopy(MockCopy):
+    async def write_row(self, row):
+        await self.writer.write(("\t".join(row) + "\n").encode())
+
+
+class MockAsyncStreamingCursor(MockStreamingCursor):
+    @contextlib.asynccontextmanager
+    async def copy(self, statement, params=None, *, writer=None):
+        yield MockAsyncCopy(writer)
+        if " FROM " in statement:
+            await writer.finish(None)
+        self.rowcount = 2
+
+    async def stream(self, query, params=None, *, size=1):
+        try:
+            while self.results:
+                for row in range(self.results.pop(0).ntuples):
+                    yield row
+        finally:
+            self.closed_streams += 1
+
+
+class MockServerCursor:
+    name = "test_cursor"
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def _fetch_gen(self, num):
+        yield from ()
+        rows, self.rows = self.rows[:num], self.rows[num:]
+        return rows
+
+    def fetchmany(self, size):
+        return _wait(self._fetch_gen(size))
+
+
+class ListWriter(psycopg.copy.Writer):
+    def __init__(self):
+        self.data = []
+
+    def write(self, data):
+        self.data.append(data)
+
+
+class MockAsyncCopyWriter:
+    def __init__(self):
+        self.data = []
+
+    async def write(self, data):
+        self.data.append(data)
+
+    async def finish(self, exc=None):
+        pass
+
+
+class TestPsycopgCopyAndStream(TestBase, IsolatedAsyncioTestCase):
+    def test_copy_from(self):
+        cursor = _new_cursor_factory(base_factory=MockStreamingCursor)()
+        writer = ListWriter()
+        with cursor.copy("COPY test FROM STDIN", writer=writer) as copy:
+            copy.write_row(("1", "adam"))
+            copy.write_row(("2", "eve"))
+
+        self.assertEqual(writer.data, [b"1\tadam\n", b"2\teve\n"])
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.name, "COPY")
+        self.assertEqual(
+            span.attributes["db.statement"], "COPY test FROM STDIN"
+        )
+        self.assertEqual(span.attributes["db.postgresql.copy.rows"], 2)
+        self.assertEqual(span.attributes["db.postgresql.copy.bytes"], 13)
+
+    def test_copy_to(self):
+        cursor = _new_cursor_factory(base_factory=MockStreamingCursor)()
+        with cursor.copy("COPY test TO STDOUT", writer=ListWriter()):
+            pass
+
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.attributes["db.postgresql.copy.rows"], 2)
+        self.assertNotIn("db.postgresql.copy.bytes", span.attributes)
+
+    def test_copy_error(self):
+        cursor = _new_cursor_factory(base_factory=MockStreamingCursor)()
+        with self.assertRaises(ValueError):
+            with cursor.copy("COPY test FROM STDIN", writer=ListWriter()):
+                raise ValueError("bad row")
+
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.status.status_code, StatusCode.ERROR)
+        self.assertEqual(span.status.description, "ValueError: bad row")
+        self.assertNotIn("db.postgresql.copy.rows", span.attributes)
+
+    def test_stream(self):
+        cursor = _new_cursor_factory(base_factory=MockStreamingCursor)(
+            [MockResult(2), MockResult(3)]
+        )
+        rows = cursor.stream("SELECT * FROM test", size=2)
+        self.assertEqual(next(rows), 0)
+        # the span lasts until the last row is returned
+        self.assertEqual(self.memory_exporter.get_finished_spans(), ())
+        self.assertEqual(len(list(rows)), 4)
+
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.name, "SELECT")
+        self.assertEqual(span.attributes["db.response.returned_rows"], 5)
+        self.assertEqual(span.status.status_code, StatusCode.UNSET)
+
+    def test_stream_early_exit(self):
+        cursor = _new_cursor_factory(base_factory=MockStreamingCursor)(
+            [MockResult(3)]
+        )
+        for row in cursor.stream("SELECT * FROM test"):
+            if row == 1:
+                break
+
+        # the stream of psycopg is closed, which cancels the query
+        self.assertEqual(cursor.closed_streams, 1)
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.attributes["db.response.returned_rows"], 2)
+        self.assertEqual(span.status.status_code, StatusCode.UNSET)
+
+    def test_server_cursor_fetch(self):
+        cursor = _new_server_cursor_factory(base_factory=MockServerCursor)(
+            list(range(5))
+        )
+        self.assertEqual(cursor.fetchmany(3), [0, 1, 2])
+        self.assertEqual(cursor.fetchmany(3), [3, 4])
+
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 2)
+        self.assertEqual(spans[0].name, "FETCH")
+        self.assertEqual(
+            spans[0].attributes["db.statement"],
+            "FETCH FORWARD 3 FROM test_cursor",
+        )
+        self.assertEqual(
+            [span.attributes["db.response.returned_rows"] for span in spans],
+            [3, 2],
+        )
+
+    async def test_copy_from_async(self):
+        cursor = _new_cursor_async_factory(
+            base_factory=MockAsyncStreamingCursor
+        )()
+        writer = MockAsyncCopyWriter()
+        async with cursor.copy("COPY test FROM STDIN", writer=writer) as copy:
+            await copy.write_row(("1", "adam"))
+
+        self.assertEqual(writer.data, [b"1\tadam\n"])
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.name, "COPY")
+        self.assertEqual(span.attributes["db.postgresql.copy.rows"], 2)
+        self.assertEqual(span.attributes["db.postgresql.copy.bytes"], 7)
+
+    async def test_stream_async(self):
+        cursor = _new_cursor_async_factory(
+            base_factory=MockAsyncStreamingCursor
+        )([MockResult(2), MockResult(1)])
+        rows = [row async for row in cursor.stream("SELECT * FROM test")]
+
+        self.assertEqual(rows, [0, 1, 0])
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.attributes["db.response.returned_rows"], 3)
+
+    async def test_stream_async_early_exit(self):
+        cursor = _new_cursor_async_factory(
+            base_factory=MockAsyncStreamingCursor
+        )([MockResult(3)])
+        rows = cursor.stream("SELECT * FROM test")
+        async for _ in rows:
+            break
+        await rows.aclose()
+
+        self.assertEqual(cursor.closed_streams, 1)
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.attributes["db.response.returned_rows"], 1)
+        self.assertEqual(span.status.status_code, StatusCode.UNSET)
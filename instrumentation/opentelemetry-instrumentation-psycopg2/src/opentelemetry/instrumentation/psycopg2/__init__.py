@@ -159,6 +159,9 @@ from opentelemetry.instrumentation.psycopg2.package import (
     _instruments_psycopg2_binary,
 )
 from opentelemetry.instrumentation.psycopg2.version import __version__
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _get_sql_operation_name,
+)
 
 _logger = logging.getLogger(__name__)
 _OTEL_CURSOR_FACTORY_KEY = "_otel_orig_cursor_factory"
@@ -197,6 +200,10 @@ class Psycopg2Instrumentor(BaseInstrumentor):
         Psycopg: http://initd.org/psycopg/
         """
         tracer_provider = kwargs.get("tracer_provider")
+        meter_provider = kwargs.get("meter_provider")
+        enable_metrics = kwargs.get("enable_metrics", False)
+        metrics_fingerprint_limit = kwargs.get("metrics_fingerprint_limit", 0)
+        repeated_query_threshold = kwargs.get("repeated_query_threshold", 0)
         enable_sqlcommenter = kwargs.get("enable_commenter", False)
         commenter_options = kwargs.get("commenter_options", {})
         enable_attribute_commenter = kwargs.get(
@@ -210,6 +217,10 @@ class Psycopg2Instrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            enable_metrics=enable_metrics,
+            metrics_fingerprint_limit=metrics_fingerprint_limit,
+            repeated_query_threshold=repeated_query_threshold,
             db_api_integration_factory=DatabaseApiIntegration,
             enable_commenter=enable_sqlcommenter,
             commenter_options=commenter_options,
@@ -293,7 +304,7 @@ class CursorTracer(dbapi.CursorTracer):
 
         if isinstance(statement, str):
             # Strip leading comments so we get the operation name.
-            return self._leading_comment_remover.sub("", statement).split()[0]
+            return _get_sql_operation_name(statement)
 
         return ""
 
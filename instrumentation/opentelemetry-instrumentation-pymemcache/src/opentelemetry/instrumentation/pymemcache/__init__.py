@@ -32,24 +32,63 @@ Usage
     client = Client(('localhost', 11211))
     client.set('some_key', 'some_value')
 
+Batch-aware mode
+----------------
+
+The statement of a command lists all of its keys, which is of no use for the
+commands of thousands of keys like ``get_many`` and ``set_many``. With
+``batch_aware=True``, the statement of these commands only lists a sample of
+their first 10 keys, and their spans have the following attributes:
+
+* ``db.memcached.key_count``: the number of keys of the command;
+* ``db.memcached.key_bytes``: the size of the keys in bytes;
+* ``db.memcached.hits`` and ``db.memcached.misses``: the number of keys
+  found and not found by the lookup commands, like ``get_many``.
+
+.. code-block:: python
+
+    PymemcacheInstrumentor().instrument(batch_aware=True)
+
+Metrics
+-------
+
+With ``enable_metrics=True``, the duration of every command is recorded in
+the ``db.client.operation.duration`` histogram, whether its span is sampled
+or not, with the ``db.system.name``, ``db.operation.name``,
+``server.address`` and ``server.port`` attributes. The keys looked up by
+``get``, ``gets``, ``get_many`` and ``gets_many`` are counted by
+``db.memcached.lookups``, with ``db.memcached.lookup.result`` set to ``hit``
+or ``miss``, from which the hit ratio of the cache is derived.
+
+.. code-block:: python
+
+    PymemcacheInstrumentor().instrument(enable_metrics=True)
+
 API
 ---
 """
 # pylint: disable=no-value-for-parameter
 
 import logging
+from collections.abc import Sized
+from timeit import default_timer
 from typing import Collection
 
 import pymemcache
 from wrapt import wrap_function_wrapper as _wrap
 
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.pymemcache.package import _instruments
 from opentelemetry.instrumentation.pymemcache.version import __version__
 from opentelemetry.instrumentation.utils import unwrap
+from opentelemetry.metrics import get_meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_STATEMENT,
     DB_SYSTEM,
+    DbSystemNameValues,
 )
 from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_PEER_NAME,
@@ -57,6 +96,18 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_TRANSPORT,
     NetTransportValues,
 )
+from opentelemetry.semconv._incubating.metrics.db_metrics import (
+    DB_CLIENT_OPERATION_DURATION,
+)
+from opentelemetry.semconv.attributes.db_attributes import (
+    DB_OPERATION_NAME,
+    DB_SYSTEM_NAME,
+)
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+from opentelemetry.semconv.attributes.server_attributes import (
+    SERVER_ADDRESS,
+    SERVER_PORT,
+)
 from opentelemetry.trace import SpanKind, get_tracer
 
 logger = logging.getLogger(__name__)
@@ -87,6 +138,27 @@ COMMANDS = [
     "get_multi",
 ]
 
+# Commands taking a list of keys, or a dict of values by key
+MULTI_KEY_COMMANDS = {
+    "set_many",
+    "set_multi",
+    "get_many",
+    "get_multi",
+    "gets_many",
+    "delete_many",
+}
+LOOKUP_COMMANDS = {"get", "gets", "get_many", "get_multi", "gets_many"}
+
+DB_MEMCACHED_KEY_COUNT = "db.memcached.key_count"
+DB_MEMCACHED_KEY_BYTES = "db.memcached.key_bytes"
+DB_MEMCACHED_HITS = "db.memcached.hits"
+DB_MEMCACHED_MISSES = "db.memcached.misses"
+DB_MEMCACHED_LOOKUPS = "db.memcached.lookups"
+DB_MEMCACHED_LOOKUP_RESULT = "db.memcached.lookup.result"
+
+# Number of keys listed in the statement of a command in batch-aware mode
+_KEY_SAMPLE_SIZE = 10
+
 
 def _set_connection_attributes(span, instance):
     if not span.is_recording():
@@ -95,30 +167,87 @@ def _set_connection_attributes(span, instance):
         span.set_attribute(key, value)
 
 
+class _CommandMetrics:
+    """Records the duration and the cache lookups of the commands."""
+
+    def __init__(self, meter):
+        self._duration = meter.create_histogram(
+            name=DB_CLIENT_OPERATION_DURATION,
+            unit="s",
+            description="Duration of database client operations.",
+            explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+        )
+        self._lookups = meter.create_counter(
+            name=DB_MEMCACHED_LOOKUPS,
+            unit="{key}",
+            description="The number of keys looked up in memcached.",
+        )
+
+    def record_duration(self, attributes, duration_s, error_type):
+        if error_type is not None:
+            attributes = {**attributes, ERROR_TYPE: error_type}
+        self._duration.record(duration_s, attributes)
+
+    def record_lookups(self, attributes, hits, misses):
+        if hits:
+            self._lookups.add(
+                hits, {**attributes, DB_MEMCACHED_LOOKUP_RESULT: "hit"}
+            )
+        if misses:
+            self._lookups.add(
+                misses, {**attributes, DB_MEMCACHED_LOOKUP_RESULT: "miss"}
+            )
+
+
 def _with_tracer_wrapper(func):
     """Helper for providing tracer for wrapper functions."""
 
-    def _with_tracer(tracer, cmd):
+    def _with_tracer(tracer, cmd, metrics=None, batch_aware=False):
         def wrapper(wrapped, instance, args, kwargs):
             # prevent double wrapping
             if hasattr(wrapped, "__wrapped__"):
                 return wrapped(*args, **kwargs)
 
-            return func(tracer, cmd, wrapped, instance, args, kwargs)
+            return func(
+                tracer,
+                cmd,
+                metrics,
+                batch_aware,
+                wrapped,
+                instance,
+                args,
+                kwargs,
+            )
 
         return wrapper
 
     return _with_tracer
 
 
+# pylint: disable=too-many-arguments,too-many-locals
 @_with_tracer_wrapper
-def _wrap_cmd(tracer, cmd, wrapped, instance, args, kwargs):
+def _wrap_cmd(
+    tracer, cmd, metrics, batch_aware, wrapped, instance, args, kwargs
+):
+    keys = None
+    if cmd in MULTI_KEY_COMMANDS:
+        keys, args, kwargs = _get_keys(args, kwargs)
+    batch = batch_aware and keys is not None
+
     with tracer.start_as_current_span(
         cmd, kind=SpanKind.CLIENT, attributes={}
     ) as span:
         try:
             if span.is_recording():
-                if not args:
+                if batch:
+                    vals = _get_query_string(_sample_keys(keys))
+                    if len(keys) > _KEY_SAMPLE_SIZE:
+                        vals += " ..."
+                    span.set_attribute(DB_MEMCACHED_KEY_COUNT, len(keys))
+                    span.set_attribute(
+                        DB_MEMCACHED_KEY_BYTES, _get_keys_size(keys)
+                    )
+                elif not args:
                     vals = ""
                 else:
                     vals = _get_query_string(args[0])
@@ -132,7 +261,88 @@ def _wrap_cmd(tracer, cmd, wrapped, instance, args, kwargs):
                 "Failed to set attributes for pymemcache span %s", str(ex)
             )
 
-        return wrapped(*args, **kwargs)
+        set_hits = batch and cmd in LOOKUP_COMMANDS and span.is_recording()
+        if metrics is None:
+            result = wrapped(*args, **kwargs)
+            if set_hits:
+                hits, misses = _count_lookups(cmd, keys, args, kwargs, result)
+                span.set_attribute(DB_MEMCACHED_HITS, hits)
+                span.set_attribute(DB_MEMCACHED_MISSES, misses)
+            return result
+
+        attributes = _get_metric_attributes(instance, cmd)
+        error_type = None
+        start = default_timer()
+        try:
+            result = wrapped(*args, **kwargs)
+        except Exception as exc:
+            error_type = type(exc).__qualname__
+            raise
+        finally:
+            metrics.record_duration(
+                attributes, default_timer() - start, error_type
+            )
+
+        if cmd in LOOKUP_COMMANDS:
+            hits, misses = _count_lookups(cmd, keys, args, kwargs, result)
+            metrics.record_lookups(attributes, hits, misses)
+            if set_hits:
+                span.set_attribute(DB_MEMCACHED_HITS, hits)
+                span.set_attribute(DB_MEMCACHED_MISSES, misses)
+        return result
+
+
+def _get_keys(args, kwargs):
+    """Returns the keys of a command taking several keys, along with its
+    arguments, where an iterator of keys is replaced by a list so that they
+    can be counted without consuming it."""
+    if args:
+        keys = args[0]
+    else:
+        keys = kwargs.get("keys", kwargs.get("values"))
+    if keys is None:
+        return None, args, kwargs
+    if not isinstance(keys, Sized):
+        keys = list(keys)
+        if args:
+            args = (keys, *args[1:])
+        else:
+            kwargs = {
+                **kwargs,
+                ("keys" if "keys" in kwargs else "values"): keys,
+            }
+    return keys, args, kwargs
+
+
+def _sample_keys(keys):
+    sample = []
+    for key in keys:
+        if len(sample) == _KEY_SAMPLE_SIZE:
+            break
+        sample.append(key)
+    return sample
+
+
+def _get_keys_size(keys):
+    return sum(
+        len(key.encode()) if isinstance(key, str) else len(key) for key in keys
+    )
+
+
+def _count_lookups(cmd, keys, args, kwargs, result):
+    """Returns the number of keys found and not found by a lookup command."""
+    if cmd == "get":
+        default = args[1] if len(args) > 1 else kwargs.get("default")
+        hits = 0 if result is default else 1
+        return hits, 1 - hits
+    if cmd == "gets":
+        cas_default = args[2] if len(args) > 2 else kwargs.get("cas_default")
+        hits = 0 if result[1] is cas_default else 1
+        return hits, 1 - hits
+    if keys is None:
+        return 0, 0
+    hits = len(result)
+    return hits, max(len(keys) - hits, 0)
 
 
 def _get_query_string(arg):
@@ -179,6 +389,19 @@ def _get_address_attributes(instance):
     return address_attributes
 
 
+def _get_metric_attributes(instance, cmd):
+    attributes = {
+        DB_SYSTEM_NAME: DbSystemNameValues.MEMCACHED.value,
+        DB_OPERATION_NAME: cmd,
+    }
+    server = getattr(instance, "server", None)
+    if isinstance(server, tuple):
+        attributes[SERVER_ADDRESS], attributes[SERVER_PORT] = server
+    elif isinstance(server, str):
+        attributes[SERVER_ADDRESS] = server
+    return attributes
+
+
 class PymemcacheInstrumentor(BaseInstrumentor):
     """An instrumentor for pymemcache See `BaseInstrumentor`"""
 
@@ -193,12 +416,22 @@ class PymemcacheInstrumentor(BaseInstrumentor):
             tracer_provider,
             schema_url="https://opentelemetry.io/schemas/1.11.0",
         )
+        metrics = None
+        if kwargs.get("enable_metrics", False):
+            meter = get_meter(
+                __name__,
+                __version__,
+                kwargs.get("meter_provider"),
+                schema_url="https://opentelemetry.io/schemas/1.11.0",
+            )
+            metrics = _CommandMetrics(meter)
+        batch_aware = kwargs.get("batch_aware", False)
 
         for cmd in COMMANDS:
             _wrap(
                 "pymemcache.client.base",
                 f"Client.{cmd}",
-                _wrap_cmd(tracer, cmd),
+                _wrap_cmd(tracer, cmd, metrics, batch_aware),
             )
 
     def _uninstrument(self, **kwargs):
@@ -35,6 +35,14 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_PEER_NAME,
     NET_PEER_PORT,
 )
+from opentelemetry.semconv.attributes.db_attributes import (
+    DB_OPERATION_NAME,
+    DB_SYSTEM_NAME,
+)
+from opentelemetry.semconv.attributes.server_attributes import (
+    SERVER_ADDRESS,
+    SERVER_PORT,
+)
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import get_tracer
 
@@ -516,6 +524,112 @@ class PymemcacheClientTestCase(TestBase):  # pylint: disable=too-many-public-met
         assert spans is not None
         self.assertEqual(len(spans), 0)
 
+    def _get_metric(self, name):
+        for metric in self.get_sorted_metrics():
+            if metric.name == name:
+                return metric
+        return None
+
+    def test_operation_duration_metric(self):
+        PymemcacheInstrumentor().uninstrument()
+        PymemcacheInstrumentor().instrument(
+            tracer_provider=trace_api.NoOpTracerProvider(),
+            enable_metrics=True,
+        )
+        client = self.make_client([b"STORED\r\n", b"STORED\r\n"])
+        client.set(b"key", b"value", noreply=False)
+        client.set(b"key", b"value", noreply=False)
+
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 0)
+        metric = self._get_metric("db.client.operation.duration")
+        (point,) = metric.data.data_points
+        self.assertEqual(point.count, 2)
+        self.assertEqual(
+            dict(point.attributes),
+            {
+                DB_SYSTEM_NAME: "memcached",
+                DB_OPERATION_NAME: "set",
+                SERVER_ADDRESS: TEST_HOST,
+                SERVER_PORT: TEST_PORT,
+            },
+        )
+
+    def test_metrics_disabled(self):
+        client = self.make_client([b"VALUE key 0 5\r\nvalue\r\nEND\r\n"])
+        client.get(b"key")
+
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 1)
+        self.assertIsNone(self._get_metric("db.client.operation.duration"))
+        self.assertIsNone(self._get_metric("db.memcached.lookups"))
+
+    def test_lookup_metrics(self):
+        PymemcacheInstrumentor().uninstrument()
+        PymemcacheInstrumentor().instrument(enable_metrics=True)
+        client = self.make_client(
+            [
+                b"VALUE key 0 5\r\nvalue\r\nEND\r\n",
+                b"END\r\n",
+                b"VALUE key1 0 6\r\nvalue1\r\nEND\r\n",
+            ]
+        )
+        client.get(b"key")
+        client.get(b"missing")
+        client.get_many([b"key1", b"key2", b"key3"])
+
+        lookups = {
+            (
+                point.attributes[DB_OPERATION_NAME],
+                point.attributes["db.memcached.lookup.result"],
+            ): point.value
+            for point in self._get_metric(
+                "db.memcached.lookups"
+            ).data.data_points
+        }
+        self.assertEqual(
+            lookups,
+            {
+                ("get", "hit"): 1,
+                ("get", "miss"): 1,
+                ("get_many", "hit"): 1,
+                ("get_many", "miss"): 2,
+            },
+        )
+
+    def test_get_many_batch_aware(self):
+        PymemcacheInstrumentor().uninstrument()
+        PymemcacheInstrumentor().instrument(batch_aware=True)
+        keys = [f"key{index}".encode() for index in range(100)]
+        client = self.make_client([b"VALUE key1 0 6\r\nvalue1\r\nEND\r\n"])
+        result = client.get_many(key for key in keys)
+        self.assertEqual(result, {b"key1": b"value1"})
+
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            span.attributes[DB_STATEMENT],
+            "get_many "
+            + " ".join(f"key{index}" for index in range(10))
+            + " ...",
+        )
+        self.assertEqual(span.attributes["db.memcached.key_count"], 100)
+        self.assertEqual(
+            span.attributes["db.memcached.key_bytes"],
+            sum(len(key) for key in keys),
+        )
+        self.assertEqual(span.attributes["db.memcached.hits"], 1)
+        self.assertEqual(span.attributes["db.memcached.misses"], 99)
+
+    def test_set_many_batch_aware(self):
+        PymemcacheInstrumentor().uninstrument()
+        PymemcacheInstrumentor().instrument(batch_aware=True)
+        client = self.make_client([b"STORED\r\n"])
+        client.set_many({b"key": b"value"}, noreply=False)
+
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.attributes[DB_STATEMENT], "set_many key")
+        self.assertEqual(span.attributes["db.memcached.key_count"], 1)
+        self.assertEqual(span.attributes["db.memcached.key_bytes"], 3)
+        self.assertNotIn("db.memcached.hits", span.attributes)
+
 
 class PymemcacheHashClientTestCase(TestBase):
     """Tests for a patched pymemcache.client.hash.HashClient."""
@@ -37,10 +37,12 @@ API
 The `instrument` method accepts the following keyword args:
 
 * tracer_provider (``TracerProvider``) - an optional tracer provider
+* meter_provider (``MeterProvider``) - an optional meter provider
 * request_hook (``Callable[[Span, CommandStartedEvent], None]``) - a function with extra user-defined logic to be performed before querying mongodb
 * response_hook (``Callable[[Span, CommandSucceededEvent], None]``) - a function with extra user-defined logic to be performed after the query returns with a successful response
 * failed_hook (``Callable[[Span, CommandFailedEvent], None]``) - a function with extra user-defined logic to be performed after the query returns with a failed response
 * capture_statement (``bool``) - an optional value to enable capturing the database statement that is being executed
+* aggregate_cursors (``bool``) - an optional value to aggregate the ``getMore`` commands of a cursor into the span of the command that opened it
 
 for example:
 
@@ -70,15 +72,49 @@ for example:
     collection = db["MongoDB_Collection"]
     collection.find_one()
 
+Cursor aggregation
+******************
+Iterating over a large cursor sends a ``getMore`` command per batch of
+documents, each traced in its own span by default. With
+``aggregate_cursors``, the span of the command opening the cursor, ``find``
+or ``aggregate`` for instance, stays open until the cursor is exhausted or
+killed, and the ``getMore`` commands of the cursor are counted in its
+attributes instead. The spans of the cursors left unused for 10 minutes, the
+default cursor timeout of MongoDB servers, are ended by the next command at
+the time of their last ``getMore``, as are the spans of the cursors still
+open when the instrumentation is disabled:
+
+* ``db.mongodb.cursor.batches``: batches of documents returned
+* ``db.mongodb.cursor.documents``: documents returned
+* ``db.mongodb.cursor.get_more_duration``: cumulative duration of the
+  ``getMore`` commands, in seconds
+
+.. code:: python
+
+    PymongoInstrumentor().instrument(aggregate_cursors=True)
+
+Metrics
+*******
+The duration of every command is recorded in the
+``db.client.operation.duration`` histogram, with the command name as
+``db.operation.name`` and the attributes of the stable database semantic
+conventions: ``db.system.name``, ``db.namespace``, ``server.address``,
+``server.port`` and ``error.type``.
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from logging import getLogger
+from threading import Lock
+from time import time_ns
 from typing import Any, Callable, Collection, TypeVar
 
 from pymongo import monitoring
 
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.pymongo.package import _instruments
 from opentelemetry.instrumentation.pymongo.utils import (
@@ -86,16 +122,31 @@ from opentelemetry.instrumentation.pymongo.utils import (
 )
 from opentelemetry.instrumentation.pymongo.version import __version__
 from opentelemetry.instrumentation.utils import is_instrumentation_enabled
+from opentelemetry.metrics import Meter, get_meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_MONGODB_COLLECTION,
     DB_NAME,
     DB_STATEMENT,
     DB_SYSTEM,
+    DbSystemNameValues,
 )
 from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_PEER_NAME,
     NET_PEER_PORT,
 )
+from opentelemetry.semconv._incubating.metrics.db_metrics import (
+    DB_CLIENT_OPERATION_DURATION,
+)
+from opentelemetry.semconv.attributes.db_attributes import (
+    DB_NAMESPACE,
+    DB_OPERATION_NAME,
+    DB_SYSTEM_NAME,
+)
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+from opentelemetry.semconv.attributes.server_attributes import (
+    SERVER_ADDRESS,
+    SERVER_PORT,
+)
 from opentelemetry.semconv.trace import DbSystemValues
 from opentelemetry.trace import SpanKind, Tracer, get_tracer
 from opentelemetry.trace.span import Span
@@ -115,9 +166,53 @@ CommandEvent = TypeVar(
 )
 
 
+CURSOR_BATCHES = "db.mongodb.cursor.batches"
+CURSOR_DOCUMENTS = "db.mongodb.cursor.documents"
+CURSOR_GET_MORE_DURATION = "db.mongodb.cursor.get_more_duration"
+
+# Beyond this number of open cursors, spans are no longer kept open
+_MAX_AGGREGATED_CURSORS = 1024
+# The spans of the cursors unused for longer are ended, like the cursors are
+# by MongoDB servers after ``cursorTimeoutMillis``
+_CURSOR_IDLE_TIMEOUT_NS = 10 * 60 * 1_000_000_000
+
+CursorKey = tuple[Any, Any]
+
+
 def dummy_callback(span: Span, event: CommandEvent): ...
 
 
+class _AggregatedCursor:
+    """The span of the command that opened a cursor, with the statistics of
+    the ``getMore`` commands of the cursor."""
+
+    __slots__ = (
+        "span",
+        "batches",
+        "documents",
+        "get_more_duration",
+        "last_used",
+    )
+
+    def __init__(self, span: Span, documents: int):
+        self.span = span
+        self.batches = 1
+        self.documents = documents
+        self.get_more_duration = 0.0
+        self.last_used = time_ns()
+
+    def end(self, end_time: int | None = None):
+        if self.span.is_recording():
+            self.span.set_attributes(
+                {
+                    CURSOR_BATCHES: self.batches,
+                    CURSOR_DOCUMENTS: self.documents,
+                    CURSOR_GET_MORE_DURATION: self.get_more_duration,
+                }
+            )
+        self.span.end(end_time)
+
+
 class CommandTracer(monitoring.CommandListener):
     def __init__(
         self,
@@ -126,6 +221,8 @@ class CommandTracer(monitoring.CommandListener):
         response_hook: ResponseHookT = dummy_callback,
         failed_hook: FailedHookT = dummy_callback,
         capture_statement: bool = False,
+        aggregate_cursors: bool = False,
+        meter: Meter | None = None,
     ):
         self._tracer = tracer
         self._span_dict = {}
@@ -134,12 +231,28 @@ class CommandTracer(monitoring.CommandListener):
         self.success_hook = response_hook
         self.failed_hook = failed_hook
         self.capture_statement = capture_statement
+        self.aggregate_cursors = aggregate_cursors
+        # Open cursors, from the least recently used, and the cursors of the
+        # getMore commands in flight
+        self._cursors: dict[CursorKey, _AggregatedCursor] = {}
+        self._get_more_cursors: dict[Any, CursorKey] = {}
+        self._cursors_lock = Lock()
+        self._operation_duration = None
+        if meter is not None:
+            self._operation_duration = meter.create_histogram(
+                name=DB_CLIENT_OPERATION_DURATION,
+                unit="s",
+                description="Duration of database client operations.",
+                explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+            )
 
     def started(self, event: monitoring.CommandStartedEvent):
         """Method to handle a pymongo CommandStartedEvent"""
         if not self.is_enabled or not is_instrumentation_enabled():
             return
         command_name = event.command_name
+        if self.aggregate_cursors and self._aggregate_started(event):
+            return
         span_name = f"{event.database_name}.{command_name}"
         statement = self._get_statement_by_command_name(command_name, event)
         collection = _get_command_collection_name(event)
@@ -174,6 +287,9 @@ class CommandTracer(monitoring.CommandListener):
         """Method to handle a pymongo CommandSucceededEvent"""
         if not self.is_enabled or not is_instrumentation_enabled():
             return
+        self._record_duration(event)
+        if self.aggregate_cursors and self._aggregate_get_more(event):
+            return
         span = self._pop_span(event)
         if span is None:
             return
@@ -184,13 +300,27 @@ class CommandTracer(monitoring.CommandListener):
                 Exception  # noqa pylint: disable=broad-except
             ) as hook_exception:  # noqa pylint: disable=broad-except
                 _LOG.exception(hook_exception)
+        if self.aggregate_cursors and self._open_cursor(span, event):
+            return
         span.end()
 
     def failed(self, event: monitoring.CommandFailedEvent):
         """Method to handle a pymongo CommandFailedEvent"""
         if not (self.is_enabled and is_instrumentation_enabled()):
             return
+        self._record_duration(
+            event, str(event.failure.get("codeName", "_OTHER"))
+        )
         span = self._pop_span(event)
+        cursor = None
+        if span is None and self.aggregate_cursors:
+            # a getMore failure ends the span of its cursor
+            with self._cursors_lock:
+                cursor_key = self._get_more_cursors.pop(
+                    _get_span_dict_key(event), None
+                )
+                cursor = self._cursors.pop(cursor_key, None)
+            span = cursor.span if cursor is not None else None
         if span is None:
             return
         if span.is_recording():
@@ -206,11 +336,132 @@ class CommandTracer(monitoring.CommandListener):
                 Exception  # noqa pylint: disable=broad-except
             ) as hook_exception:  # noqa pylint: disable=broad-except
                 _LOG.exception(hook_exception)
-        span.end()
+        if cursor is not None:
+            cursor.end()
+        else:
+            span.end()
 
     def _pop_span(self, event: CommandEvent) -> Span | None:
         return self._span_dict.pop(_get_span_dict_key(event), None)
 
+    def _record_duration(
+        self, event: CommandEvent, error_type: str | None = None
+    ) -> None:
+        if self._operation_duration is None:
+            return
+        attributes = {
+            DB_SYSTEM_NAME: DbSystemNameValues.MONGODB.value,
+            DB_NAMESPACE: event.database_name,
+            DB_OPERATION_NAME: str(event.command_name),
+        }
+        if event.connection_id is not None:
+            attributes[SERVER_ADDRESS] = event.connection_id[0]
+            attributes[SERVER_PORT] = event.connection_id[1]
+        if error_type is not None:
+            attributes[ERROR_TYPE] = error_type
+        self._operation_duration.record(
+            event.duration_micros / 1e6, attributes
+        )
+
+    def _aggregate_started(self, event: monitoring.CommandStartedEvent):
+        """Accounts for the getMore and killCursors commands of the open
+        cursors, returns true if the command gets no span of its own.
+        """
+        command_name = event.command_name
+        expired = self._expire_cursors(time_ns())
+        killed = []
+        aggregated = False
+        with self._cursors_lock:
+            if command_name == "getMore":
+                cursor_key = (
+                    event.connection_id,
+                    event.command.get("getMore"),
+                )
+                if cursor_key in self._cursors:
+                    self._get_more_cursors[_get_span_dict_key(event)] = (
+                        cursor_key
+                    )
+                    aggregated = True
+            elif command_name == "killCursors":
+                for cursor_id in event.command.get("cursors") or ():
+                    cursor = self._cursors.pop(
+                        (event.connection_id, cursor_id), None
+                    )
+                    if cursor is not None:
+                        killed.append(cursor)
+        for cursor in expired:
+            cursor.end(cursor.last_used)
+        for cursor in killed:
+            cursor.end()
+        return aggregated
+
+    def _aggregate_get_more(
+        self, event: monitoring.CommandSucceededEvent
+    ) -> bool:
+        """Counts the batch returned by a getMore command in its cursor,
+        returns true if the command was aggregated.
+        """
+        reply_cursor = event.reply.get("cursor") or {}
+        with self._cursors_lock:
+            cursor_key = self._get_more_cursors.pop(
+                _get_span_dict_key(event), None
+            )
+            if cursor_key is None:
+                return False
+            cursor = self._cursors.pop(cursor_key, None)
+            if cursor is None:
+                return True
+            cursor.batches += 1
+            cursor.documents += len(reply_cursor.get("nextBatch") or ())
+            cursor.get_more_duration += event.duration_micros / 1e6
+            cursor.last_used = time_ns()
+            if reply_cursor.get("id"):
+                # moved to the end of the least recently used cursors
+                self._cursors[cursor_key] = cursor
+                return True
+        # exhausted
+        cursor.end()
+        return True
+
+    def _open_cursor(
+        self, span: Span, event: monitoring.CommandSucceededEvent
+    ) -> bool:
+        """Keeps the span open if the command opened a cursor."""
+        reply_cursor = event.reply.get("cursor")
+        if not isinstance(reply_cursor, Mapping):
+            return False
+        cursor = _AggregatedCursor(
+            span, len(reply_cursor.get("firstBatch") or ())
+        )
+        cursor_id = reply_cursor.get("id")
+        if cursor_id:
+            with self._cursors_lock:
+                if len(self._cursors) < _MAX_AGGREGATED_CURSORS:
+                    self._cursors[(event.connection_id, cursor_id)] = cursor
+                    return True
+        cursor.end()
+        return True
+
+    def _expire_cursors(self, now: int) -> list[_AggregatedCursor]:
+        """Removes the cursors unused for longer than the cursor timeout of
+        the servers, which have most likely closed them."""
+        expired = []
+        with self._cursors_lock:
+            for cursor_key, cursor in self._cursors.items():
+                if now - cursor.last_used < _CURSOR_IDLE_TIMEOUT_NS:
+                    break
+                expired.append(cursor_key)
+            return [self._cursors.pop(cursor_key) for cursor_key in expired]
+
+    def end_cursors(self) -> None:
+        """Ends the spans of all the open cursors."""
+        with self._cursors_lock:
+            cursors = list(self._cursors.values())
+            self._cursors.clear()
+            self._get_more_cursors.clear()
+        for cursor in cursors:
+            cursor.end(cursor.last_used)
+
     def _get_statement_by_command_name(
         self, command_name: str, event: CommandEvent
     ) -> str:
@@ -256,6 +507,8 @@ class PymongoInstrumentor(BaseInstrumentor):
         Args:
             tracer_provider: The `TracerProvider` to use. If none is passed the
                 current configured one is used.
+            meter_provider: The `MeterProvider` to use. If none is passed the
+                current configured one is used.
         """
 
         tracer_provider = kwargs.get("tracer_provider")
@@ -263,6 +516,7 @@ class PymongoInstrumentor(BaseInstrumentor):
         response_hook = kwargs.get("response_hook", dummy_callback)
         failed_hook = kwargs.get("failed_hook", dummy_callback)
         capture_statement = kwargs.get("capture_statement")
+        aggregate_cursors = kwargs.get("aggregate_cursors", False)
         # Create and register a CommandTracer only the first time
         if self._commandtracer_instance is None:
             tracer = get_tracer(
@@ -271,6 +525,12 @@ class PymongoInstrumentor(BaseInstrumentor):
                 tracer_provider,
                 schema_url="https://opentelemetry.io/schemas/1.11.0",
             )
+            meter = get_meter(
+                __name__,
+                __version__,
+                kwargs.get("meter_provider"),
+                schema_url="https://opentelemetry.io/schemas/1.11.0",
+            )
 
             self._commandtracer_instance = CommandTracer(
                 tracer,
@@ -278,6 +538,8 @@ class PymongoInstrumentor(BaseInstrumentor):
                 response_hook=response_hook,
                 failed_hook=failed_hook,
                 capture_statement=capture_statement,
+                aggregate_cursors=aggregate_cursors,
+                meter=meter,
             )
             monitoring.register(self._commandtracer_instance)
         # If already created, just enable it
@@ -286,3 +548,4 @@ class PymongoInstrumentor(BaseInstrumentor):
     def _uninstrument(self, **kwargs: Any):
         if self._commandtracer_instance is not None:
             self._commandtracer_instance.is_enabled = False
+            self._commandtracer_instance.end_cursors()
@@ -312,6 +312,170 @@ class TestPymongo(TestBase):
                 )
                 self.memory_exporter.clear()
 
+    def _cursor_event(self, command_attrs, request_id, reply):
+        event = MockEvent(command_attrs, ("test.com", 1234), request_id)
+        event.reply = reply
+        event.duration_micros = 2000
+        return event
+
+    def test_aggregate_cursors(self):
+        command_tracer = CommandTracer(self.tracer, aggregate_cursors=True)
+        find_event = self._cursor_event(
+            {"command_name": "find", "find": "test_collection"},
+            "find",
+            {"cursor": {"id": 42, "firstBatch": [{}, {}]}},
+        )
+        command_tracer.started(event=find_event)
+        command_tracer.succeeded(event=find_event)
+        for request_id, cursor_id, documents in (
+            ("first", 42, 3),
+            ("second", 0, 1),
+        ):
+            self.assertEqual(len(self.memory_exporter.get_finished_spans()), 0)
+            get_more_event = self._cursor_event(
+                {"command_name": "getMore", "getMore": 42},
+                request_id,
+                {"cursor": {"id": cursor_id, "nextBatch": [{}] * documents}},
+            )
+            command_tracer.started(event=get_more_event)
+            command_tracer.succeeded(event=get_more_event)
+
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 1)
+        span = spans_list[0]
+        self.assertEqual(span.name, "database_name.find")
+        self.assertEqual(span.attributes["db.mongodb.cursor.batches"], 3)
+        self.assertEqual(span.attributes["db.mongodb.cursor.documents"], 6)
+        self.assertEqual(
+            span.attributes["db.mongodb.cursor.get_more_duration"], 0.004
+        )
+        # pylint: disable=protected-access
+        self.assertEqual(command_tracer._cursors, {})
+        self.assertEqual(command_tracer._get_more_cursors, {})
+        self.assertEqual(command_tracer._span_dict, {})
+
+    def test_aggregate_cursors_killed(self):
+        command_tracer = CommandTracer(self.tracer, aggregate_cursors=True)
+        find_event = self._cursor_event(
+            {"command_name": "aggregate"},
+            "aggregate",
+            {"cursor": {"id": 42, "firstBatch": [{}]}},
+        )
+        command_tracer.started(event=find_event)
+        command_tracer.succeeded(event=find_event)
+        kill_event = self._cursor_event(
+            {"command_name": "killCursors", "cursors": [42]},
+            "kill",
+            {"cursorsKilled": [42]},
+        )
+        command_tracer.started(event=kill_event)
+        command_tracer.succeeded(event=kill_event)
+
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            [span.name for span in spans_list],
+            ["database_name.aggregate", "database_name.killCursors"],
+        )
+        self.assertEqual(
+            spans_list[0].attributes["db.mongodb.cursor.batches"], 1
+        )
+
+    def _open_cursor(self, command_tracer):
+        find_event = self._cursor_event(
+            {"command_name": "find", "find": "test_collection"},
+            "find",
+            {"cursor": {"id": 42, "firstBatch": [{}]}},
+        )
+        command_tracer.started(event=find_event)
+        command_tracer.succeeded(event=find_event)
+        # pylint: disable=protected-access
+        (cursor,) = command_tracer._cursors.values()
+        return cursor
+
+    def test_aggregate_cursors_idle_timeout(self):
+        command_tracer = CommandTracer(self.tracer, aggregate_cursors=True)
+        cursor = self._open_cursor(command_tracer)
+        insert_event = self._cursor_event(
+            {"command_name": "insert"}, "insert", {}
+        )
+        with mock.patch(
+            "opentelemetry.instrumentation.pymongo.time_ns",
+            return_value=cursor.last_used + 10 * 60 * 1_000_000_000,
+        ):
+            command_tracer.started(event=insert_event)
+        command_tracer.succeeded(event=insert_event)
+
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            [span.name for span in spans_list],
+            ["database_name.find", "database_name.insert"],
+        )
+        self.assertEqual(spans_list[0].end_time, cursor.last_used)
+        # pylint: disable=protected-access
+        self.assertEqual(command_tracer._cursors, {})
+
+    def test_aggregate_cursors_ended_on_uninstrument(self):
+        instrumentor = PymongoInstrumentor()
+        instrumentor.instrument(aggregate_cursors=True)
+        # pylint: disable=protected-access
+        command_tracer = instrumentor._commandtracer_instance
+        try:
+            self._open_cursor(command_tracer)
+            self.assertEqual(self.memory_exporter.get_finished_spans(), ())
+        finally:
+            instrumentor.uninstrument()
+            instrumentor._commandtracer_instance = None
+
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.name, "database_name.find")
+        self.assertEqual(span.attributes["db.mongodb.cursor.batches"], 1)
+        self.assertEqual(command_tracer._cursors, {})
+
+    def test_operation_duration_metric(self):
+        command_tracer = CommandTracer(
+            self.tracer,
+            meter=self.meter_provider.get_meter(__name__),
+        )
+        succeeded_event = self._cursor_event(
+            {"command_name": "find"}, "find", {}
+        )
+        failed_event = self._cursor_event(
+            {"command_name": "insert"}, "insert", {}
+        )
+        failed_event.mark_as_failed()
+        command_tracer.started(event=succeeded_event)
+        command_tracer.succeeded(event=succeeded_event)
+        command_tracer.started(event=failed_event)
+        command_tracer.failed(event=failed_event)
+
+        (metric,) = self.get_sorted_metrics()
+        self.assertEqual(metric.name, "db.client.operation.duration")
+        points = sorted(
+            metric.data.data_points,
+            key=lambda point: point.attributes["db.operation.name"],
+        )
+        self.assertEqual(
+            [dict(point.attributes) for point in points],
+            [
+                {
+                    "db.system.name": "mongodb",
+                    "db.namespace": "database_name",
+                    "db.operation.name": "find",
+                    "server.address": "test.com",
+                    "server.port": 1234,
+                },
+                {
+                    "db.system.name": "mongodb",
+                    "db.namespace": "database_name",
+                    "db.operation.name": "insert",
+                    "server.address": "test.com",
+                    "server.port": 1234,
+                    "error.type": "_OTHER",
+                },
+            ],
+        )
+        self.assertEqual([point.sum for point in points], [0.002, 0.002])
+
 
 class MockCommand:
     def __init__(self, command_attrs):
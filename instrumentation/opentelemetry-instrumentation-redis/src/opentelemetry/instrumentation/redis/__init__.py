@@ -139,6 +139,48 @@ creating spans for internal operations, health checks, or during specific code p
     # This will report a span again
     client.get("another-key")
 
+Metrics
+-------
+
+The duration of every command is recorded in the
+``db.client.operation.duration`` histogram, with the command name as
+``db.operation.name``, whether its span is sampled or not. The commands that
+fail are also counted by ``db.redis.command.errors``, with the type of the
+exception as ``error.type``, and the number of commands sent in pipelines is
+recorded in the ``db.redis.pipeline.length`` histogram.
+
+Pipelines
+---------
+
+The span of a pipeline is named after its commands, counted by name, like
+``SET×49000 EXPIRE×1000``, whether it runs in a transaction or not. Its ``db.statement`` lists
+the sanitized commands of the pipeline up to 4096 characters.
+
+Redis Cluster Metrics
+---------------------
+
+The metrics of the nodes of Redis Clusters are opt-in, as they wrap the
+internals of the cluster clients:
+
+.. code:: python
+
+    RedisInstrumentor().instrument(cluster_metrics=True)
+
+* ``db.redis.cluster.node.duration``: the duration of the commands, by the
+  ``host:port`` of the node they are sent to as ``db.redis.cluster.node``. A
+  command redirected to another node is reported under its first node.
+* ``db.redis.cluster.redirects``: the MOVED and ASK redirections of the
+  commands, by type as ``db.redis.cluster.redirect.type`` and by the node
+  they point to. The commands of a pipeline are counted when they are
+  retried one by one after a redirection.
+* ``db.redis.cluster.slot_cache.refreshes``: the loads of the slot cache of
+  the clients.
+* ``db.redis.cluster.pipeline.node_commands``: the number of commands of a
+  pipeline sent to each node.
+
+At most 128 nodes are reported separately, the others are reported as
+``_OTHER``.
+
 API
 ---
 """
@@ -146,6 +188,7 @@ API
 from __future__ import annotations
 
 import logging
+from timeit import default_timer
 from typing import TYPE_CHECKING, Any, Callable, Collection
 
 import redis
@@ -153,20 +196,27 @@ from wrapt import wrap_function_wrapper
 
 from opentelemetry import trace
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
+from opentelemetry.instrumentation.redis.cluster_metrics import (
+    _ClusterMetrics,
+)
 from opentelemetry.instrumentation.redis.package import _instruments
 from opentelemetry.instrumentation.redis.util import (
     _add_create_attributes,
     _add_search_attributes,
-    _build_span_meta_data_for_pipeline,
     _build_span_name,
+    _CommandMetrics,
     _format_command_args,
+    _format_pipeline_statement,
+    _get_operation_name,
     _set_connection_attributes,
+    _summarize_pipeline,
 )
 from opentelemetry.instrumentation.redis.version import __version__
 from opentelemetry.instrumentation.utils import (
     is_instrumentation_enabled,
     unwrap,
 )
+from opentelemetry.metrics import MeterProvider, get_meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_STATEMENT,
 )
@@ -221,6 +271,7 @@ def _traced_execute_factory(
     tracer: Tracer,
     request_hook: RequestHook | None = None,
     response_hook: ResponseHook | None = None,
+    metrics: _CommandMetrics | None = None,
 ):
     def _traced_execute_command(
         func: Callable[..., R],
@@ -231,20 +282,35 @@ def _traced_execute_factory(
         if not is_instrumentation_enabled():
             return func(*args, **kwargs)
 
-        query = _format_command_args(args)
         name = _build_span_name(instance, args)
         with tracer.start_as_current_span(
             name, kind=trace.SpanKind.CLIENT
         ) as span:
             if span.is_recording():
-                span.set_attribute(DB_STATEMENT, query)
+                span.set_attribute(DB_STATEMENT, _format_command_args(args))
                 _set_connection_attributes(span, instance)
                 span.set_attribute("db.redis.args_length", len(args))
                 if span.name == "redis.create_index":
                     _add_create_attributes(span, args)
             if callable(request_hook):
                 request_hook(span, instance, args, kwargs)
-            response = func(*args, **kwargs)
+            if metrics is None:
+                response = func(*args, **kwargs)
+            else:
+                error_type = None
+                start = default_timer()
+                try:
+                    response = func(*args, **kwargs)
+                except Exception as exc:
+                    error_type = type(exc).__qualname__
+                    raise
+                finally:
+                    metrics.record(
+                        instance,
+                        _get_operation_name(args),
+                        default_timer() - start,
+                        error_type,
+                    )
             if span.is_recording():
                 if span.name == "redis.search":
                     _add_search_attributes(span, response, args)
@@ -259,6 +325,7 @@ def _traced_execute_pipeline_factory(
     tracer: Tracer,
     request_hook: RequestHook | None = None,
     response_hook: ResponseHook | None = None,
+    metrics: _CommandMetrics | None = None,
 ):
     def _traced_execute_pipeline(
         func: Callable[..., R],
@@ -269,17 +336,17 @@ def _traced_execute_pipeline_factory(
         if not is_instrumentation_enabled():
             return func(*args, **kwargs)
 
-        (
-            command_stack,
-            resource,
-            span_name,
-        ) = _build_span_meta_data_for_pipeline(instance)
+        command_stack, span_name = _summarize_pipeline(instance)
+        if metrics is not None and command_stack:
+            metrics.record_pipeline(instance, len(command_stack))
         exception = None
         with tracer.start_as_current_span(
             span_name, kind=trace.SpanKind.CLIENT
         ) as span:
             if span.is_recording():
-                span.set_attribute(DB_STATEMENT, resource)
+                span.set_attribute(
+                    DB_STATEMENT, _format_pipeline_statement(command_stack)
+                )
                 _set_connection_attributes(span, instance)
                 span.set_attribute(
                     "db.redis.pipeline_length", len(command_stack)
@@ -307,6 +374,7 @@ def _async_traced_execute_factory(
     tracer: Tracer,
     request_hook: RequestHook | None = None,
     response_hook: ResponseHook | None = None,
+    metrics: _CommandMetrics | None = None,
 ):
     async def _async_traced_execute_command(
         func: Callable[..., Awaitable[R]],
@@ -317,19 +385,34 @@ def _async_traced_execute_factory(
         if not is_instrumentation_enabled():
             return await func(*args, **kwargs)
 
-        query = _format_command_args(args)
         name = _build_span_name(instance, args)
 
         with tracer.start_as_current_span(
             name, kind=trace.SpanKind.CLIENT
         ) as span:
             if span.is_recording():
-                span.set_attribute(DB_STATEMENT, query)
+                span.set_attribute(DB_STATEMENT, _format_command_args(args))
                 _set_connection_attributes(span, instance)
                 span.set_attribute("db.redis.args_length", len(args))
             if callable(request_hook):
                 request_hook(span, instance, args, kwargs)
-            response = await func(*args, **kwargs)
+            if metrics is None:
+                response = await func(*args, **kwargs)
+            else:
+                error_type = None
+                start = default_timer()
+                try:
+                    response = await func(*args, **kwargs)
+                except Exception as exc:
+                    error_type = type(exc).__qualname__
+                    raise
+                finally:
+                    metrics.record(
+                        instance,
+                        _get_operation_name(args),
+                        default_timer() - start,
+                        error_type,
+                    )
             if callable(response_hook):
                 response_hook(span, instance, response)
             return response
@@ -341,6 +424,7 @@ def _async_traced_execute_pipeline_factory(
     tracer: Tracer,
     request_hook: RequestHook | None = None,
     response_hook: ResponseHook | None = None,
+    metrics: _CommandMetrics | None = None,
 ):
     async def _async_traced_execute_pipeline(
         func: Callable[..., Awaitable[R]],
@@ -351,11 +435,9 @@ def _async_traced_execute_pipeline_factory(
         if not is_instrumentation_enabled():
             return await func(*args, **kwargs)
 
-        (
-            command_stack,
-            resource,
-            span_name,
-        ) = _build_span_meta_data_for_pipeline(instance)
+        command_stack, span_name = _summarize_pipeline(instance)
+        if metrics is not None and command_stack:
+            metrics.record_pipeline(instance, len(command_stack))
 
         exception = None
 
@@ -363,7 +445,9 @@ def _async_traced_execute_pipeline_factory(
             span_name, kind=trace.SpanKind.CLIENT
         ) as span:
             if span.is_recording():
-                span.set_attribute(DB_STATEMENT, resource)
+                span.set_attribute(
+                    DB_STATEMENT, _format_pipeline_statement(command_stack)
+                )
                 _set_connection_attributes(span, instance)
                 span.set_attribute(
                     "db.redis.pipeline_length", len(command_stack)
@@ -392,12 +476,14 @@ def _instrument(
     tracer: Tracer,
     request_hook: RequestHook | None = None,
     response_hook: ResponseHook | None = None,
+    metrics: _CommandMetrics | None = None,
+    cluster_metrics: _ClusterMetrics | None = None,
 ):
     _traced_execute_command = _traced_execute_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
     _traced_execute_pipeline = _traced_execute_pipeline_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
     pipeline_class = "BasePipeline" if _CLIENT_BEFORE_V3 else "Pipeline"
     redis_class = "StrictRedis" if _CLIENT_BEFORE_V3 else "Redis"
@@ -426,12 +512,33 @@ def _instrument(
             "ClusterPipeline.execute",
             _traced_execute_pipeline,
         )
+        if cluster_metrics is not None:
+            wrap_function_wrapper(
+                "redis.cluster",
+                "RedisCluster._execute_command",
+                cluster_metrics.traced_execute_command,
+            )
+            wrap_function_wrapper(
+                "redis.cluster",
+                "NodesManager.initialize",
+                cluster_metrics.traced_initialize,
+            )
+            wrap_function_wrapper(
+                "redis.cluster",
+                "NodeCommands.write",
+                cluster_metrics.traced_node_commands_write,
+            )
+            wrap_function_wrapper(
+                "redis.exceptions",
+                "AskError.__init__",
+                cluster_metrics.traced_redirect_init,
+            )
 
     _async_traced_execute_command = _async_traced_execute_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
     _async_traced_execute_pipeline = _async_traced_execute_pipeline_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
     if _CLIENT_ASYNCIO_SUPPORT:
         wrap_function_wrapper(
@@ -460,6 +567,22 @@ def _instrument(
             "ClusterPipeline.execute",
             _async_traced_execute_pipeline,
         )
+        if cluster_metrics is not None:
+            wrap_function_wrapper(
+                "redis.asyncio.cluster",
+                "RedisCluster._execute_command",
+                cluster_metrics.async_traced_execute_command,
+            )
+            wrap_function_wrapper(
+                "redis.asyncio.cluster",
+                "NodesManager.initialize",
+                cluster_metrics.async_traced_initialize,
+            )
+            wrap_function_wrapper(
+                "redis.asyncio.cluster",
+                "ClusterNode.execute_pipeline",
+                cluster_metrics.async_traced_execute_pipeline,
+            )
 
 
 def _instrument_client(
@@ -467,13 +590,14 @@ def _instrument_client(
     tracer: Tracer,
     request_hook: RequestHook | None = None,
     response_hook: ResponseHook | None = None,
+    metrics: _CommandMetrics | None = None,
 ):
     # first, handle async clients and cluster clients
     _async_traced_execute = _async_traced_execute_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
     _async_traced_execute_pipeline = _async_traced_execute_pipeline_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
 
     if _CLIENT_ASYNCIO_SUPPORT and isinstance(client, redis.asyncio.Redis):
@@ -511,10 +635,10 @@ def _instrument_client(
     # for redis.client.Redis, redis.Cluster and v3.0.0 redis.client.StrictRedis
     # the wrappers are the same
     _traced_execute = _traced_execute_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
     _traced_execute_pipeline = _traced_execute_pipeline_factory(
-        tracer, request_hook, response_hook
+        tracer, request_hook, response_hook, metrics
     )
 
     def _pipeline_wrapper(func, instance, args, kwargs):
@@ -548,11 +672,34 @@ class RedisInstrumentor(BaseInstrumentor):
             schema_url="https://opentelemetry.io/schemas/1.11.0",
         )
 
+    @staticmethod
+    def _get_metrics(**kwargs):
+        meter = get_meter(
+            __name__,
+            __version__,
+            meter_provider=kwargs.get("meter_provider"),
+            schema_url="https://opentelemetry.io/schemas/1.11.0",
+        )
+        return _CommandMetrics(meter)
+
+    @staticmethod
+    def _get_cluster_metrics(**kwargs):
+        if not kwargs.get("cluster_metrics"):
+            return None
+        meter = get_meter(
+            __name__,
+            __version__,
+            meter_provider=kwargs.get("meter_provider"),
+            schema_url="https://opentelemetry.io/schemas/1.11.0",
+        )
+        return _ClusterMetrics(meter)
+
     def instrument(
         self,
         tracer_provider: TracerProvider | None = None,
         request_hook: RequestHook | None = None,
         response_hook: ResponseHook | None = None,
+        meter_provider: MeterProvider | None = None,
         **kwargs,
     ):
         """Instruments all Redis/StrictRedis/RedisCluster and async client instances.
@@ -573,11 +720,15 @@ class RedisInstrumentor(BaseInstrumentor):
                 a function with extra user-defined logic to run after the request is complete.
 
                 The ``args`` represents the response.
+            meter_provider: A MeterProvider, defaults to global.
+            cluster_metrics: Whether to record the metrics of the nodes of
+                Redis Clusters, defaults to False.
         """
         super().instrument(
             tracer_provider=tracer_provider,
             request_hook=request_hook,
             response_hook=response_hook,
+            meter_provider=meter_provider,
             **kwargs,
         )
 
@@ -589,11 +740,15 @@ class RedisInstrumentor(BaseInstrumentor):
                 ``tracer_provider``: a TracerProvider, defaults to global.
                 ``request_hook``: An optional callback that is invoked right after a span is created.
                 ``response_hook``: An optional callback which is invoked right before the span is finished processing a response.
+                ``meter_provider``: a MeterProvider, defaults to global.
+                ``cluster_metrics``: Whether to record the metrics of the nodes of Redis Clusters, defaults to False.
         """
         _instrument(
             self._get_tracer(**kwargs),
             request_hook=kwargs.get("request_hook"),
             response_hook=kwargs.get("response_hook"),
+            metrics=self._get_metrics(**kwargs),
+            cluster_metrics=self._get_cluster_metrics(**kwargs),
         )
 
     def _uninstrument(self, **kwargs: Any):
@@ -617,6 +772,10 @@ class RedisInstrumentor(BaseInstrumentor):
         if _CLIENT_CLUSTER_SUPPORT:
             unwrap(redis.cluster.RedisCluster, "execute_command")
             unwrap(redis.cluster.ClusterPipeline, "execute")
+            unwrap(redis.cluster.RedisCluster, "_execute_command")
+            unwrap(redis.cluster.NodesManager, "initialize")
+            unwrap(redis.cluster.NodeCommands, "write")
+            unwrap(redis.exceptions.AskError, "__init__")
         if _CLIENT_ASYNCIO_SUPPORT:
             unwrap(redis.asyncio.Redis, "execute_command")
             unwrap(redis.asyncio.Redis, "pipeline")
@@ -625,6 +784,9 @@ class RedisInstrumentor(BaseInstrumentor):
         if _CLIENT_ASYNCIO_CLUSTER_SUPPORT:
             unwrap(redis.asyncio.cluster.RedisCluster, "execute_command")
             unwrap(redis.asyncio.cluster.ClusterPipeline, "execute")
+            unwrap(redis.asyncio.cluster.RedisCluster, "_execute_command")
+            unwrap(redis.asyncio.cluster.NodesManager, "initialize")
+            unwrap(redis.asyncio.cluster.ClusterNode, "execute_pipeline")
 
     @staticmethod
     def instrument_client(
@@ -636,6 +798,7 @@ class RedisInstrumentor(BaseInstrumentor):
         tracer_provider: TracerProvider | None = None,
         request_hook: RequestHook | None = None,
         response_hook: ResponseHook | None = None,
+        meter_provider: MeterProvider | None = None,
     ):
         """Instrument the provided Redis Client. The client can be sync or async.
         Cluster client is also supported.
@@ -658,6 +821,7 @@ class RedisInstrumentor(BaseInstrumentor):
                 the request is complete.
 
                 The ``args`` represents the response.
+            meter_provider: A MeterProvider, defaults to global.
         """
         if not hasattr(client, _INSTRUMENTATION_ATTR):
             setattr(client, _INSTRUMENTATION_ATTR, False)
@@ -667,6 +831,9 @@ class RedisInstrumentor(BaseInstrumentor):
                 RedisInstrumentor._get_tracer(tracer_provider=tracer_provider),
                 request_hook=request_hook,
                 response_hook=response_hook,
+                metrics=RedisInstrumentor._get_metrics(
+                    meter_provider=meter_provider
+                ),
             )
             setattr(client, _INSTRUMENTATION_ATTR, True)
         else:
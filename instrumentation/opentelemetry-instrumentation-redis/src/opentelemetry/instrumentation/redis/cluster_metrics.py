@@ -0,0 +1,211 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Metrics of the nodes of a Redis Cluster, recorded by wrapping the internals
+of the redis cluster clients that send commands to a given node.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from timeit import default_timer
+from typing import Any
+
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
+from opentelemetry.instrumentation.redis.util import (
+    _PIPELINE_LENGTH_BUCKETS,
+)
+from opentelemetry.instrumentation.utils import is_instrumentation_enabled
+from opentelemetry.metrics import Meter
+from opentelemetry.semconv._incubating.attributes.db_attributes import (
+    DbSystemNameValues,
+)
+from opentelemetry.semconv.attributes.db_attributes import DB_SYSTEM_NAME
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+
+DB_REDIS_CLUSTER_NODE = "db.redis.cluster.node"
+DB_REDIS_CLUSTER_REDIRECT_TYPE = "db.redis.cluster.redirect.type"
+
+DB_REDIS_CLUSTER_NODE_DURATION = "db.redis.cluster.node.duration"
+DB_REDIS_CLUSTER_REDIRECTS = "db.redis.cluster.redirects"
+DB_REDIS_CLUSTER_SLOT_CACHE_REFRESHES = "db.redis.cluster.slot_cache.refreshes"
+DB_REDIS_CLUSTER_PIPELINE_NODE_COMMANDS = (
+    "db.redis.cluster.pipeline.node_commands"
+)
+
+# Bound of the nodes reported separately, the others are reported as _OTHER
+_MAX_NODES = 128
+_OTHER_NODE = "_OTHER"
+
+# Set while an instrumented cluster client sends a command to a node, only the
+# redirections of these commands are counted
+_sending_command: ContextVar[bool] = ContextVar(
+    "otel_redis_cluster_sending_command", default=False
+)
+
+
+def _is_moved_error(error: Exception) -> bool:
+    # redis.exceptions.MovedError does not exist before redis 4.1
+    return any(cls.__name__ == "MovedError" for cls in type(error).__mro__)
+
+
+class _ClusterMetrics:
+    """Records the metrics of the nodes of Redis Clusters.
+
+    The methods are wrappers of the cluster client methods sending commands
+    to a node, refreshing the slot cache and parsing redirections.
+    """
+
+    def __init__(self, meter: Meter):
+        self._node_attributes: dict[str, dict[str, str]] = {}
+        self._node_duration = meter.create_histogram(
+            name=DB_REDIS_CLUSTER_NODE_DURATION,
+            unit="s",
+            description="Duration of the commands sent to a Redis Cluster node.",
+            explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+        )
+        self._redirects = meter.create_counter(
+            name=DB_REDIS_CLUSTER_REDIRECTS,
+            unit="{redirect}",
+            description="The number of MOVED and ASK redirections to a Redis Cluster node.",
+        )
+        self._slot_cache_refreshes = meter.create_counter(
+            name=DB_REDIS_CLUSTER_SLOT_CACHE_REFRESHES,
+            unit="{refresh}",
+            description="The number of times the slot cache of a Redis Cluster client was loaded.",
+        )
+        self._pipeline_node_commands = meter.create_histogram(
+            name=DB_REDIS_CLUSTER_PIPELINE_NODE_COMMANDS,
+            unit="{command}",
+            description="The number of commands of a Redis Cluster pipeline sent to a node.",
+            explicit_bucket_boundaries_advisory=_PIPELINE_LENGTH_BUCKETS,
+        )
+
+    def _get_node_attributes(self, node_name: str) -> dict[str, str]:
+        attributes = self._node_attributes.get(node_name)
+        if attributes is None:
+            if len(self._node_attributes) >= _MAX_NODES:
+                node_name = _OTHER_NODE
+            attributes = {
+                DB_SYSTEM_NAME: DbSystemNameValues.REDIS.value,
+                DB_REDIS_CLUSTER_NODE: node_name,
+            }
+            if node_name != _OTHER_NODE:
+                self._node_attributes[node_name] = attributes
+        return attributes
+
+    def _record_node_duration(
+        self, target_node: Any, duration_s: float, error_type: str | None
+    ) -> None:
+        attributes = self._get_node_attributes(str(target_node.name))
+        if error_type is not None:
+            attributes = {**attributes, ERROR_TYPE: error_type}
+        self._node_duration.record(duration_s, attributes)
+
+    def traced_execute_command(self, func, instance, args, kwargs):
+        """Wraps ``RedisCluster._execute_command(target_node, *args)``."""
+        if not is_instrumentation_enabled() or not args:
+            return func(*args, **kwargs)
+        error_type = None
+        token = _sending_command.set(True)
+        start = default_timer()
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            error_type = type(exc).__qualname__
+            raise
+        finally:
+            _sending_command.reset(token)
+            self._record_node_duration(
+                args[0], default_timer() - start, error_type
+            )
+
+    async def async_traced_execute_command(self, func, instance, args, kwargs):
+        """Wraps ``redis.asyncio.RedisCluster._execute_command``."""
+        if not is_instrumentation_enabled() or not args:
+            return await func(*args, **kwargs)
+        error_type = None
+        token = _sending_command.set(True)
+        start = default_timer()
+        try:
+            return await func(*args, **kwargs)
+        except Exception as exc:
+            error_type = type(exc).__qualname__
+            raise
+        finally:
+            _sending_command.reset(token)
+            self._record_node_duration(
+                args[0], default_timer() - start, error_type
+            )
+
+    def traced_initialize(self, func, instance, args, kwargs):
+        """Wraps ``NodesManager.initialize``, which loads the slot cache."""
+        self._slot_cache_refreshes.add(
+            1, {DB_SYSTEM_NAME: DbSystemNameValues.REDIS.value}
+        )
+        return func(*args, **kwargs)
+
+    async def async_traced_initialize(self, func, instance, args, kwargs):
+        self._slot_cache_refreshes.add(
+            1, {DB_SYSTEM_NAME: DbSystemNameValues.REDIS.value}
+        )
+        return await func(*args, **kwargs)
+
+    def traced_redirect_init(self, func, instance, args, kwargs):
+        """Wraps ``AskError.__init__``, also inherited by ``MovedError``.
+
+        The redirections are handled within
+        ``RedisCluster._execute_command``, which retries the command on the
+        node the error points to, so they are counted as they are parsed
+        while it sends a command. The errors built anywhere else are ignored.
+        """
+        func(*args, **kwargs)
+        if not _sending_command.get() or not is_instrumentation_enabled():
+            return
+        host = getattr(instance, "host", None)
+        port = getattr(instance, "port", None)
+        if host is None or port is None:
+            return
+        attributes = {
+            **self._get_node_attributes(f"{host}:{port}"),
+            DB_REDIS_CLUSTER_REDIRECT_TYPE: "MOVED"
+            if _is_moved_error(instance)
+            else "ASK",
+        }
+        self._redirects.add(1, attributes)
+
+    def traced_node_commands_write(self, func, instance, args, kwargs):
+        """Wraps ``redis.cluster.NodeCommands.write``, sending the commands
+        of a pipeline to a node."""
+        if is_instrumentation_enabled():
+            connection = instance.connection
+            self._pipeline_node_commands.record(
+                len(instance.commands),
+                self._get_node_attributes(
+                    f"{connection.host}:{connection.port}"
+                ),
+            )
+        return func(*args, **kwargs)
+
+    async def async_traced_execute_pipeline(
+        self, func, instance, args, kwargs
+    ):
+        """Wraps ``redis.asyncio.cluster.ClusterNode.execute_pipeline``."""
+        if is_instrumentation_enabled() and args:
+            self._pipeline_node_commands.record(
+                len(args[0]), self._get_node_attributes(str(instance.name))
+            )
+        return await func(*args, **kwargs)
@@ -18,17 +18,35 @@ Some utils used by the redis integration
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
+from opentelemetry.metrics import Meter
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_REDIS_DATABASE_INDEX,
     DB_SYSTEM,
+    DbSystemNameValues,
 )
 from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_PEER_NAME,
     NET_PEER_PORT,
     NET_TRANSPORT,
 )
+from opentelemetry.semconv._incubating.metrics.db_metrics import (
+    DB_CLIENT_OPERATION_DURATION,
+)
+from opentelemetry.semconv.attributes.db_attributes import (
+    DB_NAMESPACE,
+    DB_OPERATION_NAME,
+    DB_SYSTEM_NAME,
+)
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+from opentelemetry.semconv.attributes.server_attributes import (
+    SERVER_ADDRESS,
+    SERVER_PORT,
+)
 from opentelemetry.semconv.trace import (
     DbSystemValues,
     NetTransportValues,
@@ -45,6 +63,141 @@ if TYPE_CHECKING:
 
 _FIELD_TYPES = ["NUMERIC", "TEXT", "GEO", "TAG", "VECTOR"]
 
+DB_REDIS_COMMAND_ERRORS = "db.redis.command.errors"
+DB_REDIS_PIPELINE_LENGTH = "db.redis.pipeline.length"
+
+_PIPELINE_LENGTH_BUCKETS = [
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1000,
+    2000,
+    5000,
+    10000,
+    20000,
+    50000,
+    100000,
+]
+# Bound of the statement of a pipeline, its commands are not rendered past it
+_PIPELINE_STATEMENT_MAX_LEN = 4096
+# Bound of the distinct command names in the span name of a pipeline
+_PIPELINE_SPAN_NAME_MAX_COMMANDS = 10
+_VALUE_TOO_LONG_MARK = "..."
+
+# Name of the attribute caching the _ConnectionAttributes of a connection pool
+_CONNECTION_ATTRIBUTES_ATTR = "_otel_connection_attributes"
+# Bound of the metric attribute sets cached per connection pool
+_MAX_CACHED_OPERATIONS = 256
+
+
+class _ConnectionAttributes(NamedTuple):
+    """Attributes of the commands sent through a connection pool."""
+
+    span: dict[str, Any]
+    metric: dict[str, Any]
+    # Metric attributes by command name
+    operations: dict[str, dict[str, Any]]
+
+    def operation(self, name: str) -> dict[str, Any]:
+        if not name:
+            return self.metric
+        attributes = self.operations.get(name)
+        if attributes is None:
+            attributes = {**self.metric, DB_OPERATION_NAME: name}
+            if len(self.operations) < _MAX_CACHED_OPERATIONS:
+                self.operations[name] = attributes
+        return attributes
+
+
+def _new_connection_attributes(conn_kwargs) -> _ConnectionAttributes:
+    span_attributes = _extract_conn_attributes(conn_kwargs)
+    metric_attributes = {
+        DB_SYSTEM_NAME: DbSystemNameValues.REDIS.value,
+        DB_NAMESPACE: str(span_attributes[DB_REDIS_DATABASE_INDEX]),
+        SERVER_ADDRESS: span_attributes[NET_PEER_NAME],
+    }
+    if NET_PEER_PORT in span_attributes:
+        metric_attributes[SERVER_PORT] = span_attributes[NET_PEER_PORT]
+    return _ConnectionAttributes(span_attributes, metric_attributes, {})
+
+
+# Attributes of the clients without a single connection pool, like clusters
+_DEFAULT_CONNECTION_ATTRIBUTES = _ConnectionAttributes(
+    {}, {DB_SYSTEM_NAME: DbSystemNameValues.REDIS.value}, {}
+)
+
+
+def _get_connection_attributes(
+    conn: RedisInstance | AsyncRedisInstance,
+) -> _ConnectionAttributes:
+    """Returns the attributes of a client, cached on its connection pool.
+
+    The connection arguments of a pool do not change once it is created, so
+    the attributes are only built for the first command sent through it.
+    """
+    pool = getattr(conn, "connection_pool", None)
+    if pool is None:
+        return _DEFAULT_CONNECTION_ATTRIBUTES
+    attributes = getattr(pool, _CONNECTION_ATTRIBUTES_ATTR, None)
+    if attributes is None:
+        attributes = _new_connection_attributes(pool.connection_kwargs)
+        try:
+            setattr(pool, _CONNECTION_ATTRIBUTES_ATTR, attributes)
+        except AttributeError:
+            pass
+    return attributes
+
+
+class _CommandMetrics:
+    """Records the duration and the errors of Redis commands."""
+
+    def __init__(self, meter: Meter):
+        self._duration = meter.create_histogram(
+            name=DB_CLIENT_OPERATION_DURATION,
+            unit="s",
+            description="Duration of database client operations.",
+            explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+        )
+        self._errors = meter.create_counter(
+            name=DB_REDIS_COMMAND_ERRORS,
+            unit="{error}",
+            description="The number of Redis commands that failed.",
+        )
+        self._pipeline_length = meter.create_histogram(
+            name=DB_REDIS_PIPELINE_LENGTH,
+            unit="{command}",
+            description="The number of commands sent in a Redis pipeline.",
+            explicit_bucket_boundaries_advisory=_PIPELINE_LENGTH_BUCKETS,
+        )
+
+    def record(
+        self,
+        conn: RedisInstance | AsyncRedisInstance,
+        name: str,
+        duration_s: float,
+        error_type: str | None,
+    ) -> None:
+        attributes = _get_connection_attributes(conn).operation(name)
+        if error_type is not None:
+            attributes = {**attributes, ERROR_TYPE: error_type}
+            self._errors.add(1, attributes)
+        self._duration.record(duration_s, attributes)
+
+    def record_pipeline(
+        self,
+        pipeline: PipelineInstance | AsyncPipelineInstance,
+        length: int,
+    ) -> None:
+        self._pipeline_length.record(
+            length, _get_connection_attributes(pipeline).metric
+        )
+
 
 def _extract_conn_attributes(conn_kwargs):
     """Transform redis conn info into dict"""
@@ -67,12 +220,14 @@ def _extract_conn_attributes(conn_kwargs):
 def _format_command_args(args: list[str]):
     """Format and sanitize command arguments, and trim them as needed"""
     cmd_max_len = 1000
-    value_too_long_mark = "..."
+    value_too_long_mark = _VALUE_TOO_LONG_MARK
 
     # Sanitized query format: "COMMAND ? ?"
     args_length = len(args)
     if args_length > 0:
-        out = [str(args[0])] + ["?"] * (args_length - 1)
+        # Placeholders past the maximum length would be trimmed anyway
+        placeholders = min(args_length - 1, cmd_max_len // 2 + 1)
+        out = [str(args[0])] + ["?"] * placeholders
         out_str = " ".join(out)
 
         if len(out_str) > cmd_max_len:
@@ -101,12 +256,17 @@ def _value_or_none(values, n):
 def _set_connection_attributes(
     span: Span, conn: RedisInstance | AsyncRedisInstance
 ) -> None:
-    if not span.is_recording() or not hasattr(conn, "connection_pool"):
+    if not span.is_recording():
         return
-    for key, value in _extract_conn_attributes(
-        conn.connection_pool.connection_kwargs
-    ).items():
-        span.set_attribute(key, value)
+    attributes = _get_connection_attributes(conn).span
+    if attributes:
+        span.set_attributes(attributes)
+
+
+def _get_operation_name(cmd_args: tuple[Any, ...]) -> str:
+    if len(cmd_args) > 0 and cmd_args[0]:
+        return str(cmd_args[0])
+    return ""
 
 
 def _build_span_name(
@@ -180,31 +340,80 @@ def _add_search_attributes(span: Span, response, args):
                 )
 
 
-def _build_span_meta_data_for_pipeline(
+class _PipelineSummary(NamedTuple):
+    """Commands of a pipeline, counted in a single walk of its stack."""
+
+    command_stack: list[Any]
+    span_name: str
+
+
+def _get_pipeline_command_stack(
     instance: PipelineInstance | AsyncPipelineInstance,
-) -> tuple[list[Any], str, str]:
+) -> list[Any]:
+    command_stack = getattr(instance, "command_stack", None)
+    if command_stack is None:
+        command_stack = getattr(instance, "_command_stack", None)
+    if command_stack is None:
+        # redis.asyncio.cluster.ClusterPipeline queues the commands in its
+        # execution strategy
+        strategy = getattr(instance, "_execution_strategy", None)
+        command_stack = getattr(strategy, "_command_queue", None)
+    return command_stack or []
+
+
+def _get_command_args(command: Any) -> tuple[Any, ...]:
+    return command.args if hasattr(command, "args") else command[0]
+
+
+def _summarize_pipeline(
+    instance: PipelineInstance | AsyncPipelineInstance,
+) -> _PipelineSummary:
+    """Counts the commands of a pipeline by name to build its span name.
+
+    Repeated commands are only named once with their count, like
+    ``SET×49000 EXPIRE×1000``, so the span name of a pipeline does not
+    grow with its length.
+    """
     try:
-        command_stack = (
-            instance.command_stack
-            if hasattr(instance, "command_stack")
-            else instance._command_stack
-        )
+        command_stack = _get_pipeline_command_stack(instance)
+        counts: dict[str, int] = {}
+        for command in command_stack:
+            name = str(_get_command_args(command)[0])
+            counts[name] = counts.get(name, 0) + 1
+    except (AttributeError, IndexError, TypeError):
+        return _PipelineSummary([], "redis")
+    if not counts:
+        return _PipelineSummary(command_stack, "redis")
 
-        cmds = [
-            _format_command_args(c.args if hasattr(c, "args") else c[0])
-            for c in command_stack
+    names = [
+        name if count == 1 else f"{name}×{count}"
+        for name, count in list(counts.items())[
+            :_PIPELINE_SPAN_NAME_MAX_COMMANDS
         ]
-        resource = "\n".join(cmds)
+    ]
+    if len(counts) > _PIPELINE_SPAN_NAME_MAX_COMMANDS:
+        names.append(_VALUE_TOO_LONG_MARK)
+    return _PipelineSummary(command_stack, " ".join(names))
 
-        span_name = " ".join(
-            [
-                (c.args[0] if hasattr(c, "args") else c[0][0])
-                for c in command_stack
-            ]
-        )
-    except (AttributeError, IndexError):
-        command_stack = []
-        resource = ""
-        span_name = ""
 
-    return command_stack, resource, span_name or "redis"
+def _format_pipeline_statement(
+    command_stack: list[Any],
+    max_length: int = _PIPELINE_STATEMENT_MAX_LEN,
+) -> str:
+    """Formats the commands of a pipeline until ``max_length`` is reached."""
+    commands = []
+    length = -1
+    try:
+        for command in command_stack:
+            formatted = _format_command_args(_get_command_args(command))
+            commands.append(formatted)
+            length += len(formatted) + 1
+            if length > max_length:
+                statement = "\n".join(commands)
+                return (
+                    statement[: max_length - len(_VALUE_TOO_LONG_MARK)]
+                    + _VALUE_TOO_LONG_MARK
+                )
+    except (AttributeError, IndexError, TypeError):
+        return ""
+    return "\n".join(commands)
@@ -0,0 +1,200 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+In-process Redis Cluster speaking just enough of the RESP protocol for
+the GET and SET commands of the redis cluster clients, with slots that can be
+moved or migrated between its nodes to produce MOVED and ASK redirections.
+"""
+
+import socketserver
+import threading
+
+from redis.crc import key_slot
+
+_SLOTS = 16384
+
+# Reply of COMMAND for the commands supported by the fake cluster
+_COMMANDS = [
+    [b"get", 2, [b"readonly", b"fast"], 1, 1, 1],
+    [b"set", -3, [b"write", b"denyoom"], 1, 1, 1],
+    [b"ping", -1, [b"fast", b"stale"], 0, 0, 0],
+]
+
+
+class _Status(str):
+    pass
+
+
+class _Error(str):
+    pass
+
+
+def _encode(value, protocol):
+    if value is None:
+        return b"_\r\n" if protocol == 3 else b"$-1\r\n"
+    if isinstance(value, _Status):
+        return b"+" + value.encode() + b"\r\n"
+    if isinstance(value, _Error):
+        return b"-" + value.encode() + b"\r\n"
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        value = value.encode()
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, dict):
+        # only sent to the clients using RESP3, in reply to HELLO
+        return b"%%%d\r\n" % len(value) + b"".join(
+            _encode(k, protocol) + _encode(v, protocol)
+            for k, v in value.items()
+        )
+    return b"*%d\r\n" % len(value) + b"".join(
+        _encode(v, protocol) for v in value
+    )
+
+
+class _Connection:
+    def __init__(self):
+        self.protocol = 2
+        # whether the previous command was ASKING
+        self.asking = False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        connection = _Connection()
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            reply = self.server.node.execute(connection, args)
+            self.wfile.write(_encode(reply, connection.protocol))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _Node:
+    def __init__(self, cluster, index):
+        self.cluster = cluster
+        self.index = index
+        self.server = _Server(("127.0.0.1", 0), _Handler)
+        self.server.node = self
+        self.port = self.server.server_address[1]
+        self.name = f"127.0.0.1:{self.port}"
+
+    def redirect(self, slot, asking):
+        owner = self.cluster.owners[slot]
+        if slot in self.cluster.migrating:
+            target = self.cluster.migrating[slot]
+            if self is target and asking:
+                return None
+            if self is owner:
+                return _Error(f"ASK {slot} {target.name}")
+        if self is owner:
+            return None
+        return _Error(f"MOVED {slot} {owner.name}")
+
+    def execute(self, connection, args):
+        command = args[0].decode().upper()
+        asking, connection.asking = connection.asking, False
+        if command == "ASKING":
+            connection.asking = True
+            return _Status("OK")
+        if command in ("GET", "SET"):
+            key = args[1]
+            error = self.redirect(key_slot(key), asking)
+            if error is not None:
+                return error
+            if command == "SET":
+                self.cluster.data[key] = args[2]
+                return _Status("OK")
+            return self.cluster.data.get(key)
+        if command == "CLUSTER" and args[1].upper() == b"SLOTS":
+            return self.cluster.slots()
+        if command == "COMMAND":
+            return _COMMANDS
+        if command == "HELLO":
+            connection.protocol = int(args[1])
+            return {b"server": b"redis", b"proto": connection.protocol}
+        if command == "PING":
+            return _Status("PONG")
+        # CLIENT SETINFO, READONLY and the other connection setup commands
+        return _Status("OK")
+
+
+class FakeRedisCluster:
+    """Redis Cluster of ``node_count`` nodes sharing the slots evenly.
+
+    Slots can be moved to another node, which then answers with a MOVED
+    redirection until the client refreshes its slot cache, or be migrating to
+    another node, in which case their owner answers with an ASK redirection.
+    """
+
+    def __init__(self, node_count=2):
+        self.data = {}
+        self.nodes = [_Node(self, index) for index in range(node_count)]
+        per_node = _SLOTS // node_count
+        self.owners = [
+            self.nodes[min(slot // per_node, node_count - 1)]
+            for slot in range(_SLOTS)
+        ]
+        self.migrating = {}
+
+    def __enter__(self):
+        for node in self.nodes:
+            threading.Thread(
+                target=node.server.serve_forever, daemon=True
+            ).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        for node in self.nodes:
+            node.server.shutdown()
+            node.server.server_close()
+
+    @property
+    def host(self):
+        return "127.0.0.1"
+
+    @property
+    def port(self):
+        return self.nodes[0].port
+
+    def node_of(self, key):
+        return self.owners[key_slot(key.encode())]
+
+    def move_slot_of(self, key, node):
+        """Moves the slot of ``key`` to ``node`` without telling clients."""
+        self.owners[key_slot(key.encode())] = node
+
+    def migrate_slot_of(self, key, node):
+        """Starts the migration of the slot of ``key`` to ``node``."""
+        self.migrating[key_slot(key.encode())] = node
+
+    def slots(self):
+        ranges = []
+        start = 0
+        for slot in range(1, _SLOTS + 1):
+            if slot == _SLOTS or self.owners[slot] is not self.owners[start]:
+                node = self.owners[start]
+                ranges.append([start, slot - 1, [self.host, node.port]])
+                start = slot
+        return ranges
@@ -19,15 +19,21 @@ import fakeredis
 import pytest
 import redis
 import redis.asyncio
+import redis.asyncio.cluster
+import redis.cluster
 from fakeredis.aioredis import FakeRedis
 from redis.exceptions import ConnectionError as redis_ConnectionError
 from redis.exceptions import WatchError
 
 from opentelemetry import trace
 from opentelemetry.instrumentation.redis import RedisInstrumentor
+from opentelemetry.instrumentation.redis.util import _extract_conn_attributes
 from opentelemetry.instrumentation.utils import suppress_instrumentation
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
+    DB_NAMESPACE,
+    DB_OPERATION_NAME,
     DB_REDIS_DATABASE_INDEX,
+    DB_STATEMENT,
     DB_SYSTEM,
     DbSystemValues,
 )
@@ -37,9 +43,17 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_TRANSPORT,
     NetTransportValues,
 )
+from opentelemetry.semconv.attributes.db_attributes import DB_SYSTEM_NAME
+from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
+from opentelemetry.semconv.attributes.server_attributes import (
+    SERVER_ADDRESS,
+    SERVER_PORT,
+)
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import SpanKind
 
+from ._fake_cluster import FakeRedisCluster
+
 
 # pylint: disable=too-many-public-methods
 class TestRedis(TestBase):
@@ -54,7 +68,10 @@ class TestRedis(TestBase):
 
     def setUp(self):
         super().setUp()
-        RedisInstrumentor().instrument(tracer_provider=self.tracer_provider)
+        RedisInstrumentor().instrument(
+            tracer_provider=self.tracer_provider,
+            meter_provider=self.meter_provider,
+        )
 
     def tearDown(self):
         super().tearDown()
@@ -403,6 +420,148 @@ class TestRedis(TestBase):
         self.assertEqual(spans[0].kind, SpanKind.CLIENT)
         self.assertEqual(spans[0].status.status_code, trace.StatusCode.UNSET)
 
+    def _get_metric(self, name):
+        for metric in self.get_sorted_metrics():
+            if metric.name == name:
+                return metric
+        return None
+
+    def test_operation_duration_metric(self):
+        redis_client = fakeredis.FakeStrictRedis()
+        redis_client.set("key", "value")
+        redis_client.get("key")
+        redis_client.get("key")
+
+        metric = self._get_metric("db.client.operation.duration")
+        self.assertEqual(metric.unit, "s")
+        points = {
+            point.attributes[DB_OPERATION_NAME]: point
+            for point in metric.data.data_points
+        }
+        self.assertEqual(points["SET"].count, 1)
+        self.assertEqual(points["GET"].count, 2)
+        attributes = dict(points["GET"].attributes)
+        # fakeredis connects to a server with a random host name
+        self.assertIn(SERVER_ADDRESS, attributes)
+        self.assertEqual(
+            attributes,
+            {
+                DB_SYSTEM_NAME: DbSystemValues.REDIS.value,
+                DB_NAMESPACE: "0",
+                DB_OPERATION_NAME: "GET",
+                SERVER_ADDRESS: attributes[SERVER_ADDRESS],
+                SERVER_PORT: 6379,
+            },
+        )
+        self.assertIsNone(self._get_metric("db.redis.command.errors"))
+
+    def test_operation_duration_metric_not_sampled(self):
+        RedisInstrumentor().uninstrument()
+        RedisInstrumentor().instrument(
+            tracer_provider=trace.NoOpTracerProvider(),
+            meter_provider=self.meter_provider,
+        )
+        redis_client = redis.Redis()
+
+        with mock.patch(
+            "opentelemetry.instrumentation.redis._format_command_args"
+        ) as format_command_args:
+            with mock.patch.object(redis_client, "connection"):
+                redis_client.get("key")
+
+        format_command_args.assert_not_called()
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 0)
+        metric = self._get_metric("db.client.operation.duration")
+        (point,) = metric.data.data_points
+        self.assertEqual(point.count, 1)
+        self.assertEqual(point.attributes[DB_OPERATION_NAME], "GET")
+
+    def test_error_metrics(self):
+        redis_client = fakeredis.FakeStrictRedis()
+        redis_client.lpush("mylist", "value")
+        with self.assertRaises(redis.ResponseError):
+            redis_client.incr("mylist")
+
+        metric = self._get_metric("db.redis.command.errors")
+        (point,) = metric.data.data_points
+        self.assertEqual(point.value, 1)
+        self.assertEqual(point.attributes[DB_OPERATION_NAME], "INCRBY")
+        self.assertEqual(point.attributes[ERROR_TYPE], "ResponseError")
+
+        metric = self._get_metric("db.client.operation.duration")
+        error_types = {
+            point.attributes[DB_OPERATION_NAME]: point.attributes.get(
+                ERROR_TYPE
+            )
+            for point in metric.data.data_points
+        }
+        self.assertEqual(
+            error_types, {"LPUSH": None, "INCRBY": "ResponseError"}
+        )
+
+    def test_connection_attributes_cached(self):
+        redis_client = redis.Redis.from_url("redis://1.1.1.1:6380/1")
+
+        with mock.patch(
+            "opentelemetry.instrumentation.redis.util._extract_conn_attributes",
+            wraps=_extract_conn_attributes,
+        ) as extract_conn_attributes:
+            with mock.patch.object(redis_client, "connection"):
+                redis_client.set("key", "value")
+                redis_client.get("key")
+                redis_client.get("key")
+
+        self.assertEqual(extract_conn_attributes.call_count, 1)
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 3)
+        for span in spans:
+            self.assertEqual(span.attributes[NET_PEER_NAME], "1.1.1.1")
+            self.assertEqual(span.attributes[NET_PEER_PORT], 6380)
+            self.assertEqual(span.attributes[DB_REDIS_DATABASE_INDEX], 1)
+
+    def test_pipeline_summary(self):
+        redis_client = fakeredis.FakeStrictRedis()
+        pipe = redis_client.pipeline()
+        for index in range(1000):
+            pipe.set(f"key{index}", "value")
+            if index % 10 == 0:
+                pipe.expire(f"key{index}", 60)
+        pipe.execute()
+
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 1)
+        span = spans[0]
+        self.assertEqual(span.name, "SET×1000 EXPIRE×100")
+        self.assertEqual(span.attributes["db.redis.pipeline_length"], 1100)
+        statement = span.attributes[DB_STATEMENT]
+        self.assertEqual(len(statement), 4096)
+        self.assertTrue(statement.startswith("SET ? ?\nEXPIRE ? ?\nSET ? ?"))
+        self.assertTrue(statement.endswith("..."))
+
+        metric = self._get_metric("db.redis.pipeline.length")
+        self.assertEqual(metric.unit, "{command}")
+        (point,) = metric.data.data_points
+        self.assertEqual(point.count, 1)
+        self.assertEqual(point.sum, 1100)
+
+    def test_pipeline_summary_without_transaction(self):
+        redis_client = fakeredis.FakeStrictRedis()
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.set("blah", 32)
+        pipe.rpush("foo", "éé")
+        pipe.hgetall("xxx")
+        pipe.hgetall("yyy")
+        pipe.execute()
+
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 1)
+        span = spans[0]
+        self.assertEqual(span.name, "SET RPUSH HGETALL×2")
+        self.assertEqual(
+            span.attributes[DB_STATEMENT],
+            "SET ? ?\nRPUSH ? ?\nHGETALL ?\nHGETALL ?",
+        )
+
     def test_suppress_instrumentation_command(self):
         redis_client = redis.Redis()
 
@@ -773,3 +932,173 @@ class TestRedisInstance(TestBase):
             self.assertEqual(span.attributes.get("db.statement"), "SET ? ?")
             self.assertEqual(span.kind, SpanKind.CLIENT)
             self.assertEqual(span.status.status_code, trace.StatusCode.UNSET)
+
+
+class TestRedisClusterMetrics(TestBase, IsolatedAsyncioTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cluster = FakeRedisCluster()
+        self.cluster.__enter__()
+        RedisInstrumentor().instrument(
+            tracer_provider=self.tracer_provider,
+            meter_provider=self.meter_provider,
+            cluster_metrics=True,
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        RedisInstrumentor().uninstrument()
+        self.cluster.__exit__(None, None, None)
+
+    def _get_data_points(self, name):
+        for metric in self.get_sorted_metrics():
+            if metric.name == name:
+                return metric.data.data_points
+        return []
+
+    def _other_node(self, key):
+        owner = self.cluster.node_of(key)
+        return next(node for node in self.cluster.nodes if node is not owner)
+
+    def test_node_duration(self):
+        client = redis.cluster.RedisCluster(
+            host=self.cluster.host, port=self.cluster.port
+        )
+        # the client sends COMMAND to a node when it is created
+        initial_count = sum(
+            point.count
+            for point in self._get_data_points(
+                "db.redis.cluster.node.duration"
+            )
+        )
+        for index in range(20):
+            client.set(f"key{index}", "value")
+
+        points = self._get_data_points("db.redis.cluster.node.duration")
+        counts = {
+            point.attributes["db.redis.cluster.node"]: point.count
+            for point in points
+        }
+        self.assertEqual(
+            set(counts), {node.name for node in self.cluster.nodes}
+        )
+        self.assertEqual(sum(counts.values()), initial_count + 20)
+        for point in points:
+            self.assertEqual(point.attributes[DB_SYSTEM_NAME], "redis")
+        (point,) = self._get_data_points(
+            "db.redis.cluster.slot_cache.refreshes"
+        )
+        self.assertEqual(point.value, 1)
+        self.assertEqual(dict(point.attributes), {DB_SYSTEM_NAME: "redis"})
+
+    def test_redirects(self):
+        client = redis.cluster.RedisCluster(
+            host=self.cluster.host, port=self.cluster.port
+        )
+        moved_to = self._other_node("foo")
+        self.cluster.move_slot_of("foo", moved_to)
+        client.set("foo", "value")
+        asked_to = self._other_node("bar")
+        self.cluster.migrate_slot_of("bar", asked_to)
+        client.get("bar")
+        client.get("bar")
+
+        redirects = {
+            (
+                point.attributes["db.redis.cluster.redirect.type"],
+                point.attributes["db.redis.cluster.node"],
+            ): point.value
+            for point in self._get_data_points("db.redis.cluster.redirects")
+        }
+        self.assertEqual(
+            redirects,
+            {("MOVED", moved_to.name): 1, ("ASK", asked_to.name): 2},
+        )
+
+    def test_redirects_outside_cluster_commands(self):
+        client = redis.cluster.RedisCluster(
+            host=self.cluster.host, port=self.cluster.port
+        )
+        redis.exceptions.AskError("3999 127.0.0.1:6381")
+        asked_to = self._other_node("bar")
+        self.cluster.migrate_slot_of("bar", asked_to)
+        with suppress_instrumentation():
+            client.get("bar")
+
+        self.assertEqual(
+            self._get_data_points("db.redis.cluster.redirects"), []
+        )
+
+    def test_pipeline_node_commands(self):
+        client = redis.cluster.RedisCluster(
+            host=self.cluster.host, port=self.cluster.port
+        )
+        keys = [f"key{index}" for index in range(20)]
+        pipe = client.pipeline()
+        for key in keys:
+            pipe.set(key, "value")
+        pipe.execute()
+
+        sums = {
+            point.attributes["db.redis.cluster.node"]: point.sum
+            for point in self._get_data_points(
+                "db.redis.cluster.pipeline.node_commands"
+            )
+        }
+        expected = {}
+        for key in keys:
+            name = self.cluster.node_of(key).name
+            expected[name] = expected.get(name, 0) + 1
+        self.assertEqual(sums, expected)
+
+    async def test_async_cluster(self):
+        client = redis.asyncio.cluster.RedisCluster(
+            host=self.cluster.host, port=self.cluster.port
+        )
+        await client.initialize()
+        owner = self.cluster.node_of("foo")
+        moved_to = self._other_node("foo")
+        self.cluster.move_slot_of("foo", moved_to)
+        await client.set("foo", "value")
+        async with client.pipeline() as pipe:
+            pipe.set("a", "1")
+            pipe.get("b")
+            await pipe.execute()
+        await client.aclose()
+
+        points = self._get_data_points("db.redis.cluster.node.duration")
+        # the redirected command is reported under its first node
+        (point,) = points
+        self.assertEqual(point.count, 1)
+        self.assertEqual(point.attributes["db.redis.cluster.node"], owner.name)
+        (point,) = self._get_data_points("db.redis.cluster.redirects")
+        self.assertEqual(point.value, 1)
+        self.assertEqual(
+            point.attributes["db.redis.cluster.node"], moved_to.name
+        )
+        (point,) = self._get_data_points(
+            "db.redis.cluster.slot_cache.refreshes"
+        )
+        self.assertEqual(point.value, 1)
+        points = self._get_data_points(
+            "db.redis.cluster.pipeline.node_commands"
+        )
+        self.assertEqual(sum(point.sum for point in points), 2)
+
+    def test_disabled_by_default(self):
+        RedisInstrumentor().uninstrument()
+        RedisInstrumentor().instrument(
+            tracer_provider=self.tracer_provider,
+            meter_provider=self.meter_provider,
+        )
+        client = redis.cluster.RedisCluster(
+            host=self.cluster.host, port=self.cluster.port
+        )
+        client.set("foo", "value")
+
+        self.assertEqual(
+            self._get_data_points("db.redis.cluster.node.duration"), []
+        )
+        self.assertEqual(
+            self._get_data_points("db.redis.cluster.slot_cache.refreshes"), []
+        )
@@ -257,6 +257,11 @@ from opentelemetry.util.http import (
     sanitize_method,
 )
 from opentelemetry.util.http.httplib import set_ip_on_next_http_connection
+from opentelemetry.util.http.span_budget import (
+    OutboundSpanBudget,
+    get_outbound_span_budget,
+    start_client_span,
+)
 
 _excluded_urls_from_env = get_excluded_urls("REQUESTS")
 
@@ -303,6 +308,7 @@ def _instrument(
     captured_request_headers: list[str] | None = None,
     captured_response_headers: list[str] | None = None,
     sensitive_headers: list[str] | None = None,
+    span_budget: OutboundSpanBudget | None = None,
 ):
     """Enables tracing of all requests calls that go through
     :code:`requests.session.Session.request` (this includes
@@ -378,8 +384,10 @@ def _instrument(
             sem_conv_opt_in_mode,
         )
 
+        host = None
         try:
             parsed_url = urlparse(url)
+            host = parsed_url.hostname
             if parsed_url.scheme:
                 if _report_old(sem_conv_opt_in_mode):
                     # TODO: Support opt-in for url.scheme in new semconv
@@ -415,8 +423,14 @@ def _instrument(
             pass
 
         with (
-            tracer.start_as_current_span(
-                span_name, kind=SpanKind.CLIENT, attributes=span_attributes
+            start_client_span(
+                tracer,
+                span_budget,
+                span_name,
+                host,
+                method,
+                kind=SpanKind.CLIENT,
+                attributes=span_attributes,
             ) as span,
             set_ip_on_next_http_connection(span),
         ):
@@ -629,6 +643,7 @@ class RequestsInstrumentor(BaseInstrumentor):
             sensitive_headers=get_custom_headers(
                 OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
             ),
+            span_budget=get_outbound_span_budget(),
         )
 
     def _uninstrument(self, **kwargs: Any):
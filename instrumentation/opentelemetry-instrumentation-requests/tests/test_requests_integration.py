@@ -77,6 +77,9 @@ from opentelemetry.util.http import (
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS,
     get_excluded_urls,
 )
+from opentelemetry.util.http.span_budget import (
+    OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET,
+)
 
 
 class TransportMock:
@@ -478,6 +481,33 @@ class RequestsIntegrationTestBase(abc.ABC):
 
         self.assert_span(num_spans=0)
 
+    def test_outbound_span_budget(self):
+        RequestsInstrumentor().uninstrument()
+        with mock.patch.dict(
+            "os.environ",
+            {OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET: "2"},
+        ):
+            RequestsInstrumentor().instrument()
+
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span("parent"):
+            for _ in range(5):
+                result = self.perform_request(self.URL)
+                self.assertEqual(result.text, "Hello!")
+
+        spans = self.assert_span(num_spans=3)
+        parent = spans[-1]
+        self.assertEqual(parent.name, "parent")
+        for span in spans[:-1]:
+            self.assertEqual(span.parent.span_id, parent.context.span_id)
+        self.assertEqual(
+            parent.attributes["http.client.suppressed.targets"],
+            ("GET mock",),
+        )
+        self.assertEqual(
+            parent.attributes["http.client.suppressed.count"], (3,)
+        )
+
     def test_suppress_http_instrumentation(self):
         with suppress_http_instrumentation():
             result = self.perform_request(self.URL)
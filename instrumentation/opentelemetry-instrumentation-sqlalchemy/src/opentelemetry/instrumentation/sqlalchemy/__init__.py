@@ -107,6 +107,25 @@ The following sqlcomment key-values can be opted out of through ``commenter_opti
 | ``opentelemetry_values``  | OpenTelemetry context as traceparent at time of query.    | ``traceparent='00-03afa25236b8cd948fa853d67038ac79-405ff022e8247c46-01'`` |
 +---------------------------+-----------------------------------------------------------+---------------------------------------------------------------------------+
 
+Prepared statement friendly sqlcommenter
+****************************************
+By default the ``traceparent`` makes the text of every commented statement
+unique, which defeats driver side prepared statement caches and server side
+statement statistics. With the ``prepared_statement_friendly`` commenter
+option, only tags that do not change between executions are added to
+statements, and the commented statement is cached. The ``traceparent`` is only
+added to statements executed in sampled spans, unless ``opentelemetry_values``
+is disabled.
+
+.. code:: python
+
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+
+    SQLAlchemyInstrumentor().instrument(
+        enable_commenter=True,
+        commenter_options={"prepared_statement_friendly": True},
+    )
+
 SQLComment in span attribute
 ****************************
 If sqlcommenter is enabled, you can opt into the inclusion of sqlcomment in
@@ -129,16 +148,65 @@ setting.
 Warning:
     Capture of sqlcomment in ``db.statement`` may have high cardinality without platform normalization. See `Semantic Conventions for database spans <https://opentelemetry.io/docs/specs/semconv/database/database-spans/#generating-a-summary-of-the-query-text>`_ for more information.
 
+Capture statement parameters
+****************************
+With ``capture_parameters``, the parameters of statements are added to their
+span as the ``db.statement.parameters`` attribute. Large parameters, such as
+the rows of ``executemany`` batches, are cut short: only their first items and
+the first few kilobytes of their text are rendered.
+
+.. code:: python
+
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+
+    SQLAlchemyInstrumentor().instrument(capture_parameters=True)
+
+ORM session spans
+*****************
+With ``enable_session_spans``, ``Session.flush`` and ``Session.commit``
+spans are created around the flushes and commits of ORM sessions. Flush spans
+count the statements executed by the flush on instrumented engines:
+
+* ``sqlalchemy.flush.statements``: statements executed
+* ``sqlalchemy.flush.executions``: round trips to the database, more than
+  the statements when inserts are split in insertmanyvalues batches
+* ``sqlalchemy.flush.inserts``, ``sqlalchemy.flush.updates`` and
+  ``sqlalchemy.flush.deletes``: statements by operation
+* ``sqlalchemy.flush.batched_statements``: statements executed with several
+  parameter sets, through executemany or insertmanyvalues
+* ``sqlalchemy.flush.max_batch_size``: largest number of parameter sets of a
+  statement
+* ``sqlalchemy.flush.rows_affected``: rows reported by the cursors
+
+With ``session_summary``, the statements executed by a flush get no span of
+their own, only the flush span is traced.
+
+Flush spans wrap the private ``Session._flush``, the only method that runs
+every flush from start to end, whether autoflush, ``Session.flush`` or
+``Session.commit`` triggered it. When a SQLAlchemy version lacks it, a
+warning is logged and only commit spans are created.
+
+.. code:: python
+
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+
+    SQLAlchemyInstrumentor().instrument(
+        enable_session_spans=True,
+        session_summary=True,
+    )
+
 API
 ---
 """
 
+import logging
 from collections.abc import Sequence
 from typing import Collection
 
 import sqlalchemy
 from packaging.version import parse as parse_version
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.orm.session import Session
 from wrapt import wrap_function_wrapper as _w
 
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
@@ -149,12 +217,18 @@ from opentelemetry.instrumentation.sqlalchemy.engine import (
     _wrap_create_engine,
 )
 from opentelemetry.instrumentation.sqlalchemy.package import _instruments
+from opentelemetry.instrumentation.sqlalchemy.session import (
+    _wrap_session_commit,
+    _wrap_session_flush,
+)
 from opentelemetry.instrumentation.sqlalchemy.version import __version__
 from opentelemetry.instrumentation.utils import unwrap
 from opentelemetry.metrics import get_meter
 from opentelemetry.semconv.metrics import MetricInstruments
 from opentelemetry.trace import get_tracer
 
+_logger = logging.getLogger(__name__)
+
 
 class SQLAlchemyInstrumentor(BaseInstrumentor):
     """An instrumentor for SQLAlchemy
@@ -177,6 +251,9 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
                 ``enable_commenter``: bool to enable sqlcommenter, defaults to False
                 ``commenter_options``: dict of sqlcommenter config, defaults to {}
                 ``enable_attribute_commenter``: bool to enable sqlcomment addition to span attribute, defaults to False. Must also set `enable_commenter`.
+                ``capture_parameters``: bool to capture statement parameters in the ``db.statement.parameters`` span attribute, defaults to False
+                ``enable_session_spans``: bool to trace the flushes and commits of ORM sessions, defaults to False
+                ``session_summary``: bool to only trace the flush span of the statements executed by flushes, defaults to False. Must also set `enable_session_spans`.
 
         Returns:
             An instrumented engine if passed in as an argument or list of instrumented engines, None otherwise.
@@ -208,6 +285,7 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
         enable_attribute_commenter = kwargs.get(
             "enable_attribute_commenter", False
         )
+        capture_parameters = kwargs.get("capture_parameters", False)
 
         _w(
             "sqlalchemy",
@@ -218,6 +296,7 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
                 enable_commenter,
                 commenter_options,
                 enable_attribute_commenter,
+                capture_parameters,
             ),
         )
         _w(
@@ -229,6 +308,7 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
                 enable_commenter,
                 commenter_options,
                 enable_attribute_commenter,
+                capture_parameters,
             ),
         )
         # sqlalchemy.engine.create is not present in earlier versions of sqlalchemy (which we support)
@@ -242,6 +322,7 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
                     enable_commenter,
                     commenter_options,
                     enable_attribute_commenter,
+                    capture_parameters,
                 ),
             )
         _w(
@@ -249,6 +330,26 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
             "Engine.connect",
             _wrap_connect(tracer),
         )
+        if kwargs.get("enable_session_spans", False):
+            if hasattr(Session, "_flush"):
+                _w(
+                    "sqlalchemy.orm.session",
+                    "Session._flush",
+                    _wrap_session_flush(
+                        tracer, kwargs.get("session_summary", False)
+                    ),
+                )
+            else:
+                _logger.warning(
+                    "Session._flush not found in SQLAlchemy %s, flushes of "
+                    "ORM sessions will not be traced",
+                    sqlalchemy.__version__,
+                )
+            _w(
+                "sqlalchemy.orm.session",
+                "Session.commit",
+                _wrap_session_commit(tracer),
+            )
         if parse_version(sqlalchemy.__version__).release >= (1, 4):
             _w(
                 "sqlalchemy.ext.asyncio",
@@ -259,6 +360,7 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
                     enable_commenter,
                     commenter_options,
                     enable_attribute_commenter,
+                    capture_parameters,
                 ),
             )
         if kwargs.get("engine") is not None:
@@ -269,6 +371,7 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
                 kwargs.get("enable_commenter", False),
                 kwargs.get("commenter_options", {}),
                 kwargs.get("enable_attribute_commenter", False),
+                capture_parameters,
             )
         if kwargs.get("engines") is not None and isinstance(
             kwargs.get("engines"), Sequence
@@ -281,6 +384,7 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
                     kwargs.get("enable_commenter", False),
                     kwargs.get("commenter_options", {}),
                     kwargs.get("enable_attribute_commenter", False),
+                    capture_parameters,
                 )
                 for engine in kwargs.get("engines")
             ]
@@ -293,6 +397,9 @@ class SQLAlchemyInstrumentor(BaseInstrumentor):
         if parse_version(sqlalchemy.__version__).release >= (1, 4):
             unwrap(sqlalchemy.engine.create, "create_engine")
         unwrap(Engine, "connect")
+        if hasattr(Session, "_flush"):
+            unwrap(Session, "_flush")
+        unwrap(Session, "commit")
         if parse_version(sqlalchemy.__version__).release >= (1, 4):
             unwrap(sqlalchemy.ext.asyncio, "create_async_engine")
         EngineTracer.remove_all_event_listeners()
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-import re
 import weakref
 
 import sqlalchemy
@@ -22,7 +21,20 @@ from sqlalchemy.event import (  # pylint: disable=no-name-in-module
 )
 
 from opentelemetry import trace
-from opentelemetry.instrumentation.sqlcommenter_utils import _add_sql_comment
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _get_sql_operation_name,
+)
+from opentelemetry.instrumentation.sql_parameters import (
+    _render_sql_parameters,
+)
+from opentelemetry.instrumentation.sqlalchemy.session import (
+    _flush_statistics,
+)
+from opentelemetry.instrumentation.sqlcommenter_utils import (
+    _add_sql_comment_with_static,
+    _add_static_sql_comment,
+    _StaticSqlComment,
+)
 from opentelemetry.instrumentation.utils import (
     _get_opentelemetry_values,
     is_instrumentation_enabled,
@@ -41,6 +53,9 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
 )
 from opentelemetry.trace.status import Status, StatusCode
 
+# Key of the connection attributes in the info of pooled DBAPI connections
+_CONNECTION_ATTRIBUTES_KEY = "opentelemetry.instrumentation.sqlalchemy"
+
 
 def _normalize_vendor(vendor):
     """Return a canonical name for a type of database."""
@@ -62,6 +77,7 @@ def _wrap_create_async_engine(
     enable_commenter=False,
     commenter_options=None,
     enable_attribute_commenter=False,
+    capture_parameters=False,
 ):
     # pylint: disable=unused-argument
     def _wrap_create_async_engine_internal(func, module, args, kwargs):
@@ -79,6 +95,7 @@ def _wrap_create_async_engine(
             enable_commenter,
             commenter_options,
             enable_attribute_commenter,
+            capture_parameters,
         )
         return engine
 
@@ -91,6 +108,7 @@ def _wrap_create_engine(
     enable_commenter=False,
     commenter_options=None,
     enable_attribute_commenter=False,
+    capture_parameters=False,
 ):
     def _wrap_create_engine_internal(func, _module, args, kwargs):
         """Trace the SQLAlchemy engine, creating an `EngineTracer`
@@ -107,6 +125,7 @@ def _wrap_create_engine(
             enable_commenter,
             commenter_options,
             enable_attribute_commenter,
+            capture_parameters,
         )
         return engine
 
@@ -142,15 +161,23 @@ class EngineTracer:
         enable_commenter=False,
         commenter_options=None,
         enable_attribute_commenter=False,
+        capture_parameters=False,
     ):
         self.tracer = tracer
         self.connections_usage = connections_usage
         self.vendor = _normalize_vendor(engine.name)
         self.enable_commenter = enable_commenter
         self.commenter_options = commenter_options if commenter_options else {}
+        self._prepared_statement_friendly = self.commenter_options.get(
+            "prepared_statement_friendly", False
+        )
         self.enable_attribute_commenter = enable_attribute_commenter
+        self.capture_parameters = capture_parameters
+        self._static_sql_comment = None
         self._engine_attrs = _get_attributes_from_engine(engine)
-        self._leading_comment_remover = re.compile(r"^/\*.*?\*/")
+        self._url_attrs, self._url_has_host = _get_attributes_from_url(
+            engine.url
+        )
 
         self._register_event_listener(
             engine, "before_cursor_execute", self._before_cur_exec, retval=True
@@ -247,41 +274,83 @@ class EngineTracer:
             # use cases and uses the SQL statement in span name correctly as per the spec.
             # For some very special cases it might not record the correct statement if the SQL
             # dialect is too weird but in any case it shouldn't break anything.
-            # Strip leading comments so we get the operation name.
-            parts.append(
-                self._leading_comment_remover.sub("", statement).split()[0]
-            )
+            operation = _get_sql_operation_name(statement)
+            if operation:
+                parts.append(operation)
         if db_name:
             parts.append(db_name)
         if not parts:
             return self.vendor
         return " ".join(parts)
 
-    def _get_commenter_data(self, conn) -> dict:
-        """Calculate sqlcomment contents from conn and configured options"""
-        commenter_data = {
-            "db_driver": conn.engine.driver,
-            # Driver/framework centric information.
-            "db_framework": f"sqlalchemy:{sqlalchemy.__version__}",
-        }
-
-        if self.commenter_options.get("opentelemetry_values", True):
-            commenter_data.update(**_get_opentelemetry_values())
+    def _get_static_sql_comment(self, conn) -> _StaticSqlComment:
+        """Returns the sqlcomment tags that are the same for every statement
+        of the engine, computed on first use.
+        """
+        if self._static_sql_comment is None:
+            commenter_data = {
+                "db_driver": conn.engine.driver,
+                # Driver/framework centric information.
+                "db_framework": f"sqlalchemy:{sqlalchemy.__version__}",
+            }
+            # Filter down to just the requested attributes.
+            self._static_sql_comment = _StaticSqlComment(
+                **{
+                    k: v
+                    for k, v in commenter_data.items()
+                    if self.commenter_options.get(k, True)
+                }
+            )
+        return self._static_sql_comment
 
-        # Filter down to just the requested attributes.
-        commenter_data = {
+    def _get_opentelemetry_commenter_data(self) -> dict:
+        """Returns the sqlcomment tags of the current OpenTelemetry context"""
+        if not self.commenter_options.get("opentelemetry_values", True):
+            return {}
+        return {
             k: v
-            for k, v in commenter_data.items()
+            for k, v in _get_opentelemetry_values().items()
             if self.commenter_options.get(k, True)
         }
-        return commenter_data
+
+    def _comment_statement(self, conn, statement, span) -> str:
+        """Adds the sqlcomment for the execution in ``span`` to statement"""
+        static_comment = self._get_static_sql_comment(conn)
+        if (
+            self._prepared_statement_friendly
+            and not span.get_span_context().trace_flags.sampled
+        ):
+            # only static tags, for the statement text to stay the same
+            return _add_static_sql_comment(statement, static_comment)
+        return _add_sql_comment_with_static(
+            statement,
+            static_comment,
+            **self._get_opentelemetry_commenter_data(),
+        )
+
+    def _get_connection_attributes(self, conn, cursor) -> dict:
+        """Returns the attributes of the connection, computed once per
+        engine from its URL or, when the URL has no host, once per DBAPI
+        connection from the cursor. The latter are kept in the ``info`` of
+        the pooled connection, which is cleared when it is recycled.
+        """
+        if self._url_has_host:
+            return self._url_attrs
+        info = conn.info
+        attrs = info.get(_CONNECTION_ATTRIBUTES_KEY)
+        if attrs is None:
+            attrs = info[_CONNECTION_ATTRIBUTES_KEY] = (
+                _get_attributes_from_cursor(
+                    self.vendor, cursor, dict(self._url_attrs)
+                )
+            )
+        return attrs
 
     def _set_db_client_span_attributes(self, span, statement, attrs) -> None:
         """Uses statement and attrs to set attributes of provided Otel span"""
         span.set_attribute(DB_STATEMENT, statement)
         span.set_attribute(DB_SYSTEM, self.vendor)
-        for key, value in attrs.items():
-            span.set_attribute(key, value)
+        span.set_attributes(attrs)
 
     def _before_cur_exec(
         self, conn, cursor, statement, params, context, _executemany
@@ -289,9 +358,20 @@ class EngineTracer:
         if not is_instrumentation_enabled():
             return statement, params
 
-        attrs, found = _get_attributes_from_url(conn.engine.url)
-        if not found:
-            attrs = _get_attributes_from_cursor(self.vendor, cursor, attrs)
+        flush_statistics = _flush_statistics.get()
+        if flush_statistics is not None:
+            flush_statistics.count_execution(
+                context, statement, params, _executemany
+            )
+            if flush_statistics.summary:
+                # only the flush span is traced
+                if self.enable_commenter:
+                    statement = self._comment_statement(
+                        conn, str(statement), trace.get_current_span()
+                    )
+                return statement, params
+
+        attrs = self._get_connection_attributes(conn, cursor)
 
         db_name = attrs.get(DB_NAME, "")
         span = self.tracer.start_span(
@@ -300,16 +380,19 @@ class EngineTracer:
         )
         with trace.use_span(span, end_on_exit=False):
             if span.is_recording():
+                if self.capture_parameters and params:
+                    span.set_attribute(
+                        "db.statement.parameters",
+                        _render_sql_parameters(params),
+                    )
                 if self.enable_commenter:
-                    commenter_data = self._get_commenter_data(conn)
-
                     if self.enable_attribute_commenter:
                         # just to handle type safety
                         statement = str(statement)
 
                         # sqlcomment is added to executed query and db.statement span attribute
-                        statement = _add_sql_comment(
-                            statement, **commenter_data
+                        statement = self._comment_statement(
+                            conn, statement, span
                         )
                         self._set_db_client_span_attributes(
                             span, statement, attrs
@@ -321,13 +404,16 @@ class EngineTracer:
                         self._set_db_client_span_attributes(
                             span, statement, attrs
                         )
-                        statement = _add_sql_comment(
-                            statement, **commenter_data
+                        statement = self._comment_statement(
+                            conn, statement, span
                         )
 
                 else:
                     # no sqlcomment anywhere
                     self._set_db_client_span_attributes(span, statement, attrs)
+            elif self.enable_commenter and self._prepared_statement_friendly:
+                # keep the same statement text as for recorded executions
+                statement = self._comment_statement(conn, statement, span)
 
         context._otel_span = span
 
@@ -336,6 +422,10 @@ class EngineTracer:
 
 # pylint: disable=unused-argument
 def _after_cur_exec(conn, cursor, statement, params, context, executemany):
+    flush_statistics = _flush_statistics.get()
+    if flush_statistics is not None:
+        flush_statistics.count_rows(cursor)
+
     span = getattr(context, "_otel_span", None)
     if span is None:
         return
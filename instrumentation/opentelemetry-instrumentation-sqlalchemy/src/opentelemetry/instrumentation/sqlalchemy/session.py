@@ -0,0 +1,141 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from contextvars import ContextVar
+
+from opentelemetry import trace
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _get_sql_operation_name,
+)
+from opentelemetry.instrumentation.utils import is_instrumentation_enabled
+
+FLUSH_STATEMENTS = "sqlalchemy.flush.statements"
+FLUSH_EXECUTIONS = "sqlalchemy.flush.executions"
+FLUSH_INSERTS = "sqlalchemy.flush.inserts"
+FLUSH_UPDATES = "sqlalchemy.flush.updates"
+FLUSH_DELETES = "sqlalchemy.flush.deletes"
+FLUSH_BATCHED_STATEMENTS = "sqlalchemy.flush.batched_statements"
+FLUSH_MAX_BATCH_SIZE = "sqlalchemy.flush.max_batch_size"
+FLUSH_ROWS_AFFECTED = "sqlalchemy.flush.rows_affected"
+
+# Statistics of the flush in progress, updated by the engine event listeners
+_flush_statistics = ContextVar(
+    "opentelemetry.instrumentation.sqlalchemy.flush_statistics",
+    default=None,
+)
+
+
+class _FlushStatistics:
+    """Statements executed by a flush of an ORM session.
+
+    A statement executed with several parameter sets is counted once, even
+    when it is sent to the database in several insertmanyvalues batches,
+    each of which is counted as an execution.
+    """
+
+    __slots__ = (
+        "summary",
+        "statements",
+        "executions",
+        "inserts",
+        "updates",
+        "deletes",
+        "batched_statements",
+        "max_batch_size",
+        "rows_affected",
+    )
+
+    def __init__(self, summary):
+        self.summary = summary
+        self.statements = 0
+        self.executions = 0
+        self.inserts = 0
+        self.updates = 0
+        self.deletes = 0
+        self.batched_statements = 0
+        self.max_batch_size = 0
+        self.rows_affected = 0
+
+    def count_execution(self, context, statement, params, executemany):
+        self.executions += 1
+        if getattr(context, "_otel_flush_counted", False):
+            return
+        context._otel_flush_counted = True
+        self.statements += 1
+        operation = _get_sql_operation_name(str(statement)).upper()
+        if operation == "INSERT":
+            self.inserts += 1
+        elif operation == "UPDATE":
+            self.updates += 1
+        elif operation == "DELETE":
+            self.deletes += 1
+        compiled_parameters = getattr(context, "compiled_parameters", None)
+        if compiled_parameters is not None:
+            batch_size = len(compiled_parameters)
+        else:
+            batch_size = len(params) if executemany and params else 1
+        if batch_size > 1:
+            self.batched_statements += 1
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+
+    def count_rows(self, cursor):
+        rowcount = getattr(cursor, "rowcount", -1)
+        if isinstance(rowcount, int) and rowcount > 0:
+            self.rows_affected += rowcount
+
+    def attributes(self):
+        return {
+            FLUSH_STATEMENTS: self.statements,
+            FLUSH_EXECUTIONS: self.executions,
+            FLUSH_INSERTS: self.inserts,
+            FLUSH_UPDATES: self.updates,
+            FLUSH_DELETES: self.deletes,
+            FLUSH_BATCHED_STATEMENTS: self.batched_statements,
+            FLUSH_MAX_BATCH_SIZE: self.max_batch_size,
+            FLUSH_ROWS_AFFECTED: self.rows_affected,
+        }
+
+
+def _wrap_session_flush(tracer, summary):
+    # pylint: disable=unused-argument
+    def _wrap_flush_internal(func, instance, args, kwargs):
+        if not is_instrumentation_enabled():
+            return func(*args, **kwargs)
+
+        statistics = _FlushStatistics(summary)
+        with tracer.start_as_current_span(
+            "Session.flush", kind=trace.SpanKind.INTERNAL
+        ) as span:
+            token = _flush_statistics.set(statistics)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _flush_statistics.reset(token)
+                if span.is_recording():
+                    span.set_attributes(statistics.attributes())
+
+    return _wrap_flush_internal
+
+
+def _wrap_session_commit(tracer):
+    # pylint: disable=unused-argument
+    def _wrap_commit_internal(func, instance, args, kwargs):
+        if not is_instrumentation_enabled():
+            return func(*args, **kwargs)
+
+        with tracer.start_as_current_span(
+            "Session.commit", kind=trace.SpanKind.INTERNAL
+        ):
+            return func(*args, **kwargs)
+
+    return _wrap_commit_internal
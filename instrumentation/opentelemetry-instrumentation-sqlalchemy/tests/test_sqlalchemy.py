@@ -18,9 +18,13 @@ from unittest import mock
 import pytest
 import sqlalchemy
 from sqlalchemy import (
+    Column,
+    Integer,
+    String,
     create_engine,
     text,
 )
+from sqlalchemy.orm import Session, declarative_base
 
 from opentelemetry import trace
 from opentelemetry.instrumentation.sqlalchemy import (
@@ -37,6 +41,14 @@ from opentelemetry.semconv._incubating.attributes.db_attributes import (
 )
 from opentelemetry.test.test_base import TestBase
 
+Base = declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
 
 class TestSqlalchemyInstrumentation(TestBase):
     @pytest.fixture(autouse=True)
@@ -163,6 +175,181 @@ class TestSqlalchemyInstrumentation(TestBase):
             self.assertFalse(mock_span.set_attribute.called)
             self.assertFalse(mock_span.set_status.called)
 
+    def test_capture_parameters(self):
+        engine = create_engine("sqlite:///:memory:")
+        SQLAlchemyInstrumentor().instrument(
+            engine=engine,
+            tracer_provider=self.tracer_provider,
+            capture_parameters=True,
+        )
+        with engine.connect() as cnx:
+            cnx.execute(text("CREATE TABLE t (id INTEGER)"))
+            cnx.execute(text("SELECT :id"), {"id": 1}).fetchall()
+            cnx.execute(
+                text("INSERT INTO t VALUES (:id)"),
+                [{"id": index} for index in range(1000)],
+            )
+        spans = self.memory_exporter.get_finished_spans()
+
+        self.assertEqual(len(spans), 4)
+        self.assertNotIn("db.statement.parameters", spans[1].attributes)
+        self.assertEqual(
+            spans[2].attributes["db.statement.parameters"], "(1,)"
+        )
+        self.assertTrue(
+            spans[3]
+            .attributes["db.statement.parameters"]
+            .endswith(", ... 900 more]")
+        )
+
+    def test_connection_attributes_cached(self):
+        engine = create_engine("sqlite:///:memory:")
+        SQLAlchemyInstrumentor().instrument(
+            engine=engine,
+            tracer_provider=self.tracer_provider,
+        )
+        with mock.patch(
+            "opentelemetry.instrumentation.sqlalchemy.engine._get_attributes_from_cursor",
+            side_effect=lambda vendor, cursor, attrs: attrs,
+        ) as get_attributes:
+            with engine.connect() as cnx:
+                cnx.execute(text("SELECT 1 + 1;")).fetchall()
+                cnx.execute(text("SELECT 2 + 2;")).fetchall()
+                self.assertEqual(get_attributes.call_count, 1)
+                # the cache goes away with the DBAPI connection
+                cnx.invalidate()
+                cnx.rollback()
+                cnx.execute(text("SELECT 3 + 3;")).fetchall()
+                self.assertEqual(get_attributes.call_count, 2)
+        spans = [
+            span
+            for span in self.memory_exporter.get_finished_spans()
+            if span.name != "connect"
+        ]
+
+        self.assertEqual(len(spans), 3)
+        for span in spans:
+            self.assertEqual(span.attributes[DB_NAME], ":memory:")
+
+    def _flush_users(self, **kwargs):
+        engine = create_engine("sqlite:///:memory:")
+        SQLAlchemyInstrumentor().instrument(
+            engine=engine,
+            tracer_provider=self.tracer_provider,
+            enable_session_spans=True,
+            **kwargs,
+        )
+        Base.metadata.create_all(engine)
+        self.memory_exporter.clear()
+        with Session(engine) as session:
+            session.add_all([User(id=index, name="a") for index in range(3)])
+            session.commit()
+            renamed, deleted = session.get(User, 0), session.get(User, 1)
+            renamed.name = "b"
+            session.delete(deleted)
+            session.commit()
+        return [
+            span
+            for span in self.memory_exporter.get_finished_spans()
+            if span.name != "connect"
+        ]
+
+    def test_session_spans(self):
+        spans = self._flush_users()
+
+        self.assertEqual(
+            [span.name for span in spans],
+            [
+                "INSERT :memory:",
+                "Session.flush",
+                "Session.commit",
+                "SELECT :memory:",
+                "SELECT :memory:",
+                "UPDATE :memory:",
+                "DELETE :memory:",
+                "Session.flush",
+                "Session.commit",
+            ],
+        )
+        insert, flush, commit = spans[:3]
+        self.assertEqual(insert.parent.span_id, flush.context.span_id)
+        self.assertEqual(flush.parent.span_id, commit.context.span_id)
+        self.assertIs(flush.kind, trace.SpanKind.INTERNAL)
+        self.assertEqual(
+            dict(flush.attributes),
+            {
+                "sqlalchemy.flush.statements": 1,
+                "sqlalchemy.flush.executions": 1,
+                "sqlalchemy.flush.inserts": 1,
+                "sqlalchemy.flush.updates": 0,
+                "sqlalchemy.flush.deletes": 0,
+                "sqlalchemy.flush.batched_statements": 1,
+                "sqlalchemy.flush.max_batch_size": 3,
+                "sqlalchemy.flush.rows_affected": 3,
+            },
+        )
+        self.assertEqual(
+            dict(spans[7].attributes),
+            {
+                "sqlalchemy.flush.statements": 2,
+                "sqlalchemy.flush.executions": 2,
+                "sqlalchemy.flush.inserts": 0,
+                "sqlalchemy.flush.updates": 1,
+                "sqlalchemy.flush.deletes": 1,
+                "sqlalchemy.flush.batched_statements": 0,
+                "sqlalchemy.flush.max_batch_size": 1,
+                "sqlalchemy.flush.rows_affected": 2,
+            },
+        )
+
+    def test_session_summary(self):
+        spans = self._flush_users(session_summary=True)
+
+        self.assertEqual(
+            [span.name for span in spans],
+            [
+                "Session.flush",
+                "Session.commit",
+                "SELECT :memory:",
+                "SELECT :memory:",
+                "Session.flush",
+                "Session.commit",
+            ],
+        )
+        self.assertEqual(spans[0].attributes["sqlalchemy.flush.inserts"], 1)
+        self.assertEqual(spans[4].attributes["sqlalchemy.flush.updates"], 1)
+
+    def test_session_flush_exists(self):
+        # Flush spans wrap this private method, make its removal loud
+        self.assertTrue(
+            callable(getattr(Session, "_flush", None)),
+            "Session._flush is gone, flush spans must be ported to the "
+            "SQLAlchemy version in use",
+        )
+
+    def test_session_flush_missing(self):
+        flush = Session.__dict__["_flush"]
+        del Session._flush
+        try:
+            with self.assertLogs(level=logging.WARNING) as logs:
+                SQLAlchemyInstrumentor().instrument(
+                    tracer_provider=self.tracer_provider,
+                    enable_session_spans=True,
+                )
+            self.assertIn("Session._flush not found", logs.output[0])
+            self.assertTrue(hasattr(Session.commit, "__wrapped__"))
+            SQLAlchemyInstrumentor().uninstrument()
+            self.assertFalse(hasattr(Session.commit, "__wrapped__"))
+        finally:
+            Session._flush = flush
+
+    def test_session_spans_disabled(self):
+        SQLAlchemyInstrumentor().instrument(
+            tracer_provider=self.tracer_provider
+        )
+        self.assertFalse(hasattr(Session._flush, "__wrapped__"))
+        self.assertFalse(hasattr(Session.commit, "__wrapped__"))
+
     def test_create_engine_wrapper(self):
         SQLAlchemyInstrumentor().instrument()
         from sqlalchemy import (  # noqa: PLC0415
@@ -21,7 +21,10 @@ from sqlalchemy import (
 )
 
 from opentelemetry import context
+from opentelemetry import trace as trace_api
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ParentBased
 from opentelemetry.semconv._incubating.attributes.db_attributes import (
     DB_STATEMENT,
 )
@@ -179,6 +182,43 @@ class TestSqlalchemyInstrumentationWithSQLCommenter(TestBase):
         ).group()
         self.assertEqual(cnx_span_id, db_statement_span_id)
 
+    def test_sqlcommenter_prepared_statement_friendly(self):
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+        engine = create_engine("sqlite:///:memory:")
+        SQLAlchemyInstrumentor().instrument(
+            engine=engine,
+            tracer_provider=TracerProvider(sampler=ParentBased(ALWAYS_OFF)),
+            enable_commenter=True,
+            commenter_options={
+                "db_framework": False,
+                "prepared_statement_friendly": True,
+            },
+        )
+        cnx = engine.connect()
+        # no framework tags left in the context by other tests
+        token = context.attach(context.Context())
+        self.addCleanup(context.detach, token)
+        cnx.execute(text("SELECT  1;")).fetchall()
+        self.assertRegex(
+            self.caplog.records[-2].getMessage(),
+            r"SELECT  1 /\*db_driver='(.*)'\*/;",
+        )
+
+        sampled_parent = trace_api.NonRecordingSpan(
+            trace_api.SpanContext(
+                trace_id=1,
+                span_id=2,
+                is_remote=True,
+                trace_flags=trace_api.TraceFlags(trace_api.TraceFlags.SAMPLED),
+            )
+        )
+        with trace_api.use_span(sampled_parent):
+            cnx.execute(text("SELECT  1;")).fetchall()
+        self.assertRegex(
+            self.caplog.records[-2].getMessage(),
+            r"SELECT  1 /\*db_driver='(.*)',traceparent='\d{1,2}-[a-zA-Z0-9_]{32}-[a-zA-Z0-9_]{16}-\d{1,2}'\*/;",
+        )
+
     def test_sqlcommenter_enabled_otel_values_false(self):
         engine = create_engine("sqlite:///:memory:")
         SQLAlchemyInstrumentor().instrument(
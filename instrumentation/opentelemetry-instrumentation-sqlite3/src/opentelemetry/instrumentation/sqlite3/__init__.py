@@ -89,6 +89,10 @@ class SQLite3Instrumentor(BaseInstrumentor):
         https://docs.python.org/3/library/sqlite3.html
         """
         tracer_provider = kwargs.get("tracer_provider")
+        meter_provider = kwargs.get("meter_provider")
+        enable_metrics = kwargs.get("enable_metrics", False)
+        metrics_fingerprint_limit = kwargs.get("metrics_fingerprint_limit", 0)
+        repeated_query_threshold = kwargs.get("repeated_query_threshold", 0)
 
         for module in self._TO_WRAP:
             dbapi.wrap_connect(
@@ -99,6 +103,10 @@ class SQLite3Instrumentor(BaseInstrumentor):
                 _CONNECTION_ATTRIBUTES,
                 version=__version__,
                 tracer_provider=tracer_provider,
+                meter_provider=meter_provider,
+                enable_metrics=enable_metrics,
+                metrics_fingerprint_limit=metrics_fingerprint_limit,
+                repeated_query_threshold=repeated_query_threshold,
             )
 
     def _uninstrument(self, **kwargs: Any) -> None:
@@ -229,10 +229,16 @@ from opentelemetry.semconv.attributes.url_attributes import (
     URL_SCHEME,
 )
 from opentelemetry.semconv.metrics import MetricInstruments
+from opentelemetry.semconv.metrics.http_metrics import (
+    HTTP_SERVER_REQUEST_DURATION,
+)
 from opentelemetry.util.http import (
+    METRIC_ATTRIBUTE_OVERFLOW_VALUE,
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST,
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE,
+    MetricAttributeLimiter,
     _parse_url_query,
+    create_metric_attribute_limiter,
     get_custom_headers,
     get_excluded_urls,
     get_traced_request_attrs,
@@ -252,6 +258,7 @@ _HANDLER_CONTEXT_KEY = "_otel_trace_context_key"
 _OTEL_PATCHED_KEY = "_otel_patched_key"
 
 _START_TIME = "start_time"
+_OVERFLOWED_ATTRIBUTES = "overflowed_attributes"
 
 _excluded_urls = get_excluded_urls("TORNADO")
 _traced_request_attrs = get_traced_request_attrs("TORNADO")
@@ -332,6 +339,9 @@ class TornadoInstrumentor(BaseInstrumentor):
         server_histograms = _create_server_histograms(
             meter_old, meter_new, sem_conv_opt_in_mode
         )
+        server_attribute_limiters = _create_server_attribute_limiters(
+            meter_old, meter_new, sem_conv_opt_in_mode
+        )
 
         client_request_hook = kwargs.get("client_request_hook", None)
         client_response_hook = kwargs.get("client_response_hook", None)
@@ -345,6 +355,7 @@ class TornadoInstrumentor(BaseInstrumentor):
                 cls,
                 server_request_hook,
                 sem_conv_opt_in_mode,
+                server_attribute_limiters,
             ):
                 self.patched_handlers.append(cls)
             return init(*args, **kwargs)
@@ -414,7 +425,7 @@ def _create_server_histograms(
     # Create new semconv metrics
     if _report_new(sem_conv_opt_in_mode):
         histograms["new_duration"] = meter_new.create_histogram(
-            name="http.server.request.duration",
+            name=HTTP_SERVER_REQUEST_DURATION,
             unit="s",
             description="Duration of HTTP server requests.",
             explicit_bucket_boundaries_advisory=HTTP_DURATION_HISTOGRAM_BUCKETS_NEW,
@@ -444,6 +455,23 @@ def _create_server_histograms(
     return histograms
 
 
+def _create_server_attribute_limiters(
+    meter_old, meter_new, sem_conv_opt_in_mode
+) -> Dict[str, MetricAttributeLimiter]:
+    """Creates the limiters of the attributes of the server metrics, keyed
+    by ``old`` and ``new`` semconv."""
+    limiters = {}
+    if _report_old(sem_conv_opt_in_mode):
+        limiters["old"] = create_metric_attribute_limiter(
+            meter_old, MetricInstruments.HTTP_SERVER_DURATION
+        )
+    if _report_new(sem_conv_opt_in_mode):
+        limiters["new"] = create_metric_attribute_limiter(
+            meter_new, HTTP_SERVER_REQUEST_DURATION
+        )
+    return limiters
+
+
 def _create_client_histograms(
     meter_old, meter_new, sem_conv_opt_in_mode
 ) -> Dict[str, Histogram]:
@@ -495,11 +523,13 @@ def patch_handler_class(
     cls,
     request_hook=None,
     sem_conv_opt_in_mode=_StabilityMode.DEFAULT,
+    server_attribute_limiters=None,
 ):
     if getattr(cls, _OTEL_PATCHED_KEY, False):
         return False
 
     setattr(cls, _OTEL_PATCHED_KEY, True)
+    server_attribute_limiters = server_attribute_limiters or {}
     _wrap(
         cls,
         "prepare",
@@ -509,13 +539,18 @@ def patch_handler_class(
             server_histograms,
             request_hook,
             sem_conv_opt_in_mode,
+            server_attribute_limiters,
         ),
     )
     _wrap(
         cls,
         "log_exception",
         partial(
-            _log_exception, tracer, server_histograms, sem_conv_opt_in_mode
+            _log_exception,
+            tracer,
+            server_histograms,
+            sem_conv_opt_in_mode,
+            server_attribute_limiters,
         ),
     )
 
@@ -528,6 +563,7 @@ def patch_handler_class(
                 tracer,
                 server_histograms,
                 sem_conv_opt_in_mode,
+                server_attribute_limiters,
             ),
         )
     else:
@@ -535,7 +571,11 @@ def patch_handler_class(
             cls,
             "on_finish",
             partial(
-                _on_finish, tracer, server_histograms, sem_conv_opt_in_mode
+                _on_finish,
+                tracer,
+                server_histograms,
+                sem_conv_opt_in_mode,
+                server_attribute_limiters,
             ),
         )
     return True
@@ -565,6 +605,7 @@ def _prepare(
     server_histograms,
     request_hook,
     sem_conv_opt_in_mode,
+    server_attribute_limiters,
     func,
     handler,
     args,
@@ -580,7 +621,12 @@ def _prepare(
     if otel_handler_state["exclude_request"]:
         return func(*args, **kwargs)
 
-    _record_prepare_metrics(server_histograms, handler, sem_conv_opt_in_mode)
+    _record_prepare_metrics(
+        server_histograms,
+        server_attribute_limiters,
+        handler,
+        sem_conv_opt_in_mode,
+    )
 
     ctx = _start_span(tracer, handler, sem_conv_opt_in_mode)
     if request_hook:
@@ -592,6 +638,7 @@ def _on_finish(
     tracer,
     server_histograms,
     sem_conv_opt_in_mode,
+    server_attribute_limiters,
     func,
     handler,
     args,
@@ -601,7 +648,11 @@ def _on_finish(
         return func(*args, **kwargs)
     finally:
         _record_on_finish_metrics(
-            server_histograms, handler, None, sem_conv_opt_in_mode
+            server_histograms,
+            server_attribute_limiters,
+            handler,
+            None,
+            sem_conv_opt_in_mode,
         )
         _finish_span(tracer, handler, None, sem_conv_opt_in_mode)
 
@@ -610,6 +661,7 @@ def _websockethandler_on_close(
     tracer,
     server_histograms,
     sem_conv_opt_in_mode,
+    server_attribute_limiters,
     func,
     handler,
     args,
@@ -619,7 +671,11 @@ def _websockethandler_on_close(
         func()
     finally:
         _record_on_finish_metrics(
-            server_histograms, handler, None, sem_conv_opt_in_mode
+            server_histograms,
+            server_attribute_limiters,
+            handler,
+            None,
+            sem_conv_opt_in_mode,
         )
         _finish_span(tracer, handler, None, sem_conv_opt_in_mode)
 
@@ -628,6 +684,7 @@ def _log_exception(
     tracer,
     server_histograms,
     sem_conv_opt_in_mode,
+    server_attribute_limiters,
     func,
     handler,
     args,
@@ -638,7 +695,11 @@ def _log_exception(
         error = args[1]
 
     _record_on_finish_metrics(
-        server_histograms, handler, error, sem_conv_opt_in_mode
+        server_histograms,
+        server_attribute_limiters,
+        handler,
+        error,
+        sem_conv_opt_in_mode,
     )
 
     _finish_span(tracer, handler, error, sem_conv_opt_in_mode)
@@ -835,12 +896,23 @@ def _finish_span(tracer, handler, error, sem_conv_opt_in_mode):
     delattr(handler, _HANDLER_CONTEXT_KEY)
 
 
-def _record_prepare_metrics(server_histograms, handler, sem_conv_opt_in_mode):
+def _record_prepare_metrics(
+    server_histograms, server_attribute_limiters, handler, sem_conv_opt_in_mode
+):
     request_size = int(handler.request.headers.get("Content-Length", 0))
+    # the attributes replaced by the limiters, reused when the request
+    # finishes so that the limits are applied once per request
+    overflowed_attributes = {}
+    getattr(handler, _HANDLER_STATE_KEY)[_OVERFLOWED_ATTRIBUTES] = (
+        overflowed_attributes
+    )
 
     # Record old semconv metrics
     if _report_old(sem_conv_opt_in_mode):
         metric_attributes_old = _create_metric_attributes_old(handler)
+        overflowed_attributes["old"] = _limit_metric_attributes(
+            server_attribute_limiters.get("old"), metric_attributes_old
+        )
         server_histograms["old_request_size"].record(
             request_size, attributes=metric_attributes_old
         )
@@ -854,6 +926,9 @@ def _record_prepare_metrics(server_histograms, handler, sem_conv_opt_in_mode):
     # Record new semconv metrics
     if _report_new(sem_conv_opt_in_mode):
         metric_attributes_new = _create_metric_attributes_new(handler)
+        overflowed_attributes["new"] = _limit_metric_attributes(
+            server_attribute_limiters.get("new"), metric_attributes_new
+        )
         server_histograms["new_request_size"].record(
             request_size, attributes=metric_attributes_new
         )
@@ -868,7 +943,11 @@ def _record_prepare_metrics(server_histograms, handler, sem_conv_opt_in_mode):
 
 
 def _record_on_finish_metrics(
-    server_histograms, handler, error, sem_conv_opt_in_mode
+    server_histograms,
+    server_attribute_limiters,
+    handler,
+    error,
+    sem_conv_opt_in_mode,
 ):
     otel_handler_state = getattr(handler, _HANDLER_STATE_KEY, None) or {}
     if otel_handler_state.get("exclude_request"):
@@ -878,6 +957,7 @@ def _record_on_finish_metrics(
     elapsed_time_ms = round(elapsed_time_s * 1000)
 
     response_size = int(handler._headers.get("Content-Length", 0))
+    overflowed_attributes = otel_handler_state.get(_OVERFLOWED_ATTRIBUTES, {})
     status_code = handler.get_status()
 
     if isinstance(error, tornado.web.HTTPError):
@@ -888,6 +968,11 @@ def _record_on_finish_metrics(
         metric_attributes_old = _create_metric_attributes_old(handler)
         if isinstance(error, tornado.web.HTTPError):
             metric_attributes_old[HTTP_STATUS_CODE] = status_code
+        _limit_metric_attributes(
+            server_attribute_limiters.get("old"),
+            metric_attributes_old,
+            overflowed_attributes.get("old"),
+        )
 
         server_histograms["old_response_size"].record(
             response_size, attributes=metric_attributes_old
@@ -908,6 +993,11 @@ def _record_on_finish_metrics(
         metric_attributes_new = _create_metric_attributes_new(handler)
         if isinstance(error, tornado.web.HTTPError):
             metric_attributes_new[HTTP_RESPONSE_STATUS_CODE] = status_code
+        _limit_metric_attributes(
+            server_attribute_limiters.get("new"),
+            metric_attributes_new,
+            overflowed_attributes.get("new"),
+        )
 
         server_histograms["new_response_size"].record(
             response_size, attributes=metric_attributes_new
@@ -926,6 +1016,24 @@ def _record_on_finish_metrics(
             )
 
 
+def _limit_metric_attributes(limiter, attributes, overflowed=None):
+    """Replaces the values of ``attributes`` over the limits of ``limiter``
+    with ``_OTHER``, or the ``overflowed`` attributes if already known for
+    the request. Returns the replaced attributes."""
+    if overflowed is None:
+        if limiter is None:
+            return ()
+        limiter.limit_attributes(attributes)
+        return tuple(
+            key
+            for key, value in attributes.items()
+            if value == METRIC_ATTRIBUTE_OVERFLOW_VALUE
+        )
+    for key in overflowed:
+        attributes[key] = METRIC_ATTRIBUTE_OVERFLOW_VALUE
+    return overflowed
+
+
 def _create_active_requests_attributes_old(request):
     """Create metric attributes for active requests using old semconv."""
     metric_attributes = {
@@ -287,6 +287,45 @@ class TestTornadoMetricsInstrumentation(TornadoTest):
                 if isinstance(point, HistogramDataPoint):
                     self.assertEqual(point.count, 1)
 
+    def test_metric_attribute_limit(self):
+        TornadoInstrumentor().uninstrument()
+        with patch.dict(
+            "os.environ",
+            {"OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT": "1"},
+        ):
+            TornadoInstrumentor().instrument()
+        self.fetch("/")
+        self.fetch("/cor")
+
+        metrics = {
+            metric.name: metric for metric in self.get_sorted_metrics(SCOPE)
+        }
+        for name in (
+            "http.server.duration",
+            "http.server.request.size",
+            "http.server.response.size",
+        ):
+            self.assertEqual(
+                sorted(
+                    point.attributes["http.target"]
+                    for point in metrics[name].data.data_points
+                ),
+                ["/", "_OTHER"],
+                name,
+            )
+        # the limit is applied once per request
+        (overflow,) = metrics[
+            "otel.instrumentation.http.metric_attribute_overflow"
+        ].data.data_points
+        self.assertEqual(overflow.value, 1)
+        self.assertEqual(
+            dict(overflow.attributes),
+            {
+                "otel.metric.name": "http.server.duration",
+                "otel.metric.attribute": "http.target",
+            },
+        )
+
     def test_exclude_lists(self):
         def test_excluded(path):
             self.fetch(path)
@@ -248,6 +248,11 @@ from opentelemetry.util.http import (
     sanitize_method,
 )
 from opentelemetry.util.http.httplib import set_ip_on_next_http_connection
+from opentelemetry.util.http.span_budget import (
+    OutboundSpanBudget,
+    get_outbound_span_budget,
+    start_client_span,
+)
 
 _excluded_urls_from_env = get_excluded_urls("URLLIB3")
 
@@ -411,6 +416,7 @@ class URLLib3Instrumentor(BaseInstrumentor):
                     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
                 ),
             ),
+            span_budget=get_outbound_span_budget(),
         )
 
     def _uninstrument(self, **kwargs):
@@ -441,6 +447,7 @@ def _instrument(
     captured_request_headers: typing.Optional[list[str]] = None,
     captured_response_headers: typing.Optional[list[str]] = None,
     sensitive_headers: typing.Optional[list[str]] = None,
+    span_budget: typing.Optional[OutboundSpanBudget] = None,
 ):
     urlopen_signature = inspect.signature(
         urllib3.connectionpool.HTTPConnectionPool.urlopen
@@ -489,8 +496,14 @@ def _instrument(
         )
 
         with (
-            tracer.start_as_current_span(
-                span_name, kind=SpanKind.CLIENT, attributes=span_attributes
+            start_client_span(
+                tracer,
+                span_budget,
+                span_name,
+                instance.host,
+                method,
+                kind=SpanKind.CLIENT,
+                attributes=span_attributes,
             ) as span,
             set_ip_on_next_http_connection(span),
         ):
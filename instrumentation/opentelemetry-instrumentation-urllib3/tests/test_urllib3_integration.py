@@ -41,6 +41,9 @@ from opentelemetry.test.mock_textmap import MockTextMapPropagator
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import Span
 from opentelemetry.util.http import get_excluded_urls
+from opentelemetry.util.http.span_budget import (
+    OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET,
+)
 
 # pylint: disable=too-many-public-methods,too-many-lines
 
@@ -1002,3 +1005,31 @@ class TestURLLib3Instrumentor(TestBase):
         self.assertEqual(
             span.attributes["http.request.header.x_test"], ("Value",)
         )
+
+    def test_outbound_span_budget(self):
+        URLLib3Instrumentor().uninstrument()
+        with mock.patch.dict(
+            "os.environ",
+            {OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET: "2"},
+        ):
+            URLLib3Instrumentor().instrument()
+
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span("parent"):
+            for _ in range(5):
+                response = self.perform_request(self.HTTP_URL)
+                self.assertEqual(b"Hello!", response.data)
+            self.perform_request(self.HTTP_URL, method="POST")
+
+        spans = self.assert_span(num_spans=4)
+        parent = spans[-1]
+        self.assertEqual(parent.name, "parent")
+        for span in spans[:-1]:
+            self.assertEqual(span.parent.span_id, parent.context.span_id)
+        self.assertEqual(
+            parent.attributes["http.client.suppressed.targets"],
+            ("GET mock",),
+        )
+        self.assertEqual(
+            parent.attributes["http.client.suppressed.count"], (3,)
+        )
@@ -211,6 +211,19 @@ In order to prevent unbound cardinality for HTTP methods by default nonstandard
 To record all of the names set the environment variable  ``OTEL_PYTHON_INSTRUMENTATION_HTTP_CAPTURE_ALL_METHODS``
 to a value that evaluates to true, e.g. ``1``.
 
+Limiting metric attribute cardinality
+*************************************
+Attributes taken from the request, such as the host or target, can have an unbound number of values. Limiting them is
+opt-in: the environment variable ``OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT`` sets the number of
+distinct values of each of them recorded on the duration histograms, either for every histogram or per histogram
+name. Further values are replaced with ``_OTHER`` and counted by the
+``otel.instrumentation.http.metric_attribute_overflow`` counter. A limit of ``0``, the default, disables limiting.
+
+For example,
+::
+
+    export OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT="500,http.server.duration=100"
+
 API
 ---
 """
@@ -274,11 +287,11 @@ from opentelemetry.util.http import (
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE,
     SanitizeValue,
     _parse_url_query,
-    detect_synthetic_user_agent,
+    classify_user_agent,
+    create_metric_attribute_limiter,
     get_custom_headers,
     normalise_request_header_name,
     normalise_response_header_name,
-    normalize_user_agent,
     redact_url,
     sanitize_method,
 )
@@ -412,12 +425,11 @@ def _apply_user_agent_attributes(
     if not user_agent_raw:
         return
 
-    user_agent = normalize_user_agent(user_agent_raw)
+    user_agent, synthetic_type = classify_user_agent(user_agent_raw)
     if not user_agent:
         return
 
     _set_http_user_agent(result, user_agent, sem_conv_opt_in_mode)
-    synthetic_type = detect_synthetic_user_agent(user_agent)
     if synthetic_type:
         result[USER_AGENT_SYNTHETIC_TYPE] = synthetic_type
 
@@ -621,6 +633,12 @@ class OpenTelemetryMiddleware:
                 description="Duration of HTTP server requests.",
                 explicit_bucket_boundaries_advisory=HTTP_DURATION_HISTOGRAM_BUCKETS_NEW,
             )
+        self._duration_attrs_limiter_old = create_metric_attribute_limiter(
+            self.meter, MetricInstruments.HTTP_SERVER_DURATION
+        )
+        self._duration_attrs_limiter_new = create_metric_attribute_limiter(
+            self.meter, HTTP_SERVER_REQUEST_DURATION
+        )
         # We don't need a separate active request counter for old/new semantic conventions
         # because the new attributes are a subset of the old attributes
         self.active_requests_counter = self.meter.create_up_down_counter(
@@ -737,6 +755,9 @@ class OpenTelemetryMiddleware:
                 duration_attrs_old = _parse_duration_attrs(
                     req_attrs, _StabilityMode.DEFAULT
                 )
+                self._duration_attrs_limiter_old.limit_attributes(
+                    duration_attrs_old
+                )
                 self.duration_histogram_old.record(
                     max(round(duration_s * 1000), 0),
                     duration_attrs_old,
@@ -746,6 +767,9 @@ class OpenTelemetryMiddleware:
                 duration_attrs_new = _parse_duration_attrs(
                     req_attrs, _StabilityMode.HTTP
                 )
+                self._duration_attrs_limiter_new.limit_attributes(
+                    duration_attrs_new
+                )
                 self.duration_histogram_new.record(
                     max(duration_s, 0),
                     duration_attrs_new,
@@ -83,6 +83,7 @@ from opentelemetry.util.http import (
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST,
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE,
     OTEL_PYTHON_INSTRUMENTATION_HTTP_CAPTURE_ALL_METHODS,
+    OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT,
 )
 
 
@@ -487,6 +488,35 @@ class TestWsgiApplication(WsgiTestBase):
             context="both semconv",
         )
 
+    @mock.patch.dict(
+        "os.environ",
+        {OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT: "2"},
+    )
+    def test_wsgi_metrics_attribute_limit(self):
+        app = otel_wsgi.OpenTelemetryMiddleware(simple_wsgi)
+        for host in ("a.example", "b.example", "c.example", "d.example"):
+            self.environ["HTTP_HOST"] = host
+            for _ in app(self.environ, self.start_response):
+                pass
+
+        metrics = {
+            metric.name: metric for metric in self.get_sorted_metrics(SCOPE)
+        }
+        hosts = sorted(
+            point.attributes[HTTP_HOST]
+            for point in metrics["http.server.duration"].data.data_points
+        )
+        self.assertEqual(hosts, ["_OTHER", "a.example", "b.example"])
+        overflow = metrics[
+            "otel.instrumentation.http.metric_attribute_overflow"
+        ]
+        overflowed = {
+            point.attributes["otel.metric.attribute"]: point.value
+            for point in overflow.data.data_points
+        }
+        # the host is reported both as http.host and net.host.name
+        self.assertEqual(overflowed, {HTTP_HOST: 2, NET_HOST_NAME: 2})
+
     def test_wsgi_metrics_new_semconv(self):
         # pylint: disable=too-many-nested-blocks
         app = otel_wsgi.OpenTelemetryMiddleware(error_wsgi_unhandled)
@@ -0,0 +1,63 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _cached_tokenize,
+    _fingerprint_sql,
+    _tokenize,
+)
+
+# Statements as generated by SQLAlchemy and Django for a typical web app
+ORM_STATEMENTS = [
+    "SELECT users.id AS users_id, users.name AS users_name, users.email AS "
+    "users_email, users.created_at AS users_created_at \nFROM users \nWHERE "
+    "users.id = %(pk_1)s",
+    'SELECT "auth_user"."id", "auth_user"."password", "auth_user"."last_login", '
+    '"auth_user"."is_superuser", "auth_user"."username" FROM "auth_user" '
+    'WHERE "auth_user"."username" = %s LIMIT 21',
+    "INSERT INTO orders (user_id, total, status, created_at) VALUES "
+    "(%(user_id)s, %(total)s, %(status)s, now()) RETURNING orders.id",
+    "UPDATE orders SET status=%(status)s, updated_at=now() WHERE orders.id = "
+    "%(orders_id)s",
+    'DELETE FROM "django_session" WHERE "django_session"."session_key" IN (%s)',
+    "SELECT order_items.id AS order_items_id, order_items.order_id AS "
+    "order_items_order_id, order_items.sku AS order_items_sku, "
+    "products.id AS products_id, products.price AS products_price \nFROM "
+    "order_items LEFT OUTER JOIN products ON products.id = order_items.sku "
+    "\nWHERE order_items.order_id IN (%(primary_keys_1)s, "
+    "%(primary_keys_2)s, %(primary_keys_3)s) ORDER BY order_items.id",
+    "SELECT count(*) AS count_1 \nFROM (SELECT orders.id AS orders_id "
+    "\nFROM orders \nWHERE orders.status = %(status_1)s) AS anon_1",
+    "/*controller='index',framework='django%3A4.2'*/ SELECT 1",
+]
+
+
+def test_fingerprint_cached(benchmark):
+    for statement in ORM_STATEMENTS:
+        _fingerprint_sql(statement)
+
+    def fingerprint_all():
+        for statement in ORM_STATEMENTS:
+            _fingerprint_sql(statement)
+
+    benchmark(fingerprint_all)
+    assert _cached_tokenize.cache_info().hits > 0
+
+
+def test_fingerprint_uncached(benchmark):
+    def tokenize_all():
+        for statement in ORM_STATEMENTS:
+            _tokenize(statement)
+
+    benchmark(tokenize_all)
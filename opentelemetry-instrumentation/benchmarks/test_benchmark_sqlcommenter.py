@@ -0,0 +1,55 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from opentelemetry.instrumentation.sqlcommenter_utils import (
+    _add_sql_comment,
+    _add_sql_comment_with_static,
+    _StaticSqlComment,
+)
+
+STATEMENT = "SELECT users.id, users.name FROM users WHERE users.id = %s"
+# commenter data of a DB-API integration for psycopg2
+STATIC_DATA = {
+    "db_driver": "psycopg2:2.9.9",
+    "dbapi_threadsafety": 2,
+    "dbapi_level": "2.0",
+    "libpq_version": 160002,
+    "driver_paramstyle": "pyformat",
+}
+DYNAMIC_DATA = {
+    "traceparent": "00-03afa25236b8cd948fa853d67038ac79-405ff022e8247c46-01",
+}
+
+
+def test_sqlcomment_per_execute(benchmark):
+    def comment():
+        commenter_data = dict(STATIC_DATA)
+        commenter_data.update(DYNAMIC_DATA)
+        return _add_sql_comment(STATEMENT, **commenter_data)
+
+    benchmark(comment)
+
+
+def test_sqlcomment_static_prefix_per_execute(benchmark):
+    static_comment = _StaticSqlComment(**STATIC_DATA)
+
+    def comment():
+        return _add_sql_comment_with_static(
+            STATEMENT, static_comment, **DYNAMIC_DATA
+        )
+
+    assert comment() == _add_sql_comment(
+        STATEMENT, **STATIC_DATA, **DYNAMIC_DATA
+    )
+    benchmark(comment)
@@ -118,6 +118,19 @@ HTTP_DURATION_HISTOGRAM_BUCKETS_NEW = (
     10,
 )
 
+# Values defined in seconds
+DB_DURATION_HISTOGRAM_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1,
+    5,
+    10,
+)
+
 # These lists represent attributes for metrics that are currently supported
 
 _client_duration_attrs_old = [
@@ -0,0 +1,162 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+``db.client.connection.*`` metrics of database client connection pools.
+
+Instrumentations wrap the methods acquiring and creating connections of a
+pool class and report their duration here. The number of idle and used
+connections and the maximum size of the pools are only read when metrics are
+collected, so they cost nothing on the path of queries.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Callable, Iterable, NamedTuple
+from weakref import WeakKeyDictionary
+
+from opentelemetry.instrumentation._semconv import (
+    DB_DURATION_HISTOGRAM_BUCKETS,
+)
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
+from opentelemetry.semconv._incubating.attributes.db_attributes import (
+    DB_CLIENT_CONNECTION_POOL_NAME,
+    DB_CLIENT_CONNECTION_STATE,
+)
+from opentelemetry.semconv._incubating.metrics.db_metrics import (
+    DB_CLIENT_CONNECTION_COUNT,
+    DB_CLIENT_CONNECTION_CREATE_TIME,
+    DB_CLIENT_CONNECTION_MAX,
+    DB_CLIENT_CONNECTION_TIMEOUTS,
+    DB_CLIENT_CONNECTION_WAIT_TIME,
+)
+
+
+class _PoolUsage(NamedTuple):
+    """Connections of a pool at the time metrics are collected."""
+
+    idle: int
+    used: int
+    max: int
+
+
+class _ConnectionPoolMetrics:
+    """Records the ``db.client.connection.*`` metrics of a kind of pool.
+
+    Args:
+        meter: Meter creating the instruments.
+        get_usage: Returns the ``_PoolUsage`` of a pool, or ``None`` once the
+            pool is closed. ``None`` when the usage of the pools cannot be
+            read, only the connection times and timeouts are then recorded.
+    """
+
+    def __init__(
+        self,
+        meter: Meter,
+        get_usage: Callable[[Any], _PoolUsage | None] | None,
+    ):
+        self._get_usage = get_usage
+        self._pools: WeakKeyDictionary[Any, dict[str, str]] = (
+            WeakKeyDictionary()
+        )
+        # Pools which cannot be weakly referenced, like the asyncpg ones, are
+        # kept until they are unregistered when closed.
+        self._unreferenceable_pools: dict[Any, dict[str, str]] = {}
+        self._lock = Lock()
+        meter.create_observable_up_down_counter(
+            name=DB_CLIENT_CONNECTION_COUNT,
+            callbacks=[self._observe_count],
+            unit="{connection}",
+            description="The number of connections that are currently in state described by the state attribute.",
+        )
+        meter.create_observable_up_down_counter(
+            name=DB_CLIENT_CONNECTION_MAX,
+            callbacks=[self._observe_max],
+            unit="{connection}",
+            description="The maximum number of open connections allowed.",
+        )
+        self._wait_time = meter.create_histogram(
+            name=DB_CLIENT_CONNECTION_WAIT_TIME,
+            unit="s",
+            description="The time it took to obtain an open connection from the pool.",
+            explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+        )
+        self._timeouts = meter.create_counter(
+            name=DB_CLIENT_CONNECTION_TIMEOUTS,
+            unit="{timeout}",
+            description="The number of connection timeouts that have occurred trying to obtain a connection from the pool.",
+        )
+        self._create_time = meter.create_histogram(
+            name=DB_CLIENT_CONNECTION_CREATE_TIME,
+            unit="s",
+            description="The time it took to create a new connection.",
+            explicit_bucket_boundaries_advisory=DB_DURATION_HISTOGRAM_BUCKETS,
+        )
+
+    def _get_pools(self, pool: Any) -> dict[Any, dict[str, str]]:
+        if hasattr(type(pool), "__weakref__"):
+            return self._pools
+        return self._unreferenceable_pools
+
+    def register(self, pool: Any, name: str) -> None:
+        """Reports the usage of ``pool`` under ``name`` until it is closed,
+        unregistered or garbage collected."""
+        pools = self._get_pools(pool)
+        if pool not in pools:
+            with self._lock:
+                pools.setdefault(pool, {DB_CLIENT_CONNECTION_POOL_NAME: name})
+
+    def unregister(self, pool: Any) -> None:
+        """Stops reporting the usage of ``pool``, when it is closed."""
+        with self._lock:
+            self._get_pools(pool).pop(pool, None)
+
+    def record_wait_time(self, pool: Any, duration_s: float) -> None:
+        self._wait_time.record(duration_s, self._get_pools(pool).get(pool))
+
+    def record_timeout(self, pool: Any) -> None:
+        self._timeouts.add(1, self._get_pools(pool).get(pool))
+
+    def record_create_time(self, pool: Any, duration_s: float) -> None:
+        self._create_time.record(duration_s, self._get_pools(pool).get(pool))
+
+    def _usages(self) -> list[tuple[dict[str, str], _PoolUsage]]:
+        usages = []
+        if self._get_usage is None:
+            return usages
+        with self._lock:
+            for pools in (self._pools, self._unreferenceable_pools):
+                for pool, attributes in list(pools.items()):
+                    usage = self._get_usage(pool)
+                    if usage is None:
+                        del pools[pool]
+                    else:
+                        usages.append((attributes, usage))
+        return usages
+
+    def _observe_count(
+        self, options: CallbackOptions
+    ) -> Iterable[Observation]:
+        for attributes, usage in self._usages():
+            yield Observation(
+                usage.idle, {**attributes, DB_CLIENT_CONNECTION_STATE: "idle"}
+            )
+            yield Observation(
+                usage.used, {**attributes, DB_CLIENT_CONNECTION_STATE: "used"}
+            )
+
+    def _observe_max(self, options: CallbackOptions) -> Iterable[Observation]:
+        for attributes, usage in self._usages():
+            yield Observation(usage.max, attributes)
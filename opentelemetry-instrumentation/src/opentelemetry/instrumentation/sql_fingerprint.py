@@ -0,0 +1,143 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Operation name and fingerprint of SQL statements.
+
+The otel spec recommends against parsing SQL queries and this module does
+not try to. The operation name is the first word after the leading
+comments, found without looking further into the statement. For the
+fingerprint, a single regex scan splits the statement in tokens, which is
+enough to replace literals and bind parameters by ``?``. Applications, and ORMs in
+particular, run the same statements over and over, so results are memoized
+in a bounded LRU cache keyed by the statement text. Longer statements are
+not tokenized at all.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from hashlib import sha1
+from typing import NamedTuple
+
+_STATEMENT_CACHE_SIZE = 1024
+# Longer statements usually embed literal values and are unlikely to repeat
+_MAX_CACHED_STATEMENT_LENGTH = 16384
+
+_IDENTIFIER = (
+    r"""(?:[A-Za-z_\x80-\U0010ffff][\w$\x80-\U0010ffff]*"""
+    r"""|"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])"""
+)
+_TOKENS = re.compile(
+    rf"""
+    (?P<space>\s+|/\*.*?(?:\*/|\Z))
+    |(?P<comment>--[^\n]*)
+    |(?P<string>[EeNnBbXx]?'(?:[^'\\]|''|\\.)*(?:'|\Z))
+    |(?P<dollar>\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?(?:\$(?P=tag)\$|\Z))
+    |(?P<param>\?|%s|%\(\w+\)s|\$\d+|(?<![:\w]):\w+)
+    |(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+    |(?P<name>{_IDENTIFIER}(?:\s*\.\s*{_IDENTIFIER})*)
+    |(?P<other>.)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+# Returned once the bounded set of fingerprint ids is full
+_OTHER_FINGERPRINT_ID = "other"
+
+_LEADING_COMMENTS = re.compile(r"(?:\s+|/\*.*?(?:\*/|\Z))*", re.DOTALL)
+_OPERATION = re.compile(r"\S+")
+_LIST_OF_PLACEHOLDERS = re.compile(r"\(\?(?:\s*,\s*\?)+\)")
+
+
+class _SqlFingerprint(NamedTuple):
+    """What is known of a SQL statement without parsing it.
+
+    ``operation`` is the first word of the statement as written, or ``""``
+    for an empty statement. ``fingerprint`` is the statement without
+    comments and with literals and bind parameters replaced by ``?``, lists
+    of which are collapsed to a single ``(?)``.
+    """
+
+    operation: str
+    fingerprint: str
+
+
+def _get_sql_operation_name(statement: str) -> str:
+    """Returns the first word of ``statement`` after leading block comments.
+
+    Like the first word of a statement split on whitespace, a leading line
+    comment is kept as the operation name.
+    """
+    operation = _OPERATION.match(
+        statement, _LEADING_COMMENTS.match(statement).end()
+    )
+    return operation.group() if operation else ""
+
+
+def _tokenize(statement: str) -> _SqlFingerprint:
+    parts = []
+    for match in _TOKENS.finditer(statement):
+        kind = match.lastgroup
+        if kind in ("space", "comment"):
+            if parts and parts[-1] not in " (":
+                parts.append(" ")
+            continue
+        token = match.group()
+        if kind == "other":
+            if token in ",)" and parts and parts[-1] == " ":
+                parts.pop()
+        elif kind != "name":
+            token = "?"
+        parts.append(token)
+    fingerprint = _LIST_OF_PLACEHOLDERS.sub("(?)", "".join(parts).rstrip())
+    return _SqlFingerprint(_get_sql_operation_name(statement), fingerprint)
+
+
+_cached_tokenize = lru_cache(maxsize=_STATEMENT_CACHE_SIZE)(_tokenize)
+
+
+def _fingerprint_sql(statement: str) -> _SqlFingerprint | None:
+    """Returns the operation name and fingerprint of ``statement``,
+    or ``None`` if it is too long to be cached."""
+    if len(statement) > _MAX_CACHED_STATEMENT_LENGTH:
+        return None
+    return _cached_tokenize(statement)
+
+
+def _get_sql_fingerprint_id(fingerprint: str) -> str:
+    """Returns a short stable id of ``fingerprint``."""
+    return sha1(fingerprint.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+class _SqlFingerprintIds:
+    """Bounded set of the fingerprint ids of an integration.
+
+    Only the first ``limit`` fingerprints seen get an id, later ones get
+    ``"other"``, which keeps the id usable as a metric attribute.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._ids: dict[str, str] = {}
+
+    def get(self, fingerprint: str) -> str:
+        fingerprint_id = self._ids.get(fingerprint)
+        if fingerprint_id is None:
+            if len(self._ids) >= self._limit:
+                return _OTHER_FINGERPRINT_ID
+            fingerprint_id = self._ids.setdefault(
+                fingerprint, _get_sql_fingerprint_id(fingerprint)
+            )
+        return fingerprint_id
@@ -0,0 +1,125 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Rendering of SQL statement parameters for the ``db.statement.parameters``
+span attribute.
+
+Parameters are rendered like ``str(parameters)`` as long as they are small.
+Larger ones, such as the rows of an ``executemany`` batch, are rendered
+piecewise until a length budget is spent, and sequences and mappings with
+more than a maximum number of items are summarized by their first items and
+the count of the other ones, so the full string is never built.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_MAX_LENGTH = 4096
+_MAX_ITEMS = 100
+_ELLIPSIS = "..."
+
+_CONTAINER_TYPES = (tuple, list, dict)
+_TEXT_TYPES = (str, bytes, bytearray)
+
+
+class _BudgetSpent(Exception):
+    pass
+
+
+class _Renderer:
+    __slots__ = ("_parts", "_remaining", "_max_items")
+
+    def __init__(self, max_length: int, max_items: int):
+        self._parts: list[str] = []
+        self._remaining = max_length
+        self._max_items = max_items
+
+    def write(self, text: str) -> None:
+        if len(text) > self._remaining:
+            self._parts.append(text[: self._remaining])
+            self._parts.append(_ELLIPSIS)
+            raise _BudgetSpent()
+        self._parts.append(text)
+        self._remaining -= len(text)
+
+    def render(self, value: Any) -> None:
+        value_type = type(value)
+        if value_type is tuple:
+            self._render_items(value, "(", ",)" if len(value) == 1 else ")")
+        elif value_type is list:
+            self._render_items(value, "[", "]")
+        elif value_type is dict:
+            self._render_dict(value)
+        elif isinstance(value, _TEXT_TYPES):
+            # only the part of long values that fits in the budget is copied
+            self.write(repr(value[: self._remaining + 1]))
+        else:
+            self.write(repr(value))
+
+    def _render_items(self, items, start: str, end: str) -> None:
+        self.write(start)
+        for index, item in enumerate(items):
+            if index:
+                self.write(", ")
+            if index == self._max_items:
+                self.write(f"{_ELLIPSIS} {len(items) - index} more")
+                break
+            self.render(item)
+        self.write(end)
+
+    def _render_dict(self, mapping: dict) -> None:
+        self.write("{")
+        for index, (key, item) in enumerate(mapping.items()):
+            if index:
+                self.write(", ")
+            if index == self._max_items:
+                self.write(f"{_ELLIPSIS} {len(mapping) - index} more")
+                break
+            self.render(key)
+            self.write(": ")
+            self.render(item)
+        self.write("}")
+
+    def result(self) -> str:
+        return "".join(self._parts)
+
+
+def _render_sql_parameters(
+    parameters: Any,
+    max_length: int = _MAX_LENGTH,
+    max_items: int = _MAX_ITEMS,
+) -> str:
+    """Renders ``parameters`` like ``str(parameters)``, within bounds.
+
+    Args:
+        parameters: Parameters of a statement, or the sequence of parameters
+            of an ``executemany`` call.
+        max_length: Length after which rendering stops, the result then
+            ends with ``...``.
+        max_items: Number of items of a tuple, list or dict rendered before
+            the count of the remaining ones.
+    """
+    renderer = _Renderer(max_length, max_items)
+    try:
+        if type(parameters) in _CONTAINER_TYPES:
+            renderer.render(parameters)
+        elif isinstance(parameters, str):
+            renderer.write(parameters[: max_length + 1])
+        else:
+            renderer.write(str(parameters))
+    except _BudgetSpent:
+        pass
+    return renderer.result()
@@ -12,16 +12,61 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+
 from opentelemetry import context
 from opentelemetry.instrumentation.utils import _url_quote
 
+_STATIC_SQL_COMMENT_CACHE_SIZE = 1024
+
 
 def _add_sql_comment(sql, **meta) -> str:
     """
     Appends comments to the sql statement and returns it
     """
     meta.update(**_add_framework_tags())
-    comment = _generate_sql_comment(**meta)
+    return _append_sql_comment(sql, _generate_sql_comment(**meta))
+
+
+def _add_sql_comment_with_static(sql, static_comment, **meta) -> str:
+    """
+    Appends comments to the sql statement and returns it, like
+    ``_add_sql_comment``, with the tags of ``static_comment`` merged with the
+    ones given for this execution.
+    """
+    meta.update(**_add_framework_tags())
+    return _append_sql_comment(sql, static_comment.generate(**meta))
+
+
+def _add_static_sql_comment(sql, static_comment) -> str:
+    """
+    Appends comments to the sql statement and returns it, like
+    ``_add_sql_comment``, with only tags that do not change between
+    executions.
+
+    The commented statement is cached, and the same statement with the same
+    tags always gets the same text, so that it can be reused by prepared
+    statement and query plan caches.
+    """
+    framework_tags = _add_framework_tags()
+    try:
+        return _add_cached_sql_comment(
+            sql, static_comment, tuple(sorted(framework_tags.items()))
+        )
+    except TypeError:  # unhashable statement or tag values
+        return _append_sql_comment(
+            sql, static_comment.generate(**framework_tags)
+        )
+
+
+@lru_cache(maxsize=_STATIC_SQL_COMMENT_CACHE_SIZE)
+def _add_cached_sql_comment(sql, static_comment, framework_items) -> str:
+    return _append_sql_comment(
+        sql, static_comment.generate(**dict(framework_items))
+    )
+
+
+def _append_sql_comment(sql, comment) -> str:
     sql = sql.rstrip()
     if sql.endswith(";"):
         sql = sql[:-1] + comment + ";"
@@ -45,7 +90,7 @@ def _generate_sql_comment(**meta) -> str:
     return (
         " /*"
         + key_value_delimiter.join(
-            f"{_url_quote(key)}={_url_quote(value)!r}"
+            _format_sql_comment_tag(key, value)
             for key, value in sorted(meta.items())
             if value is not None
         )
@@ -53,6 +98,56 @@ def _generate_sql_comment(**meta) -> str:
     )
 
 
+def _format_sql_comment_tag(key, value) -> str:
+    return f"{_url_quote(key)}={_url_quote(value)!r}"
+
+
+class _StaticSqlComment:
+    """
+    Tags of a SQL comment that do not change between executions, such as the
+    driver, formatted and sorted once so that only the tags of the current
+    execution, such as ``traceparent``, are formatted for each statement.
+    """
+
+    def __init__(self, **meta):
+        self._comment = _generate_sql_comment(**meta)
+        self._tags = {
+            key: _format_sql_comment_tag(key, value)
+            for key, value in meta.items()
+            if value is not None
+        }
+        keys = sorted(self._tags)
+        self._prefix = ",".join(self._tags[key] for key in keys)
+        self._last_key = keys[-1] if keys else None
+
+    def generate(self, **meta) -> str:
+        """
+        Return the SQL comment of ``_generate_sql_comment`` for the static
+        tags updated with **meta kwargs.
+        """
+        if not meta:
+            return self._comment
+
+        keys = sorted(meta)
+        if self._last_key is None or keys[0] > self._last_key:
+            # the common case: traceparent and tracestate sort last
+            tags = [self._prefix] if self._prefix else []
+            tags.extend(
+                _format_sql_comment_tag(key, meta[key])
+                for key in keys
+                if meta[key] is not None
+            )
+            return " /*" + ",".join(tags) + "*/"
+
+        tags = dict(self._tags)
+        for key, value in meta.items():
+            if value is None:
+                tags.pop(key, None)
+            else:
+                tags[key] = _format_sql_comment_tag(key, value)
+        return " /*" + ",".join(tags[key] for key in sorted(tags)) + "*/"
+
+
 def _add_framework_tags() -> dict:
     """
     Returns orm related tags if any set by the context
@@ -18,7 +18,7 @@ import urllib.parse
 from contextlib import contextmanager
 from importlib import import_module
 from re import escape, sub
-from typing import Any, Dict, Generator, Sequence
+from typing import Any, Callable, Dict, Generator, Sequence
 
 from wrapt import ObjectProxy
 
@@ -225,3 +225,49 @@ def suppress_http_instrumentation() -> Generator[None]:
     """Suppress instrumentation within the context."""
     with _suppress_instrumentation(_SUPPRESS_HTTP_INSTRUMENTATION_KEY):
         yield
+
+
+def call_before_span_end(
+    span: trace.Span, callback: Callable[[], None]
+) -> bool:
+    """Calls ``callback`` when ``span`` is ended, right before it ends.
+
+    Lets instrumentations set attributes summarizing the work done under a
+    span they did not start, such as the span of an inbound request, once.
+
+    The ``end`` method of the span is overridden on the instance, which is
+    only possible for span types with an instance ``__dict__``, such as the
+    SDK spans. The override is removed once the span has ended. Callers must
+    handle a ``False`` return, for the span types without an instance
+    ``__dict__``, and should only rely on it for spans ended through their
+    ``end`` method, as spans ended by other means skip ``callback``.
+
+    Args:
+        span: The span to observe the end of.
+        callback: Called without arguments before ``span`` ends, while
+            attributes can still be set on it.
+
+    Returns:
+        Whether ``callback`` will be called.
+    """
+    try:
+        wrapped = vars(span).get("end")
+    except TypeError:
+        return False
+    end = span.end
+
+    def end_after_callback(*args: Any, **kwargs: Any) -> None:
+        if wrapped is None:
+            vars(span).pop("end", None)
+        else:
+            span.end = wrapped
+        try:
+            callback()
+        finally:
+            end(*args, **kwargs)
+
+    try:
+        span.end = end_after_callback
+    except AttributeError:
+        return False
+    return True
@@ -0,0 +1,90 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from opentelemetry.instrumentation.sql_fingerprint import (
+    _MAX_CACHED_STATEMENT_LENGTH,
+    _cached_tokenize,
+    _fingerprint_sql,
+    _get_sql_fingerprint_id,
+    _get_sql_operation_name,
+    _SqlFingerprintIds,
+)
+
+
+class TestSqlFingerprint(unittest.TestCase):
+    def test_operation_name(self):
+        for statement, operation in (
+            ("SELECT 1", "SELECT"),
+            ("select * from t", "select"),
+            ("/* leading comment */ query", "query"),
+            ("  /* one */ /* two */\n\tUPDATE t SET a = 1", "UPDATE"),
+            ("multi\n line\n query", "multi"),
+            ("--", "--"),
+            ("/* unterminated comment SELECT 1", ""),
+            ("", ""),
+            ("   ", ""),
+        ):
+            with self.subTest(statement=statement):
+                self.assertEqual(_get_sql_operation_name(statement), operation)
+
+    def test_fingerprint_strips_literals_and_comments(self):
+        self.assertEqual(
+            _fingerprint_sql(
+                "SELECT users.id FROM users /* c */ WHERE name = 'o''x'"
+                " AND age > 42 AND id IN (1, 2, 3) -- trailing\n"
+                "AND b = $$x$$ AND c = %(c_1)s AND d = $1 AND e::int = :e"
+            ).fingerprint,
+            "SELECT users.id FROM users WHERE name = ? AND age > ?"
+            " AND id IN (?) AND b = ? AND c = ? AND d = ? AND e::int = ?",
+        )
+
+    def test_fingerprint_is_shared_by_variants(self):
+        self.assertEqual(
+            _fingerprint_sql("SELECT * FROM t WHERE id IN (1,2)").fingerprint,
+            _fingerprint_sql(
+                "SELECT *  FROM t\n WHERE id IN ( 3, 4, 5 )"
+            ).fingerprint,
+        )
+
+    def test_results_are_cached(self):
+        statement = "SELECT * FROM cached_table WHERE id = %s"
+        self.assertIs(
+            _fingerprint_sql(statement), _fingerprint_sql(str(statement))
+        )
+        self.assertGreater(_cached_tokenize.cache_info().hits, 0)
+
+    def test_long_statements_are_not_tokenized(self):
+        statement = "INSERT INTO t VALUES " + ", ".join(
+            ["(1, 'x')"] * (_MAX_CACHED_STATEMENT_LENGTH // 8)
+        )
+        misses = _cached_tokenize.cache_info().misses
+
+        self.assertEqual(_get_sql_operation_name(statement), "INSERT")
+        self.assertIsNone(_fingerprint_sql(statement))
+        self.assertEqual(_cached_tokenize.cache_info().misses, misses)
+
+    def test_fingerprint_ids_are_bounded_per_instance(self):
+        first, second = _SqlFingerprintIds(1), _SqlFingerprintIds(1)
+
+        self.assertEqual(
+            first.get("SELECT ?"), _get_sql_fingerprint_id("SELECT ?")
+        )
+        self.assertEqual(first.get("SELECT ?"), first.get("SELECT ?"))
+        self.assertEqual(first.get("DELETE FROM t"), "other")
+        self.assertEqual(
+            second.get("DELETE FROM t"),
+            _get_sql_fingerprint_id("DELETE FROM t"),
+        )
@@ -0,0 +1,63 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import unittest
+
+from opentelemetry.instrumentation.sql_parameters import (
+    _render_sql_parameters,
+)
+
+
+class TestSqlParameters(unittest.TestCase):
+    def test_small_parameters_render_like_str(self):
+        for parameters in (
+            ("param1Value", False),
+            (1,),
+            (),
+            [(1, "a"), (2, None)],
+            {"id": 1, "names": ["a'b", b"\x00"], "price": decimal.Decimal(1)},
+            ({"nested": (datetime.date(2024, 1, 1),)},),
+            "already a string",
+            decimal.Decimal("1.5"),
+            None,
+        ):
+            with self.subTest(parameters=parameters):
+                self.assertEqual(
+                    _render_sql_parameters(parameters), str(parameters)
+                )
+
+    def test_large_sequences_are_summarized(self):
+        rows = [(index, "name") for index in range(10000)]
+        self.assertEqual(
+            _render_sql_parameters(rows, max_items=2),
+            "[(0, 'name'), (1, 'name'), ... 9998 more]",
+        )
+        self.assertEqual(
+            _render_sql_parameters({"a": 1, "b": 2, "c": 3}, max_items=1),
+            "{'a': 1, ... 2 more}",
+        )
+
+    def test_rendering_stops_at_max_length(self):
+        for parameters in (
+            [(index, "name") for index in range(10000)],
+            ("x" * 1000000,),
+            "x" * 1000000,
+            [[[["deep"] * 1000] * 1000]],
+        ):
+            rendered = _render_sql_parameters(parameters, max_length=64)
+            self.assertEqual(len(rendered), 64 + 3)
+            self.assertTrue(rendered.endswith("..."))
+            self.assertTrue(str(parameters).startswith(rendered[:-3]))
@@ -23,9 +23,14 @@ from opentelemetry.context import (
     get_current,
     get_value,
 )
-from opentelemetry.instrumentation.sqlcommenter_utils import _add_sql_comment
+from opentelemetry.instrumentation.sqlcommenter_utils import (
+    _add_sql_comment,
+    _add_sql_comment_with_static,
+    _StaticSqlComment,
+)
 from opentelemetry.instrumentation.utils import (
     _python_path_without_directory,
+    call_before_span_end,
     http_status_to_status_code,
     is_http_instrumentation_enabled,
     is_instrumentation_enabled,
@@ -33,6 +38,7 @@ from opentelemetry.instrumentation.utils import (
     suppress_instrumentation,
     unwrap,
 )
+from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.trace import StatusCode
 
 
@@ -208,6 +214,29 @@ class TestUtils(unittest.TestCase):
 
         self.assertEqual(commented_sql_without_semicolon, "Select 1")
 
+    def test_add_sql_comments_with_static(self):
+        static_comment = _StaticSqlComment(
+            db_driver="psycopg2", comment_1="value 1"
+        )
+        for dynamic in (
+            {},
+            {"traceparent": "00-01-02-01"},
+            {"comment 2": "value 3", "traceparent": "00-01-02-01"},
+            {"comment_1": "value 2"},
+            {"comment_1": None},
+        ):
+            meta = {"db_driver": "psycopg2", "comment_1": "value 1"}
+            meta.update(dynamic)
+            self.assertEqual(
+                _add_sql_comment_with_static(
+                    "Select 1;", static_comment, **dynamic
+                ),
+                _add_sql_comment(
+                    "Select 1;",
+                    **{k: v for k, v in meta.items() if v is not None},
+                ),
+            )
+
     def test_is_instrumentation_enabled_by_default(self):
         self.assertTrue(is_instrumentation_enabled())
         self.assertTrue(is_http_instrumentation_enabled())
@@ -252,6 +281,34 @@ class TestUtils(unittest.TestCase):
 
         self.assertIsNone(get_value(_SUPPRESS_HTTP_INSTRUMENTATION_KEY))
 
+    def test_call_before_span_end(self):
+        tracer = TracerProvider().get_tracer(__name__)
+        calls = []
+        with tracer.start_as_current_span("parent") as span:
+            self.assertTrue(
+                call_before_span_end(span, lambda: calls.append("first"))
+            )
+            self.assertTrue(
+                call_before_span_end(
+                    span,
+                    lambda: calls.append(("second", span.is_recording())),
+                )
+            )
+            self.assertEqual(calls, [])
+
+        self.assertEqual(calls, [("second", True), "first"])
+        self.assertNotIn("end", vars(span))
+        self.assertFalse(span.is_recording())
+
+    def test_call_before_span_end_unsupported_span(self):
+        class SlottedSpan:
+            __slots__ = ()
+
+            def end(self):
+                pass
+
+        self.assertFalse(call_before_span_end(SlottedSpan(), lambda: None))
+
 
 class UnwrapTestCase(unittest.TestCase):
     @staticmethod
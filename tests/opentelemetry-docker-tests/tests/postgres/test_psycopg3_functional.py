@@ -0,0 +1,99 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import psycopg
+from test_psycopg_functional import (
+    POSTGRES_DB_NAME,
+    POSTGRES_HOST,
+    POSTGRES_PASSWORD,
+    POSTGRES_PORT,
+    POSTGRES_USER,
+)
+
+from opentelemetry.instrumentation.psycopg import PsycopgInstrumentor
+from opentelemetry.test.test_base import TestBase
+from opentelemetry.trace import StatusCode
+
+
+class TestFunctionalPsycopgStream(TestBase):
+    def setUp(self):
+        super().setUp()
+        PsycopgInstrumentor().instrument(tracer_provider=self.tracer_provider)
+        self._connection = psycopg.connect(
+            dbname=POSTGRES_DB_NAME,
+            user=POSTGRES_USER,
+            password=POSTGRES_PASSWORD,
+            host=POSTGRES_HOST,
+            port=POSTGRES_PORT,
+            autocommit=True,
+        )
+        self._cursor = self._connection.cursor()
+
+    def tearDown(self):
+        self._cursor.close()
+        self._connection.close()
+        PsycopgInstrumentor().uninstrument()
+        super().tearDown()
+
+    def test_stream(self):
+        rows = list(
+            self._cursor.stream("SELECT * FROM generate_series(1, 100)")
+        )
+
+        self.assertEqual(len(rows), 100)
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.name, "SELECT")
+        self.assertEqual(span.attributes["db.response.returned_rows"], 100)
+        self.assertEqual(span.status.status_code, StatusCode.UNSET)
+
+    def test_stream_early_exit(self):
+        for (value,) in self._cursor.stream(
+            "SELECT * FROM generate_series(1, 10000000)"
+        ):
+            if value == 10:
+                break
+
+        # psycopg cancelled the query, the connection is usable again
+        self._cursor.execute("SELECT 1")
+        self.assertEqual(self._cursor.fetchone(), (1,))
+
+        stream_span, select_span = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            stream_span.attributes["db.response.returned_rows"], 10
+        )
+        self.assertEqual(stream_span.status.status_code, StatusCode.UNSET)
+        self.assertEqual(select_span.name, "SELECT")
+
+    def test_stream_error(self):
+        with self.assertRaises(psycopg.errors.DivisionByZero):
+            for _ in self._cursor.stream(
+                "SELECT 1 / (3 - i) FROM generate_series(1, 5) AS i"
+            ):
+                pass
+
+        (span,) = self.memory_exporter.get_finished_spans()
+        self.assertEqual(span.status.status_code, StatusCode.ERROR)
+
+    def test_copy_from(self):
+        self._cursor.execute(
+            "CREATE TEMPORARY TABLE copy_test (id integer, name text)"
+        )
+        with self._cursor.copy("COPY copy_test FROM STDIN") as copy:
+            copy.write_row((1, "adam"))
+            copy.write_row((2, "eve"))
+
+        span = self.memory_exporter.get_finished_spans()[-1]
+        self.assertEqual(span.name, "COPY")
+        self.assertEqual(span.attributes["db.postgresql.copy.rows"], 2)
+        self.assertGreater(span.attributes["db.postgresql.copy.bytes"], 0)
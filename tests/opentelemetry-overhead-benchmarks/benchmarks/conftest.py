@@ -0,0 +1,153 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared fixtures of the instrumentation overhead benchmarks.
+
+Every benchmark runs the same operation twice: once uninstrumented
+(``baseline``) and once instrumented (``instrumented``), both in the same
+benchmark group. Spans and metrics go to in-memory exporters.
+
+On top of the pytest-benchmark timings, each benchmark stores the peak
+memory allocated by one operation in its ``extra_info`` and the JSON
+report gets an ``overhead`` section with, per group, the mean time and
+peak memory the instrumentation adds to the operation.
+"""
+
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+BASELINE = "baseline"
+INSTRUMENTED = "instrumented"
+
+_MEMORY_ROUNDS = 20
+
+
+@pytest.fixture(scope="session")
+def span_exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture(scope="session")
+def tracer_provider(span_exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    return provider
+
+
+@pytest.fixture(scope="session")
+def meter_provider():
+    return MeterProvider(metric_readers=[InMemoryMetricReader()])
+
+
+@pytest.fixture(params=[BASELINE, INSTRUMENTED])
+def mode(request):
+    return request.param
+
+
+def _peak_memory(operation):
+    """Returns the mean peak of memory allocated by ``operation``."""
+    operation()
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(_MEMORY_ROUNDS):
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - start
+    finally:
+        tracemalloc.stop()
+    return total // _MEMORY_ROUNDS
+
+
+@pytest.fixture
+def measure(benchmark, mode, span_exporter):
+    """Benchmarks an operation under ``group``, tagged with the mode."""
+
+    def _measure(group, operation):
+        def run():
+            operation()
+            # keep the exporter from growing across rounds
+            span_exporter.clear()
+
+        benchmark.group = group
+        benchmark.extra_info["mode"] = mode
+        benchmark.extra_info["peak_memory_bytes"] = _peak_memory(run)
+        benchmark(run)
+
+    return _measure
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, avoid delayed ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def http_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/status"
+    server.shutdown()
+    server.server_close()
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    # pylint: disable=unused-argument
+    groups = {}
+    for bench in output_json["benchmarks"]:
+        mode = bench["extra_info"].get("mode")
+        if mode is not None:
+            groups.setdefault(bench["group"], {})[mode] = bench
+    overhead = {}
+    for group, modes in sorted(groups.items()):
+        if BASELINE not in modes or INSTRUMENTED not in modes:
+            continue
+        baseline, instrumented = modes[BASELINE], modes[INSTRUMENTED]
+        overhead[group] = {
+            "baseline_mean_us": baseline["stats"]["mean"] * 1e6,
+            "instrumented_mean_us": instrumented["stats"]["mean"] * 1e6,
+            "overhead_mean_us": (
+                instrumented["stats"]["mean"] - baseline["stats"]["mean"]
+            )
+            * 1e6,
+            "overhead_peak_memory_bytes": (
+                instrumented["extra_info"]["peak_memory_bytes"]
+                - baseline["extra_info"]["peak_memory_bytes"]
+            ),
+        }
+    output_json["overhead"] = overhead
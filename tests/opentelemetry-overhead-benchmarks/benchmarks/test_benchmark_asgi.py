@@ -0,0 +1,78 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
+
+from .conftest import INSTRUMENTED
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/status",
+    "raw_path": b"/status",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"127.0.0.1"), (b"user-agent", b"benchmark")],
+    "client": ("127.0.0.1", 32767),
+    "server": ("127.0.0.1", 80),
+}
+
+
+async def simple_asgi(scope, receive, send):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message):
+    pass
+
+
+@pytest.fixture
+def asgi_app(mode, tracer_provider, meter_provider):
+    if mode == INSTRUMENTED:
+        return OpenTelemetryMiddleware(
+            simple_asgi,
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+        )
+    return simple_asgi
+
+
+def test_asgi_request(measure, asgi_app):
+    loop = asyncio.new_event_loop()
+
+    def request():
+        loop.run_until_complete(asgi_app(dict(SCOPE), _receive, _send))
+
+    try:
+        measure("asgi", request)
+    finally:
+        loop.close()
@@ -0,0 +1,47 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+
+import pytest
+
+from opentelemetry.instrumentation.sqlite3 import SQLite3Instrumentor
+
+from .conftest import INSTRUMENTED
+
+
+@pytest.fixture
+def connection(mode, tracer_provider):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany(
+        "INSERT INTO users (id, name) VALUES (?, ?)",
+        [(i, f"user{i}") for i in range(100)],
+    )
+    if mode == INSTRUMENTED:
+        conn = SQLite3Instrumentor.instrument_connection(
+            conn, tracer_provider=tracer_provider
+        )
+    yield conn
+    conn.close()
+
+
+def test_dbapi_select(measure, connection):
+    cursor = connection.cursor()
+
+    def query():
+        cursor.execute("SELECT name FROM users WHERE id = ?", (42,))
+        cursor.fetchall()
+
+    measure("dbapi-sqlite3", query)
@@ -0,0 +1,98 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-message overhead of the instrumented gRPC streams.
+
+Each operation is a server streaming RPC of ``_MESSAGES`` raw bytes messages,
+the overhead of a message is the overhead of the group divided by
+``_MESSAGES``.
+"""
+
+from concurrent import futures
+
+import grpc
+import pytest
+
+from opentelemetry.instrumentation.grpc import (
+    client_interceptor,
+    server_interceptor,
+)
+from opentelemetry.instrumentation.grpc.grpcext import intercept_channel
+
+from .conftest import INSTRUMENTED
+
+_MESSAGES = 1000
+_MESSAGE = b"x" * 64
+_METHOD = "/bench.StreamService/Stream"
+
+
+def _stream(request, context):
+    for _ in range(_MESSAGES):
+        yield _MESSAGE
+
+
+@pytest.fixture(params=[False, True], ids=["default", "summarized"])
+def summarize_streams(request):
+    return request.param
+
+
+@pytest.fixture
+def stream(mode, summarize_streams, tracer_provider, meter_provider):
+    interceptors = []
+    if mode == INSTRUMENTED:
+        interceptors.append(
+            server_interceptor(
+                tracer_provider=tracer_provider,
+                meter_provider=meter_provider,
+                summarize_streams=summarize_streams,
+            )
+        )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=1), interceptors=interceptors
+    )
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "bench.StreamService",
+                {"Stream": grpc.unary_stream_rpc_method_handler(_stream)},
+            ),
+        )
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    if mode == INSTRUMENTED:
+        channel = intercept_channel(
+            channel,
+            client_interceptor(
+                tracer_provider=tracer_provider,
+                meter_provider=meter_provider,
+                summarize_streams=summarize_streams,
+            ),
+        )
+    yield channel.unary_stream(_METHOD)
+    channel.close()
+    server.stop(None)
+
+
+def test_grpc_server_stream(measure, stream, summarize_streams):
+    group = f"grpc-server-stream-{_MESSAGES}"
+    if summarize_streams:
+        group += "-summarized"
+
+    def consume():
+        for _ in stream(_MESSAGE):
+            pass
+
+    measure(group, consume)
@@ -0,0 +1,69 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+
+import httpx
+import requests
+import urllib3
+
+from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+from opentelemetry.instrumentation.requests import RequestsInstrumentor
+from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
+
+from .conftest import INSTRUMENTED
+
+
+@contextmanager
+def instrumented(instrumentor, mode, tracer_provider, meter_provider):
+    if mode != INSTRUMENTED:
+        yield
+        return
+    instrumentor.instrument(
+        tracer_provider=tracer_provider, meter_provider=meter_provider
+    )
+    try:
+        yield
+    finally:
+        instrumentor.uninstrument()
+
+
+def test_requests_get(
+    measure, mode, tracer_provider, meter_provider, http_server_url
+):
+    with instrumented(
+        RequestsInstrumentor(), mode, tracer_provider, meter_provider
+    ):
+        with requests.Session() as session:
+            measure("requests", lambda: session.get(http_server_url))
+
+
+def test_urllib3_get(
+    measure, mode, tracer_provider, meter_provider, http_server_url
+):
+    with instrumented(
+        URLLib3Instrumentor(), mode, tracer_provider, meter_provider
+    ):
+        with urllib3.PoolManager() as pool:
+            measure("urllib3", lambda: pool.request("GET", http_server_url))
+
+
+def test_httpx_get(
+    measure, mode, tracer_provider, meter_provider, http_server_url
+):
+    with instrumented(
+        HTTPXClientInstrumentor(), mode, tracer_provider, meter_provider
+    ):
+        with httpx.Client() as client:
+            measure("httpx", lambda: client.get(http_server_url))
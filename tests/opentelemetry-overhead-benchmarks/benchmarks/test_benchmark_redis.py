@@ -0,0 +1,64 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import redis
+
+from opentelemetry.instrumentation.redis import RedisInstrumentor
+
+from .conftest import INSTRUMENTED
+
+
+class FakeConnection(redis.Connection):
+    """A connection answering every command without any I/O."""
+
+    def connect(self, *args, **kwargs):
+        pass
+
+    def can_read(self, timeout=0):
+        return False
+
+    def send_packed_command(self, command, check_health=True):
+        pass
+
+    def read_response(self, disable_decoding=False, **kwargs):
+        return b"OK"
+
+
+@pytest.fixture
+def client(mode, tracer_provider):
+    client = redis.Redis(
+        connection_pool=redis.ConnectionPool(connection_class=FakeConnection)
+    )
+    if mode == INSTRUMENTED:
+        RedisInstrumentor.instrument_client(
+            client, tracer_provider=tracer_provider
+        )
+    yield client
+    if mode == INSTRUMENTED:
+        RedisInstrumentor.uninstrument_client(client)
+
+
+def test_redis_get(measure, client):
+    measure("redis-get", lambda: client.get("key"))
+
+
+def test_redis_pipeline(measure, client):
+    def pipeline():
+        with client.pipeline(transaction=False) as pipe:
+            for i in range(10):
+                pipe.set(f"key{i}", i)
+            pipe.execute()
+
+    measure("redis-pipeline-10", pipeline)
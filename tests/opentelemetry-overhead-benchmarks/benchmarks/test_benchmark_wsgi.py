@@ -0,0 +1,53 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import wsgiref.util
+
+import pytest
+
+from opentelemetry.instrumentation.wsgi import OpenTelemetryMiddleware
+
+from .conftest import INSTRUMENTED
+
+
+def simple_wsgi(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [b"ok"]
+
+
+def _start_response(status, response_headers, exc_info=None):
+    return lambda data: None
+
+
+@pytest.fixture
+def wsgi_app(mode, tracer_provider, meter_provider):
+    if mode == INSTRUMENTED:
+        return OpenTelemetryMiddleware(
+            simple_wsgi,
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+        )
+    return simple_wsgi
+
+
+def test_wsgi_request(measure, wsgi_app):
+    environ = {}
+    wsgiref.util.setup_testing_defaults(environ)
+    environ["HTTP_USER_AGENT"] = "benchmark"
+
+    def request():
+        for _ in wsgi_app(dict(environ), _start_response):
+            pass
+
+    measure("wsgi", request)
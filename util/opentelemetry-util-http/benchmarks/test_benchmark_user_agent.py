@@ -0,0 +1,46 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from opentelemetry.util.http import (
+    classify_user_agent,
+    detect_synthetic_user_agent,
+    normalize_user_agent,
+)
+
+USER_AGENTS = [
+    b"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    b"Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Mobile/15E148 Safari/604.1",
+    b"Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+    b"AlwaysOn-Monitor/1.0",
+    b"python-requests/2.32.3",
+    b"kube-probe/1.30",
+]
+
+
+def _uncached(user_agents):
+    for user_agent in user_agents:
+        detect_synthetic_user_agent(normalize_user_agent(user_agent))
+
+
+def _cached(user_agents):
+    for user_agent in user_agents:
+        classify_user_agent(user_agent)
+
+
+def test_classify_user_agent_uncached(benchmark):
+    benchmark(_uncached, USER_AGENTS)
+
+
+def test_classify_user_agent_cached(benchmark):
+    benchmark(_cached, USER_AGENTS)
@@ -14,14 +14,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
 from os import environ
 from re import IGNORECASE as RE_IGNORECASE
 from re import compile as re_compile
+from re import escape as re_escape
 from re import search
+from threading import Lock
 from typing import Callable, Iterable, overload
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+from opentelemetry.metrics import Counter, Meter
 from opentelemetry.semconv._incubating.attributes.http_attributes import (
     HTTP_FLAVOR,
     HTTP_HOST,
@@ -29,6 +33,7 @@ from opentelemetry.semconv._incubating.attributes.http_attributes import (
     HTTP_SCHEME,
     HTTP_SERVER_NAME,
     HTTP_STATUS_CODE,
+    HTTP_TARGET,
 )
 from opentelemetry.semconv._incubating.attributes.net_attributes import (
     NET_HOST_NAME,
@@ -37,6 +42,9 @@ from opentelemetry.semconv._incubating.attributes.net_attributes import (
 from opentelemetry.semconv._incubating.attributes.user_agent_attributes import (
     UserAgentSyntheticTypeValues,
 )
+from opentelemetry.semconv.attributes.http_attributes import HTTP_ROUTE
+from opentelemetry.semconv.attributes.server_attributes import SERVER_ADDRESS
+from opentelemetry.semconv.attributes.url_attributes import URL_PATH, URL_QUERY
 from opentelemetry.util.http.constants import BOT_PATTERNS, TEST_PATTERNS
 
 OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS = (
@@ -59,6 +67,10 @@ OTEL_PYTHON_INSTRUMENTATION_HTTP_CAPTURE_ALL_METHODS = (
     "OTEL_PYTHON_INSTRUMENTATION_HTTP_CAPTURE_ALL_METHODS"
 )
 
+OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT = (
+    "OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT"
+)
+
 # List of recommended metrics attributes
 _duration_attrs = {
     HTTP_METHOD,
@@ -79,8 +91,48 @@ _active_requests_count_attrs = {
     HTTP_SERVER_NAME,
 }
 
+# Metric attributes whose values come from the request and are therefore
+# unbounded, e.g. the raw target when no route is known
+_unbounded_metric_attrs = (
+    HTTP_TARGET,
+    HTTP_ROUTE,
+    HTTP_HOST,
+    HTTP_SERVER_NAME,
+    NET_HOST_NAME,
+    SERVER_ADDRESS,
+    URL_PATH,
+    URL_QUERY,
+)
+
+_DEFAULT_METRIC_ATTRIBUTE_LIMIT = 0
+
+METRIC_ATTRIBUTE_OVERFLOW_VALUE = "_OTHER"
+
 PARAMS_TO_REDACT = ["AWSAccessKeyId", "Signature", "sig", "X-Goog-Signature"]
 
+# Matches anything that may require ``redact_url`` to rewrite the url:
+# userinfo in the authority, a sensitive (or percent-encoded, hence possibly
+# sensitive) query parameter key with a non-empty value, or characters that
+# ``urlparse`` strips before parsing. It is deliberately a superset of what
+# the full parse would redact so that a miss can safely skip parsing.
+_URL_SCRUB_CANDIDATE = re_compile(
+    r"//[^/?#]*@|[\t\r\n]|[?&](?:{}|[^&=#]*%[^&=#]*)=[^&#]".format(
+        "|".join(re_escape(param) for param in PARAMS_TO_REDACT)
+    )
+)
+
+_REDACTED_URL_CACHE_SIZE = 128
+
+# Test patterns take priority over bot patterns, so they are kept apart.
+_TEST_USER_AGENT_REGEX = re_compile(
+    "|".join(re_escape(pattern) for pattern in TEST_PATTERNS), RE_IGNORECASE
+)
+_BOT_USER_AGENT_REGEX = re_compile(
+    "|".join(re_escape(pattern) for pattern in BOT_PATTERNS), RE_IGNORECASE
+)
+
+_USER_AGENT_CACHE_SIZE = 1024
+
 
 class ExcludeList:
     """Class to exclude certain paths (given as a list of regexes) from tracing requests"""
@@ -141,6 +193,102 @@ class SanitizeValue:
         return values
 
 
+class MetricAttributeLimiter:
+    """Class to bound the number of distinct values of metric attributes.
+
+    The first ``limit`` distinct values seen for each attribute in
+    ``attribute_keys`` are kept as-is, further values are replaced with
+    ``_OTHER``. Memory is capped at ``limit`` values per attribute whatever
+    the shape of the traffic. A non-positive ``limit`` disables limiting.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        attribute_keys: Iterable[str] = _unbounded_metric_attrs,
+        overflow_counter: Counter | None = None,
+        instrument_name: str | None = None,
+    ):
+        self._limit = limit
+        self._seen_values: dict[str, set[object]] = {
+            key: set() for key in attribute_keys
+        }
+        self._overflow_counter = overflow_counter
+        self._instrument_name = instrument_name
+        self._lock = Lock()
+        self.overflow_count = 0
+
+    def limit_attributes(
+        self, attributes: MutableMapping[str, object]
+    ) -> MutableMapping[str, object]:
+        """Collapses values over the limit into ``_OTHER``, in place."""
+        if self._limit <= 0:
+            return attributes
+        for key, seen_values in self._seen_values.items():
+            value = attributes.get(key)
+            if value is None or value in seen_values:
+                continue
+            with self._lock:
+                if len(seen_values) < self._limit:
+                    seen_values.add(value)
+                    continue
+                self.overflow_count += 1
+            attributes[key] = METRIC_ATTRIBUTE_OVERFLOW_VALUE
+            if self._overflow_counter is not None:
+                self._overflow_counter.add(
+                    1,
+                    {
+                        "otel.metric.name": self._instrument_name or "",
+                        "otel.metric.attribute": key,
+                    },
+                )
+        return attributes
+
+
+def get_metric_attribute_limit(instrument_name: str) -> int:
+    """Returns the distinct values limit configured for ``instrument_name``.
+
+    ``OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT`` is a comma
+    separated list of either a bare limit, used for every instrument, or
+    ``<instrument name>=<limit>`` entries overriding it per instrument.
+    """
+    default_limit = _DEFAULT_METRIC_ATTRIBUTE_LIMIT
+    instrument_limit = None
+    for entry in environ.get(
+        OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT, ""
+    ).split(","):
+        name, _, value = entry.rpartition("=")
+        try:
+            limit = int(value)
+        except ValueError:
+            continue
+        name = name.strip()
+        if not name:
+            default_limit = limit
+        elif name == instrument_name:
+            instrument_limit = limit
+    return default_limit if instrument_limit is None else instrument_limit
+
+
+def create_metric_attribute_limiter(
+    meter: Meter, instrument_name: str
+) -> MetricAttributeLimiter:
+    """Creates the attribute limiter for the ``instrument_name`` histogram.
+
+    Values collapsed into ``_OTHER`` are counted by the
+    ``otel.instrumentation.http.metric_attribute_overflow`` counter.
+    """
+    return MetricAttributeLimiter(
+        get_metric_attribute_limit(instrument_name),
+        overflow_counter=meter.create_counter(
+            name="otel.instrumentation.http.metric_attribute_overflow",
+            unit="{value}",
+            description="Number of metric attribute values replaced with _OTHER because of the cardinality limit.",
+        ),
+        instrument_name=instrument_name,
+    )
+
+
 _root = r"OTEL_PYTHON_{}"
 
 
@@ -335,11 +483,21 @@ def redact_query_parameters(url: str) -> str:
         return url
 
 
+@lru_cache(maxsize=_REDACTED_URL_CACHE_SIZE)
+def _redact_url_slow(url: str) -> str:
+    return redact_query_parameters(remove_url_credentials(url))
+
+
 def redact_url(url: str) -> str:
-    """Redact sensitive data from the URL, including credentials and query parameters."""
-    url = remove_url_credentials(url)
-    url = redact_query_parameters(url)
-    return url
+    """Redact sensitive data from the URL, including credentials and query parameters.
+
+    Urls that carry neither credentials nor sensitive query parameters are
+    detected with a single scan and returned as-is, without being parsed.
+    The result for the remaining urls is kept in a small LRU cache.
+    """
+    if _URL_SCRUB_CANDIDATE.search(url) is None:
+        return url
+    return _redact_url_slow(url)
 
 
 def normalize_user_agent(
@@ -376,11 +534,42 @@ def detect_synthetic_user_agent(user_agent: str | None) -> str | None:
     if not user_agent:
         return None
 
-    user_agent_lower = user_agent.lower()
-
-    if any(test_pattern in user_agent_lower for test_pattern in TEST_PATTERNS):
+    if TEST_PATTERNS and _TEST_USER_AGENT_REGEX.search(user_agent):
         return UserAgentSyntheticTypeValues.TEST.value
-    if any(bot_pattern in user_agent_lower for bot_pattern in BOT_PATTERNS):
+    if BOT_PATTERNS and _BOT_USER_AGENT_REGEX.search(user_agent):
         return UserAgentSyntheticTypeValues.BOT.value
 
     return None
+
+
+@lru_cache(maxsize=_USER_AGENT_CACHE_SIZE)
+def _classify_user_agent(
+    user_agent: str | bytes,
+) -> tuple[str | None, str | None]:
+    normalized = normalize_user_agent(user_agent)
+    return normalized, detect_synthetic_user_agent(normalized)
+
+
+def classify_user_agent(
+    user_agent: str | bytes | bytearray | memoryview | None,
+) -> tuple[str | None, str | None]:
+    """Normalize a user-agent header value and detect its synthetic type.
+
+    Equivalent to calling ``normalize_user_agent`` followed by
+    ``detect_synthetic_user_agent``, but results are memoized in a bounded
+    LRU cache since servers see the same few user agents over and over.
+
+    Returns:
+        A ``(user_agent, synthetic_type)`` tuple.
+    """
+    if user_agent is None:
+        return None, None
+    if not isinstance(user_agent, (str, bytes)):
+        # bytearray and memoryview are not hashable
+        user_agent = normalize_user_agent(user_agent)
+    return _classify_user_agent(user_agent)
+
+
+def user_agent_cache_info():
+    """Return the hit/miss statistics of the ``classify_user_agent`` cache."""
+    return _classify_user_agent.cache_info()
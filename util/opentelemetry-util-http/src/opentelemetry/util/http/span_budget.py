@@ -0,0 +1,246 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Budget for the number of HTTP client spans created under a single parent span.
+
+Services fanning out to the same host can issue thousands of identical
+outbound calls while handling one inbound request. With a budget of ``K``
+configured through ``OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET``,
+only the first ``K`` calls for a given ``(host, method)`` under the same
+parent span get a CLIENT span. Further calls are not traced individually:
+their count and latency are aggregated and set on the parent span right
+before it ends, as the ``http.client.suppressed.*`` attributes.
+Instrumentations keep recording their duration metrics for every call.
+
+The end of the parent span is observed with
+``opentelemetry.instrumentation.utils.call_before_span_end``. Calls under a
+parent span whose end cannot be observed that way are never suppressed.
+
+The trace context of the parent span is still propagated on suppressed
+calls, so downstream spans stay in the trace.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from os import environ
+from threading import Lock
+from timeit import default_timer
+from typing import Any, Iterator
+from weakref import WeakKeyDictionary
+
+from opentelemetry.instrumentation.utils import call_before_span_end
+from opentelemetry.trace import (
+    NonRecordingSpan,
+    Span,
+    Tracer,
+    get_current_span,
+)
+
+OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET = (
+    "OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET"
+)
+
+_SUPPRESSED_TARGETS = "http.client.suppressed.targets"
+_SUPPRESSED_COUNT = "http.client.suppressed.count"
+_SUPPRESSED_DURATION_SUM = "http.client.suppressed.duration_sum"
+_SUPPRESSED_DURATION_MAX = "http.client.suppressed.duration_max"
+
+
+class _TargetStats:
+    __slots__ = ("spans", "suppressed", "duration_sum", "duration_max")
+
+    def __init__(self):
+        self.spans = 0
+        self.suppressed = 0
+        self.duration_sum = 0.0
+        self.duration_max = 0.0
+
+
+class _ParentStats:
+    __slots__ = ("targets", "hooked")
+
+    def __init__(self):
+        self.targets: dict[tuple[str, str], _TargetStats] = {}
+        # whether the summary is set on the parent span when it ends
+        self.hooked = False
+
+
+class SuppressedCall:
+    """An outbound call over budget, to be reported to its parent span."""
+
+    def __init__(
+        self,
+        budget: OutboundSpanBudget,
+        parent: Span,
+        target: tuple[str, str],
+    ):
+        self._budget = budget
+        self._parent = parent
+        self._target = target
+        self.span = NonRecordingSpan(parent.get_span_context())
+
+    def record(self, duration_s: float) -> None:
+        """Adds the call to the summary of the parent span."""
+        # pylint: disable=protected-access
+        self._budget._record_suppressed(
+            self._parent, self._target, max(duration_s, 0)
+        )
+
+
+class OutboundSpanBudget:
+    """Limits the CLIENT spans created per (host, method) under a parent span.
+
+    Args:
+        max_spans: Number of spans created for each ``(host, method)`` under
+            the same parent span before further calls are suppressed.
+    """
+
+    def __init__(self, max_spans: int):
+        self._max_spans = max_spans
+        # Keyed by parent span so the bookkeeping goes away with it.
+        self._stats: WeakKeyDictionary[Span, _ParentStats] = (
+            WeakKeyDictionary()
+        )
+        self._lock = Lock()
+
+    def acquire(self, host: str | None, method: str) -> SuppressedCall | None:
+        """Accounts for an outbound call under the current span.
+
+        Returns:
+            ``None`` if the call fits in the budget and should be traced as
+            usual, otherwise a ``SuppressedCall`` to report its duration to.
+            Calls are not suppressed under recording parent spans which the
+            summary cannot be set on when they end.
+        """
+        parent = get_current_span()
+        if not parent.get_span_context().is_valid:
+            return None
+        target = (host or "", method)
+        with self._lock:
+            try:
+                parent_stats = self._stats.get(parent)
+                if parent_stats is None:
+                    parent_stats = self._stats[parent] = _ParentStats()
+            except TypeError:  # span types that cannot be weakly referenced
+                return None
+            stats = parent_stats.targets.get(target)
+            if stats is None:
+                stats = parent_stats.targets[target] = _TargetStats()
+            if stats.spans < self._max_spans:
+                stats.spans += 1
+                return None
+            if not parent_stats.hooked and parent.is_recording():
+                if not call_before_span_end(
+                    parent, lambda: self._set_summary(parent)
+                ):
+                    return None
+                parent_stats.hooked = True
+        return SuppressedCall(self, parent, target)
+
+    @contextmanager
+    def start_as_current_span(
+        self,
+        tracer: Tracer,
+        name: str,
+        host: str | None,
+        method: str,
+        **kwargs: Any,
+    ) -> Iterator[Span]:
+        """Starts a span like ``Tracer.start_as_current_span`` within budget.
+
+        Over budget, yields a non recording span carrying the context of the
+        parent span and records the duration of the block on the parent.
+        """
+        suppressed = self.acquire(host, method)
+        if suppressed is None:
+            with tracer.start_as_current_span(name, **kwargs) as span:
+                yield span
+            return
+        start = default_timer()
+        try:
+            yield suppressed.span
+        finally:
+            suppressed.record(default_timer() - start)
+
+    def _record_suppressed(
+        self, parent: Span, target: tuple[str, str], duration_s: float
+    ) -> None:
+        with self._lock:
+            parent_stats = self._stats.get(parent)
+            if parent_stats is None:
+                return
+            stats = parent_stats.targets[target]
+            stats.suppressed += 1
+            stats.duration_sum += duration_s
+            stats.duration_max = max(stats.duration_max, duration_s)
+
+    def _set_summary(self, parent: Span) -> None:
+        """Sets the summary of the suppressed calls on ``parent``, right
+        before it ends."""
+        with self._lock:
+            parent_stats = self._stats.pop(parent, None)
+            if parent_stats is None:
+                return
+            suppressed = [
+                (f"{method} {host}".rstrip(), stats)
+                for (host, method), stats in parent_stats.targets.items()
+                if stats.suppressed
+            ]
+        if not suppressed:
+            return
+        parent.set_attributes(
+            {
+                _SUPPRESSED_TARGETS: [target for target, _ in suppressed],
+                _SUPPRESSED_COUNT: [
+                    stats.suppressed for _, stats in suppressed
+                ],
+                _SUPPRESSED_DURATION_SUM: [
+                    stats.duration_sum for _, stats in suppressed
+                ],
+                _SUPPRESSED_DURATION_MAX: [
+                    stats.duration_max for _, stats in suppressed
+                ],
+            }
+        )
+
+
+def get_outbound_span_budget() -> OutboundSpanBudget | None:
+    """Returns the budget configured by the environment, if any."""
+    try:
+        max_spans = int(
+            environ.get(
+                OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET, ""
+            )
+        )
+    except ValueError:
+        return None
+    if max_spans <= 0:
+        return None
+    return OutboundSpanBudget(max_spans)
+
+
+def start_client_span(
+    tracer: Tracer,
+    budget: OutboundSpanBudget | None,
+    name: str,
+    host: str | None,
+    method: str,
+    **kwargs: Any,
+):
+    """Starts the span of an outbound call, honoring ``budget`` if set."""
+    if budget is None:
+        return tracer.start_as_current_span(name, **kwargs)
+    return budget.start_as_current_span(tracer, name, host, method, **kwargs)
@@ -18,8 +18,10 @@ from opentelemetry.semconv._incubating.attributes.user_agent_attributes import (
     UserAgentSyntheticTypeValues,
 )
 from opentelemetry.util.http import (
+    classify_user_agent,
     detect_synthetic_user_agent,
     normalize_user_agent,
+    user_agent_cache_info,
 )
 
 
@@ -130,3 +132,42 @@ class TestNormalizeUserAgent(unittest.TestCase):
 
     def test_none(self):
         self.assertIsNone(normalize_user_agent(None))
+
+
+class TestClassifyUserAgent(unittest.TestCase):
+    def test_classify(self):
+        test_cases = [
+            (
+                b"alwayson-monitor/1.0",
+                (
+                    "alwayson-monitor/1.0",
+                    UserAgentSyntheticTypeValues.TEST.value,
+                ),
+            ),
+            (
+                "Googlebot/2.1",
+                ("Googlebot/2.1", UserAgentSyntheticTypeValues.BOT.value),
+            ),
+            (
+                bytearray(b"bingbot/2.0"),
+                ("bingbot/2.0", UserAgentSyntheticTypeValues.BOT.value),
+            ),
+            (memoryview(b"MyApp/1.0"), ("MyApp/1.0", None)),
+            ("", ("", None)),
+            (None, (None, None)),
+        ]
+
+        for user_agent_raw, expected in test_cases:
+            with self.subTest(user_agent=user_agent_raw):
+                self.assertEqual(classify_user_agent(user_agent_raw), expected)
+
+    def test_cache_hits(self):
+        user_agent = "Mozilla/5.0 (X11; Linux x86_64) cache-test/1.0"
+        before = user_agent_cache_info()
+        classify_user_agent(user_agent)
+        classify_user_agent(user_agent)
+        after = user_agent_cache_info()
+
+        self.assertEqual(after.misses - before.misses, 1)
+        self.assertEqual(after.hits - before.hits, 1)
+        self.assertLessEqual(after.currsize, after.maxsize)
@@ -0,0 +1,92 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from opentelemetry.util.http import (
+    OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT,
+    MetricAttributeLimiter,
+    create_metric_attribute_limiter,
+    get_metric_attribute_limit,
+)
+
+
+class TestMetricAttributeLimiter(unittest.TestCase):
+    def test_collapses_values_over_limit(self):
+        limiter = MetricAttributeLimiter(2, attribute_keys=("http.target",))
+        targets = [
+            limiter.limit_attributes({"http.target": target})["http.target"]
+            for target in ("/a", "/b", "/c", "/a", "/d", "/b")
+        ]
+
+        self.assertEqual(targets, ["/a", "/b", "_OTHER", "/a", "_OTHER", "/b"])
+        self.assertEqual(limiter.overflow_count, 2)
+
+    def test_limits_are_per_attribute(self):
+        limiter = MetricAttributeLimiter(
+            1, attribute_keys=("http.target", "http.host")
+        )
+        limiter.limit_attributes({"http.target": "/a", "http.host": "a"})
+        attributes = limiter.limit_attributes(
+            {"http.target": "/a", "http.host": "b", "http.method": "GET"}
+        )
+
+        self.assertEqual(
+            attributes,
+            {"http.target": "/a", "http.host": "_OTHER", "http.method": "GET"},
+        )
+
+    def test_non_positive_limit_disables(self):
+        limiter = MetricAttributeLimiter(0, attribute_keys=("http.target",))
+        for index in range(10):
+            attributes = limiter.limit_attributes({"http.target": index})
+            self.assertEqual(attributes, {"http.target": index})
+        self.assertEqual(limiter.overflow_count, 0)
+
+    def test_overflow_counter(self):
+        meter = mock.Mock()
+        limiter = create_metric_attribute_limiter(
+            meter, "http.server.duration"
+        )
+        limiter._limit = 1
+        limiter.limit_attributes({"http.target": "/a"})
+        limiter.limit_attributes({"http.target": "/b"})
+
+        meter.create_counter.return_value.add.assert_called_once_with(
+            1,
+            {
+                "otel.metric.name": "http.server.duration",
+                "otel.metric.attribute": "http.target",
+            },
+        )
+
+
+class TestGetMetricAttributeLimit(unittest.TestCase):
+    def test_default(self):
+        self.assertEqual(get_metric_attribute_limit("http.server.duration"), 0)
+
+    @mock.patch.dict(
+        "os.environ",
+        {
+            OTEL_PYTHON_INSTRUMENTATION_HTTP_METRICS_ATTRIBUTE_LIMIT: "50, http.server.duration=10,invalid"
+        },
+    )
+    def test_per_instrument(self):
+        self.assertEqual(
+            get_metric_attribute_limit("http.server.duration"), 10
+        )
+        self.assertEqual(
+            get_metric_attribute_limit("http.server.request.duration"), 50
+        )
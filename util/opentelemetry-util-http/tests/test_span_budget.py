@@ -0,0 +1,134 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from opentelemetry import trace
+from opentelemetry.test.test_base import TestBase
+from opentelemetry.trace import SpanKind
+from opentelemetry.util.http.span_budget import (
+    OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET,
+    OutboundSpanBudget,
+    get_outbound_span_budget,
+    start_client_span,
+)
+
+
+class TestOutboundSpanBudget(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.tracer = self.tracer_provider.get_tracer(__name__)
+
+    def _call(self, budget, host, method="GET"):
+        with start_client_span(
+            self.tracer, budget, method, host, method, kind=SpanKind.CLIENT
+        ) as span:
+            return span
+
+    def test_budget_is_per_target_and_parent(self):
+        budget = OutboundSpanBudget(2)
+        with self.tracer.start_as_current_span("parent") as parent:
+            for _ in range(4):
+                self._call(budget, "a.example")
+            self._call(budget, "b.example")
+            self._call(budget, "a.example", "POST")
+            suppressed = self._call(budget, "a.example")
+
+        self.assertFalse(suppressed.is_recording())
+        self.assertEqual(
+            suppressed.get_span_context(), parent.get_span_context()
+        )
+
+        spans = self.memory_exporter.get_finished_spans()
+        # 2 GET a.example, 1 GET b.example, 1 POST a.example and the parent
+        self.assertEqual(len(spans), 5)
+        parent_span = spans[-1]
+        self.assertEqual(
+            parent_span.attributes["http.client.suppressed.targets"],
+            ("GET a.example",),
+        )
+        self.assertEqual(
+            parent_span.attributes["http.client.suppressed.count"], (3,)
+        )
+        duration_sum = parent_span.attributes[
+            "http.client.suppressed.duration_sum"
+        ][0]
+        duration_max = parent_span.attributes[
+            "http.client.suppressed.duration_max"
+        ][0]
+        self.assertGreaterEqual(duration_sum, duration_max)
+
+    def test_summary_is_set_when_parent_ends(self):
+        budget = OutboundSpanBudget(1)
+        parent = self.tracer.start_span("parent")
+        with mock.patch.object(
+            parent, "set_attributes", wraps=parent.set_attributes
+        ) as set_attributes:
+            with trace.use_span(parent):
+                for _ in range(6):
+                    self._call(budget, "a.example")
+            set_attributes.assert_not_called()
+            parent.end()
+
+        set_attributes.assert_called_once()
+        self.assertEqual(
+            parent.attributes["http.client.suppressed.count"], (5,)
+        )
+        # pylint: disable=protected-access
+        self.assertEqual(len(budget._stats), 0)
+
+    def test_parent_end_not_observable(self):
+        budget = OutboundSpanBudget(1)
+        with mock.patch(
+            "opentelemetry.util.http.span_budget.call_before_span_end",
+            return_value=False,
+        ):
+            with self.tracer.start_as_current_span("parent"):
+                for _ in range(3):
+                    self._call(budget, "a.example")
+
+        # the calls are traced rather than summarized on a parent whose end
+        # cannot be observed
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 4)
+        self.assertNotIn("http.client.suppressed.count", spans[-1].attributes)
+
+    def test_budget_resets_with_parent(self):
+        budget = OutboundSpanBudget(1)
+        for _ in range(2):
+            with self.tracer.start_as_current_span("parent"):
+                self._call(budget, "a.example")
+
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 4)
+        for span in spans:
+            self.assertNotIn("http.client.suppressed.count", span.attributes)
+
+    def test_no_parent_is_not_limited(self):
+        budget = OutboundSpanBudget(1)
+        for _ in range(3):
+            self._call(budget, "a.example")
+
+        self.assertEqual(len(self.memory_exporter.get_finished_spans()), 3)
+
+    def test_get_outbound_span_budget(self):
+        for value, enabled in (("10", True), ("0", False), ("x", False)):
+            with mock.patch.dict(
+                "os.environ",
+                {OTEL_PYTHON_INSTRUMENTATION_HTTP_CLIENT_SPAN_BUDGET: value},
+            ):
+                self.assertEqual(
+                    get_outbound_span_budget() is not None, enabled
+                )
+        self.assertIsNone(get_outbound_span_budget())